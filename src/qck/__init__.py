@@ -13,8 +13,12 @@ Typical usage::
     link = client.links.create({"url": "https://example.com"})
     print(link["short_url"])
 
+For asyncio applications, :class:`AsyncQCK` exposes the same resources
+with awaitable methods.
+
 Modules:
-    _client: Low-level HTTP transport with retries and error mapping.
+    _client: Low-level sync and async HTTP transports with retries and
+        error mapping.
     _errors: Exception hierarchy for API error responses.
     _types: TypedDict definitions for request params and response shapes.
     resources: High-level resource classes (links, analytics, etc.).
@@ -22,22 +26,48 @@ Modules:
 
 from __future__ import annotations
 
-from ._client import HttpClient
+from typing import Optional, Union
+
+from ._breaker import CircuitBreaker
+from ._cache import CacheBackend, DiskCache, MemoryCache, ResponseCache
+from ._client import AsyncHttpClient, HttpClient
+from ._columns import Columns
 from ._errors import (
     AuthenticationError,
+    CircuitOpenError,
+    NetworkError,
     NotFoundError,
     QCKError,
     RateLimitError,
     ValidationError,
 )
+from ._ingest import (
+    AsyncConversionTracker,
+    AsyncJourneyIngestor,
+    ConversionTracker,
+    JourneyIngestor,
+)
+from ._mirror import AsyncLinkMirror, LinkMirror
+from ._ratelimit import RateLimiter, _as_rate_limiter
+from ._retry import RetryBudget, RetryPolicy
+from ._rollup import rollup
+from ._timeseries import AsyncIncrementalTimeseries, IncrementalTimeseries
 from ._types import (
+    WEBHOOK_EVENT_CATEGORIES,
+    WEBHOOK_EVENTS,
     AnalyticsResult,
+    AnalyticsSnapshot,
+    AnalyticsSnapshotError,
+    AnalyticsSnapshotParams,
     AnalyticsSummary,
     AnalyticsSummaryParams,
     AnalyticsUsage,
     BulkCreateResult,
     BulkLinkError,
     BulkLinkSuccess,
+    BulkOperationError,
+    BulkOperationResult,
+    BulkOperationSuccess,
     ConversionBreakdownEntry,
     ConversionBreakdownParams,
     ConversionScopeParams,
@@ -56,7 +86,9 @@ from ._types import (
     GeoAnalyticsParams,
     HourlyAnalyticsEntry,
     HourlyAnalyticsParams,
+    ImportResult,
     IngestEventsParams,
+    IngestStats,
     JourneyEvent,
     JourneyEventsPage,
     JourneyLinkSummary,
@@ -66,6 +98,7 @@ from ._types import (
     LinkMetadata,
     LinkStats,
     ListLinksParams,
+    MirrorSyncStats,
     PaginatedResponse,
     ReferrerAnalyticsEntry,
     ReferrerAnalyticsParams,
@@ -77,8 +110,6 @@ from ._types import (
     TrackConversionParams,
     UpdateLinkParams,
     UpdateWebhookParams,
-    WEBHOOK_EVENTS,
-    WEBHOOK_EVENT_CATEGORIES,
     WebhookDelivery,
     WebhookDeliveryStatus,
     WebhookEndpoint,
@@ -86,6 +117,12 @@ from ._types import (
 )
 from .resources import (
     AnalyticsResource,
+    AsyncAnalyticsResource,
+    AsyncConversionsResource,
+    AsyncDomainsResource,
+    AsyncJourneyResource,
+    AsyncLinksResource,
+    AsyncWebhooksResource,
     ConversionsResource,
     DomainsResource,
     JourneyResource,
@@ -94,10 +131,12 @@ from .resources import (
 )
 
 __all__ = [
-    # Main class
+    # Main classes
     "QCK",
-    # Client
+    "AsyncQCK",
+    # Clients
     "HttpClient",
+    "AsyncHttpClient",
     # Resources
     "AnalyticsResource",
     "ConversionsResource",
@@ -105,20 +144,59 @@ __all__ = [
     "JourneyResource",
     "LinksResource",
     "WebhooksResource",
+    "AsyncAnalyticsResource",
+    "AsyncConversionsResource",
+    "AsyncDomainsResource",
+    "AsyncJourneyResource",
+    "AsyncLinksResource",
+    "AsyncWebhooksResource",
+    # Caching
+    "CacheBackend",
+    "DiskCache",
+    "MemoryCache",
+    "ResponseCache",
+    # Rate limiting
+    "RateLimiter",
+    # Retries
+    "RetryBudget",
+    "RetryPolicy",
+    # Circuit breaking
+    "CircuitBreaker",
+    # Batching
+    "ConversionTracker",
+    "JourneyIngestor",
+    "AsyncConversionTracker",
+    "AsyncJourneyIngestor",
+    # Mirroring
+    "LinkMirror",
+    "AsyncLinkMirror",
+    "IncrementalTimeseries",
+    "AsyncIncrementalTimeseries",
+    # Columnar results
+    "Columns",
+    "rollup",
     # Errors
     "QCKError",
     "AuthenticationError",
+    "CircuitOpenError",
+    "NetworkError",
     "RateLimitError",
     "NotFoundError",
     "ValidationError",
     # Types
     "AnalyticsResult",
+    "AnalyticsSnapshot",
+    "AnalyticsSnapshotError",
+    "AnalyticsSnapshotParams",
     "AnalyticsSummary",
     "AnalyticsSummaryParams",
     "AnalyticsUsage",
     "BulkCreateResult",
     "BulkLinkError",
     "BulkLinkSuccess",
+    "BulkOperationError",
+    "BulkOperationResult",
+    "BulkOperationSuccess",
     "ConversionBreakdownEntry",
     "ConversionBreakdownParams",
     "ConversionScopeParams",
@@ -137,7 +215,9 @@ __all__ = [
     "GeoAnalyticsParams",
     "HourlyAnalyticsEntry",
     "HourlyAnalyticsParams",
+    "ImportResult",
     "IngestEventsParams",
+    "IngestStats",
     "JourneyEvent",
     "JourneyEventsPage",
     "JourneyLinkSummary",
@@ -147,6 +227,7 @@ __all__ = [
     "LinkMetadata",
     "LinkStats",
     "ListLinksParams",
+    "MirrorSyncStats",
     "PaginatedResponse",
     "ReferrerAnalyticsEntry",
     "ReferrerAnalyticsParams",
@@ -201,6 +282,19 @@ class QCK:
         base_url: str = _DEFAULT_BASE_URL,
         timeout: int = 30,
         retries: int = 3,
+        cache: Optional[ResponseCache] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        json_codec: str = "auto",
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        accept_encoding: Optional[str] = None,
+        models: bool = False,
     ) -> None:
         """Initialise the QCK client.
 
@@ -212,9 +306,49 @@ class QCK:
             retries: Maximum number of automatic retries on transient
                 failures (rate limits, timeouts, connection errors).
                 Defaults to 3.
+            cache: Optional :class:`ResponseCache` for GET responses.
+                Disabled by default.
+            rate_limit: Client-side rate limit, either in requests per
+                second or as a :class:`RateLimiter` (which may be shared
+                between clients). Disabled by default.
+            retry_policy: Optional :class:`RetryPolicy` with the back-off
+                strategy, retry budget, and per-call deadline. Defaults
+                to full-jitter back-off without budget or deadline.
+            circuit_breaker: Optional :class:`CircuitBreaker` that fails
+                calls to an unhealthy endpoint group fast with
+                :class:`CircuitOpenError`. Disabled by default.
+            max_connections: Maximum number of concurrent connections in
+                the pool (``None`` for no limit). Defaults to 100.
+            max_keepalive_connections: Maximum number of idle connections
+                kept open for reuse (``None`` for no limit). Defaults to 20.
+            keepalive_expiry: Seconds an idle connection is kept open.
+                Defaults to 5.
+            http2: Use HTTP/2, multiplexing concurrent requests over a few
+                TLS connections. Requires ``pip install qck-sdk[http2]``.
+                Defaults to ``False``.
+            json_codec: JSON backend for request bodies and responses:
+                ``"auto"`` (orjson or msgspec when installed, else the
+                standard library), ``"orjson"``, ``"msgspec"``, or
+                ``"stdlib"``. Defaults to ``"auto"``.
+            compression: Compress JSON request bodies with ``"gzip"`` or
+                ``"zstd"`` (``pip install qck-sdk[zstd]``). Disabled by
+                default.
+            compression_threshold: Minimum JSON body size in bytes that
+                is compressed. Defaults to 1024.
+            accept_encoding: Explicit ``Accept-Encoding`` header for
+                response compression (e.g. ``"zstd, gzip"``). Defaults to
+                every coding ``httpx`` can decode.
+            models: Return responses as the compact, slotted record
+                classes of :mod:`qck.models` (``link.short_url``) instead
+                of dicts. Defaults to ``False``.
 
         Raises:
             ValueError: If *api_key* is empty or falsy.
+            ValueError: If *json_codec*, *compression*, or a coding in
+                *accept_encoding* is not supported.
+            ImportError: If *http2* is set but ``h2`` is not installed, or
+                the package needed by *json_codec*, *compression*, or
+                *accept_encoding* is missing.
 
         Example:
             >>> client = QCK(api_key="qck_live_abc123")
@@ -228,6 +362,19 @@ class QCK:
             base_url=base_url,
             timeout=timeout,
             retries=retries,
+            cache=cache,
+            rate_limiter=_as_rate_limiter(rate_limit),
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            json_codec=json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            accept_encoding=accept_encoding,
+            models=models,
         )
 
         self.links = LinksResource(self._client)
@@ -248,3 +395,142 @@ class QCK:
     def __exit__(self, *args: object) -> None:
         """Exit the context manager, closing the HTTP session."""
         self.close()
+
+
+class AsyncQCK:
+    """Asynchronous QCK API client for ``asyncio`` applications.
+
+    Exposes the same resources as :class:`QCK`, but every method is a
+    coroutine and retries back off with :func:`asyncio.sleep`, so many
+    calls can run concurrently on one event loop.
+
+    Usage::
+
+        import asyncio
+        from qck import AsyncQCK
+
+        async def main():
+            async with AsyncQCK(api_key="qck_...") as client:
+                links = await asyncio.gather(*(
+                    client.links.get(link_id) for link_id in link_ids
+                ))
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        base_url: str = _DEFAULT_BASE_URL,
+        timeout: int = 30,
+        retries: int = 3,
+        cache: Optional[ResponseCache] = None,
+        rate_limit: Union[float, RateLimiter, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        json_codec: str = "auto",
+        compression: Optional[str] = None,
+        compression_threshold: int = 1024,
+        accept_encoding: Optional[str] = None,
+        models: bool = False,
+    ) -> None:
+        """Initialise the async QCK client.
+
+        Args:
+            api_key: Your QCK API key (starts with ``qck_``).
+            base_url: Override the API base URL. Defaults to the QCK
+                production endpoint.
+            timeout: Request timeout in seconds. Defaults to 30.
+            retries: Maximum number of automatic retries on transient
+                failures (rate limits, timeouts, connection errors).
+                Defaults to 3.
+            cache: Optional :class:`ResponseCache` for GET responses.
+                Disabled by default.
+            rate_limit: Client-side rate limit, either in requests per
+                second or as a :class:`RateLimiter` (which may be shared
+                between clients). Disabled by default.
+            retry_policy: Optional :class:`RetryPolicy` with the back-off
+                strategy, retry budget, and per-call deadline. Defaults
+                to full-jitter back-off without budget or deadline.
+            circuit_breaker: Optional :class:`CircuitBreaker` that fails
+                calls to an unhealthy endpoint group fast with
+                :class:`CircuitOpenError`. Disabled by default.
+            max_connections: Maximum number of concurrent connections in
+                the pool (``None`` for no limit). Defaults to 100.
+            max_keepalive_connections: Maximum number of idle connections
+                kept open for reuse (``None`` for no limit). Defaults to 20.
+            keepalive_expiry: Seconds an idle connection is kept open.
+                Defaults to 5.
+            http2: Use HTTP/2, multiplexing concurrent requests over a few
+                TLS connections. Requires ``pip install qck-sdk[http2]``.
+                Defaults to ``False``.
+            json_codec: JSON backend for request bodies and responses:
+                ``"auto"`` (orjson or msgspec when installed, else the
+                standard library), ``"orjson"``, ``"msgspec"``, or
+                ``"stdlib"``. Defaults to ``"auto"``.
+            compression: Compress JSON request bodies with ``"gzip"`` or
+                ``"zstd"`` (``pip install qck-sdk[zstd]``). Disabled by
+                default.
+            compression_threshold: Minimum JSON body size in bytes that
+                is compressed. Defaults to 1024.
+            accept_encoding: Explicit ``Accept-Encoding`` header for
+                response compression (e.g. ``"zstd, gzip"``). Defaults to
+                every coding ``httpx`` can decode.
+            models: Return responses as the compact, slotted record
+                classes of :mod:`qck.models` (``link.short_url``) instead
+                of dicts. Defaults to ``False``.
+
+        Raises:
+            ValueError: If *api_key* is empty or falsy.
+            ValueError: If *json_codec*, *compression*, or a coding in
+                *accept_encoding* is not supported.
+            ImportError: If *http2* is set but ``h2`` is not installed, or
+                the package needed by *json_codec*, *compression*, or
+                *accept_encoding* is missing.
+        """
+        if not api_key:
+            raise ValueError("api_key is required")
+
+        self._client = AsyncHttpClient(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            retries=retries,
+            cache=cache,
+            rate_limiter=_as_rate_limiter(rate_limit),
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            json_codec=json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            accept_encoding=accept_encoding,
+            models=models,
+        )
+
+        self.links = AsyncLinksResource(self._client)
+        self.analytics = AsyncAnalyticsResource(self._client)
+        self.domains = AsyncDomainsResource(self._client)
+        self.webhooks = AsyncWebhooksResource(self._client)
+        self.journey = AsyncJourneyResource(self._client)
+        self.conversions = AsyncConversionsResource(self._client)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.close()
+
+    async def __aenter__(self) -> "AsyncQCK":
+        """Enter the async context manager, returning the client instance."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit the async context manager, closing the HTTP session."""
+        await self.close()
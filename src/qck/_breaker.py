@@ -0,0 +1,244 @@
+"""Per-endpoint-group circuit breaker.
+
+When the API degrades, every call would otherwise wait out its full
+timeout and all of its retries. A :class:`CircuitBreaker` tracks
+failures separately for each endpoint group — the first path segment,
+e.g. ``/links``, ``/analytics``, ``/journey`` — so an outage of one
+backend service does not block calls to the others:
+
+* **closed** — requests flow normally. Consecutive failures are counted;
+  reaching ``failure_threshold`` opens the circuit.
+* **open** — requests fail immediately with
+  :class:`~qck._errors.CircuitOpenError`, without touching the network,
+  until ``recovery_timeout`` seconds have passed.
+* **half_open** — up to ``half_open_max_calls`` probe requests are let
+  through. If they all succeed the circuit closes; any failure opens it
+  again. Further requests fail with a ``retry_after`` of ``0`` while the
+  probes are in flight.
+
+Failures are network errors and ``5xx`` responses. Client errors such as
+``404`` or ``429`` show the API is up and count as successes. Every
+transition is reported to the optional ``on_state_change`` hook::
+
+    from qck import QCK, CircuitBreaker
+
+    def log_transition(group, old, new):
+        print(f"{group}: {old} -> {new}")
+
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30,
+                             on_state_change=log_transition)
+    client = QCK(api_key="qck_...", circuit_breaker=breaker)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from ._errors import CircuitOpenError, NetworkError, QCKError
+
+StateChangeCallback = Callable[[str, str, str], None]
+"""Hook called as ``(group, old_state, new_state)`` on every transition."""
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    """Mutable state of one endpoint group's circuit."""
+
+    __slots__ = ("state", "failures", "opened_at", "probes", "successes")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+
+
+def _group(path: str) -> str:
+    """Return the endpoint group of *path* (``/links/abc`` -> ``/links``)."""
+    segment = path.split("?", 1)[0].lstrip("/").split("/", 1)[0]
+    return "/" + segment
+
+
+def _is_failure(exc: BaseException) -> bool:
+    """Whether *exc* indicates an unhealthy endpoint."""
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, (httpx.TransportError, NetworkError)):
+        return True
+    return isinstance(exc, QCKError) and exc.status >= 500
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker keyed by endpoint group.
+
+    One instance may be shared between clients (sync and async) so they
+    see the same circuit state.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+        >>> client = QCK(api_key="qck_...", circuit_breaker=breaker)
+        >>> breaker.state("/analytics")
+        'closed'
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        *,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ) -> None:
+        """Create a circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit.
+            recovery_timeout: Seconds an open circuit waits before letting
+                probe requests through.
+            half_open_max_calls: Number of probe requests allowed (and
+                required to succeed) while half-open.
+            on_state_change: Optional ``(group, old_state, new_state)``
+                hook. It runs on the thread that caused the transition and
+                must not raise.
+
+        Raises:
+            ValueError: If *failure_threshold* or *half_open_max_calls* is
+                less than 1, or *recovery_timeout* is negative.
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative")
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, group: str) -> str:
+        """Return the state of *group*'s circuit.
+
+        Args:
+            group: Endpoint group (``"/links"``) or any path within it.
+
+        Returns:
+            ``"closed"``, ``"open"``, or ``"half_open"``.
+        """
+        with self._lock:
+            circuit = self._circuits.get(_group(group))
+            return circuit.state if circuit is not None else CLOSED
+
+    def reset(self) -> None:
+        """Close every circuit and forget all recorded failures."""
+        with self._lock:
+            transitions = [
+                (group, circuit.state, CLOSED)
+                for group, circuit in self._circuits.items()
+                if circuit.state != CLOSED
+            ]
+            self._circuits.clear()
+        self._notify(transitions)
+
+    @contextmanager
+    def guard(self, path: str) -> Iterator[None]:
+        """Admit one request to *path* and record its outcome.
+
+        Args:
+            path: Relative API path of the request.
+
+        A request interrupted by cancellation, ``KeyboardInterrupt``, or
+        ``GeneratorExit`` says nothing about the endpoint's health: its
+        slot is released without recording an outcome.
+
+        Raises:
+            CircuitOpenError: If the path's circuit is open, or half-open
+                with all probe slots taken.
+        """
+        group = _group(path)
+        self._acquire(group)
+        try:
+            yield
+        except Exception as exc:
+            self._record(group, not _is_failure(exc))
+            raise
+        except BaseException:
+            self._release(group)
+            raise
+        self._record(group, True)
+
+    def _acquire(self, group: str) -> None:
+        """Reserve a request slot on *group*'s circuit or raise."""
+        transitions: List[Tuple[str, str, str]] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(group, _Circuit())
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self._recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(group, remaining)
+                self._transition(circuit, group, HALF_OPEN, transitions)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self._half_open_max_calls:
+                    # The in-flight probes decide the state at any moment.
+                    raise CircuitOpenError(group, 0.0)
+                circuit.probes += 1
+        self._notify(transitions)
+
+    def _release(self, group: str) -> None:
+        """Free the slot of an admitted request without recording an outcome."""
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is not None and circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+
+    def _record(self, group: str, success: bool) -> None:
+        """Record the outcome of a request admitted by :meth:`_acquire`."""
+        transitions: List[Tuple[str, str, str]] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(group, _Circuit())
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if not success:
+                    self._transition(circuit, group, OPEN, transitions)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes >= self._half_open_max_calls:
+                        self._transition(circuit, group, CLOSED, transitions)
+            elif success:
+                circuit.failures = 0
+            elif circuit.state == CLOSED:
+                circuit.failures += 1
+                if circuit.failures >= self._failure_threshold:
+                    self._transition(circuit, group, OPEN, transitions)
+        self._notify(transitions)
+
+    @staticmethod
+    def _transition(
+        circuit: _Circuit, group: str, new: str, transitions: List[Tuple[str, str, str]]
+    ) -> None:
+        """Move *circuit* to state *new*; the caller holds the lock."""
+        transitions.append((group, circuit.state, new))
+        circuit.state = new
+        circuit.failures = 0
+        circuit.probes = 0
+        circuit.successes = 0
+        if new == OPEN:
+            circuit.opened_at = time.monotonic()
+
+    def _notify(self, transitions: List[Tuple[str, str, str]]) -> None:
+        """Report *transitions* to the state-change hook, outside the lock."""
+        if self._on_state_change is None:
+            return
+        for group, old, new in transitions:
+            self._on_state_change(group, old, new)
@@ -0,0 +1,465 @@
+"""Opt-in response caching for GET requests.
+
+:class:`ResponseCache` decides *what* is cached and for how long: entries
+are keyed by method, path, and the cleaned query parameters, each path
+gets a TTL (per-path-prefix overrides on top of a default), and any
+``POST``/``PATCH``/``PUT``/``DELETE`` invalidates every cached entry of
+the resource it touched (``PATCH /links/{id}`` drops ``/links``,
+``/links?page=2``, and ``/links/{id}/stats`` alike).
+
+Entries also keep the ``ETag`` / ``Last-Modified`` validators the server
+sent. Once an entry goes stale it is revalidated with a conditional GET
+(``If-None-Match`` / ``If-Modified-Since``); a ``304 Not Modified``
+renews the entry and the cached body is served without downloading or
+decoding it again.
+
+*Where* entries live is pluggable through :class:`CacheBackend`:
+
+* :class:`MemoryCache` — a thread-safe in-process LRU.
+* :class:`DiskCache` — an SQLite file, shared across processes and
+  surviving restarts.
+
+Pass a cache to the client to enable it::
+
+    from qck import QCK, ResponseCache
+
+    cache = ResponseCache(ttl=60, path_ttls={"/domains": 600, "/links": None})
+    client = QCK(api_key="qck_...", cache=cache)
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+_DEFAULT_TTL = 60.0
+_DEFAULT_MAX_ENTRIES = 1024
+
+# Writes to one resource that change what another resource reports.
+# Conversions are ingested through the journey pipeline.
+_RELATED_RESOURCES: Dict[str, Tuple[str, ...]] = {
+    "/journey": ("/conversions",),
+}
+
+
+class CacheEntry:
+    """A cached response body with its expiry time and HTTP validators.
+
+    Attributes:
+        data: The envelope-unwrapped response data.
+        expires_at: Unix timestamp after which the entry is stale.
+        etag: The response ``ETag`` header, if any.
+        last_modified: The response ``Last-Modified`` header, if any.
+    """
+
+    __slots__ = ("data", "expires_at", "etag", "last_modified")
+
+    def __init__(
+        self,
+        data: Any,
+        expires_at: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Create a cache entry.
+
+        Args:
+            data: The envelope-unwrapped response data.
+            expires_at: Unix timestamp after which the entry is stale.
+            etag: The response ``ETag`` header, if any.
+            last_modified: The response ``Last-Modified`` header, if any.
+        """
+        self.data = data
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without contacting the server."""
+        return self.expires_at > time.time()
+
+    def validators(self) -> Dict[str, str]:
+        """Return conditional request headers for revalidating this entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def copy_with(self, data: Any) -> "CacheEntry":
+        """Return a copy of this entry holding *data*."""
+        return CacheEntry(data, self.expires_at, self.etag, self.last_modified)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the entry for storage backends."""
+        return {
+            "data": self.data,
+            "expires_at": self.expires_at,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "CacheEntry":
+        """Rebuild an entry serialised with :meth:`to_dict`."""
+        return cls(
+            raw.get("data"),
+            float(raw.get("expires_at") or 0),
+            raw.get("etag"),
+            raw.get("last_modified"),
+        )
+
+
+class CacheBackend(ABC):
+    """Storage interface for :class:`ResponseCache`.
+
+    Subclass this to keep cached responses somewhere else (Redis,
+    memcached, ...). Implementations must be thread-safe and should
+    bound their own size.
+
+    Attributes:
+        blocking: Whether the backend does blocking I/O. The async
+            client runs calls to blocking backends in a worker thread
+            so they do not stall the event loop.
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry stored under *key*, or ``None``."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store *entry* under *key*, replacing any previous entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under *key*, if any."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove *prefix* itself and every key continuing it with ``/`` or ``?``."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+def _matches_prefix(key: str, prefix: str) -> bool:
+    """Whether *key* is *prefix* or a sub-path / query of it."""
+    if not key.startswith(prefix):
+        return False
+    return len(key) == len(prefix) or key[len(prefix)] in "/?"
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-memory LRU backend.
+
+    Cached data is deep-copied on the way in and out, so callers may
+    mutate returned dicts without corrupting the cache.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        """Create an in-memory cache.
+
+        Args:
+            max_entries: Maximum number of entries; the least recently
+                used entry is evicted beyond this.
+
+        Raises:
+            ValueError: If *max_entries* is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return a copy of the entry under *key*, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        return entry.copy_with(copy.deepcopy(entry.data))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store a copy of *entry*, evicting the least recently used entry if full."""
+        entry = entry.copy_with(copy.deepcopy(entry.data))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove the entry under *key*, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every entry under *prefix*."""
+        with self._lock:
+            for key in [k for k in self._entries if _matches_prefix(k, prefix)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+
+class DiskCache(CacheBackend):
+    """SQLite-backed persistent LRU backend.
+
+    Entries are stored as JSON in a single table, so the file can be
+    shared by several processes and survives restarts. Least recently
+    used entries are evicted beyond *max_entries*. SQLite calls block,
+    so :class:`~qck.AsyncQCK` runs them in a worker thread.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, max_entries: int = 10_000) -> None:
+        """Open (or create) a cache database.
+
+        Args:
+            path: Filesystem path of the SQLite database.
+            max_entries: Maximum number of entries kept on disk.
+
+        Raises:
+            ValueError: If *max_entries* is less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS qck_cache ("
+            " key TEXT PRIMARY KEY,"
+            " entry TEXT NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS qck_cache_accessed ON qck_cache (accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry under *key*, marking it recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT entry FROM qck_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE qck_cache SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CacheEntry.from_dict(json.loads(row[0]))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store *entry*, evicting least recently used rows beyond the limit."""
+        payload = json.dumps(entry.to_dict(), separators=(",", ":"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO qck_cache (key, entry, accessed_at) VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+            self._db.execute(
+                "DELETE FROM qck_cache WHERE key IN ("
+                " SELECT key FROM qck_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove the entry under *key*, if any."""
+        with self._lock:
+            self._db.execute("DELETE FROM qck_cache WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every entry under *prefix*."""
+        n = len(prefix)
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM qck_cache WHERE key = ?"
+                " OR (substr(key, 1, ?) = ? AND substr(key, ? + 1, 1) IN ('/', '?'))",
+                (prefix, n, prefix, n),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM qck_cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """Caching policy for GET responses: keys, TTLs, and invalidation.
+
+    Entries are keyed by method, path, and cleaned query parameters.
+    A write to any path invalidates every cached GET of the same
+    resource (first path segment).
+
+    Example:
+        >>> cache = ResponseCache(ttl=60, path_ttls={"/domains": 600})
+        >>> client = QCK(api_key="qck_...", cache=cache)
+        >>> client.domains.list()  # network
+        >>> client.domains.list()  # served from cache
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttl: Optional[float] = _DEFAULT_TTL,
+        path_ttls: Optional[Mapping[str, Optional[float]]] = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        revalidate: bool = True,
+    ) -> None:
+        """Create a response cache policy.
+
+        Args:
+            backend: Where entries are stored. Defaults to a
+                :class:`MemoryCache` holding *max_entries* entries.
+            ttl: Default freshness lifetime in seconds for every GET
+                path, or ``None`` to cache only paths listed in
+                *path_ttls*.
+            path_ttls: Per-path-prefix TTL overrides, e.g.
+                ``{"/analytics": 30, "/domains": 600, "/links": None}``.
+                The longest matching prefix wins; ``None`` disables
+                caching for that prefix.
+            max_entries: Size bound for the default in-memory backend.
+            revalidate: Keep stale entries that carry an ``ETag`` or
+                ``Last-Modified`` validator and revalidate them with a
+                conditional GET instead of refetching. With a TTL of
+                ``0``, such entries are revalidated on every request.
+        """
+        self.backend = backend if backend is not None else MemoryCache(max_entries)
+        self._ttl = ttl
+        self._revalidate = revalidate
+        # Longest prefix first so the most specific override wins.
+        self._path_ttls = sorted(
+            ((p.rstrip("/") or "/", t) for p, t in (path_ttls or {}).items()),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    # ----- public methods -----
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Return the TTL that applies to *path*, or ``None`` if uncached.
+
+        Args:
+            path: API path (e.g. ``/links/abc``).
+        """
+        for prefix, ttl in self._path_ttls:
+            if prefix == "/" or _matches_prefix(path, prefix):
+                return ttl
+        return self._ttl
+
+    def invalidate(self, path: str) -> None:
+        """Drop every cached entry of the resource *path* belongs to.
+
+        The resource is the first path segment: invalidating
+        ``/links/abc/og-image`` drops all cached ``/links`` responses.
+
+        Args:
+            path: API path that was written to.
+        """
+        resource = self._resource(path)
+        self.backend.delete_prefix(f"GET {resource}")
+        for related in _RELATED_RESOURCES.get(resource, ()):
+            self.backend.delete_prefix(f"GET {related}")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self.backend.clear()
+
+    @staticmethod
+    def key(method: str, path: str, params: Optional[Mapping[str, Any]]) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            params: Cleaned query-string parameters.
+        """
+        if not params:
+            return f"{method} {path}"
+        return f"{method} {path}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Return the usable entry for *key*, or ``None``.
+
+        A usable entry is either fresh or, when revalidation is enabled,
+        stale but carrying validators. Other stale entries are evicted.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        if entry.fresh or (self._revalidate and (entry.etag or entry.last_modified)):
+            return entry
+        self.backend.delete(key)
+        return None
+
+    def store(self, key: str, ttl: float, data: Any, headers: Mapping[str, str]) -> None:
+        """Store *data* under *key* for *ttl* seconds with its validators.
+
+        Args:
+            key: Cache key.
+            ttl: Freshness lifetime in seconds.
+            data: The envelope-unwrapped response data.
+            headers: Response headers carrying ``ETag`` / ``Last-Modified``.
+        """
+        etag = headers.get("etag") if self._revalidate else None
+        last_modified = headers.get("last-modified") if self._revalidate else None
+        if ttl > 0 or etag or last_modified:
+            self.backend.set(key, CacheEntry(data, time.time() + ttl, etag, last_modified))
+
+    def renew(self, key: str, ttl: float, entry: CacheEntry, headers: Mapping[str, str]) -> None:
+        """Extend a revalidated entry after a ``304 Not Modified``.
+
+        Args:
+            key: Cache key.
+            ttl: Freshness lifetime in seconds.
+            entry: The entry that was revalidated.
+            headers: The 304 response headers; updated validators, if
+                present, replace the stored ones.
+        """
+        entry.expires_at = time.time() + ttl
+        entry.etag = headers.get("etag") or entry.etag
+        entry.last_modified = headers.get("last-modified") or entry.last_modified
+        self.backend.set(key, entry)
+
+    @property
+    def blocking(self) -> bool:
+        """Whether the backend does blocking I/O (see :attr:`CacheBackend.blocking`)."""
+        return self.backend.blocking
+
+    # ----- internals -----
+
+    @staticmethod
+    def _resource(path: str) -> str:
+        """Return the first segment of *path* (``/links/abc`` -> ``/links``)."""
+        return "/" + path.lstrip("/").split("/", 1)[0]
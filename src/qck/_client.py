@@ -1,48 +1,130 @@
-"""Low-level HTTP client with authentication, retries, and error mapping.
+"""Low-level HTTP clients with authentication, retries, and error mapping.
 
-This module provides the :class:`HttpClient` class, which is the sole
-transport layer used by every resource class in the SDK. It handles:
+This module provides the :class:`HttpClient` and :class:`AsyncHttpClient`
+classes, which are the sole transport layers used by the resource classes
+in the SDK. Both share request preparation and response handling through
+:class:`_BaseHttpClient` and differ only in how they send requests and
+sleep between retries. They handle:
 
 * Automatic ``X-API-Key`` header injection for authentication.
-* Exponential back-off retries on transient failures (rate limits,
-  connection errors, and timeouts).
+* Jittered exponential back-off retries on transient failures (rate
+  limits, connection errors, and timeouts), bounded by an optional
+  :class:`~qck._retry.RetryPolicy` budget and per-call deadline.
 * Mapping HTTP error responses to typed SDK exceptions
   (:class:`~qck._errors.ValidationError`, :class:`~qck._errors.AuthenticationError`,
   :class:`~qck._errors.NotFoundError`, :class:`~qck._errors.RateLimitError`).
+* JSON request encoding and response decoding through the fastest
+  available codec (:mod:`qck._codec`), with optional gzip/zstd
+  compression of large request bodies (:mod:`qck._compression`).
 * Unwrapping the standard ``{"success", "data", "error", "meta"}`` API
   envelope, including flat middleware errors
   (``{"success": false, "error": "CODE", "message": "..."}``) and
   pagination metadata carried in ``meta``.
-
-End users should not need to instantiate :class:`HttpClient` directly;
-the :class:`~qck.QCK` constructor creates one internally.
+* Optional GET response caching through a
+  :class:`~qck._cache.ResponseCache`, invalidated by writes to the same
+  resource.
+* Optional client-side pacing through a shared
+  :class:`~qck._ratelimit.RateLimiter`, which also turns a ``429`` into a
+  pause for every in-flight sender.
+* An optional per-endpoint-group :class:`~qck._breaker.CircuitBreaker`
+  that fails fast while an endpoint is down.
+
+End users should not need to instantiate either client directly; the
+:class:`~qck.QCK` and :class:`~qck.AsyncQCK` constructors create one
+internally.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import importlib.util
 import time
-from typing import Any, Dict, Optional, TypeVar
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import httpx
 
+from ._breaker import CircuitBreaker
+from ._cache import CacheEntry, ResponseCache
+from ._codec import get_codec
+from ._compression import check_accept_encoding, get_compressor
 from ._errors import (
     AuthenticationError,
+    CircuitOpenError,
+    NetworkError,
     NotFoundError,
     QCKError,
     RateLimitError,
     ValidationError,
 )
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
+from .models import Model, decode
 
 T = TypeVar("T")
 
+RequestContent = Union[bytes, Iterable[bytes], Iterable[memoryview]]
+"""Raw request body for :class:`HttpClient`: bytes or a re-iterable of chunks.
+
+Chunks may be :class:`memoryview` slices (see :class:`~qck._upload.ChunkedBody`);
+httpx writes them through the buffer protocol without copying.
+"""
+AsyncRequestContent = Union[bytes, AsyncIterable[bytes], AsyncIterable[memoryview]]
+"""Raw request body for :class:`AsyncHttpClient`."""
+
 _DEFAULT_BASE_URL = "https://qck.sh/public-api/v1"
 _DEFAULT_TIMEOUT = 30
 _DEFAULT_RETRIES = 3
 _MAX_RETRY_DELAY = 120
-
-
-class HttpClient:
-    """HTTP client that handles auth, retries, and error mapping for the QCK API."""
+# Connection pool defaults (the same as httpx's own).
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+_DEFAULT_KEEPALIVE_EXPIRY = 5.0
+_DEFAULT_COMPRESSION_THRESHOLD = 1024
+# Smallest per-attempt timeout used when a call's deadline is nearly spent.
+_MIN_ATTEMPT_TIMEOUT = 0.001
+
+# Returned by ``_handle_response`` for ``304 Not Modified`` so the caller can
+# serve the revalidated cache entry.
+_NOT_MODIFIED = object()
+
+
+def _as_sdk_error(exc: Exception) -> Exception:
+    """Wrap an ``httpx`` transport error in :class:`~qck._errors.NetworkError`.
+
+    Other exceptions are returned unchanged. The wrapper's ``__cause__``
+    is the original error.
+    """
+    if not isinstance(exc, httpx.TransportError):
+        return exc
+    if isinstance(exc, httpx.TimeoutException):
+        error = NetworkError(f"Request timed out: {exc}", code="TIMEOUT")
+    else:
+        error = NetworkError(f"Network error: {exc}")
+    error.__cause__ = exc
+    return error
+
+
+class _BaseHttpClient:
+    """Shared configuration, request preparation, and response handling.
+
+    Subclasses provide the transport (``httpx.Client`` or
+    ``httpx.AsyncClient``) and the retry loop; everything that does not
+    depend on blocking vs. non-blocking I/O lives here so both clients
+    behave identically.
+    """
 
     def __init__(
         self,
@@ -50,8 +132,17 @@ class HttpClient:
         base_url: str = _DEFAULT_BASE_URL,
         timeout: int = _DEFAULT_TIMEOUT,
         retries: int = _DEFAULT_RETRIES,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        json_codec: str = "auto",
+        compression: Optional[str] = None,
+        compression_threshold: int = _DEFAULT_COMPRESSION_THRESHOLD,
+        accept_encoding: Optional[str] = None,
+        models: bool = False,
     ) -> None:
-        """Create a new HTTP client.
+        """Store the client configuration.
 
         Args:
             api_key: QCK API key used for the ``X-API-Key`` header.
@@ -60,154 +151,121 @@ class HttpClient:
             timeout: Request timeout in seconds.
             retries: Maximum number of retry attempts for transient
                 failures.
+            cache: Optional GET response cache.
+            rate_limiter: Optional client-side rate limiter.
+            retry_policy: Back-off strategy, retry budget, and deadline.
+                Defaults to full-jitter back-off without a budget or
+                deadline.
+            circuit_breaker: Optional per-endpoint-group circuit breaker.
+            json_codec: JSON backend — ``"auto"``, ``"orjson"``,
+                ``"msgspec"``, or ``"stdlib"``.
+            compression: Request body compression, ``"gzip"`` or
+                ``"zstd"``; ``None`` disables it.
+            compression_threshold: Minimum JSON body size in bytes that is
+                compressed.
+            accept_encoding: Explicit ``Accept-Encoding`` header; ``None``
+                keeps the ``httpx`` default.
+            models: Decode responses into the slotted record classes of
+                :mod:`qck.models` instead of dicts.
+
+        Raises:
+            ValueError: If *json_codec*, *compression*, or a coding in
+                *accept_encoding* is unknown.
+            ImportError: If a requested backend is not installed.
         """
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._retries = retries
-        self._client = httpx.Client(
-            timeout=httpx.Timeout(timeout),
-            headers={
-                "X-API-Key": api_key,
-                "Accept": "application/json",
-            },
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._circuit_breaker = circuit_breaker
+        self._codec = get_codec(json_codec)
+        self._compressor = get_compressor(compression, compression_threshold)
+        self._accept_encoding = (
+            check_accept_encoding(accept_encoding) if accept_encoding is not None else None
         )
+        self.models = models
 
-    def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self._client.close()
-
-    def __enter__(self) -> "HttpClient":
-        """Enter the context manager, returning the client instance."""
-        return self
-
-    def __exit__(self, *args: Any) -> None:
-        """Exit the context manager, closing the HTTP session."""
-        self.close()
-
-    # ----- public methods -----
-
-    def get(
-        self,
-        path: str,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """Send a GET request.
+    def decode(self, model: Model, data: Any) -> Any:
+        """Convert response *data* to records when ``models`` is enabled.
 
         Args:
-            path: API path (e.g. ``/links``).
-            params: Optional query-string parameters.
+            model: The record class, or an :class:`~qck.models.Envelope`
+                for responses wrapping records.
+            data: Parsed response data.
 
         Returns:
-            Parsed JSON response data (envelope unwrapped).
-
-        Raises:
-            QCKError: On any API error response.
+            *data* decoded with :func:`qck.models.decode`, or unchanged
+            when ``models`` is off.
         """
-        return self._request("GET", path, params=params)
-
-    def post(
-        self,
-        path: str,
-        body: Any = None,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
-    ) -> Any:
-        """Send a POST request with an optional JSON body.
-
-        Args:
-            path: API path (e.g. ``/links``).
-            body: Request body serialised as JSON.
-            params: Optional query-string parameters.
-            headers: Optional extra HTTP headers.
-
-        Returns:
-            Parsed JSON response data (envelope unwrapped).
+        if not self.models:
+            return data
+        return decode(model, data)
 
-        Raises:
-            QCKError: On any API error response.
-        """
-        return self._request("POST", path, json=body, params=params, headers=headers)
+    def backoff(self, attempt: int, previous: float) -> float:
+        """Back-off before a caller re-sends a failed request.
 
-    def patch(
-        self,
-        path: str,
-        body: Any = None,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """Send a PATCH request with an optional JSON body.
+        Bulk helpers that retry items themselves use this so their
+        pauses follow the client's :class:`~qck.RetryPolicy`.
 
         Args:
-            path: API path (e.g. ``/links/{id}``).
-            body: Fields to update, serialised as JSON.
-            params: Optional query-string parameters.
+            attempt: Zero-based index of the failed attempt.
+            previous: The previous back-off delay, ``0`` before the first.
 
         Returns:
-            Parsed JSON response data (envelope unwrapped).
-
-        Raises:
-            QCKError: On any API error response.
+            Seconds to sleep before re-sending.
         """
-        return self._request("PATCH", path, json=body, params=params)
-
-    def put(
-        self,
-        path: str,
-        body: Any = None,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-        content: Optional[bytes] = None,
-        headers: Optional[Dict[str, str]] = None,
-    ) -> Any:
-        """Send a PUT request with a JSON body or raw bytes.
+        return self._retry_policy.delay(attempt, previous)
 
-        When *content* is provided, it is sent as the raw request body
-        and *body* is ignored. This is used for binary uploads (e.g.
-        OG images).
+    @staticmethod
+    def _transport_options(
+        max_connections: Optional[int],
+        max_keepalive_connections: Optional[int],
+        keepalive_expiry: Optional[float],
+        http2: bool,
+    ) -> Dict[str, Any]:
+        """Build the connection-pool keyword arguments for ``httpx``.
 
         Args:
-            path: API path (e.g. ``/links/{id}/og-image``).
-            body: Request body serialised as JSON (ignored when
-                *content* is set).
-            params: Optional query-string parameters.
-            content: Raw bytes to send as the request body.
-            headers: Extra headers merged into the request (e.g.
-                ``Content-Type`` for binary uploads).
+            max_connections: Maximum concurrent connections (``None`` for
+                no limit).
+            max_keepalive_connections: Maximum idle connections kept open
+                (``None`` for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Negotiate HTTP/2, multiplexing concurrent requests over
+                a few connections.
 
         Returns:
-            Parsed JSON response data (envelope unwrapped).
+            ``limits`` and ``http2`` arguments for ``httpx.Client`` /
+            ``httpx.AsyncClient``.
 
         Raises:
-            QCKError: On any API error response.
+            ImportError: If *http2* is requested but the ``h2`` package is
+                not installed.
         """
-        return self._request(
-            "PUT", path, json=body, params=params, content=content, headers=headers,
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "http2=True requires the 'h2' package; "
+                "install it with `pip install qck-sdk[http2]`"
+            )
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
-
-    def delete(
-        self,
-        path: str,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-    ) -> Any:
-        """Send a DELETE request.
-
-        Args:
-            path: API path (e.g. ``/links/{id}``).
-            params: Optional query-string parameters.
-
-        Returns:
-            ``None`` for 204 responses, or parsed JSON data otherwise.
-
-        Raises:
-            QCKError: On any API error response.
-        """
-        return self._request("DELETE", path, params=params)
-
-    # ----- internals -----
+        return {"limits": limits, "http2": http2}
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Return the headers sent with every request."""
+        headers = {
+            "X-API-Key": self._api_key,
+            "Accept": "application/json",
+        }
+        if self._accept_encoding is not None:
+            headers["Accept-Encoding"] = self._accept_encoding
+        return headers
 
     def _build_url(self, path: str) -> str:
         """Combine the base URL with an API path.
@@ -248,73 +306,220 @@ class HttpClient:
                 cleaned[k] = str(v)
         return cleaned or None
 
-    def _request(
+    @staticmethod
+    def _is_idempotent(method: str, headers: Optional[Dict[str, str]]) -> bool:
+        """Whether a request may be safely retried after a network error.
+
+        Args:
+            method: HTTP method.
+            headers: Extra request headers.
+
+        Returns:
+            ``True`` for ``GET`` requests and requests carrying an
+            ``X-Idempotency-Key`` header.
+        """
+        return method == "GET" or bool(headers and headers.get("X-Idempotency-Key"))
+
+    def _cache_lookup(
+        self, method: str, path: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[str], Optional[CacheEntry]]:
+        """Look up a cacheable GET in the response cache.
+
+        Args:
+            method: HTTP method.
+            path: Relative API path.
+            params: Cleaned query-string parameters.
+
+        Returns:
+            ``(key, entry)`` — *key* is ``None`` when the request is not
+            cacheable; *entry* is the cached response, if any. A stale
+            entry is only returned when it can be revalidated.
+        """
+        if self._cache is None or method != "GET" or self._cache.ttl_for(path) is None:
+            return None, None
+        key = self._cache.key(method, path, params)
+        return key, self._cache.lookup(key)
+
+    @staticmethod
+    def _conditional_headers(
+        cached: Optional[CacheEntry], headers: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """Add revalidation headers for a stale cached entry.
+
+        Caller-supplied headers take precedence over the cached validators.
+        """
+        if cached is None:
+            return headers
+        validators = cached.validators()
+        if not validators:
+            return headers
+        return {**validators, **(headers or {})}
+
+    def _cache_store(
         self,
-        method: str,
+        key: Optional[str],
         path: str,
-        *,
-        json: Any = None,
-        params: Optional[Dict[str, Any]] = None,
-        content: Optional[bytes] = None,
-        headers: Optional[Dict[str, str]] = None,
+        data: Any,
+        resp_headers: httpx.Headers,
+        cached: Optional[CacheEntry],
     ) -> Any:
-        """Execute an HTTP request with automatic retries.
+        """Store a successful GET response under *key* and return its data.
 
-        Rate limits (:class:`~qck._errors.RateLimitError`, honouring
-        ``Retry-After``) are retried for every request. Network errors
-        (``httpx.TimeoutException``, ``httpx.ConnectError``) are retried
-        only for idempotent requests — ``GET`` requests, or requests
-        carrying an ``X-Idempotency-Key`` header. A timed-out plain
-        ``POST`` is *not* retried, because the server may already have
-        processed it.
+        A ``304 Not Modified`` answer renews *cached* and returns its data
+        instead. No-op (returning *data*) when the request is uncacheable.
+
+        Raises:
+            QCKError: On a ``304`` with no cached entry to serve, e.g. when
+                the caller sent its own ``If-None-Match`` header.
+        """
+        if data is _NOT_MODIFIED:
+            if self._cache is None or key is None or cached is None:
+                raise QCKError(
+                    "Server answered 304 Not Modified but no cached response is available",
+                    304,
+                    "NOT_MODIFIED",
+                )
+            ttl = self._cache.ttl_for(path)
+            if ttl is not None:
+                self._cache.renew(key, ttl, cached, resp_headers)
+            return cached.data
+        if self._cache is None or key is None:
+            return data
+        ttl = self._cache.ttl_for(path)
+        if ttl is not None:
+            self._cache.store(key, ttl, data, resp_headers)
+        return data
+
+    def _cache_invalidate(self, method: str, path: str) -> None:
+        """Invalidate cached responses of the resource a write touched."""
+        if self._cache is not None and method != "GET":
+            self._cache.invalidate(path)
+
+    def _encode_json(
+        self, json: Any, headers: Optional[Dict[str, str]]
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """Serialise (and optionally compress) a JSON body.
 
         Args:
-            method: HTTP method (``GET``, ``POST``, etc.).
-            path: Relative API path.
-            json: Body to serialise as JSON (ignored when *content*
-                is provided).
-            params: Query-string parameters.
-            content: Raw bytes body (for binary uploads).
+            json: Value to send as JSON.
             headers: Extra request headers.
 
         Returns:
-            Parsed and envelope-unwrapped response data.
+            ``(body, headers)`` to send. The body gets a ``Content-Type``
+            header and, when compressed, a ``Content-Encoding`` header,
+            unless the caller set them.
+        """
+        body = self._codec.dumps(json)
+        extra = {"Content-Type": "application/json"}
+        if self._compressor is not None:
+            compressed = self._compressor.compress(body)
+            if compressed is not None:
+                body = compressed
+                extra["Content-Encoding"] = self._compressor.encoding
+        return body, {**extra, **(headers or {})}
+
+    def _circuit(self, path: str) -> ContextManager[None]:
+        """Guard one attempt with the circuit breaker, if configured.
 
         Raises:
-            RateLimitError: If rate-limited after all retries exhausted.
-            QCKError: On non-retryable API errors.
+            CircuitOpenError: On entry, if the path's circuit is open.
         """
-        url = self._build_url(path)
-        clean = self._clean_params(params)
-        idempotent = method == "GET" or bool(headers and headers.get("X-Idempotency-Key"))
-        last_exc: Optional[Exception] = None
+        if self._circuit_breaker is None:
+            return contextlib.nullcontext()
+        return self._circuit_breaker.guard(path)
 
-        for attempt in range(self._retries + 1):
-            try:
-                resp = self._client.request(
-                    method,
-                    url,
-                    json=json if content is None else None,
-                    content=content,
-                    params=clean,
-                    headers=headers,
-                )
-                return self._handle_response(resp)
-            except (RateLimitError, httpx.TimeoutException, httpx.ConnectError) as exc:
-                last_exc = exc
-                retryable = isinstance(exc, RateLimitError) or idempotent
-                if not retryable or attempt >= self._retries:
-                    raise
-                delay = self._retry_delay(exc, attempt)
-                time.sleep(delay)
+    def _throttle(self, deadline: Optional[float]) -> float:
+        """Reserve a rate-limiter slot, returning seconds to wait first.
 
-        raise last_exc  # type: ignore[misc]
+        Args:
+            deadline: The call's absolute deadline, if any.
+
+        Raises:
+            RateLimitError: If the limiter's wait would not end before
+                *deadline*. No token is taken and no request is sent.
+        """
+        if self._rate_limiter is None:
+            return 0.0
+        wait = self._rate_limiter.try_reserve(self._retry_policy.remaining(deadline))
+        if wait is None:
+            raise RateLimitError(
+                message="Client-side rate limit wait would exceed the request deadline",
+                retry_after=0,
+                code="CLIENT_RATE_LIMITED",
+            )
+        return wait
+
+    def _observe_rate_limit(self, resp: httpx.Response) -> None:
+        """Feed non-429 response headers to the rate limiter."""
+        if self._rate_limiter is not None and resp.status_code != 429:
+            self._rate_limiter.observe(resp.headers)
+
+    def _is_transient(self, exc: Exception) -> bool:
+        """Whether *exc* may succeed on a retry.
+
+        Rate limits, timeouts, connection failures, and the retry
+        policy's ``retry_statuses`` (``502``/``503``/``504`` by default)
+        are transient. An open circuit is not: retrying it immediately
+        would only be rejected again.
+        """
+        if isinstance(exc, (RateLimitError, httpx.TimeoutException, httpx.ConnectError)):
+            return True
+        if isinstance(exc, CircuitOpenError):
+            return False
+        return isinstance(exc, QCKError) and exc.status in self._retry_policy.retry_statuses
+
+    def _next_retry(
+        self,
+        exc: Exception,
+        attempt: int,
+        previous: float,
+        idempotent: bool,
+        deadline: Optional[float],
+    ) -> Optional[float]:
+        """Decide whether and when to retry after a transient failure.
+
+        A :class:`~qck._errors.RateLimitError` is reported to the rate
+        limiter (if any) even when no retry follows, so other senders
+        pause too.
+
+        Args:
+            exc: The exception raised by the failed attempt.
+            attempt: Zero-based attempt counter.
+            previous: The previous back-off delay, ``0`` before the first.
+            idempotent: Whether the request may be retried after a
+                network error.
+            deadline: The call's absolute deadline, if any.
+
+        Returns:
+            Seconds to sleep before retrying, or ``None`` to give up
+            because the error is not transient or not retryable for this
+            request, the attempts are used up, the retry would overrun
+            *deadline*, or the retry budget is exhausted.
+        """
+        if not self._is_transient(exc):
+            return None
+        delay = self._retry_delay(exc, attempt, previous)
+        retryable = isinstance(exc, RateLimitError) or idempotent
+        if not retryable or attempt >= self._retries:
+            return None
+        if not self._retry_policy.allow_retry(deadline, delay):
+            return None
+        return delay
+
+    def _attempt_timeout(self, deadline: Optional[float]) -> Any:
+        """Per-attempt ``httpx`` timeout, shortened to fit *deadline*."""
+        remaining = self._retry_policy.remaining(deadline)
+        if remaining is None:
+            return httpx.USE_CLIENT_DEFAULT
+        return max(_MIN_ATTEMPT_TIMEOUT, min(float(self._timeout), remaining))
 
     def _handle_response(self, resp: httpx.Response) -> Any:
         """Process an HTTP response, raising on errors.
 
         Handles, in order:
 
+        * **304** — returns the ``_NOT_MODIFIED`` sentinel so a
+          revalidated cache entry can be served.
         * **429** — raises :class:`~qck._errors.RateLimitError` with the
           ``Retry-After`` header and the API's message/code when present.
         * **Empty body** — for 204 / zero-length bodies, raises a typed
@@ -338,13 +543,16 @@ class HttpClient:
             RateLimitError: On HTTP 429 responses.
             QCKError: On error responses or undecodable bodies.
         """
+        if resp.status_code == 304:
+            return _NOT_MODIFIED
+
         if resp.status_code == 429:
             retry_after = int(resp.headers.get("Retry-After", "60"))
             retry_after = min(retry_after, _MAX_RETRY_DELAY)
             message = "Rate limit exceeded"
             code = "RATE_LIMIT_EXCEEDED"
             try:
-                body = resp.json()
+                body = self._codec.loads(resp.content)
             except Exception:
                 body = None
             if isinstance(body, dict):
@@ -366,7 +574,7 @@ class HttpClient:
             return None
 
         try:
-            body = resp.json()
+            body = self._codec.loads(resp.content)
         except Exception as exc:
             if resp.status_code >= 400:
                 self._raise_error(
@@ -446,23 +654,768 @@ class HttpClient:
             raise NotFoundError(message, code=code)
         raise QCKError(message, status, code)
 
-    @staticmethod
-    def _retry_delay(exc: Exception, attempt: int) -> float:
+    def _retry_delay(self, exc: Exception, attempt: int, previous: float) -> float:
         """Calculate the delay before the next retry attempt.
 
         For :class:`~qck._errors.RateLimitError`, the ``Retry-After``
-        header value is used (capped at :data:`_MAX_RETRY_DELAY`).
-        For other transient errors, exponential back-off is applied
-        (``2 ** attempt``, capped at 10 seconds).
+        header value is used (capped at :data:`_MAX_RETRY_DELAY`). With a
+        rate limiter, the ``429`` instead pauses every sender on the
+        limiter and the retry waits for its token, so ``0`` is returned.
+        For other transient errors, the retry policy's back-off strategy
+        applies (full jitter up to 10 seconds by default).
 
         Args:
             exc: The exception that triggered the retry.
             attempt: Zero-based attempt counter.
+            previous: The previous back-off delay, ``0`` before the first.
 
         Returns:
             Number of seconds to sleep before retrying.
         """
         if isinstance(exc, RateLimitError):
-            return min(exc.retry_after, _MAX_RETRY_DELAY)
-        base = min(2**attempt, 10)
-        return float(base)
+            retry_after = min(exc.retry_after, _MAX_RETRY_DELAY)
+            if self._rate_limiter is not None:
+                self._rate_limiter.backoff(retry_after)
+                return 0.0
+            return float(retry_after)
+        return self._retry_policy.delay(attempt, previous)
+
+
+class HttpClient(_BaseHttpClient):
+    """HTTP client that handles auth, retries, and error mapping for the QCK API."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = _DEFAULT_BASE_URL,
+        timeout: int = _DEFAULT_TIMEOUT,
+        retries: int = _DEFAULT_RETRIES,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_connections: Optional[int] = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = _DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        json_codec: str = "auto",
+        compression: Optional[str] = None,
+        compression_threshold: int = _DEFAULT_COMPRESSION_THRESHOLD,
+        accept_encoding: Optional[str] = None,
+        models: bool = False,
+    ) -> None:
+        """Create a new HTTP client.
+
+        Args:
+            api_key: QCK API key used for the ``X-API-Key`` header.
+            base_url: API base URL. A trailing slash is stripped
+                automatically.
+            timeout: Request timeout in seconds.
+            retries: Maximum number of retry attempts for transient
+                failures.
+            cache: Optional GET response cache. Writes invalidate
+                cached responses of the resource they touch.
+            rate_limiter: Optional limiter that paces requests before
+                they are sent.
+            retry_policy: Back-off strategy, retry budget, and deadline.
+            circuit_breaker: Optional breaker that fails calls to an
+                unhealthy endpoint group fast.
+            max_connections: Connection pool size (``None`` for no limit).
+            max_keepalive_connections: Idle connections kept open for
+                reuse (``None`` for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Use HTTP/2 (requires the ``http2`` extra).
+            json_codec: JSON backend — ``"auto"`` picks orjson or
+                msgspec when installed; ``"stdlib"`` forces :mod:`json`.
+            compression: Compress JSON request bodies with ``"gzip"`` or
+                ``"zstd"``; ``None`` disables it.
+            compression_threshold: Minimum body size in bytes to compress.
+            accept_encoding: Explicit ``Accept-Encoding`` header.
+            models: Decode responses into :mod:`qck.models` records.
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            timeout,
+            retries,
+            cache,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker,
+            json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            accept_encoding=accept_encoding,
+            models=models,
+        )
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(timeout),
+            headers=self._default_headers(),
+            **self._transport_options(
+                max_connections, max_keepalive_connections, keepalive_expiry, http2
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP client."""
+        self._client.close()
+
+    def __enter__(self) -> "HttpClient":
+        """Enter the context manager, returning the client instance."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the context manager, closing the HTTP session."""
+        self.close()
+
+    # ----- public methods -----
+
+    def get(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
+    ) -> Any:
+        """Send a GET request.
+
+        Args:
+            path: API path (e.g. ``/links``).
+            params: Optional query-string parameters.
+            cache: ``False`` bypasses the response cache for this call:
+                the response is neither served from nor stored in it.
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return self._request("GET", path, params=params, cache=cache)
+
+    def post(
+        self,
+        path: str,
+        body: Any = None,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a POST request with an optional JSON body.
+
+        Args:
+            path: API path (e.g. ``/links``).
+            body: Request body serialised as JSON.
+            params: Optional query-string parameters.
+            headers: Optional extra HTTP headers.
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return self._request("POST", path, json=body, params=params, headers=headers)
+
+    def patch(
+        self,
+        path: str,
+        body: Any = None,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a PATCH request with an optional JSON body.
+
+        Args:
+            path: API path (e.g. ``/links/{id}``).
+            body: Fields to update, serialised as JSON.
+            params: Optional query-string parameters.
+            headers: Optional extra HTTP headers.
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return self._request("PATCH", path, json=body, params=params, headers=headers)
+
+    def put(
+        self,
+        path: str,
+        body: Any = None,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[RequestContent] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a PUT request with a JSON body or raw bytes.
+
+        When *content* is provided, it is sent as the raw request body
+        and *body* is ignored. This is used for binary uploads (e.g.
+        OG images).
+
+        Args:
+            path: API path (e.g. ``/links/{id}/og-image``).
+            body: Request body serialised as JSON (ignored when
+                *content* is set).
+            params: Optional query-string parameters.
+            content: Raw request body — bytes, or a re-iterable of byte
+                chunks that is streamed.
+            headers: Extra headers merged into the request (e.g.
+                ``Content-Type`` for binary uploads).
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return self._request(
+            "PUT", path, json=body, params=params, content=content, headers=headers,
+        )
+
+    def delete(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a DELETE request.
+
+        Args:
+            path: API path (e.g. ``/links/{id}``).
+            params: Optional query-string parameters.
+            headers: Optional extra HTTP headers.
+
+        Returns:
+            ``None`` for 204 responses, or parsed JSON data otherwise.
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return self._request("DELETE", path, params=params, headers=headers)
+
+    # ----- internals -----
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[RequestContent] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cache: bool = True,
+    ) -> Any:
+        """Execute an HTTP request with automatic retries.
+
+        Rate limits (:class:`~qck._errors.RateLimitError`, honouring
+        ``Retry-After``) are retried for every request. Network errors
+        (``httpx.TimeoutException``, ``httpx.ConnectError``) and the retry
+        policy's ``retry_statuses`` (``502``/``503``/``504`` by default)
+        are retried only for idempotent requests — ``GET`` requests, or
+        requests carrying an ``X-Idempotency-Key`` header. A timed-out
+        plain ``POST`` is *not* retried, because the server may already
+        have processed it. A transport failure that ends the call is
+        raised as :class:`~qck._errors.NetworkError`. With a rate limiter,
+        every attempt first waits for a token, and a ``429`` pauses all
+        senders sharing the limiter; if the wait would run past the retry
+        policy's deadline, the call fails without taking a token. The
+        retry policy's budget and deadline can end retries early, and an
+        open circuit breaker fails the call without sending it.
+
+        When a response cache is configured, fresh cached GET responses
+        are returned without a request, stale entries carrying an
+        ``ETag`` / ``Last-Modified`` are revalidated with a conditional
+        GET (a ``304`` serves the cached data), successful GETs are
+        stored, and any other method invalidates the cached resource it
+        touched. ``cache=False`` skips the lookup and the store for one
+        GET.
+
+        Args:
+            method: HTTP method (``GET``, ``POST``, etc.).
+            path: Relative API path.
+            json: Body to serialise as JSON (ignored when *content*
+                is provided).
+            params: Query-string parameters.
+            content: Raw body for binary uploads (bytes or a
+                re-iterable of chunks).
+            headers: Extra request headers.
+            cache: Whether a GET may be served from and stored in the
+                response cache.
+
+        Returns:
+            Parsed and envelope-unwrapped response data.
+
+        Raises:
+            RateLimitError: If rate-limited after all retries exhausted, or
+                if the rate limiter cannot admit the request before the
+                deadline (code ``"CLIENT_RATE_LIMITED"``).
+            CircuitOpenError: If the circuit breaker rejects the call.
+            NetworkError: If the request failed without a response.
+            QCKError: On non-retryable API errors.
+        """
+        clean = self._clean_params(params)
+        cache_key, cached = self._cache_lookup(method, path, clean) if cache else (None, None)
+        if cached is not None and cached.fresh:
+            return cached.data
+        headers = self._conditional_headers(cached, headers)
+        try:
+            data, resp_headers = self._send(
+                method, path, json=json, params=clean, content=content, headers=headers
+            )
+        finally:
+            self._cache_invalidate(method, path)
+        return self._cache_store(cache_key, path, data, resp_headers, cached)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any,
+        params: Optional[Dict[str, Any]],
+        content: Optional[RequestContent],
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[Any, httpx.Headers]:
+        """Send one logical request, retrying transient failures.
+
+        Args:
+            method: HTTP method.
+            path: Relative API path.
+            json: Body to serialise as JSON (ignored when *content*
+                is provided).
+            params: Cleaned query-string parameters.
+            content: Raw body (bytes or a re-iterable of chunks).
+            headers: Extra request headers.
+
+        Returns:
+            ``(data, headers)`` — the parsed and envelope-unwrapped response
+            data and the final response headers.
+        """
+        url = self._build_url(path)
+        if content is None and json is not None:
+            content, headers = self._encode_json(json, headers)
+        idempotent = self._is_idempotent(method, headers)
+        deadline = self._retry_policy.start()
+        delay = 0.0
+        last_exc: Optional[Exception] = None
+
+        for attempt in range(self._retries + 1):
+            try:
+                wait = self._throttle(deadline)
+            except RateLimitError:
+                if last_exc is not None:
+                    raise last_exc from last_exc.__cause__
+                raise
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                with self._circuit(path):
+                    resp = self._client.request(
+                        method,
+                        url,
+                        # httpx's annotation says bytes, but memoryview chunks
+                        # are written through the buffer protocol unchanged.
+                        content=cast("Optional[Union[bytes, Iterable[bytes]]]", content),
+                        params=params,
+                        headers=headers,
+                        timeout=self._attempt_timeout(deadline),
+                    )
+                    self._observe_rate_limit(resp)
+                    return self._handle_response(resp), resp.headers
+            except (QCKError, httpx.TransportError) as exc:
+                error = _as_sdk_error(exc)
+                next_delay = self._next_retry(exc, attempt, delay, idempotent, deadline)
+                if next_delay is None:
+                    if error is exc:
+                        raise
+                    raise error from exc
+                last_exc = error
+                delay = next_delay
+                if delay > 0:
+                    time.sleep(delay)
+
+        raise last_exc  # type: ignore[misc]
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """Asynchronous counterpart of :class:`HttpClient` built on ``httpx.AsyncClient``.
+
+    Requests are awaited rather than blocking, and retry back-off uses
+    :func:`asyncio.sleep`, so many calls can be in flight on a single
+    event loop. Envelope unwrapping and error mapping are shared with
+    :class:`HttpClient`.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = _DEFAULT_BASE_URL,
+        timeout: int = _DEFAULT_TIMEOUT,
+        retries: int = _DEFAULT_RETRIES,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        max_connections: Optional[int] = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = _DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        json_codec: str = "auto",
+        compression: Optional[str] = None,
+        compression_threshold: int = _DEFAULT_COMPRESSION_THRESHOLD,
+        accept_encoding: Optional[str] = None,
+        models: bool = False,
+    ) -> None:
+        """Create a new asynchronous HTTP client.
+
+        Args:
+            api_key: QCK API key used for the ``X-API-Key`` header.
+            base_url: API base URL. A trailing slash is stripped
+                automatically.
+            timeout: Request timeout in seconds.
+            retries: Maximum number of retry attempts for transient
+                failures.
+            cache: Optional GET response cache. Writes invalidate
+                cached responses of the resource they touch.
+            rate_limiter: Optional limiter that paces requests before
+                they are sent.
+            retry_policy: Back-off strategy, retry budget, and deadline.
+            circuit_breaker: Optional breaker that fails calls to an
+                unhealthy endpoint group fast.
+            max_connections: Connection pool size (``None`` for no limit).
+            max_keepalive_connections: Idle connections kept open for
+                reuse (``None`` for no limit).
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Use HTTP/2 (requires the ``http2`` extra).
+            json_codec: JSON backend — ``"auto"`` picks orjson or
+                msgspec when installed; ``"stdlib"`` forces :mod:`json`.
+            compression: Compress JSON request bodies with ``"gzip"`` or
+                ``"zstd"``; ``None`` disables it.
+            compression_threshold: Minimum body size in bytes to compress.
+            accept_encoding: Explicit ``Accept-Encoding`` header.
+            models: Decode responses into :mod:`qck.models` records.
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            timeout,
+            retries,
+            cache,
+            rate_limiter,
+            retry_policy,
+            circuit_breaker,
+            json_codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            accept_encoding=accept_encoding,
+            models=models,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            headers=self._default_headers(),
+            **self._transport_options(
+                max_connections, max_keepalive_connections, keepalive_expiry, http2
+            ),
+        )
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        """Enter the async context manager, returning the client instance."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit the async context manager, closing the HTTP session."""
+        await self.close()
+
+    # ----- public methods -----
+
+    async def get(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        cache: bool = True,
+    ) -> Any:
+        """Send a GET request.
+
+        Args:
+            path: API path (e.g. ``/links``).
+            params: Optional query-string parameters.
+            cache: ``False`` bypasses the response cache for this call:
+                the response is neither served from nor stored in it.
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return await self._request("GET", path, params=params, cache=cache)
+
+    async def post(
+        self,
+        path: str,
+        body: Any = None,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a POST request with an optional JSON body.
+
+        Args:
+            path: API path (e.g. ``/links``).
+            body: Request body serialised as JSON.
+            params: Optional query-string parameters.
+            headers: Optional extra HTTP headers.
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return await self._request("POST", path, json=body, params=params, headers=headers)
+
+    async def patch(
+        self,
+        path: str,
+        body: Any = None,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a PATCH request with an optional JSON body.
+
+        Args:
+            path: API path (e.g. ``/links/{id}``).
+            body: Fields to update, serialised as JSON.
+            params: Optional query-string parameters.
+            headers: Optional extra HTTP headers.
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return await self._request("PATCH", path, json=body, params=params, headers=headers)
+
+    async def put(
+        self,
+        path: str,
+        body: Any = None,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[AsyncRequestContent] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a PUT request with a JSON body or raw bytes.
+
+        When *content* is provided, it is sent as the raw request body
+        and *body* is ignored. This is used for binary uploads (e.g.
+        OG images).
+
+        Args:
+            path: API path (e.g. ``/links/{id}/og-image``).
+            body: Request body serialised as JSON (ignored when
+                *content* is set).
+            params: Optional query-string parameters.
+            content: Raw request body — bytes, or a re-iterable of byte
+                chunks that is streamed.
+            headers: Extra headers merged into the request (e.g.
+                ``Content-Type`` for binary uploads).
+
+        Returns:
+            Parsed JSON response data (envelope unwrapped).
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return await self._request(
+            "PUT", path, json=body, params=params, content=content, headers=headers,
+        )
+
+    async def delete(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a DELETE request.
+
+        Args:
+            path: API path (e.g. ``/links/{id}``).
+            params: Optional query-string parameters.
+            headers: Optional extra HTTP headers.
+
+        Returns:
+            ``None`` for 204 responses, or parsed JSON data otherwise.
+
+        Raises:
+            QCKError: On any API error response.
+        """
+        return await self._request("DELETE", path, params=params, headers=headers)
+
+    # ----- internals -----
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[AsyncRequestContent] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cache: bool = True,
+    ) -> Any:
+        """Execute an HTTP request with automatic, non-blocking retries.
+
+        Rate limits (:class:`~qck._errors.RateLimitError`, honouring
+        ``Retry-After``) are retried for every request. Network errors
+        (``httpx.TimeoutException``, ``httpx.ConnectError``) and the retry
+        policy's ``retry_statuses`` (``502``/``503``/``504`` by default)
+        are retried only for idempotent requests — ``GET`` requests, or
+        requests carrying an ``X-Idempotency-Key`` header. A timed-out
+        plain ``POST`` is *not* retried, because the server may already
+        have processed it. A transport failure that ends the call is
+        raised as :class:`~qck._errors.NetworkError`. With a rate limiter,
+        every attempt first waits for a token, and a ``429`` pauses all
+        senders sharing the limiter; if the wait would run past the retry
+        policy's deadline, the call fails without taking a token. The
+        retry policy's budget and deadline can end retries early, and an
+        open circuit breaker fails the call without sending it.
+
+        When a response cache is configured, fresh cached GET responses
+        are returned without a request, stale entries carrying an
+        ``ETag`` / ``Last-Modified`` are revalidated with a conditional
+        GET (a ``304`` serves the cached data), successful GETs are
+        stored, and any other method invalidates the cached resource it
+        touched. ``cache=False`` skips the lookup and the store for one
+        GET. Blocking cache backends (:class:`~qck.DiskCache`) are
+        accessed from a worker thread.
+
+        Args:
+            method: HTTP method (``GET``, ``POST``, etc.).
+            path: Relative API path.
+            json: Body to serialise as JSON (ignored when *content*
+                is provided).
+            params: Query-string parameters.
+            content: Raw body for binary uploads (bytes or a
+                re-iterable of chunks).
+            headers: Extra request headers.
+            cache: Whether a GET may be served from and stored in the
+                response cache.
+
+        Returns:
+            Parsed and envelope-unwrapped response data.
+
+        Raises:
+            RateLimitError: If rate-limited after all retries exhausted, or
+                if the rate limiter cannot admit the request before the
+                deadline (code ``"CLIENT_RATE_LIMITED"``).
+            CircuitOpenError: If the circuit breaker rejects the call.
+            NetworkError: If the request failed without a response.
+            QCKError: On non-retryable API errors.
+        """
+        clean = self._clean_params(params)
+        cache_key: Optional[str] = None
+        cached: Optional[CacheEntry] = None
+        if cache:
+            cache_key, cached = await self._cache_call(self._cache_lookup, method, path, clean)
+        if cached is not None and cached.fresh:
+            return cached.data
+        headers = self._conditional_headers(cached, headers)
+        try:
+            data, resp_headers = await self._send(
+                method, path, json=json, params=clean, content=content, headers=headers
+            )
+        finally:
+            await self._cache_call(self._cache_invalidate, method, path)
+        return await self._cache_call(
+            self._cache_store, cache_key, path, data, resp_headers, cached
+        )
+
+    async def _cache_call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a response-cache helper, off the event loop if the backend blocks."""
+        if self._cache is not None and self._cache.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any,
+        params: Optional[Dict[str, Any]],
+        content: Optional[AsyncRequestContent],
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[Any, httpx.Headers]:
+        """Send one logical request, retrying transient failures.
+
+        Args:
+            method: HTTP method.
+            path: Relative API path.
+            json: Body to serialise as JSON (ignored when *content*
+                is provided).
+            params: Cleaned query-string parameters.
+            content: Raw body (bytes or a re-iterable of chunks).
+            headers: Extra request headers.
+
+        Returns:
+            ``(data, headers)`` — the parsed and envelope-unwrapped response
+            data and the final response headers.
+        """
+        url = self._build_url(path)
+        if content is None and json is not None:
+            content, headers = self._encode_json(json, headers)
+        idempotent = self._is_idempotent(method, headers)
+        deadline = self._retry_policy.start()
+        delay = 0.0
+        last_exc: Optional[Exception] = None
+
+        for attempt in range(self._retries + 1):
+            try:
+                wait = self._throttle(deadline)
+            except RateLimitError:
+                if last_exc is not None:
+                    raise last_exc from last_exc.__cause__
+                raise
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                with self._circuit(path):
+                    resp = await self._client.request(
+                        method,
+                        url,
+                        content=cast("Optional[Union[bytes, AsyncIterable[bytes]]]", content),
+                        params=params,
+                        headers=headers,
+                        timeout=self._attempt_timeout(deadline),
+                    )
+                    self._observe_rate_limit(resp)
+                    return self._handle_response(resp), resp.headers
+            except (QCKError, httpx.TransportError) as exc:
+                error = _as_sdk_error(exc)
+                next_delay = self._next_retry(exc, attempt, delay, idempotent, deadline)
+                if next_delay is None:
+                    if error is exc:
+                        raise
+                    raise error from exc
+                last_exc = error
+                delay = next_delay
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+        raise last_exc  # type: ignore[misc]
@@ -0,0 +1,175 @@
+"""JSON encoding and decoding with optional fast backends.
+
+Bulk operations spend most of their CPU time encoding request bodies and
+decoding large response pages. :func:`get_codec` picks the fastest JSON
+library available — `orjson <https://github.com/ijl/orjson>`_, then
+`msgspec <https://jcristharif.com/msgspec/>`_, then the standard
+library — and the HTTP clients use it for both directions.
+
+The fast backends produce the same Python values as :mod:`json` for
+everything the API sends. When encoding, a :class:`JsonCodec` rejects
+``NaN`` and infinity up front, as :mod:`json` does with
+``allow_nan=False`` (orjson and msgspec would silently write ``null``).
+For the few values the fast backends cannot encode but the standard
+library can (integers beyond 64 bits, non-string dict keys), it falls
+back to :mod:`json` for that one document, so request bodies never
+depend on which backend is installed. Decoding has no fallback: input
+the backend rejects is not valid JSON, and is reported once.
+
+Install a fast backend with ``pip install qck-sdk[speedups]``, or force
+the standard library with ``QCK(..., json_codec="stdlib")``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+Dumps = Callable[[Any], bytes]
+Loads = Callable[[bytes], Any]
+
+_CODEC_NAMES = ("auto", "orjson", "msgspec", "stdlib")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON, matching what ``httpx`` sends for ``json=``."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+        "utf-8"
+    )
+
+
+def _stdlib_loads(data: bytes) -> Any:
+    """Decode JSON with the standard library."""
+    return json.loads(data)
+
+
+def _check_finite(obj: Any) -> None:
+    """Raise ``ValueError`` if *obj* contains a ``NaN`` or infinite float.
+
+    Walks dicts, lists, and tuples iteratively, so deeply nested bodies
+    cannot hit the recursion limit.
+    """
+    stack: List[Any] = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+class JsonCodec:
+    """A JSON encoder/decoder pair with standard-library fallback.
+
+    Attributes:
+        name: Backend name (``"orjson"``, ``"msgspec"``, or ``"stdlib"``).
+    """
+
+    __slots__ = ("name", "_dumps", "_loads")
+
+    def __init__(self, name: str, dumps: Dumps, loads: Loads) -> None:
+        """Create a codec.
+
+        Args:
+            name: Backend name.
+            dumps: Function encoding a value to UTF-8 JSON bytes.
+            loads: Function decoding JSON bytes.
+        """
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode *obj* as compact UTF-8 JSON.
+
+        Raises:
+            TypeError: If *obj* is not JSON serialisable.
+            ValueError: If *obj* contains ``NaN`` or infinity.
+        """
+        if self._dumps is _stdlib_dumps:
+            return _stdlib_dumps(obj)
+        _check_finite(obj)
+        try:
+            return self._dumps(obj)
+        except Exception:
+            return _stdlib_dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON *data*.
+
+        Raises:
+            ValueError: If *data* is not valid JSON. The backends' decode
+                errors (``orjson.JSONDecodeError``,
+                ``msgspec.DecodeError``) are ``ValueError`` subclasses.
+        """
+        return self._loads(data)
+
+    def __repr__(self) -> str:
+        """Return ``JsonCodec('<name>')``."""
+        return f"JsonCodec({self.name!r})"
+
+
+def _orjson_codec() -> Optional[JsonCodec]:
+    """Build an orjson codec, or ``None`` if orjson is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=option)
+
+    return JsonCodec("orjson", dumps, orjson.loads)
+
+
+def _msgspec_codec() -> Optional[JsonCodec]:
+    """Build a msgspec codec, or ``None`` if msgspec is not installed."""
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return JsonCodec("msgspec", msgspec.json.Encoder().encode, msgspec.json.Decoder().decode)
+
+
+_FACTORIES: Dict[str, Callable[[], Optional[JsonCodec]]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Return the JSON codec to use for *name*.
+
+    Args:
+        name: ``"auto"`` (the fastest installed backend), ``"orjson"``,
+            ``"msgspec"``, or ``"stdlib"``.
+
+    Returns:
+        The selected :class:`JsonCodec`.
+
+    Raises:
+        ValueError: If *name* is not a known codec.
+        ImportError: If the requested backend is not installed.
+    """
+    if name not in _CODEC_NAMES:
+        raise ValueError(f"unknown json_codec {name!r}; expected one of {', '.join(_CODEC_NAMES)}")
+    if name == "stdlib":
+        return JsonCodec("stdlib", _stdlib_dumps, _stdlib_loads)
+    if name == "auto":
+        for factory in _FACTORIES.values():
+            codec = factory()
+            if codec is not None:
+                return codec
+        return JsonCodec("stdlib", _stdlib_dumps, _stdlib_loads)
+    codec = _FACTORIES[name]()
+    if codec is None:
+        raise ImportError(
+            f"json_codec={name!r} requires the {name!r} package; "
+            f"install it with `pip install {name}`"
+        )
+    return codec
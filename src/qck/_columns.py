@@ -0,0 +1,186 @@
+"""Column-oriented results for numerical pipelines.
+
+Timeseries and hourly results are usually fed into NumPy, pandas, or
+Arrow, where a list of per-bucket dicts has to be pivoted into columns
+first. With ``as_columns=True``, ``analytics.timeseries``,
+``analytics.hourly``, and ``conversions.timeseries`` return a
+:class:`Columns` instead: one list per field, pivoted from the decoded
+rows. The JSON codec still materialises a dict per row (see
+:meth:`Columns.from_rows`); columns save the pivot downstream and the
+per-row dicts held afterwards, not the decoding.
+
+:meth:`Columns.to_numpy` and :meth:`Columns.to_arrow` convert the
+columns to typed arrays — dates as ``datetime64[D]`` / ``date32``,
+timestamps as UTC ``datetime64[us]`` / ``timestamp[us, UTC]``, counts as
+``int64``, and amounts as ``float64``. NumPy and pyarrow are optional
+dependencies, imported only when those methods are called
+(``pip install qck-sdk[numpy]`` / ``qck-sdk[arrow]``).
+"""
+
+from __future__ import annotations
+
+import importlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+Schema = Tuple[Tuple[str, str], ...]
+"""``(field, kind)`` pairs; kind is ``date``, ``timestamp``, ``int``, or ``float``."""
+
+TIMESERIES_SCHEMA: Schema = (("date", "date"), ("clicks", "int"), ("unique_visitors", "int"))
+HOURLY_SCHEMA: Schema = (("hour", "int"), ("clicks", "int"), ("unique_visitors", "int"))
+CONVERSION_TIMESERIES_SCHEMA: Schema = (
+    ("timestamp", "timestamp"),
+    ("conversions", "int"),
+    ("revenue", "float"),
+)
+
+_EXTRAS = {"numpy": "numpy", "pyarrow": "arrow"}
+
+
+def _require(module: str) -> Any:
+    """Import an optional dependency, explaining how to install it."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"this conversion requires the {module!r} package; "
+            f"install it with `pip install qck-sdk[{_EXTRAS[module]}]`"
+        ) from None
+
+
+def _utc_naive(value: str) -> str:
+    """Rewrite an ISO-8601 timestamp as naive UTC, which ``datetime64`` accepts."""
+    if value.endswith("Z"):
+        return value[:-1]
+    if "T" in value and ("+" in value[10:] or "-" in value[10:]):
+        parsed = datetime.fromisoformat(value).astimezone(timezone.utc)
+        return parsed.replace(tzinfo=None).isoformat()
+    return value
+
+
+class Columns(Mapping[str, List[Any]]):
+    """A result held as one list per field.
+
+    Behaves as a read-only mapping of field name to column
+    (``cols["clicks"]``); :attr:`num_rows` is the number of buckets.
+    """
+
+    __slots__ = ("_data", "_schema", "_num_rows")
+
+    def __init__(self, data: Dict[str, List[Any]], schema: Schema, num_rows: int) -> None:
+        """Wrap columns built by :meth:`from_rows`."""
+        self._data = data
+        self._schema = schema
+        self._num_rows = num_rows
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]], schema: Schema) -> "Columns":
+        """Pivot decoded response rows into columns.
+
+        Note:
+            This is a pivot, not a columnar decode. The client's JSON
+            codec (orjson, msgspec, or the standard library) has already
+            built one dict per row by the time a resource sees the
+            response; decoding straight into columns would need the raw
+            body and a schema-specific decoder below the envelope
+            handling. The rows are dropped once pivoted, so the saving
+            is the caller's pivot and the per-row dicts held afterwards.
+
+        Args:
+            rows: The decoded rows (dicts or records).
+            schema: The fields to extract and their kinds.
+
+        Returns:
+            The columns; a field missing from a row is ``None``.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        data = {name: [row.get(name) for row in rows] for name, _ in schema}
+        return cls(data, schema, len(rows))
+
+    @property
+    def schema(self) -> Schema:
+        """The ``(field, kind)`` pairs of the columns."""
+        return self._schema
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows (buckets)."""
+        return self._num_rows
+
+    def __getitem__(self, name: str) -> List[Any]:
+        """Return the column of field *name*."""
+        return self._data[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the field names, in schema order."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Number of columns (fields), not rows; see :attr:`num_rows`."""
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        """Show the field names and row count, not the values."""
+        return f"Columns({', '.join(self._data)}; {self._num_rows} rows)"
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return the rows as a list of dicts, as without ``as_columns``."""
+        names = list(self._data)
+        return [dict(zip(names, values)) for values in zip(*self._data.values())]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Convert every column to a typed NumPy array.
+
+        Missing counts become ``0`` and missing amounts ``NaN``; missing
+        dates and timestamps become ``NaT``.
+
+        Returns:
+            ``{field: numpy.ndarray}`` in schema order.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        np = _require("numpy")
+        n = self._num_rows
+        out: Dict[str, Any] = {}
+        for name, kind in self._schema:
+            values = self._data[name]
+            if kind == "date":
+                out[name] = np.array(
+                    [v[:10] if v else "NaT" for v in values], dtype="datetime64[D]"
+                )
+            elif kind == "timestamp":
+                out[name] = np.array(
+                    [_utc_naive(v) if v else "NaT" for v in values], dtype="datetime64[us]"
+                )
+            elif kind == "int":
+                out[name] = np.fromiter((v or 0 for v in values), dtype=np.int64, count=n)
+            else:
+                out[name] = np.fromiter(
+                    (float("nan") if v is None else v for v in values), dtype=np.float64, count=n
+                )
+        return out
+
+    def to_arrow(self) -> Any:
+        """Convert the columns to a typed :class:`pyarrow.Table`.
+
+        Missing values are nulls.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        pa = _require("pyarrow")
+        arrays = []
+        for name, kind in self._schema:
+            values = self._data[name]
+            if kind == "date":
+                days = pa.array([v[:10] if v else None for v in values], pa.string())
+                arrays.append(days.cast(pa.date32()))
+            elif kind == "timestamp":
+                stamps = pa.array(values, pa.string())
+                arrays.append(stamps.cast(pa.timestamp("us", tz="UTC")))
+            elif kind == "int":
+                arrays.append(pa.array(values, pa.int64()))
+            else:
+                arrays.append(pa.array(values, pa.float64()))
+        return pa.Table.from_arrays(arrays, names=[name for name, _ in self._schema])
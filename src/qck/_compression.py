@@ -0,0 +1,150 @@
+"""Request body compression and response encoding negotiation.
+
+Journey ingest batches and bulk link payloads are large, highly
+repetitive JSON documents, which compress well. With request compression
+enabled, the HTTP clients compress JSON bodies of at least
+``compression_threshold`` bytes and send them with a
+``Content-Encoding`` header. Smaller bodies, and raw uploads such as
+OG images (already compressed), are sent unchanged.
+
+Supported request encodings:
+
+* ``"gzip"`` — standard library, always available.
+* ``"zstd"`` — faster and smaller; needs the ``zstandard`` package
+  (``pip install qck-sdk[zstd]``).
+
+Response compression is negotiated separately through the
+``Accept-Encoding`` header (see :func:`check_accept_encoding`).
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib.util
+from typing import Callable, Optional
+
+_GZIP_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+# Response codings httpx decodes without extra packages.
+_BUILTIN_DECODERS = ("identity", "gzip", "deflate")
+
+
+class Compressor:
+    """Compresses request bodies with one content coding.
+
+    Attributes:
+        encoding: The ``Content-Encoding`` value (``"gzip"`` or ``"zstd"``).
+        threshold: Minimum body size in bytes worth compressing.
+    """
+
+    __slots__ = ("encoding", "threshold", "_compress")
+
+    def __init__(self, encoding: str, threshold: int, compress: Callable[[bytes], bytes]) -> None:
+        """Create a compressor.
+
+        Args:
+            encoding: The ``Content-Encoding`` value.
+            threshold: Minimum body size in bytes worth compressing.
+            compress: Function compressing a body.
+        """
+        self.encoding = encoding
+        self.threshold = threshold
+        self._compress = compress
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """Compress *body* if it is large enough to be worth it.
+
+        Returns:
+            The compressed body, or ``None`` when *body* is below the
+            threshold or would not shrink.
+        """
+        if len(body) < self.threshold:
+            return None
+        compressed = self._compress(body)
+        return compressed if len(compressed) < len(body) else None
+
+
+def _zstd_compress() -> Callable[[bytes], bytes]:
+    """Return a zstd compression function.
+
+    Raises:
+        ImportError: If ``zstandard`` is not installed.
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "compression='zstd' requires the 'zstandard' package; "
+            "install it with `pip install qck-sdk[zstd]`"
+        ) from None
+    return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress
+
+
+def get_compressor(encoding: Optional[str], threshold: int) -> Optional[Compressor]:
+    """Build the request compressor for a client's settings.
+
+    Args:
+        encoding: ``"gzip"``, ``"zstd"``, or ``None`` to disable request
+            compression.
+        threshold: Minimum body size in bytes worth compressing.
+
+    Returns:
+        A :class:`Compressor`, or ``None`` when compression is disabled.
+
+    Raises:
+        ValueError: If *encoding* is unknown or *threshold* is negative.
+        ImportError: If ``"zstd"`` is requested without ``zstandard``.
+    """
+    if encoding is None:
+        return None
+    if threshold < 0:
+        raise ValueError("compression_threshold must not be negative")
+    if encoding == "gzip":
+        return Compressor(
+            "gzip", threshold, lambda body: gzip.compress(body, _GZIP_LEVEL, mtime=0)
+        )
+    if encoding == "zstd":
+        return Compressor("zstd", threshold, _zstd_compress())
+    raise ValueError(f"unknown compression {encoding!r}; expected 'gzip' or 'zstd'")
+
+
+def _has_module(*names: str) -> bool:
+    """Whether any of the modules *names* is installed (without importing it)."""
+    return any(importlib.util.find_spec(name) is not None for name in names)
+
+
+def check_accept_encoding(value: str) -> str:
+    """Validate an ``Accept-Encoding`` value against the installed decoders.
+
+    ``gzip``, ``deflate``, and ``identity`` are always decodable; ``br``
+    needs ``brotli`` (or ``brotlicffi``) and ``zstd`` needs
+    ``zstandard``, which ``httpx`` uses to decode those responses.
+
+    Args:
+        value: Comma-separated codings, optionally with ``q`` weights
+            (``"zstd, gzip;q=0.8"``).
+
+    Returns:
+        *value*, unchanged.
+
+    Raises:
+        ValueError: If a listed coding is not supported at all.
+        ImportError: If a listed coding needs a package that is missing.
+    """
+    for part in value.split(","):
+        coding = part.split(";", 1)[0].strip().lower()
+        if not coding or coding == "*" or coding in _BUILTIN_DECODERS:
+            continue
+        if coding == "br":
+            missing = not _has_module("brotli", "brotlicffi")
+        elif coding == "zstd":
+            missing = not _has_module("zstandard")
+        else:
+            raise ValueError(f"unsupported accept_encoding coding {coding!r}")
+        if missing:
+            raise ImportError(
+                f"cannot decode {coding!r} responses without the "
+                f"{'brotli' if coding == 'br' else 'zstandard'} package"
+            )
+    return value
@@ -0,0 +1,199 @@
+"""Bounded, order-preserving concurrency helpers.
+
+The SDK's batch helpers (auto-pagination, bulk operations, fan-out
+queries) all need the same primitive: run a blocking call for every item
+of a possibly unbounded iterable on a small thread pool, keep only a
+fixed number of calls outstanding, and hand results back in input order.
+:func:`bounded_map` provides that on top of
+:class:`concurrent.futures.ThreadPoolExecutor`; the underlying
+``httpx.Client`` is thread-safe and shares its connection pool across
+workers. :func:`abounded_map` is the ``asyncio`` equivalent used by the
+async resources, and :func:`chunked` / :func:`achunked` split a stream
+into fixed-size batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    concurrency: int,
+) -> Iterator[R]:
+    """Apply *fn* to every item concurrently, yielding results in order.
+
+    Items are pulled from *items* lazily: at most *concurrency* calls
+    are submitted but not yet consumed at any time, so memory stays
+    bounded even for generators of unknown length. When the consumer
+    stops early (``break`` or ``close()``), queued calls are cancelled.
+
+    Args:
+        fn: Blocking callable applied to each item.
+        items: Input iterable; consumed lazily.
+        concurrency: Maximum number of outstanding calls (>= 1).
+
+    Yields:
+        ``fn(item)`` for each item, in input order. An exception raised
+        by *fn* is re-raised when its result is reached.
+
+    Raises:
+        ValueError: If *concurrency* is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    it = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="qck") as pool:
+        window: Deque["Future[R]"] = deque(
+            pool.submit(fn, item) for item in itertools.islice(it, concurrency)
+        )
+        try:
+            while window:
+                result = window.popleft().result()
+                for item in itertools.islice(it, 1):
+                    window.append(pool.submit(fn, item))
+                yield result
+        finally:
+            for future in window:
+                future.cancel()
+
+
+def _puller(items: Union[Iterable[T], AsyncIterable[T]]) -> Callable[[], Awaitable[Any]]:
+    """Return a coroutine function yielding the next item, or ``_DONE``."""
+    if isinstance(items, AsyncIterable):
+        ait = items.__aiter__()
+
+        async def pull_async() -> Any:
+            try:
+                return await ait.__anext__()
+            except StopAsyncIteration:
+                return _DONE
+
+        return pull_async
+
+    it = iter(items)
+
+    async def pull() -> Any:
+        return next(it, _DONE)
+
+    return pull
+
+
+async def abounded_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    *,
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """Async counterpart of :func:`bounded_map`.
+
+    Schedules ``fn(item)`` as tasks on the running event loop with at
+    most *concurrency* outstanding, yielding results in input order.
+
+    Args:
+        fn: Coroutine function applied to each item.
+        items: Input iterable or async iterable; consumed lazily.
+        concurrency: Maximum number of outstanding tasks (>= 1).
+
+    Yields:
+        The awaited result of ``fn(item)`` for each item, in order.
+
+    Raises:
+        ValueError: If *concurrency* is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    pull = _puller(items)
+    window: Deque["asyncio.Future[R]"] = deque()
+    try:
+        while len(window) < concurrency:
+            item = await pull()
+            if item is _DONE:
+                break
+            window.append(asyncio.ensure_future(fn(item)))
+        while window:
+            result = await window.popleft()
+            item = await pull()
+            if item is not _DONE:
+                window.append(asyncio.ensure_future(fn(item)))
+            yield result
+    finally:
+        for task in window:
+            task.cancel()
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split *items* into lists of at most *size* elements, lazily.
+
+    Args:
+        items: Input iterable; consumed one chunk at a time.
+        size: Maximum chunk length (>= 1).
+
+    Yields:
+        Consecutive non-empty chunks.
+
+    Raises:
+        ValueError: If *size* is less than 1.
+    """
+    if size < 1:
+        raise ValueError("chunk size must be at least 1")
+    it = iter(items)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def achunked(
+    items: Iterable[T], size: int, *, in_thread: bool = False
+) -> AsyncIterator[List[T]]:
+    """Async counterpart of :func:`chunked`.
+
+    Args:
+        items: Input iterable; consumed one chunk at a time.
+        size: Maximum chunk length (>= 1).
+        in_thread: Read each chunk with :func:`asyncio.to_thread`, for
+            sources that block (e.g. a file parsed row by row) and would
+            otherwise stall the event loop.
+
+    Yields:
+        Consecutive non-empty chunks.
+
+    Raises:
+        ValueError: If *size* is less than 1.
+    """
+    chunks = chunked(items, size)
+    while True:
+        if in_thread:
+            chunk = await asyncio.to_thread(next, chunks, None)
+        else:
+            chunk = next(chunks, None)
+        if chunk is None:
+            return
+        yield chunk
@@ -12,6 +12,8 @@ Hierarchy::
           +-- RateLimitError       (HTTP 429)
           +-- NotFoundError        (HTTP 404)
           +-- ValidationError      (HTTP 400)
+          +-- CircuitOpenError     (raised client-side, no request sent)
+          +-- NetworkError         (no HTTP response, after retries)
 """
 
 from __future__ import annotations
@@ -145,3 +147,57 @@ class ValidationError(QCKError):
             code: Machine-readable error code from the API.
         """
         super().__init__(message, 400, code)
+
+
+class CircuitOpenError(QCKError):
+    """Raised when a circuit breaker rejects a request without sending it.
+
+    The client's :class:`~qck._breaker.CircuitBreaker` opens the circuit
+    of an endpoint group (``/links``, ``/analytics``, ...) after repeated
+    server or network failures and fails calls to it fast until the
+    recovery timeout has elapsed.
+
+    Attributes:
+        status: Always ``503``.
+        code: Always ``"CIRCUIT_OPEN"``.
+        group: The endpoint group whose circuit is open (e.g. ``"/links"``).
+        retry_after: Seconds until the circuit lets probe requests through;
+            ``0`` if it is half-open and every probe slot is taken, since
+            the in-flight probes may close it at any moment.
+    """
+
+    def __init__(self, group: str, retry_after: float) -> None:
+        """Initialise the circuit-open error.
+
+        Args:
+            group: The endpoint group whose circuit is open.
+            retry_after: Seconds until probe requests are allowed.
+        """
+        super().__init__(
+            f"Circuit open for {group}; retry in {retry_after:.1f}s", 503, "CIRCUIT_OPEN"
+        )
+        self.group = group
+        self.retry_after = retry_after
+
+
+class NetworkError(QCKError):
+    """Raised when a request fails without an HTTP response.
+
+    Wraps the final ``httpx`` transport error (timeout, connection
+    failure, dropped connection) once automatic retries are exhausted or
+    not allowed, so ``except QCKError`` covers network failures too. The
+    original exception is available as ``__cause__``.
+
+    Attributes:
+        status: Always ``0``, since no response was received.
+        code: ``"TIMEOUT"`` for timeouts, otherwise ``"NETWORK_ERROR"``.
+    """
+
+    def __init__(self, message: str = "Network error", code: str = "NETWORK_ERROR") -> None:
+        """Initialise the network error.
+
+        Args:
+            message: Human-readable error description.
+            code: ``"TIMEOUT"`` or ``"NETWORK_ERROR"``.
+        """
+        super().__init__(message, 0, code)
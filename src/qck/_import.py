@@ -0,0 +1,228 @@
+"""Streaming link import from JSON Lines and CSV files.
+
+``links.import_file()`` reads link definitions one row at a time, so
+files of any size are imported with flat memory. This module provides
+the file side:
+
+* :func:`read_rows` parses rows lazily and maps them to
+  :class:`~qck.CreateLinkParams`, validating each locally so malformed
+  rows are rejected without a round trip.
+* :class:`RejectWriter` records rows that were rejected locally or by the
+  API to a JSON Lines reject file.
+
+Row mapping:
+
+* Keys (JSON Lines) or header columns (CSV) are matched to
+  ``CreateLinkParams`` fields; ``column_map`` renames source columns
+  first. ``original_url`` is accepted for ``url``, so files written by
+  ``links.export()`` import directly. Other columns are ignored.
+* Empty CSV cells are omitted. ``tags`` may be a JSON array or a
+  comma-separated list; ``is_password_protected`` accepts
+  ``true``/``false``/``1``/``0``/``yes``/``no``.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from typing import IO, Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from ._codec import get_codec
+from ._types import CreateLinkParams
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+_SUFFIX_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+_DEFAULT_COLUMN_MAP = {"original_url": "url"}
+_FIELDS = frozenset(CreateLinkParams.__annotations__)
+_BOOLEANS = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+ERROR_PARSE = "parse"
+ERROR_VALIDATION = "validation"
+
+
+class ImportRow:
+    """One row read from an import file.
+
+    Attributes:
+        number: 1-based row number (line number for JSON Lines, data
+            row number for CSV).
+        raw: The row as read from the file.
+        params: The mapped link parameters, or ``None`` if invalid.
+        error: Why the row was rejected, or ``None``.
+        error_type: ``"parse"`` or ``"validation"`` when rejected.
+    """
+
+    __slots__ = ("number", "raw", "params", "error", "error_type")
+
+    def __init__(
+        self,
+        number: int,
+        raw: Any,
+        params: Optional[CreateLinkParams] = None,
+        error: Optional[str] = None,
+        error_type: Optional[str] = None,
+    ) -> None:
+        """Create a row; pass *params* for a valid row, *error* otherwise."""
+        self.number = number
+        self.raw = raw
+        self.params = params
+        self.error = error
+        self.error_type = error_type
+
+
+def detect_format(path: Union[str, "os.PathLike[str]"], format: Optional[str]) -> str:
+    """Return the import format for *path*.
+
+    Args:
+        path: The file to import.
+        format: ``"jsonl"``, ``"csv"``, or ``None`` to infer it from the
+            file extension (``.jsonl``, ``.ndjson``, ``.csv``).
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred.
+    """
+    if format is None:
+        suffix = os.path.splitext(os.fspath(path))[1].lower()
+        format = _SUFFIX_FORMATS.get(suffix)
+        if format is None:
+            raise ValueError(f"cannot infer the import format of {os.fspath(path)!r}; pass format=")
+    if format not in IMPORT_FORMATS:
+        raise ValueError(
+            f"unknown import format {format!r}; expected one of {', '.join(IMPORT_FORMATS)}"
+        )
+    return format
+
+
+def _tags(value: Any) -> List[str]:
+    """Parse a ``tags`` value from a JSON array, list, or comma-separated string."""
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            value = get_codec().loads(text.encode("utf-8"))
+        else:
+            return [tag.strip() for tag in text.split(",") if tag.strip()]
+    if not isinstance(value, list) or not all(isinstance(tag, str) for tag in value):
+        raise ValueError("tags must be a list of strings")
+    return value
+
+
+def _boolean(value: Any) -> bool:
+    """Parse a boolean cell."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _BOOLEANS:
+        return _BOOLEANS[value.strip().lower()]
+    raise ValueError(f"is_password_protected must be a boolean, got {value!r}")
+
+
+def to_params(record: Mapping[str, Any], column_map: Mapping[str, str]) -> CreateLinkParams:
+    """Map and validate one record as link creation parameters.
+
+    Args:
+        record: A parsed row.
+        column_map: Source column to ``CreateLinkParams`` field renames.
+
+    Returns:
+        The link parameters.
+
+    Raises:
+        ValueError: If the row is not a valid link definition.
+    """
+    params: Dict[str, Any] = {}
+    for key, value in record.items():
+        field = column_map.get(key, key)
+        if field not in _FIELDS or value is None or value == "" or field in params:
+            continue
+        if field == "tags":
+            params[field] = _tags(value)
+        elif field == "is_password_protected":
+            params[field] = _boolean(value)
+        elif isinstance(value, str):
+            params[field] = value
+        else:
+            raise ValueError(f"{field} must be a string")
+    url = params.get("url")
+    if not url:
+        raise ValueError("url is required")
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        raise ValueError(f"url must be an absolute http(s) URL, got {url!r}")
+    if params.get("is_password_protected") and not params.get("password"):
+        raise ValueError("password is required when is_password_protected is true")
+    return params  # type: ignore[return-value]
+
+
+def read_rows(
+    fp: IO[str], format: str, column_map: Optional[Mapping[str, str]] = None
+) -> Iterator[ImportRow]:
+    """Lazily read and validate the rows of an import file.
+
+    Args:
+        fp: The file, opened in text mode (``newline=""`` for CSV).
+        format: ``"jsonl"`` or ``"csv"``.
+        column_map: Extra source column to field renames.
+
+    Yields:
+        One :class:`ImportRow` per row; blank JSON Lines are skipped.
+    """
+    mapping = {**_DEFAULT_COLUMN_MAP, **(column_map or {})}
+    records: Iterator[Tuple[int, Any]]
+    if format == "csv":
+        records = enumerate(csv.DictReader(fp), 1)
+    else:
+        records = ((n, line) for n, line in enumerate(fp, 1) if line.strip())
+    loads = get_codec().loads
+    for number, raw in records:
+        if format == "jsonl":
+            try:
+                raw = loads(raw.encode("utf-8"))
+            except ValueError as exc:
+                yield ImportRow(number, raw.rstrip("\n"), error=str(exc), error_type=ERROR_PARSE)
+                continue
+            if not isinstance(raw, dict):
+                yield ImportRow(
+                    number, raw, error="row must be a JSON object", error_type=ERROR_PARSE
+                )
+                continue
+        try:
+            yield ImportRow(number, raw, params=to_params(raw, mapping))
+        except ValueError as exc:
+            yield ImportRow(number, raw, error=str(exc), error_type=ERROR_VALIDATION)
+
+
+class RejectWriter:
+    """Writes rejected rows to a JSON Lines reject file.
+
+    Each line is ``{"row": n, "error": ..., "error_type": ..., "data": raw}``.
+    With no path, rejects are only counted.
+    """
+
+    def __init__(self, path: Optional[Union[str, "os.PathLike[str]"]]) -> None:
+        """Open the reject file at *path* (truncating it), if given."""
+        self._fp: Optional[IO[str]] = open(path, "w", encoding="utf-8") if path else None
+        self._dumps = get_codec().dumps
+        self.count = 0
+
+    def write(self, row: ImportRow, error: str, error_type: str) -> None:
+        """Record *row* as rejected."""
+        self.count += 1
+        if self._fp is None:
+            return
+        line = {"row": row.number, "error": error, "error_type": error_type, "data": row.raw}
+        self._fp.write(self._dumps(line).decode("utf-8"))
+        self._fp.write("\n")
+
+    def close(self) -> None:
+        """Close the reject file."""
+        if self._fp is not None:
+            self._fp.close()
+
+    def __enter__(self) -> "RejectWriter":
+        """Enter the context manager, returning the writer."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the context manager, closing the reject file."""
+        self.close()
@@ -0,0 +1,835 @@
+"""Background batching of journey events and conversions.
+
+Provides :class:`JourneyIngestor`, returned by
+:meth:`~qck.resources.JourneyResource.ingestor`, and
+:class:`ConversionTracker`, returned by
+:meth:`~qck.resources.ConversionsResource.tracker`. Producers hand events to
+:meth:`~JourneyIngestor.add`, which only enqueues and never waits on the
+network. A background thread packs queued events into batches of up to
+``max_batch`` and sends each batch through
+:meth:`~qck.resources.JourneyResource.ingest` — one ``POST
+/journey/events`` per batch carrying its own ``X-Idempotency-Key`` — when
+the batch is full or when its oldest event has waited ``max_latency_ms``.
+
+The conversion tracker coalesces ``track()`` calls the same way, posting
+multi-event batches to the same ``/journey/events`` endpoint. Both share
+the batching machinery in :class:`_BatchWorker`, which takes the
+``send`` callable as a parameter.
+
+:class:`AsyncJourneyIngestor` and :class:`AsyncConversionTracker` are the
+:class:`~qck.AsyncQCK` counterparts. They batch on a task of the running
+event loop instead of a thread (:class:`_AsyncBatchWorker`); ``add()``
+and ``track()`` stay synchronous and never wait, while ``flush()`` and
+``close()`` are coroutines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, cast
+
+if TYPE_CHECKING:
+    from ._client import AsyncHttpClient, HttpClient
+    from ._types import IngestStats, JourneyEvent, TrackConversionParams
+    from .resources.journey import AsyncJourneyResource, JourneyResource
+
+_MAX_EVENTS_PER_REQUEST = 100
+_DEFAULT_MAX_LATENCY_MS = 1000
+
+ErrorCallback = Callable[[BaseException, List[Dict[str, Any]]], None]
+
+
+class _Flush:
+    """Queue marker asking the worker to send its buffer immediately."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class _AsyncFlush:
+    """Queue marker asking the async worker to send its buffer immediately."""
+
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+
+
+_STOP = object()
+_TIMEOUT = object()
+
+
+def conversion_event(params: "TrackConversionParams") -> Dict[str, Any]:
+    """Build the journey ``conversion`` event for a tracked conversion.
+
+    Args:
+        params: Conversion parameters as passed to ``track()``.
+
+    Returns:
+        A journey event dict ready for ``POST /journey/events``.
+
+    Raises:
+        KeyError: If ``link_id``, ``visitor_id``, or ``name`` is missing.
+    """
+    return {
+        "link_id": params["link_id"],
+        "visitor_id": params["visitor_id"],
+        "session_id": params.get("session_id", ""),
+        "event_type": "conversion",
+        "event_name": params["name"],
+        "page_url": params.get("page_url", ""),
+        "conversion_name": params["name"],
+        "revenue_cents": round((params.get("revenue", 0) or 0) * 100),
+        "currency": params.get("currency", "USD"),
+        "properties": params.get("properties") or {},
+    }
+
+
+def _check_batching(max_batch: int, max_latency_ms: int, concurrency: int) -> None:
+    """Validate the batching arguments shared by the sync and async workers."""
+    if max_batch < 1:
+        raise ValueError("max_batch must be at least 1")
+    if max_latency_ms < 0:
+        raise ValueError("max_latency_ms must not be negative")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def _new_stats() -> Dict[str, int]:
+    """Return zeroed delivery counters."""
+    return {
+        "events_added": 0,
+        "events_sent": 0,
+        "events_failed": 0,
+        "events_dropped": 0,
+        "batches_sent": 0,
+        "batches_failed": 0,
+    }
+
+
+def _snapshot(counters: Dict[str, int]) -> "IngestStats":
+    """Copy *counters* and add the derived ``events_pending`` count."""
+    stats = dict(counters)
+    stats["events_pending"] = (
+        stats["events_added"] - stats["events_sent"] - stats["events_failed"]
+    )
+    return cast("IngestStats", stats)
+
+
+class _BatchWorker:
+    """Collect items on a queue and send them in batches from a background thread.
+
+    A single batching thread drains the queue and cuts a batch when it
+    reaches *max_batch* items or when its oldest item is *max_latency_ms*
+    old. Batches are handed to a pool of *concurrency* sender threads;
+    when all senders are busy the batching thread waits, so backpressure
+    builds up in the queue rather than in unbounded in-flight requests.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Dict[str, Any]]], None],
+        *,
+        max_batch: int,
+        max_latency_ms: int,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional[ErrorCallback] = None,
+        name: str = "qck-batch",
+    ) -> None:
+        """Start the background worker.
+
+        Args:
+            send: Callable that delivers one batch; it should raise on
+                failure.
+            max_batch: Maximum items per batch.
+            max_latency_ms: Maximum time an item waits in a partial
+                batch before it is sent.
+            max_queue: Maximum queued items; ``0`` means unbounded.
+                Items added while the queue is full are dropped and
+                counted in ``events_dropped``.
+            concurrency: Number of batches that may be in flight.
+            on_error: Called with ``(exception, batch)`` when a batch
+                fails to send.
+            name: Thread name prefix.
+
+        Raises:
+            ValueError: If *max_batch*, *max_latency_ms*, or
+                *concurrency* is out of range.
+        """
+        _check_batching(max_batch, max_latency_ms, concurrency)
+        self._send = send
+        self._max_batch = max_batch
+        self._max_latency = max_latency_ms / 1000
+        self._on_error = on_error
+        # The queue itself is unbounded so control markers (flush, stop)
+        # never block; add() enforces max_queue for items.
+        self._max_queue = max_queue
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._slots = threading.Semaphore(concurrency)
+        self._senders = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=name)
+        # _lock orders enqueues against close(); counters have their own.
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._stats = _new_stats()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    # ----- public methods -----
+
+    def add(self, item: Dict[str, Any]) -> bool:
+        """Enqueue one item without blocking.
+
+        Args:
+            item: The item to send in a later batch.
+
+        Returns:
+            ``True`` if the item was queued, ``False`` if it was dropped
+            because the queue is full.
+
+        Raises:
+            RuntimeError: If the worker has been closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot add to a closed batcher")
+            queued = not self._max_queue or self._queue.qsize() < self._max_queue
+            if queued:
+                self._queue.put_nowait(item)
+        with self._stats_lock:
+            self._stats["events_added" if queued else "events_dropped"] += 1
+        return queued
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued so far and wait for it to be handed off.
+
+        Args:
+            timeout: Maximum seconds to wait, or ``None`` to wait
+                indefinitely.
+
+        Returns:
+            ``True`` if the buffer was flushed within *timeout*.
+        """
+        marker = _Flush()
+        with self._lock:
+            if self._closed:
+                return True
+            self._queue.put_nowait(marker)
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> "IngestStats":
+        """Flush remaining items, stop the worker, and return delivery stats.
+
+        Waits for queued items to be sent and for in-flight batches to
+        finish. If *timeout* expires first, delivery continues in the
+        background and the items not yet delivered are counted in
+        ``events_pending``. Calling ``close()`` more than once is
+        harmless.
+
+        Args:
+            timeout: Maximum seconds to wait for delivery, or ``None``
+                to wait indefinitely.
+
+        Returns:
+            Counters for added, sent, failed, dropped, and pending items
+            and batches.
+        """
+        with self._lock:
+            if self._closed:
+                return self.stats
+            self._closed = True
+        # Every item accepted by add() is already queued ahead of the stop
+        # marker; the worker shuts the senders down once it reaches it.
+        self._queue.put_nowait(_STOP)
+        self._thread.join(timeout)
+        return self.stats
+
+    @property
+    def stats(self) -> "IngestStats":
+        """A snapshot of the delivery counters."""
+        with self._stats_lock:
+            return _snapshot(self._stats)
+
+    def __enter__(self) -> "_BatchWorker":
+        """Enter the context manager, returning the worker."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the context manager, flushing and stopping the worker."""
+        self.close()
+
+    # ----- internals -----
+
+    def _run(self) -> None:
+        """Batching loop executed on the background thread."""
+        batch: List[Dict[str, Any]] = []
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _TIMEOUT
+
+            if item is _TIMEOUT:
+                self._dispatch(batch)
+                batch, deadline = [], None
+            elif item is _STOP:
+                self._dispatch(batch)
+                self._senders.shutdown(wait=True)
+                return
+            elif isinstance(item, _Flush):
+                self._dispatch(batch)
+                batch, deadline = [], None
+                item.done.set()
+            else:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._max_latency
+                if len(batch) >= self._max_batch:
+                    self._dispatch(batch)
+                    batch, deadline = [], None
+
+    def _dispatch(self, batch: List[Dict[str, Any]]) -> None:
+        """Hand a batch to a sender thread, waiting for a free slot."""
+        if not batch:
+            return
+        self._slots.acquire()
+        self._senders.submit(self._deliver, batch)
+
+    def _deliver(self, batch: List[Dict[str, Any]]) -> None:
+        """Send one batch and record the outcome (runs on a sender thread)."""
+        try:
+            self._send(batch)
+        except Exception as exc:
+            with self._stats_lock:
+                self._stats["events_failed"] += len(batch)
+                self._stats["batches_failed"] += 1
+            if self._on_error is not None:
+                self._on_error(exc, batch)
+        else:
+            with self._stats_lock:
+                self._stats["events_sent"] += len(batch)
+                self._stats["batches_sent"] += 1
+        finally:
+            self._slots.release()
+
+
+class JourneyIngestor(_BatchWorker):
+    """Buffer journey events and ingest them in background batches.
+
+    Create one with ``client.journey.ingestor()``. :meth:`add` is safe
+    to call from any number of producer threads; events are sent in
+    batches of up to ``max_batch`` (at most 100, the API limit), each
+    with a fresh ``X-Idempotency-Key`` so retried batches are not
+    double-counted. Always :meth:`close` the ingestor (or use it as a
+    context manager) so buffered events are flushed.
+
+    Example::
+
+        with client.journey.ingestor(max_latency_ms=500) as ingestor:
+            for event in events:
+                ingestor.add(event)
+        print(ingestor.stats)
+    """
+
+    def __init__(
+        self,
+        journey: "JourneyResource",
+        *,
+        max_batch: int = _MAX_EVENTS_PER_REQUEST,
+        max_latency_ms: int = _DEFAULT_MAX_LATENCY_MS,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """Start a background ingestor.
+
+        Args:
+            journey: The journey resource used to send batches.
+            max_batch: Maximum events per request (1-100).
+            max_latency_ms: Maximum time an event waits before its
+                partial batch is sent.
+            max_queue: Maximum queued events; ``0`` means unbounded.
+            concurrency: Number of batch requests that may be in flight.
+            on_error: Called with ``(exception, events)`` when a batch
+                fails after the client's automatic retries.
+
+        Raises:
+            ValueError: If *max_batch* is not between 1 and 100.
+        """
+        if not 1 <= max_batch <= _MAX_EVENTS_PER_REQUEST:
+            raise ValueError(f"max_batch must be between 1 and {_MAX_EVENTS_PER_REQUEST}")
+        super().__init__(
+            lambda events: journey.ingest({"events": events}),  # type: ignore[typeddict-item]
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+            name="qck-journey",
+        )
+
+    def add(self, event: "JourneyEvent") -> bool:  # type: ignore[override]
+        """Queue a journey event for the next batch without blocking.
+
+        Args:
+            event: The journey event to ingest.
+
+        Returns:
+            ``True`` if queued, ``False`` if dropped because the queue
+            is full.
+
+        Raises:
+            RuntimeError: If the ingestor has been closed.
+        """
+        return super().add(dict(event))
+
+    def __enter__(self) -> "JourneyIngestor":
+        """Enter the context manager, returning the ingestor."""
+        return self
+
+
+class ConversionTracker(_BatchWorker):
+    """Buffer conversion events and send them in background batches.
+
+    Create one with ``client.conversions.tracker()``. :meth:`track`
+    accepts the same parameters as
+    :meth:`~qck.resources.ConversionsResource.track` but only enqueues
+    the event; a worker thread posts up to ``max_batch`` conversions per
+    ``POST /journey/events`` request. Each batch gets one
+    ``X-Idempotency-Key`` when it is cut, and the key is reused for every
+    automatic retry of that batch, so a retried request can never record
+    its conversions twice.
+
+    Example::
+
+        tracker = client.conversions.tracker(max_latency_ms=2000)
+        tracker.track({"link_id": link_id, "visitor_id": "u-1", "name": "purchase"})
+        stats = tracker.close()
+    """
+
+    def __init__(
+        self,
+        client: "HttpClient",
+        *,
+        max_batch: int = _MAX_EVENTS_PER_REQUEST,
+        max_latency_ms: int = _DEFAULT_MAX_LATENCY_MS,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """Start a background conversion tracker.
+
+        Args:
+            client: HTTP client used to post batches.
+            max_batch: Maximum conversions per request (1-100).
+            max_latency_ms: Maximum time a conversion waits before its
+                partial batch is sent.
+            max_queue: Maximum queued conversions; ``0`` means unbounded.
+            concurrency: Number of batch requests that may be in flight.
+            on_error: Called with ``(exception, events)`` when a batch
+                fails after the client's automatic retries.
+
+        Raises:
+            ValueError: If *max_batch* is not between 1 and 100.
+        """
+        if not 1 <= max_batch <= _MAX_EVENTS_PER_REQUEST:
+            raise ValueError(f"max_batch must be between 1 and {_MAX_EVENTS_PER_REQUEST}")
+
+        def send(events: List[Dict[str, Any]]) -> None:
+            client.post(
+                "/journey/events",
+                {"events": events},
+                headers={"X-Idempotency-Key": uuid.uuid4().hex},
+            )
+
+        super().__init__(
+            send,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+            name="qck-conversions",
+        )
+
+    def track(self, params: "TrackConversionParams") -> bool:
+        """Queue a conversion for the next batch without blocking.
+
+        Args:
+            params: Conversion parameters, as for
+                :meth:`~qck.resources.ConversionsResource.track`.
+
+        Returns:
+            ``True`` if queued, ``False`` if dropped because the queue
+            is full.
+
+        Raises:
+            KeyError: If a required field (``link_id``, ``visitor_id``,
+                ``name``) is missing.
+            RuntimeError: If the tracker has been closed.
+        """
+        return self.add(conversion_event(params))
+
+    def __enter__(self) -> "ConversionTracker":
+        """Enter the context manager, returning the tracker."""
+        return self
+
+
+class _AsyncBatchWorker:
+    """Collect items on a queue and send them in batches from an event-loop task.
+
+    The asyncio counterpart of :class:`_BatchWorker`: one batching task
+    drains the queue with the same size and latency rules and starts a
+    sender task per batch, at most *concurrency* at a time. It must be
+    created while an event loop is running and used from that loop.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Dict[str, Any]]], Awaitable[Any]],
+        *,
+        max_batch: int,
+        max_latency_ms: int,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """Start the batching task on the running event loop.
+
+        Args:
+            send: Coroutine function that delivers one batch; it should
+                raise on failure.
+            max_batch: Maximum items per batch.
+            max_latency_ms: Maximum time an item waits in a partial
+                batch before it is sent.
+            max_queue: Maximum queued items; ``0`` means unbounded.
+                Items added while the queue is full are dropped and
+                counted in ``events_dropped``.
+            concurrency: Number of batches that may be in flight.
+            on_error: Called with ``(exception, batch)`` when a batch
+                fails to send.
+
+        Raises:
+            ValueError: If *max_batch*, *max_latency_ms*, or
+                *concurrency* is out of range.
+            RuntimeError: If no event loop is running.
+        """
+        _check_batching(max_batch, max_latency_ms, concurrency)
+        loop = asyncio.get_running_loop()
+        self._send = send
+        self._max_batch = max_batch
+        self._max_latency = max_latency_ms / 1000
+        self._on_error = on_error
+        # As in the threaded worker, the queue is unbounded so markers
+        # never wait; add() enforces max_queue for items.
+        self._max_queue = max_queue
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._slots = asyncio.Semaphore(concurrency)
+        self._in_flight: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+        self._stats = _new_stats()
+        self._task = loop.create_task(self._run())
+
+    # ----- public methods -----
+
+    def add(self, item: Dict[str, Any]) -> bool:
+        """Enqueue one item without waiting.
+
+        Args:
+            item: The item to send in a later batch.
+
+        Returns:
+            ``True`` if the item was queued, ``False`` if it was dropped
+            because the queue is full.
+
+        Raises:
+            RuntimeError: If the worker has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("cannot add to a closed batcher")
+        queued = not self._max_queue or self._queue.qsize() < self._max_queue
+        if queued:
+            self._queue.put_nowait(item)
+        self._stats["events_added" if queued else "events_dropped"] += 1
+        return queued
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued so far and wait for it to be handed off.
+
+        Args:
+            timeout: Maximum seconds to wait, or ``None`` to wait
+                indefinitely.
+
+        Returns:
+            ``True`` if the buffer was flushed within *timeout*.
+        """
+        if self._closed:
+            return True
+        marker = _AsyncFlush()
+        self._queue.put_nowait(marker)
+        try:
+            await asyncio.wait_for(marker.done.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self, timeout: Optional[float] = None) -> "IngestStats":
+        """Flush remaining items, stop the worker, and return delivery stats.
+
+        Waits for queued items to be sent and for in-flight batches to
+        finish. If *timeout* expires first, delivery continues on the
+        event loop and the items not yet delivered are counted in
+        ``events_pending``. Calling ``close()`` more than once is
+        harmless.
+
+        Args:
+            timeout: Maximum seconds to wait for delivery, or ``None``
+                to wait indefinitely.
+
+        Returns:
+            Counters for added, sent, failed, dropped, and pending items
+            and batches.
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put_nowait(_STOP)
+        try:
+            # shield() keeps the batching task alive if the wait times out.
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.stats
+
+    @property
+    def stats(self) -> "IngestStats":
+        """A snapshot of the delivery counters."""
+        return _snapshot(self._stats)
+
+    async def __aenter__(self) -> "_AsyncBatchWorker":
+        """Enter the async context manager, returning the worker."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit the async context manager, flushing and stopping the worker."""
+        await self.close()
+
+    # ----- internals -----
+
+    async def _run(self) -> None:
+        """Batching loop executed as an event-loop task."""
+        loop = asyncio.get_running_loop()
+        batch: List[Dict[str, Any]] = []
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                item = _TIMEOUT
+
+            if item is _TIMEOUT:
+                await self._dispatch(batch)
+                batch, deadline = [], None
+            elif item is _STOP:
+                await self._dispatch(batch)
+                if self._in_flight:
+                    await asyncio.wait(self._in_flight)
+                return
+            elif isinstance(item, _AsyncFlush):
+                await self._dispatch(batch)
+                batch, deadline = [], None
+                item.done.set()
+            else:
+                batch.append(item)
+                if deadline is None:
+                    deadline = loop.time() + self._max_latency
+                if len(batch) >= self._max_batch:
+                    await self._dispatch(batch)
+                    batch, deadline = [], None
+
+    async def _dispatch(self, batch: List[Dict[str, Any]]) -> None:
+        """Start a sender task for a batch, waiting for a free slot."""
+        if not batch:
+            return
+        await self._slots.acquire()
+        task = asyncio.get_running_loop().create_task(self._deliver(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _deliver(self, batch: List[Dict[str, Any]]) -> None:
+        """Send one batch and record the outcome."""
+        try:
+            await self._send(batch)
+        except Exception as exc:
+            self._stats["events_failed"] += len(batch)
+            self._stats["batches_failed"] += 1
+            if self._on_error is not None:
+                self._on_error(exc, batch)
+        else:
+            self._stats["events_sent"] += len(batch)
+            self._stats["batches_sent"] += 1
+        finally:
+            self._slots.release()
+
+
+class AsyncJourneyIngestor(_AsyncBatchWorker):
+    """Buffer journey events and ingest them in batches on the event loop.
+
+    Create one with ``client.journey.ingestor()`` on an
+    :class:`~qck.AsyncQCK` client, from inside a running event loop.
+    Behaves like :class:`JourneyIngestor`, but :meth:`flush` and
+    :meth:`close` are coroutines.
+
+    Example::
+
+        async with client.journey.ingestor(max_latency_ms=500) as ingestor:
+            for event in events:
+                ingestor.add(event)
+        print(ingestor.stats)
+    """
+
+    def __init__(
+        self,
+        journey: "AsyncJourneyResource",
+        *,
+        max_batch: int = _MAX_EVENTS_PER_REQUEST,
+        max_latency_ms: int = _DEFAULT_MAX_LATENCY_MS,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """Start an ingestor on the running event loop.
+
+        Args:
+            journey: The async journey resource used to send batches.
+            max_batch: Maximum events per request (1-100).
+            max_latency_ms: Maximum time an event waits before its
+                partial batch is sent.
+            max_queue: Maximum queued events; ``0`` means unbounded.
+            concurrency: Number of batch requests that may be in flight.
+            on_error: Called with ``(exception, events)`` when a batch
+                fails after the client's automatic retries.
+
+        Raises:
+            ValueError: If *max_batch* is not between 1 and 100.
+            RuntimeError: If no event loop is running.
+        """
+        if not 1 <= max_batch <= _MAX_EVENTS_PER_REQUEST:
+            raise ValueError(f"max_batch must be between 1 and {_MAX_EVENTS_PER_REQUEST}")
+        super().__init__(
+            lambda events: journey.ingest({"events": events}),  # type: ignore[typeddict-item]
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+        )
+
+    def add(self, event: "JourneyEvent") -> bool:  # type: ignore[override]
+        """Queue a journey event for the next batch without waiting.
+
+        Args:
+            event: The journey event to ingest.
+
+        Returns:
+            ``True`` if queued, ``False`` if dropped because the queue
+            is full.
+
+        Raises:
+            RuntimeError: If the ingestor has been closed.
+        """
+        return super().add(dict(event))
+
+    async def __aenter__(self) -> "AsyncJourneyIngestor":
+        """Enter the async context manager, returning the ingestor."""
+        return self
+
+
+class AsyncConversionTracker(_AsyncBatchWorker):
+    """Buffer conversion events and send them in batches on the event loop.
+
+    Create one with ``client.conversions.tracker()`` on an
+    :class:`~qck.AsyncQCK` client, from inside a running event loop.
+    Behaves like :class:`ConversionTracker`, including one
+    ``X-Idempotency-Key`` per batch, but :meth:`flush` and :meth:`close`
+    are coroutines.
+
+    Example::
+
+        tracker = client.conversions.tracker(max_latency_ms=2000)
+        tracker.track({"link_id": link_id, "visitor_id": "u-1", "name": "purchase"})
+        stats = await tracker.close()
+    """
+
+    def __init__(
+        self,
+        client: "AsyncHttpClient",
+        *,
+        max_batch: int = _MAX_EVENTS_PER_REQUEST,
+        max_latency_ms: int = _DEFAULT_MAX_LATENCY_MS,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional[ErrorCallback] = None,
+    ) -> None:
+        """Start a conversion tracker on the running event loop.
+
+        Args:
+            client: Async HTTP client used to post batches.
+            max_batch: Maximum conversions per request (1-100).
+            max_latency_ms: Maximum time a conversion waits before its
+                partial batch is sent.
+            max_queue: Maximum queued conversions; ``0`` means unbounded.
+            concurrency: Number of batch requests that may be in flight.
+            on_error: Called with ``(exception, events)`` when a batch
+                fails after the client's automatic retries.
+
+        Raises:
+            ValueError: If *max_batch* is not between 1 and 100.
+            RuntimeError: If no event loop is running.
+        """
+        if not 1 <= max_batch <= _MAX_EVENTS_PER_REQUEST:
+            raise ValueError(f"max_batch must be between 1 and {_MAX_EVENTS_PER_REQUEST}")
+
+        async def send(events: List[Dict[str, Any]]) -> None:
+            await client.post(
+                "/journey/events",
+                {"events": events},
+                headers={"X-Idempotency-Key": uuid.uuid4().hex},
+            )
+
+        super().__init__(
+            send,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+        )
+
+    def track(self, params: "TrackConversionParams") -> bool:
+        """Queue a conversion for the next batch without waiting.
+
+        Args:
+            params: Conversion parameters, as for
+                :meth:`~qck.resources.AsyncConversionsResource.track`.
+
+        Returns:
+            ``True`` if queued, ``False`` if dropped because the queue
+            is full.
+
+        Raises:
+            KeyError: If a required field (``link_id``, ``visitor_id``,
+                ``name``) is missing.
+            RuntimeError: If the tracker has been closed.
+        """
+        return self.add(conversion_event(params))
+
+    async def __aenter__(self) -> "AsyncConversionTracker":
+        """Enter the async context manager, returning the tracker."""
+        return self
@@ -0,0 +1,555 @@
+"""Local, incrementally synced mirror of the link table.
+
+Jobs that scan every link over and over (redirect audits, exports,
+reconciliation) should not page through ``/links`` from scratch each
+time. A :class:`LinkMirror` keeps the links in an SQLite database — in
+memory or in a file that survives restarts — and answers lookups by id,
+alias, tag, and domain locally, from indexed tables.
+
+:meth:`LinkMirror.sync` pages through ``links.iter_all`` sorted by
+``created_at``:
+
+* The first sync (and every ``full=True`` sync) fetches everything and
+  then removes links that were not seen, so deletions are picked up.
+* Later syncs only ask for links created after the newest one already
+  mirrored (``created_after``), so they cost a single request when
+  nothing changed. The cursor is moved back by a second so links that
+  share the newest timestamp (or were committed just after it was read)
+  are not missed; links already mirrored are skipped.
+* A first sync that finds no links records its start time as the
+  cursor, so the next sync is still incremental.
+
+Sync requests bypass the client's response cache: a cached page would
+hide links created since it was stored.
+
+The API has no ``updated_after`` filter, so edits to existing links are
+only picked up by a full sync. Set ``full_sync_interval`` to do one
+automatically, or call :meth:`LinkMirror.refresh` for links you know
+have changed.
+
+On a client created with ``models=True``, lookups return
+:class:`qck.models.Link` records.
+
+Example::
+
+    from qck import QCK
+
+    client = QCK(api_key="qck_...")
+    mirror = client.links.mirror("links.db", full_sync_interval=3600)
+    mirror.sync()
+
+    link = mirror.by_alias("summer-sale")
+    tagged = mirror.by_tag("marketing")
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from ._codec import get_codec
+from ._errors import NotFoundError
+from .models import Link as LinkRecord
+from .models import Record, decode
+
+if TYPE_CHECKING:
+    from ._types import Link, ListLinksParams, MirrorSyncStats
+    from .resources.links import AsyncLinksResource, LinksResource
+
+_DEFAULT_PER_PAGE = 100
+_DEFAULT_PREFETCH = 4
+_WRITE_BATCH = 500
+# How far incremental syncs re-read before the cursor, in seconds.
+_CURSOR_OVERLAP = 1.0
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS qck_links ("
+    " id TEXT PRIMARY KEY,"
+    " short_code TEXT,"
+    " domain TEXT,"
+    " created_at TEXT,"
+    " generation INTEGER NOT NULL,"
+    " data BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS qck_links_short_code ON qck_links (short_code)",
+    "CREATE INDEX IF NOT EXISTS qck_links_domain ON qck_links (domain)",
+    "CREATE TABLE IF NOT EXISTS qck_link_tags ("
+    " tag TEXT NOT NULL,"
+    " link_id TEXT NOT NULL,"
+    " PRIMARY KEY (tag, link_id)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS qck_link_tags_link ON qck_link_tags (link_id)",
+    "CREATE TABLE IF NOT EXISTS qck_mirror_state (key TEXT PRIMARY KEY, value TEXT)",
+)
+
+
+def _utc_timestamp(epoch: float) -> str:
+    """Format a Unix time like the API's ``created_at`` values."""
+    stamp = datetime.fromtimestamp(epoch, timezone.utc).isoformat(timespec="milliseconds")
+    return stamp.replace("+00:00", "Z")
+
+
+def _overlap(cursor: str) -> str:
+    """Move an ISO 8601 *cursor* back by :data:`_CURSOR_OVERLAP` seconds.
+
+    Unparseable cursors are returned unchanged.
+    """
+    try:
+        parsed = datetime.fromisoformat(cursor.replace("Z", "+00:00"))
+    except ValueError:
+        return cursor
+    earlier = (parsed - timedelta(seconds=_CURSOR_OVERLAP)).isoformat()
+    return earlier.replace("+00:00", "Z") if cursor.endswith("Z") else earlier
+
+
+class _LinkStore:
+    """SQLite storage and lookups shared by the sync and async mirrors."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        params: Optional["ListLinksParams"],
+        per_page: int,
+        prefetch: int,
+        full_sync_interval: Optional[float],
+        models: bool,
+    ) -> None:
+        """Open (or create) the mirror database.
+
+        Args:
+            path: SQLite database path, or ``":memory:"``.
+            params: Base list filters limiting which links are mirrored.
+            per_page: Page size used while syncing.
+            prefetch: Pages requested ahead while syncing.
+            full_sync_interval: Seconds after which :meth:`sync` does a
+                full sync on its own; ``None`` disables it.
+            models: Return lookups as :class:`qck.models.Link` records.
+        """
+        self._params: Dict[str, Any] = dict(params or {})
+        for key in ("page", "sort_by", "sort_order", "created_after"):
+            self._params.pop(key, None)
+        self._per_page = per_page
+        self._prefetch = prefetch
+        self._full_sync_interval = full_sync_interval
+        self._models = models
+        self._codec = get_codec()
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+
+    # -- lookups ---------------------------------------------------------
+
+    def get(self, link_id: str) -> Optional["Link"]:
+        """Return the mirrored link with *link_id*, or ``None``."""
+        rows = self._query("SELECT data FROM qck_links WHERE id = ?", (link_id,))
+        return rows[0] if rows else None
+
+    def by_alias(self, short_code: str, domain: Optional[str] = None) -> Optional["Link"]:
+        """Return the link with short code (alias) *short_code*, or ``None``.
+
+        Args:
+            short_code: The link's short code or custom alias.
+            domain: Custom domain name, when the same alias exists on
+                several domains. ``None`` matches any domain.
+        """
+        if domain is None:
+            rows = self._query("SELECT data FROM qck_links WHERE short_code = ?", (short_code,))
+        else:
+            rows = self._query(
+                "SELECT data FROM qck_links WHERE short_code = ? AND domain = ?",
+                (short_code, domain),
+            )
+        return rows[0] if rows else None
+
+    def by_tag(self, tag: str) -> List["Link"]:
+        """Return every mirrored link carrying *tag*, oldest first."""
+        return self._query(
+            "SELECT l.data FROM qck_link_tags t JOIN qck_links l ON l.id = t.link_id"
+            " WHERE t.tag = ? ORDER BY l.created_at",
+            (tag,),
+        )
+
+    def by_domain(self, domain: Optional[str]) -> List["Link"]:
+        """Return every mirrored link on custom *domain*, oldest first.
+
+        Pass ``None`` for links on the default platform domain.
+        """
+        if domain is None:
+            return self._query(
+                "SELECT data FROM qck_links WHERE domain IS NULL ORDER BY created_at", ()
+            )
+        return self._query(
+            "SELECT data FROM qck_links WHERE domain = ? ORDER BY created_at", (domain,)
+        )
+
+    def __len__(self) -> int:
+        """Number of mirrored links."""
+        with self._lock:
+            return int(self._db.execute("SELECT COUNT(*) FROM qck_links").fetchone()[0])
+
+    def __contains__(self, link_id: object) -> bool:
+        """Whether a link with id *link_id* is mirrored."""
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM qck_links WHERE id = ?", (link_id,)).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator["Link"]:
+        """Iterate over every mirrored link, oldest first."""
+        return iter(self._query("SELECT data FROM qck_links ORDER BY created_at", ()))
+
+    @property
+    def last_sync(self) -> Optional[float]:
+        """Unix time of the last completed sync, or ``None``."""
+        value = self._state("last_sync")
+        return float(value) if value is not None else None
+
+    def clear(self) -> None:
+        """Remove every mirrored link and the sync state."""
+        with self._lock:
+            self._db.execute("BEGIN")
+            for table in ("qck_links", "qck_link_tags", "qck_mirror_state"):
+                self._db.execute(f"DELETE FROM {table}")
+            self._db.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    # -- sync helpers ------------------------------------------------------
+
+    def _begin_sync(self, full: bool) -> Tuple[bool, int, "ListLinksParams", float]:
+        """Decide the sync mode and build its list parameters.
+
+        Returns:
+            ``(full, generation, params, started)`` — *started* is the
+            Unix time the sync began.
+        """
+        started = time.time()
+        cursor = self._state("cursor")
+        last_full = self._state("last_full_sync")
+        if (
+            self._full_sync_interval is not None
+            and last_full is not None
+            and time.time() - float(last_full) >= self._full_sync_interval
+        ):
+            full = True
+        full = full or cursor is None
+        generation = int(self._state("generation") or 0) + (1 if full else 0)
+        params: Dict[str, Any] = {
+            **self._params,
+            "per_page": self._per_page,
+            "sort_by": "created_at",
+            "sort_order": "asc",
+        }
+        if not full:
+            params["created_after"] = _overlap(cast(str, cursor))
+        return full, generation, cast("ListLinksParams", params), started
+
+    def _write(self, links: List["Link"], generation: int, *, skip_known: bool = False) -> int:
+        """Upsert *links* in one transaction, advancing the cursor.
+
+        Args:
+            links: Links to store.
+            generation: Generation to stamp them with.
+            skip_known: Leave links that are already mirrored untouched,
+                for the overlap an incremental sync re-reads.
+
+        Returns:
+            The number of links written.
+        """
+        if not links:
+            return 0
+        cursor = self._state("cursor") or ""
+        written = 0
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                for link in links:
+                    if isinstance(link, Record):
+                        link = link.to_dict()
+                    link_id = link.get("id")
+                    if not link_id or (skip_known and link_id in self):
+                        continue
+                    created_at = link.get("created_at") or ""
+                    cursor = max(cursor, created_at)
+                    written += 1
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO qck_links"
+                        " (id, short_code, domain, created_at, generation, data)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            link_id,
+                            link.get("short_code"),
+                            link.get("domain_name"),
+                            created_at,
+                            generation,
+                            self._codec.dumps(link),
+                        ),
+                    )
+                    self._db.execute("DELETE FROM qck_link_tags WHERE link_id = ?", (link_id,))
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO qck_link_tags (tag, link_id) VALUES (?, ?)",
+                        [(tag, link_id) for tag in link.get("tags") or ()],
+                    )
+                if cursor:
+                    self._set_state("cursor", cursor)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return written
+
+    def _finish_sync(
+        self, full: bool, generation: int, fetched: int, started: float
+    ) -> "MirrorSyncStats":
+        """Record a completed sync, sweeping stale links after a full one.
+
+        A sync that left no cursor (nothing mirrored yet) stores its start
+        time instead, so the next sync can be incremental.
+        """
+        removed = 0
+        now = str(time.time())
+        with self._lock:
+            self._db.execute("BEGIN")
+            if self._state("cursor") is None:
+                self._set_state("cursor", _utc_timestamp(started))
+            if full:
+                removed = self._db.execute(
+                    "DELETE FROM qck_links WHERE generation < ?", (generation,)
+                ).rowcount
+                self._db.execute(
+                    "DELETE FROM qck_link_tags"
+                    " WHERE link_id NOT IN (SELECT id FROM qck_links)"
+                )
+                self._set_state("generation", str(generation))
+                self._set_state("last_full_sync", now)
+            self._set_state("last_sync", now)
+            self._db.execute("COMMIT")
+        return {"full": full, "fetched": fetched, "removed": removed, "total": len(self)}
+
+    def _forget(self, link_id: str) -> None:
+        """Remove one link from the mirror."""
+        with self._lock:
+            self._db.execute("DELETE FROM qck_links WHERE id = ?", (link_id,))
+            self._db.execute("DELETE FROM qck_link_tags WHERE link_id = ?", (link_id,))
+
+    def _generation(self) -> int:
+        """The generation stamped on links written outside a full sync."""
+        return int(self._state("generation") or 0)
+
+    # -- low level -----------------------------------------------------------
+
+    def _query(self, sql: str, args: Tuple[Any, ...]) -> List["Link"]:
+        """Run a ``SELECT data`` query and decode the links."""
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        loads = self._codec.loads
+        links: List["Link"] = [loads(row[0]) for row in rows]
+        if self._models:
+            # Decoded like the resource methods: records stand in for the dicts.
+            links = decode(LinkRecord, links)
+        return links
+
+    def _state(self, key: str) -> Optional[str]:
+        """Read a sync-state value."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM qck_mirror_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        """Write a sync-state value."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO qck_mirror_state (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+
+def _batches(links: Iterable["Link"]) -> Iterator[List["Link"]]:
+    """Group a link stream into write batches."""
+    batch: List["Link"] = []
+    for link in links:
+        batch.append(link)
+        if len(batch) >= _WRITE_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class LinkMirror(_LinkStore):
+    """A local SQLite mirror of your links with incremental sync.
+
+    Create one with :meth:`LinksResource.mirror` (``client.links.mirror()``).
+    Lookups never touch the network; call :meth:`sync` to bring the
+    mirror up to date.
+    """
+
+    def __init__(
+        self,
+        links: "LinksResource",
+        path: str = ":memory:",
+        *,
+        params: Optional["ListLinksParams"] = None,
+        per_page: int = _DEFAULT_PER_PAGE,
+        prefetch: int = _DEFAULT_PREFETCH,
+        full_sync_interval: Optional[float] = None,
+    ) -> None:
+        """Create a mirror backed by *links*.
+
+        Args:
+            links: The links resource used for syncing.
+            path: SQLite database path, or ``":memory:"`` (default).
+            params: List filters limiting which links are mirrored
+                (e.g. ``{"domain": "links.example.com"}``). Paging and
+                sorting keys are managed by the mirror.
+            per_page: Page size used while syncing.
+            prefetch: Pages requested ahead while syncing.
+            full_sync_interval: Seconds after which :meth:`sync` does a
+                full sync on its own, to pick up edits and deletions.
+        """
+        super().__init__(
+            path,
+            params=params,
+            per_page=per_page,
+            prefetch=prefetch,
+            full_sync_interval=full_sync_interval,
+            models=links._client.models,
+        )
+        self._links = links
+
+    def sync(self, *, full: bool = False) -> "MirrorSyncStats":
+        """Bring the mirror up to date.
+
+        Args:
+            full: Re-fetch every link and drop the ones that no longer
+                exist. Implied on the first sync and when
+                ``full_sync_interval`` has elapsed.
+
+        Returns:
+            What the sync did: ``full``, ``fetched``, ``removed``, and
+            the new ``total``.
+        """
+        full, generation, params, started = self._begin_sync(full)
+        pages = self._links._iter_pages(params, prefetch=self._prefetch, cache=False)
+        fetched = 0
+        for batch in _batches(link for page in pages for link in page["data"]):
+            fetched += self._write(batch, generation, skip_known=not full)
+        return self._finish_sync(full, generation, fetched, started)
+
+    def refresh(self, link_id: str) -> Optional["Link"]:
+        """Re-fetch one link, dropping it from the mirror if it was deleted.
+
+        Returns:
+            The current link, or ``None`` if it no longer exists.
+        """
+        try:
+            link = self._links.get(link_id)
+        except NotFoundError:
+            self._forget(link_id)
+            return None
+        self._write([link], self._generation())
+        return link
+
+    def __enter__(self) -> "LinkMirror":
+        """Enter the context manager, returning the mirror."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the context manager, closing the database."""
+        self.close()
+
+
+class AsyncLinkMirror(_LinkStore):
+    """Asynchronous counterpart of :class:`LinkMirror`.
+
+    Create one with ``client.links.mirror()`` on an
+    :class:`~qck.AsyncQCK` client. Lookups are synchronous and local;
+    only :meth:`sync` and :meth:`refresh` must be awaited.
+    """
+
+    def __init__(
+        self,
+        links: "AsyncLinksResource",
+        path: str = ":memory:",
+        *,
+        params: Optional["ListLinksParams"] = None,
+        per_page: int = _DEFAULT_PER_PAGE,
+        prefetch: int = _DEFAULT_PREFETCH,
+        full_sync_interval: Optional[float] = None,
+    ) -> None:
+        """Create a mirror backed by *links*.
+
+        Args:
+            links: The async links resource used for syncing.
+            path: SQLite database path, or ``":memory:"`` (default).
+            params: List filters limiting which links are mirrored.
+            per_page: Page size used while syncing.
+            prefetch: Pages requested ahead while syncing.
+            full_sync_interval: Seconds after which :meth:`sync` does a
+                full sync on its own.
+        """
+        super().__init__(
+            path,
+            params=params,
+            per_page=per_page,
+            prefetch=prefetch,
+            full_sync_interval=full_sync_interval,
+            models=links._client.models,
+        )
+        self._links = links
+
+    async def sync(self, *, full: bool = False) -> "MirrorSyncStats":
+        """Bring the mirror up to date.
+
+        Args:
+            full: Re-fetch every link and drop the ones that no longer
+                exist.
+
+        Returns:
+            What the sync did: ``full``, ``fetched``, ``removed``, and
+            the new ``total``.
+        """
+        full, generation, params, started = self._begin_sync(full)
+        pages = self._links._iter_pages(params, prefetch=self._prefetch, cache=False)
+        fetched = 0
+        batch: List["Link"] = []
+        async for page in pages:
+            batch.extend(page["data"])
+            if len(batch) >= _WRITE_BATCH:
+                fetched += self._write(batch, generation, skip_known=not full)
+                batch = []
+        fetched += self._write(batch, generation, skip_known=not full)
+        return self._finish_sync(full, generation, fetched, started)
+
+    async def refresh(self, link_id: str) -> Optional["Link"]:
+        """Re-fetch one link, dropping it from the mirror if it was deleted.
+
+        Returns:
+            The current link, or ``None`` if it no longer exists.
+        """
+        try:
+            link = await self._links.get(link_id)
+        except NotFoundError:
+            self._forget(link_id)
+            return None
+        self._write([link], self._generation())
+        return link
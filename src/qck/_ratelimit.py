@@ -0,0 +1,225 @@
+"""Client-side, adaptive token-bucket rate limiting.
+
+Without a limiter the SDK only discovers the API's rate limit by hitting
+it: every worker that receives a ``429`` sleeps for the full
+``Retry-After`` on its own and then all of them retry at once.
+:class:`RateLimiter` paces requests *before* they are sent instead:
+
+* Requests draw from a token bucket refilled at ``rate`` requests per
+  second, allowing bursts of up to ``burst`` requests.
+* A ``429`` anywhere pauses *every* sender sharing the limiter until
+  ``Retry-After`` has elapsed, after which requests resume one token at a
+  time rather than as a stampede.
+* With ``adaptive=True`` the rate is halved on each ``429`` and recovers
+  gradually on success, and ``X-RateLimit-*`` / ``RateLimit-*`` response
+  headers cap it at what the server says is left in the current window.
+
+The limiter is thread-safe and never sleeps itself: :meth:`RateLimiter.reserve`
+returns how long the caller must wait, so the same instance serves
+:class:`~qck.QCK` (``time.sleep``) and :class:`~qck.AsyncQCK`
+(``asyncio.sleep``) alike, and can be shared between clients::
+
+    from qck import QCK, RateLimiter
+
+    limiter = RateLimiter(rate=10, burst=20)
+    client = QCK(api_key="qck_...", rate_limit=limiter)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Mapping, Optional, Union, cast
+
+# Epoch timestamps are told apart from delta-seconds reset headers by size.
+_EPOCH_THRESHOLD = 1_000_000_000
+# Fraction of the configured rate restored after each successful response.
+_RECOVERY_STEP = 0.05
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    """Return the first of *names* present in *headers* as a float."""
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value.split(",")[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request of a client.
+
+    Implemented as a generic cell rate algorithm: instead of counting
+    tokens, the limiter tracks the theoretical arrival time of the next
+    request, which makes reservations O(1) and lets a pause be expressed
+    by simply moving that time forward.
+
+    Example:
+        >>> limiter = RateLimiter(rate=5, burst=10)
+        >>> client = QCK(api_key="qck_...", rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        *,
+        adaptive: bool = True,
+        min_rate: Optional[float] = None,
+    ) -> None:
+        """Create a rate limiter.
+
+        Args:
+            rate: Sustained request rate in requests per second.
+            burst: Maximum number of requests sent back to back when the
+                bucket is full. Defaults to ``max(1, int(rate))``.
+            adaptive: Slow down on ``429`` responses and follow the
+                server's rate-limit headers.
+            min_rate: Floor for the adapted rate. Defaults to a tenth of
+                *rate*.
+
+        Raises:
+            ValueError: If *rate* is not positive or *burst* is less than 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._max_rate = float(rate)
+        self._rate = float(rate)
+        self._min_rate = float(min_rate) if min_rate is not None else self._max_rate / 10
+        self._burst = burst
+        self._adaptive = adaptive
+        self._ceiling = self._max_rate
+        self._tat = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """The current (possibly adapted) request rate per second."""
+        return self._rate
+
+    def reserve(self) -> float:
+        """Take one token, returning how long to wait before sending.
+
+        The token is consumed immediately, so concurrent callers are
+        spaced out rather than all waking up at the same moment.
+
+        Returns:
+            Seconds the caller must wait before sending its request.
+        """
+        return cast(float, self.try_reserve(None))
+
+    def try_reserve(self, max_wait: Optional[float]) -> Optional[float]:
+        """Take one token only if it is available within *max_wait* seconds.
+
+        Lets a caller with a deadline find out that it cannot send in
+        time without using up a token that another request could have
+        had.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds, or ``None`` for
+                no limit.
+
+        Returns:
+            Seconds the caller must wait before sending, or ``None`` if
+            the wait would not end before *max_wait* (no token is taken).
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self._rate
+            tolerance = (self._burst - 1) * interval
+            tat = max(self._tat, now)
+            wait = max(0.0, tat - tolerance - now)
+            if max_wait is not None and wait >= max_wait:
+                return None
+            self._tat = tat + interval
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every sender for *seconds*.
+
+        Once the pause ends the bucket is empty, so requests resume at the
+        sustained rate instead of bursting.
+
+        Args:
+            seconds: Pause length in seconds.
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._pause_locked(time.monotonic() + seconds)
+
+    def backoff(self, retry_after: float) -> None:
+        """Record a ``429`` response.
+
+        Pauses all senders for *retry_after* seconds and, when adaptive,
+        halves the current rate.
+
+        Args:
+            retry_after: The ``Retry-After`` value in seconds.
+        """
+        with self._lock:
+            if self._adaptive:
+                self._rate = max(self._min_rate, self._rate / 2)
+            self._pause_locked(time.monotonic() + max(0.0, retry_after))
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adapt to the rate-limit headers of a non-429 response.
+
+        Understands ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` and
+        their IETF ``RateLimit-*`` equivalents; reset values may be delta
+        seconds or Unix timestamps. When the quota left in the
+        window is exhausted, all senders pause until it resets; otherwise
+        the rate is capped at the remaining quota spread over the rest of
+        the window. Without headers, a previously reduced rate recovers
+        by a small step.
+
+        Args:
+            headers: Response headers (case-insensitive mapping).
+        """
+        if not self._adaptive:
+            return
+        remaining = _header_float(headers, "x-ratelimit-remaining", "ratelimit-remaining")
+        reset = _header_float(headers, "x-ratelimit-reset", "ratelimit-reset")
+        with self._lock:
+            now = time.monotonic()
+            if remaining is not None and reset is not None:
+                if reset > _EPOCH_THRESHOLD:
+                    reset -= time.time()
+                reset = max(0.0, reset)
+                if remaining < 1 and reset > 0:
+                    self._pause_locked(now + reset)
+                    return
+                if reset > 0:
+                    self._ceiling = max(self._min_rate, min(self._max_rate, remaining / reset))
+                else:
+                    self._ceiling = self._max_rate
+            step = self._max_rate * _RECOVERY_STEP
+            self._rate = max(self._min_rate, min(self._ceiling, self._rate + step))
+
+    def _pause_locked(self, until: float) -> None:
+        """Empty the bucket and push the next free slot to *until*."""
+        tolerance = (self._burst - 1) / self._rate
+        self._tat = max(self._tat, until + tolerance)
+
+
+def _as_rate_limiter(rate_limit: Union[float, RateLimiter, None]) -> Optional[RateLimiter]:
+    """Build a limiter from a client's ``rate_limit`` argument.
+
+    Args:
+        rate_limit: ``None`` (disabled), requests per second, or an
+            existing :class:`RateLimiter` to share.
+
+    Returns:
+        The limiter to use, or ``None``.
+    """
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(rate_limit)
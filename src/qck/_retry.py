@@ -0,0 +1,241 @@
+"""Retry back-off strategies, a client-wide retry budget, and deadlines.
+
+:class:`RetryPolicy` controls *how* the HTTP clients retry transient
+failures (the *number* of attempts is still the client's ``retries``):
+
+* **Back-off strategy** — ``"full_jitter"`` (the default) sleeps a
+  uniformly random time between 0 and the exponential ceiling,
+  ``"decorrelated_jitter"`` grows each sleep from the previous one, and
+  ``"exponential"`` keeps the old deterministic ``base * 2 ** attempt``.
+  Jitter spreads the retries of many workers hit by the same outage
+  instead of retrying them in lockstep. A callable
+  ``(attempt, previous_delay) -> seconds`` can be supplied instead.
+* **Retry budget** — a :class:`RetryBudget` caps retries at a fraction of
+  the requests sent recently by the whole client, so an outage cannot
+  multiply the load on the API.
+* **Deadline** — an upper bound on the total time of one call, including
+  retry sleeps. A retry that would end past the deadline is not
+  attempted, and each attempt's timeout is shortened to the time left.
+* **Retryable statuses** — ``502``, ``503``, and ``504`` responses are
+  retried like network errors (for idempotent requests only) by default;
+  ``retry_statuses`` changes the set.
+
+Example::
+
+    from qck import QCK, RetryBudget, RetryPolicy
+
+    policy = RetryPolicy(
+        backoff="decorrelated_jitter",
+        budget=RetryBudget(ratio=0.1),
+        deadline=5.0,
+    )
+    client = QCK(api_key="qck_...", retry_policy=policy)
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, Optional, Union
+
+BackoffFn = Callable[[int, float], float]
+"""Back-off strategy: ``(attempt, previous_delay) -> delay`` in seconds."""
+
+_DEFAULT_BASE_DELAY = 1.0
+_DEFAULT_MAX_DELAY = 10.0
+# Gateway and availability errors: the request most likely never reached
+# application code, so an idempotent retry is safe.
+_DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({502, 503, 504})
+
+
+class RetryBudget:
+    """Thread-safe cap on retries relative to recent request volume.
+
+    Every logical request deposits into the budget and every retry
+    withdraws from it. A retry is allowed while the retries made in the
+    last *window* seconds stay below ``min_retries`` plus *ratio* times
+    the requests made in the same window.
+
+    Example:
+        >>> budget = RetryBudget(ratio=0.2, window=10.0, min_retries=10)
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, *, window: float = 10.0, min_retries: int = 10
+    ) -> None:
+        """Create a retry budget.
+
+        Args:
+            ratio: Fraction of recent requests that may be retried.
+            window: Length of the sliding window in seconds.
+            min_retries: Retries always allowed per window, so a
+                low-traffic client can still retry.
+
+        Raises:
+            ValueError: If *ratio* is negative or *window* is not positive.
+        """
+        if ratio < 0:
+            raise ValueError("ratio must not be negative")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self._ratio = ratio
+        self._window = window
+        self._min_retries = min_retries
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Deposit one logical request into the budget."""
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """Withdraw one retry from the budget.
+
+        Returns:
+            ``True`` if the retry is allowed (and has been recorded),
+            ``False`` if the budget is exhausted.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self._min_retries + self._ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+    def _expire(self, now: float) -> None:
+        """Drop timestamps that have left the sliding window."""
+        cutoff = now - self._window
+        for stamps in (self._requests, self._retries):
+            while stamps and stamps[0] < cutoff:
+                stamps.popleft()
+
+
+def _exponential(base: float, cap: float) -> BackoffFn:
+    """Deterministic ``base * 2 ** attempt`` capped at *cap*."""
+    return lambda attempt, previous: min(cap, base * 2**attempt)
+
+
+def _full_jitter(base: float, cap: float) -> BackoffFn:
+    """Uniform in ``[0, min(cap, base * 2 ** attempt)]``."""
+    return lambda attempt, previous: random.uniform(0, min(cap, base * 2**attempt))
+
+
+def _decorrelated_jitter(base: float, cap: float) -> BackoffFn:
+    """Uniform in ``[base, previous * 3]`` capped at *cap*."""
+    return lambda attempt, previous: min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+_BACKOFFS: Dict[str, Callable[[float, float], BackoffFn]] = {
+    "exponential": _exponential,
+    "full_jitter": _full_jitter,
+    "decorrelated_jitter": _decorrelated_jitter,
+}
+
+
+class RetryPolicy:
+    """How the HTTP clients space out and limit their retries.
+
+    Example:
+        >>> policy = RetryPolicy(backoff="full_jitter", deadline=3.0)
+        >>> client = QCK(api_key="qck_...", retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        backoff: Union[str, BackoffFn] = "full_jitter",
+        *,
+        base_delay: float = _DEFAULT_BASE_DELAY,
+        max_delay: float = _DEFAULT_MAX_DELAY,
+        budget: Optional[RetryBudget] = None,
+        deadline: Optional[float] = None,
+        retry_statuses: Iterable[int] = _DEFAULT_RETRY_STATUSES,
+    ) -> None:
+        """Create a retry policy.
+
+        Args:
+            backoff: ``"full_jitter"``, ``"decorrelated_jitter"``,
+                ``"exponential"``, or a callable
+                ``(attempt, previous_delay) -> seconds``.
+            base_delay: Base delay in seconds for the built-in strategies.
+            max_delay: Upper bound in seconds for a single back-off sleep.
+            budget: Optional client-wide :class:`RetryBudget`. Share one
+                instance between clients to pool their budget.
+            deadline: Optional limit in seconds on the total duration of
+                one call, retries and sleeps included.
+            retry_statuses: HTTP status codes retried for idempotent
+                requests. Defaults to ``502``, ``503``, and ``504``.
+
+        Raises:
+            ValueError: If *backoff* names an unknown strategy or
+                *deadline* is not positive.
+        """
+        if isinstance(backoff, str):
+            try:
+                backoff = _BACKOFFS[backoff](base_delay, max_delay)
+            except KeyError:
+                raise ValueError(
+                    f"unknown backoff {backoff!r}; expected one of {', '.join(_BACKOFFS)}"
+                ) from None
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        self._backoff = backoff
+        self.base_delay = base_delay
+        self.budget = budget
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def start(self) -> Optional[float]:
+        """Begin one logical request.
+
+        Records it with the retry budget and returns its absolute
+        deadline on the :func:`time.monotonic` clock, if any.
+        """
+        if self.budget is not None:
+            self.budget.record_request()
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    def delay(self, attempt: int, previous: float) -> float:
+        """Back-off before retry number *attempt* (zero-based).
+
+        Args:
+            attempt: Zero-based index of the failed attempt.
+            previous: The previous back-off delay (``0`` on the first retry).
+
+        Returns:
+            Seconds to sleep before retrying.
+        """
+        return max(0.0, self._backoff(attempt, previous or self.base_delay))
+
+    def allow_retry(self, deadline: Optional[float], delay: float) -> bool:
+        """Whether a retry after *delay* seconds may be attempted.
+
+        Rejects the retry when it would start past *deadline* or when the
+        retry budget is exhausted.
+        """
+        if not self.fits(deadline, delay):
+            return False
+        if self.budget is not None and not self.budget.try_retry():
+            return False
+        return True
+
+    @staticmethod
+    def fits(deadline: Optional[float], delay: float) -> bool:
+        """Whether sleeping *delay* seconds still ends before *deadline*."""
+        return deadline is None or time.monotonic() + delay < deadline
+
+    @staticmethod
+    def remaining(deadline: Optional[float]) -> Optional[float]:
+        """Seconds left until *deadline*, or ``None`` without a deadline."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
@@ -0,0 +1,287 @@
+"""Local week / month / quarter rollups of timeseries data.
+
+The timeseries endpoints return daily (or finer) buckets. Weekly,
+monthly, and quarterly reports can be computed from a series that is
+already held locally — for example the buckets kept by an
+:class:`~qck.IncrementalTimeseries` — so changing the report
+granularity costs no API calls. :func:`rollup` groups the buckets in a
+single pass and sums their numeric fields. :class:`~qck.Columns` input
+is aggregated column by column — with ``numpy.bincount`` when NumPy is
+installed — and each distinct date or timestamp is parsed only once.
+
+Bucket boundaries are computed in the time zone passed as ``tz``:
+
+* Points with a ``timestamp`` (:class:`~qck.ConversionTimeseriesPoint`)
+  are converted to ``tz`` before being assigned to a period, so an
+  hourly conversion series rolls up on local midnights exactly.
+* Points with a ``date`` (:class:`~qck.TimeseriesPoint`) are days the
+  API has already aggregated in UTC; they are assigned to the period
+  containing that calendar day.
+
+``unique_visitors`` is summed like the other counts, so a rolled-up
+value is an upper bound: a visitor active on several days is counted
+once per day.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union, overload
+
+from ._columns import Columns
+
+ROLLUP_PERIODS = ("day", "week", "month", "quarter", "year")
+
+_KEY_FIELDS = ("date", "timestamp")
+
+
+def _zone(tz: Union[str, tzinfo, None]) -> tzinfo:
+    """Resolve *tz* to a :class:`~datetime.tzinfo`."""
+    if tz is None or tz == "UTC":
+        return timezone.utc
+    if isinstance(tz, tzinfo):
+        return tz
+    from zoneinfo import ZoneInfo
+
+    return ZoneInfo(tz)
+
+
+def _period_start(day: date, period: str, week_start: int) -> date:
+    """The first day of the *period* containing *day*."""
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=(day.weekday() - week_start) % 7)
+    if period == "month":
+        return day.replace(day=1)
+    if period == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day.replace(month=1, day=1)
+
+
+def _local_day(value: Any, key: str, zone: tzinfo) -> date:
+    """The calendar day of a bucket's key, in *zone* for timestamps."""
+    text = str(value)
+    if key == "date":
+        return date.fromisoformat(text[:10])
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(zone).date()
+
+
+class _Periods:
+    """Maps bucket keys to period starts, parsing each distinct key once."""
+
+    def __init__(self, key: str, period: str, zone: tzinfo, week_start: int) -> None:
+        """Assign values of field *key* to periods of *period* in *zone*."""
+        self.key = key
+        self._period = period
+        self._zone = zone
+        self._week_start = week_start
+        self._starts: Dict[Any, date] = {}
+
+    def start(self, value: Any, row: int) -> date:
+        """The start of the period containing *value*, the key of row *row*.
+
+        Raises:
+            ValueError: If *value* is missing or not an ISO-8601 date or
+                timestamp.
+        """
+        start = self._starts.get(value)
+        if start is not None:
+            return start
+        if value is None:
+            raise ValueError(f"rollup row {row} has no {self.key!r} value")
+        try:
+            day = _local_day(value, self.key, self._zone)
+        except ValueError as exc:
+            raise ValueError(f"rollup row {row} has an invalid {self.key!r}: {exc}") from None
+        start = self._starts[value] = _period_start(day, self._period, self._week_start)
+        return start
+
+
+def _numpy() -> Any:
+    """NumPy, or ``None`` if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _is_number(value: Any) -> bool:
+    """Whether *value* is summed: an ``int`` or ``float``, but not a ``bool``."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _group_sums(values: Sequence[Any], groups: Sequence[int], size: int) -> List[Any]:
+    """Sum one column into *size* groups; non-numeric values are skipped.
+
+    Args:
+        values: The column.
+        groups: The group index of each value.
+        size: Number of groups.
+
+    Returns:
+        One total per group, or ``None`` for every group when the
+        column holds no numbers.
+    """
+    numbers = [value if _is_number(value) else None for value in values]
+    if all(value is None for value in numbers):
+        return [None] * size
+    np = _numpy()
+    if np is None:
+        totals: List[Any] = [0] * size
+        for group, value in zip(groups, numbers):
+            if value is not None:
+                totals[group] += value
+        return totals
+    weights = np.fromiter(
+        (0 if value is None else value for value in numbers), dtype=np.float64, count=len(numbers)
+    )
+    sums = np.bincount(np.asarray(groups, dtype=np.intp), weights=weights, minlength=size)
+    if all(value is None or isinstance(value, int) for value in numbers):
+        return [int(total) for total in sums]
+    return [float(total) for total in sums]
+
+
+def _label(start: date, key: str, zone: tzinfo) -> str:
+    """The key value written for a period starting on *start*."""
+    if key == "date":
+        return start.isoformat()
+    # Local midnight, with the zone's offset on that day.
+    return datetime(start.year, start.month, start.day, tzinfo=zone).isoformat()
+
+
+@overload
+def rollup(
+    points: Columns,
+    period: str,
+    *,
+    tz: Union[str, tzinfo, None] = ...,
+    week_start: int = ...,
+) -> Columns: ...
+
+
+@overload
+def rollup(
+    points: Iterable[Mapping[str, Any]],
+    period: str,
+    *,
+    tz: Union[str, tzinfo, None] = ...,
+    week_start: int = ...,
+) -> List[Dict[str, Any]]: ...
+
+
+def rollup(
+    points: Union[Iterable[Mapping[str, Any]], Columns],
+    period: str,
+    *,
+    tz: Union[str, tzinfo, None] = "UTC",
+    week_start: int = 0,
+) -> Union[List[Dict[str, Any]], Columns]:
+    """Roll daily (or finer) timeseries buckets up into longer periods.
+
+    Works on :class:`~qck.TimeseriesPoint` rows (keyed by ``date``) and
+    :class:`~qck.ConversionTimeseriesPoint` rows (keyed by
+    ``timestamp``), as dicts, :mod:`qck.models` records, or
+    :class:`~qck.Columns`. Numeric fields are summed per period; other
+    fields are dropped.
+
+    Args:
+        points: The buckets to roll up, in any order.
+        period: ``"day"``, ``"week"``, ``"month"``, ``"quarter"``, or
+            ``"year"``.
+        tz: Time zone for period boundaries — an IANA name (e.g.
+            ``"America/New_York"``) or a :class:`~datetime.tzinfo`.
+            Defaults to UTC.
+        week_start: First day of the week for ``"week"``: ``0`` for
+            Monday (default) through ``6`` for Sunday.
+
+    Returns:
+        One row per period that has data, oldest first, keyed like the
+        input (``date`` as ``YYYY-MM-DD``, ``timestamp`` as the local
+        midnight starting the period). Returns :class:`~qck.Columns`
+        when given columns, otherwise a list of dicts.
+
+    Raises:
+        ValueError: If *period* or *week_start* is invalid, the rows
+            have neither a ``date`` nor a ``timestamp``, or a row's
+            key is missing or malformed (the message names the row).
+
+    Example:
+        >>> daily = client.analytics.timeseries({"days": 365})["analytics"]
+        >>> for month in rollup(daily, "month", tz="Europe/Berlin"):
+        ...     print(month["date"], month["clicks"])
+    """
+    if period not in ROLLUP_PERIODS:
+        raise ValueError(
+            f"unknown rollup period {period!r}; expected one of {', '.join(ROLLUP_PERIODS)}"
+        )
+    if not 0 <= week_start <= 6:
+        raise ValueError("week_start must be between 0 (Monday) and 6 (Sunday)")
+    zone = _zone(tz)
+
+    if isinstance(points, Columns):
+        return _rollup_columns(points, period, zone, week_start)
+
+    periods: Optional[_Periods] = None
+    totals: Dict[date, Dict[str, Any]] = {}
+    fields: Dict[str, None] = {}
+    for index, row in enumerate(points):
+        if periods is None:
+            key = next((name for name in _KEY_FIELDS if row.get(name) is not None), None)
+            if key is None:
+                raise ValueError("rollup rows need a 'date' or 'timestamp' field")
+            periods = _Periods(key, period, zone, week_start)
+        start = periods.start(row.get(periods.key), index)
+        bucket = totals.get(start)
+        if bucket is None:
+            bucket = totals[start] = {}
+        for name in row.keys():
+            value = row[name]
+            if name == periods.key or not _is_number(value):
+                continue
+            fields.setdefault(name)
+            bucket[name] = bucket.get(name, 0) + value
+
+    out: List[Dict[str, Any]] = []
+    if periods is None:
+        return out
+    for start in sorted(totals):
+        bucket = totals[start]
+        row_out: Dict[str, Any] = {periods.key: _label(start, periods.key, zone)}
+        row_out.update((name, bucket.get(name, 0)) for name in fields)
+        out.append(row_out)
+    return out
+
+
+def _rollup_columns(columns: Columns, period: str, zone: tzinfo, week_start: int) -> Columns:
+    """:func:`rollup` for :class:`~qck.Columns`, aggregating column by column.
+
+    Each row's period is computed once from the key column; every
+    numeric column is then summed per period in one pass (with
+    ``numpy.bincount`` when NumPy is installed).
+
+    Raises:
+        ValueError: If the schema has no ``date`` or ``timestamp`` field,
+            or a row's key is missing or invalid.
+    """
+    key = next((name for name, _ in columns.schema if name in _KEY_FIELDS), None)
+    if key is None:
+        raise ValueError("rollup columns need a 'date' or 'timestamp' field")
+    periods = _Periods(key, period, zone, week_start)
+    starts = [periods.start(value, index) for index, value in enumerate(columns[key])]
+    ordered = sorted(set(starts))
+    position = {start: n for n, start in enumerate(ordered)}
+    groups = [position[start] for start in starts]
+    data: Dict[str, List[Any]] = {}
+    for name, _ in columns.schema:
+        if name == key:
+            data[name] = [_label(start, key, zone) for start in ordered]
+        else:
+            data[name] = _group_sums(columns[name], groups, len(ordered))
+    return Columns(data, columns.schema, len(ordered))
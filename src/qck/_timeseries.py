@@ -0,0 +1,236 @@
+"""Incrementally refreshed click timeseries.
+
+Trend charts re-request the same long window (``{"days": 90}``) every few
+minutes although only the newest daily bucket changes. An
+:class:`IncrementalTimeseries` keeps the buckets it has already fetched
+and, on each :meth:`~IncrementalTimeseries.refresh`, asks
+``analytics.timeseries`` only for the open tail of the window:
+
+* The first refresh (and every ``full=True`` refresh) fetches the whole
+  window.
+* Later refreshes start at the last closed day — yesterday, or the
+  newest stored day if it is older — so clicks recorded late for a day
+  that has just ended are still picked up. The returned buckets replace
+  the stored ones from that day on.
+
+Buckets that fall out of the rolling window are dropped, as are buckets
+older than the account's retention (``usage.retention_days``) or an
+over-limit ``usage.cutoff_date``; evicted history is never requested
+again. Days are UTC calendar days (``YYYY-MM-DD``).
+
+Example::
+
+    from qck import QCK
+
+    client = QCK(api_key="qck_...")
+    trend = client.analytics.incremental_timeseries(90, params={"bot_filter": "real"})
+    result = trend.refresh()          # whole window
+    result = trend.refresh()          # only yesterday and today
+    for point in result["analytics"]:
+        print(point["date"], point["clicks"])
+    monthly = trend.rollup("month", tz="Europe/Berlin")   # no API call
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from ._rollup import rollup
+
+if TYPE_CHECKING:
+    from ._types import AnalyticsResult, AnalyticsUsage, TimeseriesParams, TimeseriesPoint
+    from .resources.analytics import AnalyticsResource, AsyncAnalyticsResource
+
+_DEFAULT_DAYS = 90
+
+
+def _today() -> date:
+    """The current UTC calendar day."""
+    return datetime.now(timezone.utc).date()
+
+
+class _TimeseriesBuckets:
+    """Bucket storage and window bookkeeping shared by both variants."""
+
+    def __init__(self, days: int, params: Optional["TimeseriesParams"]) -> None:
+        """Create an empty series.
+
+        Args:
+            days: Length of the rolling window in days, including today.
+            params: Extra filters (``bot_filter``, ``domain_name``).
+                Date keys are managed by the series.
+
+        Raises:
+            ValueError: If *days* is less than 1.
+        """
+        if days < 1:
+            raise ValueError("days must be at least 1")
+        self._days = days
+        self._params: Dict[str, Any] = dict(params or {})
+        for key in ("days", "start_date", "end_date"):
+            self._params.pop(key, None)
+        self._buckets: Dict[str, "TimeseriesPoint"] = {}
+        self._usage: "AnalyticsUsage" = {}
+        self._last_refresh: Optional[float] = None
+
+    @property
+    def points(self) -> List["TimeseriesPoint"]:
+        """The stored buckets, oldest first."""
+        return [self._buckets[day] for day in sorted(self._buckets)]
+
+    @property
+    def usage(self) -> "AnalyticsUsage":
+        """The usage block of the most recent response."""
+        return self._usage
+
+    @property
+    def last_refresh(self) -> Optional[float]:
+        """Unix time of the last successful refresh, or ``None``."""
+        return self._last_refresh
+
+    def rollup(
+        self, period: str, *, tz: Union[str, tzinfo, None] = "UTC", week_start: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Roll the stored buckets up by week, month, quarter, or year.
+
+        Computed locally from the buckets already fetched; no API call
+        is made. See :func:`qck.rollup` for the arguments.
+
+        Returns:
+            One ``{"date", "clicks", "unique_visitors"}`` row per period,
+            oldest first. ``unique_visitors`` is an upper bound.
+        """
+        return rollup(self.points, period, tz=tz, week_start=week_start)
+
+    def clear(self) -> None:
+        """Drop every stored bucket; the next refresh fetches the whole window."""
+        self._buckets.clear()
+        self._usage = {}
+        self._last_refresh = None
+
+    def _earliest(self, today: date) -> str:
+        """The oldest day still kept: window start, clamped by retention and cutoff."""
+        earliest = (today - timedelta(days=self._days - 1)).isoformat()
+        retention = self._usage.get("retention_days")
+        if retention:
+            earliest = max(earliest, (today - timedelta(days=retention - 1)).isoformat())
+        cutoff = self._usage.get("cutoff_date")
+        if cutoff:
+            earliest = max(earliest, cutoff[:10])
+        return earliest
+
+    def _plan(self, full: bool) -> Dict[str, Any]:
+        """Return the query for the next refresh, evicting expired buckets."""
+        today = _today()
+        earliest = self._earliest(today)
+        self._evict(earliest)
+        start = earliest
+        if self._buckets and not full:
+            last_closed = (today - timedelta(days=1)).isoformat()
+            start = max(earliest, min(max(self._buckets), last_closed))
+        return {**self._params, "start_date": start, "end_date": today.isoformat()}
+
+    def _splice(self, query: Dict[str, Any], result: "AnalyticsResult") -> "AnalyticsResult":
+        """Replace the buckets from the query's start date with *result*."""
+        start = query["start_date"]
+        for day in [day for day in self._buckets if day >= start]:
+            del self._buckets[day]
+        for point in result.get("analytics") or ():
+            day = str(point["date"])[:10]
+            if day >= start:
+                self._buckets[day] = point
+        self._usage = result.get("usage") or {}
+        # The response may carry a newer retention or cutoff than the last one.
+        self._evict(self._earliest(_today()))
+        self._last_refresh = time.time()
+        return {"analytics": self.points, "usage": self._usage}
+
+    def _evict(self, earliest: str) -> None:
+        """Drop buckets older than *earliest*."""
+        for day in [day for day in self._buckets if day < earliest]:
+            del self._buckets[day]
+
+
+class IncrementalTimeseries(_TimeseriesBuckets):
+    """A click timeseries that only re-fetches the open tail of its window.
+
+    Create one with :meth:`AnalyticsResource.incremental_timeseries`
+    (``client.analytics.incremental_timeseries()``).
+    """
+
+    def __init__(
+        self,
+        analytics: "AnalyticsResource",
+        days: int = _DEFAULT_DAYS,
+        *,
+        params: Optional["TimeseriesParams"] = None,
+    ) -> None:
+        """Create a series backed by *analytics*.
+
+        Args:
+            analytics: The analytics resource used for fetching.
+            days: Length of the rolling window in days, including today.
+            params: Extra filters (``bot_filter``, ``domain_name``).
+
+        Raises:
+            ValueError: If *days* is less than 1.
+        """
+        super().__init__(days, params)
+        self._analytics = analytics
+
+    def refresh(self, *, full: bool = False) -> "AnalyticsResult":
+        """Fetch the open tail of the window and splice it in.
+
+        Args:
+            full: Re-fetch the whole window. Implied on the first
+                refresh.
+
+        Returns:
+            ``{"analytics": list[TimeseriesPoint], "usage": AnalyticsUsage}``
+            covering the whole window, like :meth:`timeseries`.
+        """
+        query = self._plan(full)
+        return self._splice(query, self._analytics.timeseries(query))  # type: ignore[arg-type]
+
+
+class AsyncIncrementalTimeseries(_TimeseriesBuckets):
+    """Asynchronous counterpart of :class:`IncrementalTimeseries`.
+
+    Create one with ``client.analytics.incremental_timeseries()`` on an
+    :class:`~qck.AsyncQCK` client; only :meth:`refresh` must be awaited.
+    """
+
+    def __init__(
+        self,
+        analytics: "AsyncAnalyticsResource",
+        days: int = _DEFAULT_DAYS,
+        *,
+        params: Optional["TimeseriesParams"] = None,
+    ) -> None:
+        """Create a series backed by *analytics*.
+
+        Args:
+            analytics: The async analytics resource used for fetching.
+            days: Length of the rolling window in days, including today.
+            params: Extra filters (``bot_filter``, ``domain_name``).
+
+        Raises:
+            ValueError: If *days* is less than 1.
+        """
+        super().__init__(days, params)
+        self._analytics = analytics
+
+    async def refresh(self, *, full: bool = False) -> "AnalyticsResult":
+        """Fetch the open tail of the window and splice it in.
+
+        Args:
+            full: Re-fetch the whole window.
+
+        Returns:
+            The whole window, shaped like :meth:`timeseries`.
+        """
+        query = self._plan(full)
+        result = await self._analytics.timeseries(query)  # type: ignore[arg-type]
+        return self._splice(query, result)
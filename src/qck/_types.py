@@ -12,7 +12,6 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional, TypedDict
 
-
 # --------------------------------------------------------------------------
 # Generic response wrappers
 # --------------------------------------------------------------------------
@@ -343,6 +342,78 @@ class BulkCreateResult(TypedDict):
     failure_count: int
 
 
+class ImportResult(TypedDict):
+    """Summary of a ``links.import_file()`` run.
+
+    Per-row failures are written to the reject file rather than kept in
+    memory, so the result stays small for files of any size.
+
+    Attributes:
+        total_rows: Rows read from the file.
+        success_count: Links created.
+        failure_count: Rows rejected locally or by the API.
+    """
+
+    total_rows: int
+    success_count: int
+    failure_count: int
+
+
+class BulkOperationSuccess(TypedDict):
+    """A link updated or deleted by ``update_many`` / ``delete_many``.
+
+    Attributes:
+        index: Position of the item in the input.
+        link_id: The link's ID.
+        link: The updated link, or ``None`` for deletions.
+    """
+
+    index: int
+    link_id: str
+    link: Optional[Link]
+
+
+class BulkOperationError(TypedDict):
+    """A failed item of ``update_many`` / ``delete_many``.
+
+    Attributes:
+        index: Position of the item in the input.
+        link_id: The link's ID.
+        error: Error message explaining why the item failed.
+        error_type: The API error code (e.g. ``"NOT_FOUND"``,
+            ``"VALIDATION_ERROR"``).
+        status: HTTP status code of the failed request.
+    """
+
+    index: int
+    link_id: str
+    error: str
+    error_type: str
+    status: int
+
+
+class BulkOperationResult(TypedDict):
+    """Result of a bulk link update or deletion.
+
+    Shaped like :class:`BulkCreateResult`: a failed item does not abort
+    the run, so inspect ``failed`` after every call.
+
+    Attributes:
+        succeeded: Items that succeeded, ordered by input position.
+        failed: Items that failed after retries, ordered by input
+            position.
+        total_requested: Number of items in the input.
+        success_count: Number of items that succeeded.
+        failure_count: Number of items that failed.
+    """
+
+    succeeded: List[BulkOperationSuccess]
+    failed: List[BulkOperationError]
+    total_requested: int
+    success_count: int
+    failure_count: int
+
+
 class LinkStats(TypedDict):
     """Click statistics for a single link.
 
@@ -633,6 +704,59 @@ class HourlyAnalyticsEntry(TypedDict):
     unique_visitors: int
 
 
+class AnalyticsSnapshotParams(TypedDict, total=False):
+    """Query parameters shared by every endpoint of an analytics snapshot.
+
+    Attributes:
+        days: Rolling window in days.
+        start_date: ISO-8601 start date (inclusive).
+        end_date: ISO-8601 end date (inclusive).
+        bot_filter: Traffic filter: ``"real"``, ``"bot"``, or ``"all"``.
+        domain_name: Restrict results to a specific custom domain.
+    """
+
+    days: int
+    start_date: str
+    end_date: str
+    bot_filter: Literal["real", "bot", "all"]
+    domain_name: str
+
+
+class AnalyticsSnapshotError(TypedDict):
+    """An analytics endpoint that failed during ``snapshot()``.
+
+    Attributes:
+        error: Error message returned by the API.
+        error_type: The API error code (e.g. ``"VALIDATION_ERROR"``).
+        status: HTTP status code of the failed request.
+    """
+
+    error: str
+    error_type: str
+    status: int
+
+
+class AnalyticsSnapshot(TypedDict):
+    """Combined result of ``analytics.snapshot()``.
+
+    Attributes:
+        analytics: The ``analytics`` payload of each endpoint that
+            succeeded, keyed by endpoint name (``"summary"``,
+            ``"timeseries"``, ``"geo"``, ``"devices"``, ``"referrers"``,
+            ``"hourly"``).
+        usage: Tier usage metadata merged from every response.
+        latency: Seconds each endpoint took, keyed by endpoint name.
+        errors: Endpoints that failed, keyed by endpoint name.
+        elapsed: Wall-clock seconds for the whole snapshot.
+    """
+
+    analytics: Dict[str, Any]
+    usage: AnalyticsUsage
+    latency: Dict[str, float]
+    errors: Dict[str, AnalyticsSnapshotError]
+    elapsed: float
+
+
 # --------------------------------------------------------------------------
 # Domains
 # --------------------------------------------------------------------------
@@ -967,6 +1091,50 @@ class IngestEventsParams(TypedDict):
     events: List[JourneyEvent]
 
 
+class IngestStats(TypedDict):
+    """Delivery counters reported by a background event batcher.
+
+    Returned by ``close()`` and the ``stats`` property of
+    ``JourneyIngestor`` and ``ConversionTracker``.
+
+    Attributes:
+        events_added: Events accepted by ``add()``.
+        events_sent: Events in batches the API accepted.
+        events_failed: Events in batches that failed after retries.
+        events_dropped: Events rejected because the queue was full.
+        batches_sent: Batches the API accepted.
+        batches_failed: Batches that failed after retries.
+        events_pending: Events accepted but not yet sent or failed —
+            queued or in flight. Non-zero after ``close(timeout)`` gave
+            up waiting.
+    """
+
+    events_added: int
+    events_sent: int
+    events_failed: int
+    events_dropped: int
+    batches_sent: int
+    batches_failed: int
+    events_pending: int
+
+
+class MirrorSyncStats(TypedDict):
+    """Outcome of one ``LinkMirror.sync()`` call.
+
+    Attributes:
+        full: Whether every link was re-fetched (and deletions swept).
+        fetched: Links written to the mirror; links an incremental sync
+            re-reads in its overlap window are not counted.
+        removed: Mirrored links dropped because they no longer exist.
+        total: Links in the mirror after the sync.
+    """
+
+    full: bool
+    fetched: int
+    removed: int
+    total: int
+
+
 class PageCount(TypedDict):
     """Page URL and its visit count in a journey summary.
 
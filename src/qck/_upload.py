@@ -0,0 +1,180 @@
+"""Zero-copy binary upload bodies.
+
+Binary uploads (OG images) used to be read into a single ``bytes`` object
+before the request. This module instead exposes the source as a
+:class:`memoryview` — memory-mapping files on disk — and streams it to
+``httpx`` in fixed-size slices:
+
+* :func:`open_buffer` turns a path, a binary file object, ``bytes``,
+  ``bytearray``, or ``memoryview`` into a read-only view without copying
+  the data, and releases it afterwards.
+* :class:`ChunkedBody` / :class:`AsyncChunkedBody` iterate that view for
+  the sync and async clients. Both can be iterated again, so a retried
+  request re-sends the same body.
+* :func:`sniff_image_type` detects an image format from its magic bytes.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import IO, AsyncIterator, Iterator, Optional, Union
+
+UploadSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, IO[bytes]]
+"""Anything :func:`open_buffer` accepts."""
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """Return the MIME type of an image from its first bytes.
+
+    Recognises JPEG, PNG, GIF, and WebP.
+
+    Args:
+        head: At least the first 12 bytes of the image.
+
+    Returns:
+        The MIME type, or ``None`` if the format is not recognised.
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def _map_file(fp: IO[bytes]) -> Optional[mmap.mmap]:
+    """Memory-map an open regular file, or return ``None`` if impossible."""
+    try:
+        fileno = fp.fileno()
+        if os.fstat(fileno).st_size == 0:
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
+
+
+@contextmanager
+def open_buffer(source: UploadSource) -> Iterator[memoryview]:
+    """Expose *source* as a read-only byte view without copying it.
+
+    * Paths are memory-mapped.
+    * File objects backed by a regular file are memory-mapped from their
+      current position; :class:`io.BytesIO` exposes its buffer. Other
+      streams (pipes, sockets) are read into memory, as they cannot be
+      re-read for retries.
+    * ``bytes``, ``bytearray``, and ``memoryview`` are wrapped as-is,
+      except non-contiguous views, which are copied once.
+
+    Args:
+        source: The data to upload.
+
+    Yields:
+        A one-dimensional byte :class:`memoryview` of the data. It is
+        released, and any mapping closed, when the block exits; the
+        caller must not modify it.
+
+    Raises:
+        TypeError: If *source* is not a supported type.
+        OSError: If a path cannot be opened.
+    """
+    mapped: Optional[mmap.mmap] = None
+    owner: Optional[IO[bytes]] = None
+    view: memoryview
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            owner = open(source, "rb")
+            mapped = _map_file(owner)
+            view = memoryview(mapped) if mapped is not None else memoryview(owner.read())
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source)
+            if not view.c_contiguous:
+                # Strided views (e.g. ``buf[::2]``) cannot be cast or
+                # streamed in slices; copy them into one contiguous block.
+                view = memoryview(view.tobytes())
+            view = view.cast("B")
+        elif isinstance(source, io.BytesIO):
+            view = source.getbuffer()[source.tell() :]
+        elif hasattr(source, "read"):
+            mapped = _map_file(source)
+            if mapped is not None:
+                view = memoryview(mapped)[source.tell() :]
+            else:
+                view = memoryview(source.read())
+        else:
+            raise TypeError(
+                "expected a path, binary file object, bytes, bytearray, or memoryview, "
+                f"got {type(source).__name__}"
+            )
+        with view:
+            yield view
+    finally:
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # A caller still holds a slice; the mapping closes on GC.
+                pass
+        if owner is not None:
+            owner.close()
+
+
+class ChunkedBody:
+    """Re-iterable request body streaming a byte view in slices.
+
+    Pass it as ``content=`` to the sync client together with a
+    ``Content-Length`` header of ``len(body)``.
+    """
+
+    __slots__ = ("_view", "_chunk_size")
+
+    def __init__(self, view: memoryview, chunk_size: int = _CHUNK_SIZE) -> None:
+        """Wrap *view*.
+
+        Args:
+            view: One-dimensional byte view of the body.
+            chunk_size: Size of each slice in bytes.
+        """
+        self._view = view
+        self._chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        """Body size in bytes."""
+        return self._view.nbytes
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Yield the body in slices, from the start, without copying."""
+        view, size = self._view, self._chunk_size
+        for start in range(0, view.nbytes, size):
+            yield view[start : start + size]
+
+
+class AsyncChunkedBody:
+    """Async counterpart of :class:`ChunkedBody` for the async client."""
+
+    __slots__ = ("_body",)
+
+    def __init__(self, view: memoryview, chunk_size: int = _CHUNK_SIZE) -> None:
+        """Wrap *view*.
+
+        Args:
+            view: One-dimensional byte view of the body.
+            chunk_size: Size of each slice in bytes.
+        """
+        self._body = ChunkedBody(view, chunk_size)
+
+    def __len__(self) -> int:
+        """Body size in bytes."""
+        return len(self._body)
+
+    async def __aiter__(self) -> AsyncIterator[memoryview]:
+        """Yield the body in slices, from the start, without copying."""
+        for chunk in self._body:
+            yield chunk
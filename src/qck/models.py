@@ -0,0 +1,664 @@
+"""Compact record classes for API responses.
+
+By default every response is a plain ``dict`` and the TypedDicts in
+:mod:`qck._types` are type hints only. A dict per record is costly for
+large working sets — tens of thousands of links or timeseries points.
+With ``QCK(..., models=True)`` responses are decoded into the classes
+defined here instead:
+
+* Each class uses ``__slots__``, so a record stores its values in a
+  fixed array rather than a per-instance hash table: a link needs about
+  a third of the memory of its dict, and attribute access is as fast as
+  a dict lookup.
+* Nested objects (a link's ``metadata``, a session's ``events``) stay
+  raw until first accessed, so fields you never read cost nothing to
+  decode.
+* :meth:`Record.to_dict` returns the original response data — fields
+  the API sent that this SDK does not know yet are kept too — so records
+  can be serialised or compared losslessly.
+* Records also support ``record["field"]`` and ``record.get("field")``,
+  so code written against the dict responses keeps working.
+
+Fields missing from a response read as ``None`` and are left out of
+:meth:`~Record.to_dict`; unknown fields are only reachable through
+``record["field"]`` and :meth:`~Record.to_dict`. Envelopes (paginated pages, analytics results)
+remain dicts; only the records inside them are converted.
+
+Example::
+
+    from qck import QCK
+
+    client = QCK(api_key="qck_...", models=True)
+    for link in client.links.iter_all():
+        print(link.short_url, link.metadata.title)
+
+    link.to_dict()  # the plain response dict
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from . import _types
+
+R = TypeVar("R", bound="Record")
+
+_MISSING = object()
+
+
+def _fields_of(typed_dict: type) -> Tuple[str, ...]:
+    """Field names of a TypedDict, in declaration order."""
+    return tuple(typed_dict.__annotations__)
+
+
+def _slots(fields: Tuple[str, ...], *nested: str) -> Tuple[str, ...]:
+    """Slot names for *fields*; nested fields store their raw value in ``_<name>``."""
+    return tuple("_" + name if name in nested else name for name in fields)
+
+
+def _plain(value: Any) -> Any:
+    """Convert records (and lists of them) back to plain data."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class Nested:
+    """Descriptor decoding a nested object (or list of objects) on first access."""
+
+    __slots__ = ("model", "_slot")
+
+    def __init__(self, model: Type["Record"]) -> None:
+        """Decode values of this field into *model*."""
+        self.model = model
+        self._slot: Any = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = owner.__dict__["_" + name]
+
+    def __get__(self, obj: Optional["Record"], owner: type) -> Any:
+        if obj is None:
+            return self
+        value = self._slot.__get__(obj, owner)
+        if isinstance(value, dict):
+            value = self.model.from_dict(value)
+            self._slot.__set__(obj, value)
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            value = [self.model.from_dict(item) for item in value]
+            self._slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: "Record", value: Any) -> None:
+        self._slot.__set__(obj, value)
+
+    def raw(self, obj: "Record") -> Any:
+        """The stored value, decoded or not."""
+        return self._slot.__get__(obj, type(obj))
+
+
+class Record:
+    """Base class of the slotted response records.
+
+    Subclasses list their fields in ``_fields`` (taken from the matching
+    TypedDict) and declare nested fields with :class:`Nested`. Every
+    slot is always set — to ``None`` for fields missing from the
+    response, which are remembered so :meth:`to_dict` can leave them out.
+    """
+
+    __slots__ = ("_absent", "_extra")
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _field_set: ClassVar[FrozenSet[str]] = frozenset()
+    _nested: ClassVar[Dict[str, Nested]] = {}
+    _absent_sets: ClassVar[Dict[FrozenSet[str], FrozenSet[str]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+        cls._nested = {
+            name: attr for name, attr in vars(cls).items() if isinstance(attr, Nested)
+        }
+        cls._absent_sets = {}
+
+    def __init__(self, **values: Any) -> None:
+        """Create a record from keyword arguments (see :meth:`from_dict`)."""
+        self._load(values)
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Mapping[str, Any]) -> R:
+        """Create a record from response data.
+
+        Keys that are not fields of the record are kept and returned by
+        :meth:`to_dict` (and by ``record[key]``).
+        """
+        obj = cls.__new__(cls)
+        obj._load(data)
+        return obj
+
+    def _load(self, data: Mapping[str, Any]) -> None:
+        """Store *data*'s values in their slots."""
+        absent = []
+        for name in self._fields:
+            value = data.get(name, _MISSING)
+            if value is _MISSING:
+                absent.append(name)
+                value = None
+            setattr(self, name, value)
+        if absent:
+            # Records of one response usually lack the same fields; share the set.
+            key = frozenset(absent)
+            self._absent: Optional[FrozenSet[str]] = self._absent_sets.setdefault(key, key)
+        else:
+            self._absent = None
+        extra = None
+        if len(data) > len(self._fields) - len(absent):
+            extra = {k: v for k, v in data.items() if k not in self._field_set}
+        self._extra: Optional[Dict[str, Any]] = extra
+
+    def _has(self, name: str) -> bool:
+        """Whether field *name* was present in the response."""
+        return self._absent is None or name not in self._absent
+
+    def _raw(self, name: str) -> Any:
+        """The stored value of field *name*, without decoding nested data."""
+        nested = self._nested.get(name)
+        if nested is not None:
+            return nested.raw(self)
+        return getattr(self, name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict, equal to the response data."""
+        out: Dict[str, Any] = {
+            name: _plain(self._raw(name)) for name in self._fields if self._has(name)
+        }
+        if self._extra:
+            out.update(self._extra)
+        return out
+
+    # -- dict compatibility ------------------------------------------------
+
+    def keys(self) -> List[str]:
+        """Names of the fields present, as in the response dict."""
+        names = [name for name in self._fields if self._has(name)]
+        if self._extra:
+            names.extend(self._extra)
+        return names
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            if not self._has(key):
+                raise KeyError(key)
+            return getattr(self, key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return field *key*, or *default* if it is missing."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore[index]
+        except KeyError:
+            return False
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={self[name]!r}" for name in self.keys())
+        return f"{type(self).__name__}({values})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._load(state)
+
+
+# ---------------------------------------------------------------------------
+# Links
+# ---------------------------------------------------------------------------
+
+
+class LinkMetadata(Record):
+    """Scraped page metadata of a link (see :class:`qck.LinkMetadata`)."""
+
+    _fields = _fields_of(_types.LinkMetadata)
+    __slots__ = _slots(_fields)
+
+    title: str
+    description: str
+    og_image: str
+    domain: str
+    is_safe: bool
+    tags: List[str]
+
+
+class Link(Record):
+    """A short link (see :class:`qck.Link`)."""
+
+    _fields = _fields_of(_types.Link)
+    __slots__ = _slots(_fields, "metadata")
+
+    id: str
+    short_code: str
+    original_url: str
+    short_url: str
+    title: Optional[str]
+    description: Optional[str]
+    expires_at: Optional[str]
+    created_at: str
+    updated_at: str
+    is_active: bool
+    tags: List[str]
+    is_password_protected: bool
+    metadata: LinkMetadata = Nested(LinkMetadata)  # type: ignore[assignment]
+    total_clicks: int
+    unique_visitors: int
+    bot_clicks: int
+    last_accessed_at: Optional[str]
+    domain_id: Optional[str]
+    domain_name: Optional[str]
+    campaign_id: Optional[str]
+    campaign_name: Optional[str]
+    utm_source: Optional[str]
+    utm_medium: Optional[str]
+    utm_campaign: Optional[str]
+    utm_term: Optional[str]
+    utm_content: Optional[str]
+
+
+class LinkStats(Record):
+    """Click statistics of a link (see :class:`qck.LinkStats`)."""
+
+    _fields = _fields_of(_types.LinkStats)
+    __slots__ = _slots(_fields)
+
+    short_code: str
+    original_url: str
+    total_clicks: int
+    unique_visitors: int
+    bot_clicks: int
+    human_clicks: int
+    created_at: str
+    last_accessed_at: Optional[str]
+    is_active: bool
+    days_active: int
+    average_clicks_per_day: float
+    conversion_rate: float
+
+
+# ---------------------------------------------------------------------------
+# Analytics
+# ---------------------------------------------------------------------------
+
+
+class AnalyticsSummary(Record):
+    """Account or domain analytics summary (see :class:`qck.AnalyticsSummary`)."""
+
+    _fields = _fields_of(_types.AnalyticsSummary)
+    __slots__ = _slots(_fields)
+
+    total_clicks: int
+    unique_visitors: int
+    total_links: int
+    last_click_at: Optional[str]
+    today_clicks: int
+    yesterday_clicks: int
+    active_links: int
+    total_links_count: int
+    links_this_month: int
+    clicks_this_month: int
+
+
+class TimeseriesPoint(Record):
+    """One day of click analytics (see :class:`qck.TimeseriesPoint`)."""
+
+    _fields = _fields_of(_types.TimeseriesPoint)
+    __slots__ = _slots(_fields)
+
+    date: str
+    clicks: int
+    unique_visitors: int
+
+
+class GeoAnalyticsEntry(Record):
+    """Clicks from one country (see :class:`qck.GeoAnalyticsEntry`)."""
+
+    _fields = _fields_of(_types.GeoAnalyticsEntry)
+    __slots__ = _slots(_fields)
+
+    country_code: str
+    clicks: int
+    unique_visitors: int
+
+
+class DeviceAnalyticsEntry(Record):
+    """Clicks from one device/browser/OS (see :class:`qck.DeviceAnalyticsEntry`)."""
+
+    _fields = _fields_of(_types.DeviceAnalyticsEntry)
+    __slots__ = _slots(_fields)
+
+    device_type: str
+    browser: str
+    os: str
+    clicks: int
+
+
+class ReferrerAnalyticsEntry(Record):
+    """Clicks from one referrer (see :class:`qck.ReferrerAnalyticsEntry`)."""
+
+    _fields = _fields_of(_types.ReferrerAnalyticsEntry)
+    __slots__ = _slots(_fields)
+
+    referrer: str
+    clicks: int
+    unique_visitors: int
+
+
+class HourlyAnalyticsEntry(Record):
+    """Clicks in one hour of the day (see :class:`qck.HourlyAnalyticsEntry`)."""
+
+    _fields = _fields_of(_types.HourlyAnalyticsEntry)
+    __slots__ = _slots(_fields)
+
+    hour: int
+    clicks: int
+    unique_visitors: int
+
+
+# ---------------------------------------------------------------------------
+# Domains and webhooks
+# ---------------------------------------------------------------------------
+
+
+class Domain(Record):
+    """A custom domain (see :class:`qck.Domain`)."""
+
+    _fields = _fields_of(_types.Domain)
+    __slots__ = _slots(_fields)
+
+    # The API serialises domains in camelCase, and slot names must match
+    # the wire keys (see :class:`qck.Domain`).
+    id: str
+    organizationId: str  # noqa: N815
+    domain: str
+    status: str
+    verificationToken: str  # noqa: N815
+    dnsVerifiedAt: Optional[str]  # noqa: N815
+    rejectionReason: Optional[str]  # noqa: N815
+    createdAt: str  # noqa: N815
+    updatedAt: str  # noqa: N815
+    sslExpiryAt: Optional[str]  # noqa: N815
+    healthStatus: Optional[str]  # noqa: N815
+    sslStatus: Optional[str]  # noqa: N815
+    provisioningError: Optional[str]  # noqa: N815
+
+
+class WebhookEndpoint(Record):
+    """A webhook endpoint (see :class:`qck.WebhookEndpoint`)."""
+
+    _fields = _fields_of(_types.WebhookEndpoint)
+    __slots__ = _slots(_fields)
+
+    id: str
+    url: str
+    events: List[str]
+    is_active: bool
+    description: str
+    consecutive_failures: int
+    last_failure_at: str
+    created_at: str
+    updated_at: str
+    secret: str
+
+
+class WebhookDelivery(Record):
+    """A webhook delivery attempt (see :class:`qck.WebhookDelivery`)."""
+
+    _fields = _fields_of(_types.WebhookDelivery)
+    __slots__ = _slots(_fields)
+
+    id: str
+    endpoint_id: str
+    event_type: str
+    payload: Dict[str, Any]
+    status: str
+    attempt_number: int
+    max_attempts: int
+    http_status: Optional[int]
+    response_body: Optional[str]
+    error_message: Optional[str]
+    next_retry_at: Optional[str]
+    delivered_at: Optional[str]
+    created_at: str
+
+
+# ---------------------------------------------------------------------------
+# Journey
+# ---------------------------------------------------------------------------
+
+
+class JourneyEvent(Record):
+    """A visitor journey event (see :class:`qck.JourneyEvent`)."""
+
+    _fields = _fields_of(_types.JourneyEvent)
+    __slots__ = _slots(_fields)
+
+    link_id: str
+    visitor_id: str
+    event_type: str
+    page_url: str
+    session_id: str
+    event_name: str
+    page_title: str
+    scroll_percent: int
+    time_on_page: int
+    timestamp: str
+    conversion_name: str
+    revenue_cents: int
+    currency: str
+    country_code: str
+    city: str
+    region: str
+    device_type: str
+    browser: str
+    browser_version: str
+    os: str
+    os_version: str
+    properties: Dict[str, Any]
+
+
+class SessionEvent(Record):
+    """An event within a session summary (see :class:`qck.SessionEvent`)."""
+
+    _fields = _fields_of(_types.SessionEvent)
+    __slots__ = _slots(_fields)
+
+    event_type: str
+    event_name: str
+    page_url: str
+    timestamp: str
+    scroll_percent: int
+    time_on_page: int
+
+
+class SessionSummary(Record):
+    """A visitor session (see :class:`qck.SessionSummary`)."""
+
+    _fields = _fields_of(_types.SessionSummary)
+    __slots__ = _slots(_fields, "events")
+
+    visitor_id: str
+    session_id: str
+    session_start: str
+    session_end: str
+    event_count: int
+    pages_visited: List[str]
+    events: List[SessionEvent] = Nested(SessionEvent)  # type: ignore[assignment]
+
+
+class FunnelStep(Record):
+    """One funnel step (see :class:`qck.FunnelStep`)."""
+
+    _fields = _fields_of(_types.FunnelStep)
+    __slots__ = _slots(_fields)
+
+    step_name: str
+    visitors: int
+    conversion_rate: float
+
+
+class FunnelResult(Record):
+    """A funnel analysis (see :class:`qck.FunnelResult`)."""
+
+    _fields = _fields_of(_types.FunnelResult)
+    __slots__ = _slots(_fields, "steps")
+
+    steps: List[FunnelStep] = Nested(FunnelStep)  # type: ignore[assignment]
+    total_visitors: int
+
+
+# ---------------------------------------------------------------------------
+# Conversions
+# ---------------------------------------------------------------------------
+
+
+class ConversionSummary(Record):
+    """Aggregated conversion metrics (see :class:`qck.ConversionSummary`)."""
+
+    _fields = _fields_of(_types.ConversionSummary)
+    __slots__ = _slots(_fields)
+
+    total_conversions: int
+    unique_converters: int
+    total_revenue: float
+    average_order_value: float
+    conversion_rate: float
+
+
+class ConversionTimeseriesPoint(Record):
+    """Conversions in one interval (see :class:`qck.ConversionTimeseriesPoint`)."""
+
+    _fields = _fields_of(_types.ConversionTimeseriesPoint)
+    __slots__ = _slots(_fields)
+
+    timestamp: str
+    conversions: int
+    revenue: float
+
+
+class ConversionBreakdownEntry(Record):
+    """Conversions for one dimension value (see :class:`qck.ConversionBreakdownEntry`)."""
+
+    _fields = _fields_of(_types.ConversionBreakdownEntry)
+    __slots__ = _slots(_fields)
+
+    label: str
+    conversions: int
+    revenue: float
+    conversion_rate: float
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+class Envelope:
+    """Decoding spec for a dict wrapping records under one key.
+
+    Used for paginated pages (``{"data": [...], ...}``) and analytics
+    results (``{"analytics": ..., "usage": ...}``): the envelope stays a
+    dict and only ``data[key]`` is converted.
+    """
+
+    __slots__ = ("key", "model")
+
+    def __init__(self, key: str, model: Type[Record]) -> None:
+        self.key = key
+        self.model = model
+
+
+Model = Union[Type[Record], Envelope]
+"""What :func:`decode` accepts: a record class or an :class:`Envelope`."""
+
+
+def decode(model: Model, data: Any) -> Any:
+    """Convert response *data* to records described by *model*.
+
+    A dict becomes one record and a list becomes a list of records;
+    anything else (``None``, scalars) is returned unchanged.
+    """
+    if isinstance(model, Envelope):
+        if not isinstance(data, dict) or model.key not in data:
+            return data
+        out = dict(data)
+        out[model.key] = decode(model.model, data[model.key])
+        return out
+    if isinstance(data, dict):
+        return model.from_dict(data)
+    if isinstance(data, list):
+        return [model.from_dict(item) if isinstance(item, dict) else item for item in data]
+    return data
+
+
+def to_dicts(records: Iterable[Any]) -> List[Any]:
+    """Convert records (or plain dicts) to plain dicts."""
+    return [_plain(record) for record in records]
+
+
+__all__ = [
+    "Record",
+    "Nested",
+    "Envelope",
+    "decode",
+    "to_dicts",
+    "LinkMetadata",
+    "Link",
+    "LinkStats",
+    "AnalyticsSummary",
+    "TimeseriesPoint",
+    "GeoAnalyticsEntry",
+    "DeviceAnalyticsEntry",
+    "ReferrerAnalyticsEntry",
+    "HourlyAnalyticsEntry",
+    "Domain",
+    "WebhookEndpoint",
+    "WebhookDelivery",
+    "JourneyEvent",
+    "SessionEvent",
+    "SessionSummary",
+    "FunnelStep",
+    "FunnelResult",
+    "ConversionSummary",
+    "ConversionTimeseriesPoint",
+    "ConversionBreakdownEntry",
+]
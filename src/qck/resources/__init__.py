@@ -12,16 +12,26 @@ Resources:
     DomainsResource: List custom domains.
     JourneyResource: Ingest events and query visitor journeys.
     WebhooksResource: Manage webhook endpoints and deliveries.
+
+Each resource also has an ``Async``-prefixed counterpart (e.g.
+:class:`AsyncLinksResource`) used by :class:`~qck.AsyncQCK`, whose
+methods are coroutines.
 """
 
-from .analytics import AnalyticsResource
-from .conversions import ConversionsResource
-from .domains import DomainsResource
-from .journey import JourneyResource
-from .links import LinksResource
-from .webhooks import WebhooksResource
+from .analytics import AnalyticsResource, AsyncAnalyticsResource
+from .conversions import AsyncConversionsResource, ConversionsResource
+from .domains import AsyncDomainsResource, DomainsResource
+from .journey import AsyncJourneyResource, JourneyResource
+from .links import AsyncLinksResource, LinksResource
+from .webhooks import AsyncWebhooksResource, WebhooksResource
 
 __all__ = [
+    "AsyncAnalyticsResource",
+    "AsyncConversionsResource",
+    "AsyncDomainsResource",
+    "AsyncJourneyResource",
+    "AsyncLinksResource",
+    "AsyncWebhooksResource",
     "AnalyticsResource",
     "ConversionsResource",
     "DomainsResource",
@@ -7,6 +7,16 @@ device/browser stats, referrer sources, and hourly distributions.
 Every analytics endpoint returns ``{"analytics": ..., "usage": {...}}``:
 the endpoint-specific payload plus tier usage metadata (monthly click
 counts, limits, retention, and any over-limit cutoff date).
+:meth:`AnalyticsResource.snapshot` requests several endpoints at once
+for a dashboard and merges their usage blocks, and
+:meth:`AnalyticsResource.incremental_timeseries` keeps a trend chart's
+window up to date by fetching only its newest days.
+
+``geo``, ``devices``, and ``referrers`` accept ``split_days`` to break a
+long date range into shorter windows that are queried in parallel and
+merged. Clicks add up exactly across windows; ``unique_visitors`` does
+not (a visitor seen in two windows is counted twice), so merged
+``unique_visitors`` values are upper bounds.
 
 Example::
 
@@ -20,13 +30,25 @@ Example::
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import time
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple, cast
+
+from .. import models
+from .._columns import HOURLY_SCHEMA, TIMESERIES_SCHEMA, Columns, Schema
+from .._concurrency import abounded_map, bounded_map
+from .._errors import AuthenticationError, QCKError
+from .._timeseries import AsyncIncrementalTimeseries, IncrementalTimeseries, _today
+from ..models import Envelope
 
 if TYPE_CHECKING:
-    from .._client import HttpClient
+    from .._client import AsyncHttpClient, HttpClient
     from .._types import (
         AnalyticsResult,
+        AnalyticsSnapshot,
+        AnalyticsSnapshotParams,
         AnalyticsSummaryParams,
+        AnalyticsUsage,
         DeviceAnalyticsParams,
         GeoAnalyticsParams,
         HourlyAnalyticsParams,
@@ -34,6 +56,156 @@ if TYPE_CHECKING:
         TimeseriesParams,
     )
 
+_SUMMARY = Envelope("analytics", models.AnalyticsSummary)
+_TIMESERIES = Envelope("analytics", models.TimeseriesPoint)
+_GEO = Envelope("analytics", models.GeoAnalyticsEntry)
+_DEVICES = Envelope("analytics", models.DeviceAnalyticsEntry)
+_REFERRERS = Envelope("analytics", models.ReferrerAnalyticsEntry)
+_HOURLY = Envelope("analytics", models.HourlyAnalyticsEntry)
+
+_DEFAULT_SPLIT_CONCURRENCY = 4
+
+NON_ADDITIVE_FIELDS = ("unique_visitors",)
+"""Fields that are only upper bounds after a ``split_days`` merge."""
+
+# Entry fields identifying a row of each breakdown; other numeric fields
+# are summed across windows.
+_BREAKDOWN_KEYS = {
+    "/analytics/geo": ("country_code",),
+    "/analytics/devices": ("device_type", "browser", "os"),
+    "/analytics/referrers": ("referrer",),
+}
+
+SNAPSHOT_ENDPOINTS = ("summary", "timeseries", "geo", "devices", "referrers", "hourly")
+"""Endpoint names accepted by ``snapshot(include=...)``, in request order."""
+
+
+def _snapshot_endpoints(include: Optional[Iterable[str]]) -> List[str]:
+    """Validate and de-duplicate the endpoints requested for a snapshot.
+
+    Raises:
+        ValueError: If *include* is empty or names an unknown endpoint.
+    """
+    if include is None:
+        return list(SNAPSHOT_ENDPOINTS)
+    names = list(dict.fromkeys(include))
+    if not names:
+        raise ValueError("include must name at least one analytics endpoint")
+    unknown = [name for name in names if name not in SNAPSHOT_ENDPOINTS]
+    if unknown:
+        raise ValueError(
+            f"unknown analytics endpoint(s) {', '.join(map(repr, unknown))}; "
+            f"expected any of {', '.join(SNAPSHOT_ENDPOINTS)}"
+        )
+    return names
+
+
+def _merge_usage(into: Dict[str, Any], usage: Mapping[str, Any]) -> None:
+    """Fold one response's usage block into the merged one.
+
+    Responses are taken moments apart, so the click count can differ
+    between them: the merged block keeps the highest count, flags the
+    limit as exceeded if any response did, and keeps the latest cutoff.
+    """
+    for key, value in usage.items():
+        current = into.get(key)
+        if current is None:
+            into[key] = value
+        elif key == "clicks_this_month" and value is not None:
+            into[key] = max(current, value)
+        elif key == "limit_exceeded":
+            into[key] = bool(current or value)
+        elif key == "cutoff_date" and value is not None:
+            into[key] = max(current, value)
+
+
+def _split_windows(params: Optional[Mapping[str, Any]], split_days: int) -> List[Dict[str, Any]]:
+    """Split the date range of *params* into windows of at most *split_days*.
+
+    ``days`` is converted to an explicit range ending today (UTC). Without
+    a complete range (no ``days``, or only one of ``start_date`` /
+    ``end_date``) the query is returned unsplit.
+
+    Raises:
+        ValueError: If *split_days* is less than 1 or the range is reversed.
+    """
+    if split_days < 1:
+        raise ValueError("split_days must be at least 1")
+    p: Dict[str, Any] = dict(params) if params else {}
+    if p.get("start_date") and p.get("end_date"):
+        start = date.fromisoformat(str(p["start_date"])[:10])
+        end = date.fromisoformat(str(p["end_date"])[:10])
+    elif p.get("days") and not (p.get("start_date") or p.get("end_date")):
+        end = _today()
+        start = end - timedelta(days=int(p["days"]) - 1)
+    else:
+        return [p]
+    if start > end:
+        raise ValueError("start_date must not be after end_date")
+    p.pop("days", None)
+    windows = []
+    while start <= end:
+        stop = min(start + timedelta(days=split_days - 1), end)
+        windows.append({**p, "start_date": start.isoformat(), "end_date": stop.isoformat()})
+        start = stop + timedelta(days=1)
+    return windows
+
+
+def _merge_breakdowns(path: str, results: List[Any]) -> Dict[str, Any]:
+    """Merge the breakdowns of consecutive windows into one result.
+
+    Rows with the same key (country, device/browser/OS, referrer) are
+    combined by summing their numeric fields, and the rows are re-sorted
+    by clicks, descending. Summed ``unique_visitors`` are upper bounds.
+    """
+    keys = _BREAKDOWN_KEYS[path]
+    rows: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    usage: Dict[str, Any] = {}
+    for result in results:
+        _merge_usage(usage, result.get("usage") or {})
+        for entry in result.get("analytics") or ():
+            key = tuple(entry.get(field) for field in keys)
+            row = rows.get(key)
+            if row is None:
+                rows[key] = dict(entry)
+                continue
+            for field, value in entry.items():
+                if field in keys or isinstance(value, bool):
+                    continue
+                if isinstance(value, (int, float)):
+                    row[field] = (row.get(field) or 0) + value
+    merged = sorted(rows.values(), key=lambda row: row.get("clicks") or 0, reverse=True)
+    return {"analytics": merged, "usage": usage}
+
+
+def _as_columns(result: Any, schema: Schema) -> Any:
+    """Replace the ``analytics`` rows of *result* with :class:`Columns`."""
+    if not isinstance(result, dict) or not isinstance(result.get("analytics"), list):
+        return result
+    return {**result, "analytics": Columns.from_rows(result["analytics"], schema)}
+
+
+def _record_snapshot(snapshot: "AnalyticsSnapshot", outcome: Tuple[str, Any, float]) -> None:
+    """Add one endpoint's result (or error) to *snapshot*."""
+    name, result, latency = outcome
+    snapshot["latency"][name] = latency
+    if isinstance(result, QCKError):
+        snapshot["errors"][name] = {
+            "error": str(result),
+            "error_type": result.code,
+            "status": result.status,
+        }
+        return
+    snapshot["analytics"][name] = result.get("analytics")
+    usage: Dict[str, Any] = dict(snapshot["usage"])
+    _merge_usage(usage, result.get("usage") or {})
+    snapshot["usage"] = cast("AnalyticsUsage", usage)
+
+
+def _empty_snapshot() -> "AnalyticsSnapshot":
+    """Return a fresh, empty snapshot."""
+    return {"analytics": {}, "usage": {}, "latency": {}, "errors": {}, "elapsed": 0.0}
+
 
 class AnalyticsResource:
     """Query analytics summaries and timeseries data.
@@ -75,9 +247,15 @@ class AnalyticsResource:
             >>> print(result["analytics"]["total_clicks"])
             >>> print(result["usage"]["limit_exceeded"])
         """
-        return self._client.get("/analytics/summary", params=dict(params) if params else None)
-
-    def timeseries(self, params: Optional["TimeseriesParams"] = None) -> "AnalyticsResult":
+        data = self._client.get("/analytics/summary", params=dict(params) if params else None)
+        return self._client.decode(_SUMMARY, data)
+
+    def timeseries(
+        self,
+        params: Optional["TimeseriesParams"] = None,
+        *,
+        as_columns: bool = False,
+    ) -> "AnalyticsResult":
         """Get click timeseries data.
 
         Returns a list of date-bucketed data points with click counts
@@ -86,6 +264,9 @@ class AnalyticsResource:
         Args:
             params: Date range and filter options. Pass ``None`` to
                 use the API default period.
+            as_columns: Return ``analytics`` as a :class:`~qck.Columns`
+                (one list per field, convertible with ``to_numpy()`` /
+                ``to_arrow()``) instead of a list of points.
 
         Returns:
             ``{"analytics": list[TimeseriesPoint], "usage": AnalyticsUsage}``.
@@ -97,14 +278,62 @@ class AnalyticsResource:
             >>> for p in result["analytics"]:
             ...     print(p["date"], p["clicks"])
         """
-        return self._client.get("/analytics/timeseries", params=dict(params) if params else None)
+        data = self._client.get("/analytics/timeseries", params=dict(params) if params else None)
+        if as_columns:
+            return _as_columns(data, TIMESERIES_SCHEMA)
+        return self._client.decode(_TIMESERIES, data)
+
+    def incremental_timeseries(
+        self,
+        days: int = 90,
+        *,
+        params: Optional["TimeseriesParams"] = None,
+    ) -> IncrementalTimeseries:
+        """Create a timeseries that only re-fetches the newest days.
+
+        The first ``refresh()`` fetches the whole window; later ones
+        request only the days from the last closed day onwards and
+        splice them into the stored buckets. Buckets that leave the
+        window, the account's retention, or an over-limit cutoff are
+        dropped rather than fetched again.
+
+        Args:
+            days: Length of the rolling window in days, including today.
+            params: Extra filters (``bot_filter``, ``domain_name``).
+                Dates are managed by the series.
+
+        Returns:
+            An :class:`~qck.IncrementalTimeseries`. Call ``refresh()``
+            to fetch data.
 
-    def geo(self, params: Optional["GeoAnalyticsParams"] = None) -> "AnalyticsResult":
+        Raises:
+            ValueError: If *days* is less than 1.
+
+        Example:
+            >>> trend = client.analytics.incremental_timeseries(90)
+            >>> result = trend.refresh()
+            >>> for p in result["analytics"]:
+            ...     print(p["date"], p["clicks"])
+        """
+        return IncrementalTimeseries(self, days, params=params)
+
+    def geo(
+        self,
+        params: Optional["GeoAnalyticsParams"] = None,
+        *,
+        split_days: Optional[int] = None,
+        concurrency: int = _DEFAULT_SPLIT_CONCURRENCY,
+    ) -> "AnalyticsResult":
         """Get geographic analytics (clicks by country).
 
         Args:
             params: Date range and filter options. Pass ``None`` to
                 use the API default period.
+            split_days: Split the date range into windows of this many
+                days, queried in parallel and merged. ``unique_visitors``
+                is then an upper bound (see :data:`NON_ADDITIVE_FIELDS`).
+                ``None`` (default) sends a single query.
+            concurrency: Maximum windows queried at once.
 
         Returns:
             ``{"analytics": list[GeoAnalyticsEntry], "usage": AnalyticsUsage}``.
@@ -117,14 +346,26 @@ class AnalyticsResource:
             >>> for c in result["analytics"]:
             ...     print(c["country_code"], c["clicks"])
         """
-        return self._client.get("/analytics/geo", params=dict(params) if params else None)
-
-    def devices(self, params: Optional["DeviceAnalyticsParams"] = None) -> "AnalyticsResult":
+        data = self._get_split("/analytics/geo", params, split_days, concurrency)
+        return self._client.decode(_GEO, data)
+
+    def devices(
+        self,
+        params: Optional["DeviceAnalyticsParams"] = None,
+        *,
+        split_days: Optional[int] = None,
+        concurrency: int = _DEFAULT_SPLIT_CONCURRENCY,
+    ) -> "AnalyticsResult":
         """Get device and browser analytics.
 
         Args:
             params: Date range and filter options. Pass ``None`` to
                 use the API default period.
+            split_days: Split the date range into windows of this many
+                days, queried in parallel and merged. ``unique_visitors``
+                is then an upper bound (see :data:`NON_ADDITIVE_FIELDS`).
+                ``None`` (default) sends a single query.
+            concurrency: Maximum windows queried at once.
 
         Returns:
             ``{"analytics": list[DeviceAnalyticsEntry], "usage": AnalyticsUsage}``.
@@ -136,14 +377,26 @@ class AnalyticsResource:
             >>> for d in result["analytics"]:
             ...     print(d["browser"], d["clicks"])
         """
-        return self._client.get("/analytics/devices", params=dict(params) if params else None)
-
-    def referrers(self, params: Optional["ReferrerAnalyticsParams"] = None) -> "AnalyticsResult":
+        data = self._get_split("/analytics/devices", params, split_days, concurrency)
+        return self._client.decode(_DEVICES, data)
+
+    def referrers(
+        self,
+        params: Optional["ReferrerAnalyticsParams"] = None,
+        *,
+        split_days: Optional[int] = None,
+        concurrency: int = _DEFAULT_SPLIT_CONCURRENCY,
+    ) -> "AnalyticsResult":
         """Get referrer analytics (clicks by traffic source).
 
         Args:
             params: Date range and filter options. Pass ``None`` to
                 use the API default period.
+            split_days: Split the date range into windows of this many
+                days, queried in parallel and merged. ``unique_visitors``
+                is then an upper bound (see :data:`NON_ADDITIVE_FIELDS`).
+                ``None`` (default) sends a single query.
+            concurrency: Maximum windows queried at once.
 
         Returns:
             ``{"analytics": list[ReferrerAnalyticsEntry], "usage": AnalyticsUsage}``.
@@ -155,9 +408,37 @@ class AnalyticsResource:
             >>> for r in result["analytics"]:
             ...     print(r["referrer"], r["clicks"])
         """
-        return self._client.get("/analytics/referrers", params=dict(params) if params else None)
-
-    def hourly(self, params: Optional["HourlyAnalyticsParams"] = None) -> "AnalyticsResult":
+        data = self._get_split("/analytics/referrers", params, split_days, concurrency)
+        return self._client.decode(_REFERRERS, data)
+
+    def _get_split(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]],
+        split_days: Optional[int],
+        concurrency: int,
+    ) -> Any:
+        """GET a breakdown, split into parallel date windows if requested."""
+        if split_days is None:
+            return self._client.get(path, params=dict(params) if params else None)
+        windows = _split_windows(params, split_days)
+        if len(windows) == 1:
+            return self._client.get(path, params=windows[0])
+        results = list(
+            bounded_map(
+                lambda window: self._client.get(path, params=window),
+                windows,
+                concurrency=concurrency,
+            )
+        )
+        return _merge_breakdowns(path, results)
+
+    def hourly(
+        self,
+        params: Optional["HourlyAnalyticsParams"] = None,
+        *,
+        as_columns: bool = False,
+    ) -> "AnalyticsResult":
         """Get hourly analytics (click distribution by hour of day).
 
         Returns 24 entries (one per UTC hour) showing the aggregate
@@ -166,6 +447,9 @@ class AnalyticsResource:
         Args:
             params: Date range and filter options. Pass ``None`` to
                 use the API default period.
+            as_columns: Return ``analytics`` as a :class:`~qck.Columns`
+                (one list per field, convertible with ``to_numpy()`` /
+                ``to_arrow()``) instead of a list of points.
 
         Returns:
             ``{"analytics": list[HourlyAnalyticsEntry], "usage": AnalyticsUsage}``.
@@ -177,4 +461,359 @@ class AnalyticsResource:
             >>> peak = max(result["analytics"], key=lambda h: h["clicks"])
             >>> print(f"Peak hour: {peak['hour']}:00 UTC")
         """
-        return self._client.get("/analytics/hourly", params=dict(params) if params else None)
+        data = self._client.get("/analytics/hourly", params=dict(params) if params else None)
+        if as_columns:
+            return _as_columns(data, HOURLY_SCHEMA)
+        return self._client.decode(_HOURLY, data)
+
+    def snapshot(
+        self,
+        params: Optional["AnalyticsSnapshotParams"] = None,
+        *,
+        include: Optional[Iterable[str]] = None,
+    ) -> "AnalyticsSnapshot":
+        """Fetch several analytics endpoints at once for a dashboard.
+
+        Every endpoint in *include* is requested concurrently with the
+        same *params* over the shared connection pool, so the call
+        takes about as long as the slowest endpoint rather than the sum
+        of all of them. An endpoint that fails is reported in
+        ``errors`` instead of discarding the others.
+
+        Args:
+            params: Date range and filter options applied to every
+                endpoint. Pass ``None`` to use the API default period.
+            include: Endpoints to fetch, from :data:`SNAPSHOT_ENDPOINTS`
+                (``"summary"``, ``"timeseries"``, ``"geo"``,
+                ``"devices"``, ``"referrers"``, ``"hourly"``). Defaults
+                to all of them.
+
+        Returns:
+            An :class:`~qck.AnalyticsSnapshot`: each endpoint's
+            ``analytics`` payload keyed by name, one merged ``usage``
+            block, per-endpoint ``latency`` in seconds, ``errors``, and
+            the total ``elapsed`` time.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *include* is empty or names an unknown
+                endpoint.
+
+        Example:
+            >>> snap = client.analytics.snapshot({"days": 30}, include=["summary", "geo"])
+            >>> print(snap["analytics"]["summary"]["total_clicks"])
+            >>> print(snap["usage"]["clicks_this_month"], snap["latency"])
+        """
+        names = _snapshot_endpoints(include)
+
+        def fetch(name: str) -> Tuple[str, Any, float]:
+            start = time.perf_counter()
+            try:
+                result = getattr(self, name)(params)
+            except AuthenticationError:
+                raise
+            except QCKError as exc:
+                result = exc
+            return name, result, time.perf_counter() - start
+
+        start = time.perf_counter()
+        snapshot = _empty_snapshot()
+        for outcome in bounded_map(fetch, names, concurrency=len(names)):
+            _record_snapshot(snapshot, outcome)
+        snapshot["elapsed"] = time.perf_counter() - start
+        return snapshot
+
+
+class AsyncAnalyticsResource:
+    """Asynchronous counterpart of :class:`AnalyticsResource`.
+
+    Access via ``client.analytics`` on an :class:`~qck.AsyncQCK` client.
+    Every method mirrors its synchronous twin and must be awaited.
+
+    Attributes:
+        _client: The underlying async HTTP client used for API calls.
+    """
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        """Initialise the analytics resource.
+
+        Args:
+            client: HTTP client instance for making API requests.
+        """
+        self._client = client
+
+    async def summary(self, params: Optional["AnalyticsSummaryParams"] = None) -> "AnalyticsResult":
+        """Get an aggregated analytics summary.
+
+        Returns high-level metrics such as total clicks, unique
+        visitors, active links, and this month's link/click counts
+        for the given time period.
+
+        Args:
+            params: Date range and filter options. Pass ``None`` to
+                use the API default period.
+
+        Returns:
+            ``{"analytics": AnalyticsSummary, "usage": AnalyticsUsage}``.
+
+        Example:
+            >>> result = await client.analytics.summary({"days": 7})
+            >>> print(result["analytics"]["total_clicks"])
+            >>> print(result["usage"]["limit_exceeded"])
+        """
+        data = await self._client.get("/analytics/summary", params=dict(params) if params else None)
+        return self._client.decode(_SUMMARY, data)
+
+    async def timeseries(
+        self,
+        params: Optional["TimeseriesParams"] = None,
+        *,
+        as_columns: bool = False,
+    ) -> "AnalyticsResult":
+        """Get click timeseries data.
+
+        Returns a list of date-bucketed data points with click counts
+        and unique visitor counts, suitable for charting.
+
+        Args:
+            params: Date range and filter options. Pass ``None`` to
+                use the API default period.
+            as_columns: Return ``analytics`` as a :class:`~qck.Columns`
+                (one list per field, convertible with ``to_numpy()`` /
+                ``to_arrow()``) instead of a list of points.
+
+        Returns:
+            ``{"analytics": list[TimeseriesPoint], "usage": AnalyticsUsage}``.
+            Points are ordered chronologically; each has ``date``
+            (``YYYY-MM-DD``), ``clicks``, and ``unique_visitors``.
+
+        Example:
+            >>> result = await client.analytics.timeseries({"days": 30})
+            >>> for p in result["analytics"]:
+            ...     print(p["date"], p["clicks"])
+        """
+        data = await self._client.get(
+            "/analytics/timeseries", params=dict(params) if params else None
+        )
+        if as_columns:
+            return _as_columns(data, TIMESERIES_SCHEMA)
+        return self._client.decode(_TIMESERIES, data)
+
+    def incremental_timeseries(
+        self,
+        days: int = 90,
+        *,
+        params: Optional["TimeseriesParams"] = None,
+    ) -> AsyncIncrementalTimeseries:
+        """Create a timeseries that only re-fetches the newest days.
+
+        Async counterpart of
+        :meth:`AnalyticsResource.incremental_timeseries`; the returned
+        series' ``refresh()`` must be awaited.
+
+        Args:
+            days: Length of the rolling window in days, including today.
+            params: Extra filters (``bot_filter``, ``domain_name``).
+
+        Returns:
+            An :class:`~qck.AsyncIncrementalTimeseries`.
+
+        Raises:
+            ValueError: If *days* is less than 1.
+        """
+        return AsyncIncrementalTimeseries(self, days, params=params)
+
+    async def geo(
+        self,
+        params: Optional["GeoAnalyticsParams"] = None,
+        *,
+        split_days: Optional[int] = None,
+        concurrency: int = _DEFAULT_SPLIT_CONCURRENCY,
+    ) -> "AnalyticsResult":
+        """Get geographic analytics (clicks by country).
+
+        Args:
+            params: Date range and filter options. Pass ``None`` to
+                use the API default period.
+            split_days: Split the date range into windows of this many
+                days, queried in parallel and merged. ``unique_visitors``
+                is then an upper bound (see :data:`NON_ADDITIVE_FIELDS`).
+                ``None`` (default) sends a single query.
+            concurrency: Maximum windows queried at once.
+
+        Returns:
+            ``{"analytics": list[GeoAnalyticsEntry], "usage": AnalyticsUsage}``.
+            Entries have ``country_code`` (ISO 3166-1 alpha-2),
+            ``clicks``, and ``unique_visitors``, sorted by clicks
+            descending.
+
+        Example:
+            >>> result = await client.analytics.geo({"days": 30})
+            >>> for c in result["analytics"]:
+            ...     print(c["country_code"], c["clicks"])
+        """
+        data = await self._get_split("/analytics/geo", params, split_days, concurrency)
+        return self._client.decode(_GEO, data)
+
+    async def devices(
+        self,
+        params: Optional["DeviceAnalyticsParams"] = None,
+        *,
+        split_days: Optional[int] = None,
+        concurrency: int = _DEFAULT_SPLIT_CONCURRENCY,
+    ) -> "AnalyticsResult":
+        """Get device and browser analytics.
+
+        Args:
+            params: Date range and filter options. Pass ``None`` to
+                use the API default period.
+            split_days: Split the date range into windows of this many
+                days, queried in parallel and merged. ``unique_visitors``
+                is then an upper bound (see :data:`NON_ADDITIVE_FIELDS`).
+                ``None`` (default) sends a single query.
+            concurrency: Maximum windows queried at once.
+
+        Returns:
+            ``{"analytics": list[DeviceAnalyticsEntry], "usage": AnalyticsUsage}``.
+            Entries have ``device_type``, ``browser``, ``os``, and
+            ``clicks``, sorted by clicks descending.
+
+        Example:
+            >>> result = await client.analytics.devices({"days": 30})
+            >>> for d in result["analytics"]:
+            ...     print(d["browser"], d["clicks"])
+        """
+        data = await self._get_split("/analytics/devices", params, split_days, concurrency)
+        return self._client.decode(_DEVICES, data)
+
+    async def referrers(
+        self,
+        params: Optional["ReferrerAnalyticsParams"] = None,
+        *,
+        split_days: Optional[int] = None,
+        concurrency: int = _DEFAULT_SPLIT_CONCURRENCY,
+    ) -> "AnalyticsResult":
+        """Get referrer analytics (clicks by traffic source).
+
+        Args:
+            params: Date range and filter options. Pass ``None`` to
+                use the API default period.
+            split_days: Split the date range into windows of this many
+                days, queried in parallel and merged. ``unique_visitors``
+                is then an upper bound (see :data:`NON_ADDITIVE_FIELDS`).
+                ``None`` (default) sends a single query.
+            concurrency: Maximum windows queried at once.
+
+        Returns:
+            ``{"analytics": list[ReferrerAnalyticsEntry], "usage": AnalyticsUsage}``.
+            Entries have ``referrer``, ``clicks``, and
+            ``unique_visitors``, sorted by clicks descending.
+
+        Example:
+            >>> result = await client.analytics.referrers({"days": 7})
+            >>> for r in result["analytics"]:
+            ...     print(r["referrer"], r["clicks"])
+        """
+        data = await self._get_split("/analytics/referrers", params, split_days, concurrency)
+        return self._client.decode(_REFERRERS, data)
+
+    async def _get_split(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]],
+        split_days: Optional[int],
+        concurrency: int,
+    ) -> Any:
+        """GET a breakdown, split into parallel date windows if requested."""
+        if split_days is None:
+            return await self._client.get(path, params=dict(params) if params else None)
+        windows = _split_windows(params, split_days)
+        if len(windows) == 1:
+            return await self._client.get(path, params=windows[0])
+        results = [
+            result
+            async for result in abounded_map(
+                lambda window: self._client.get(path, params=window),
+                windows,
+                concurrency=concurrency,
+            )
+        ]
+        return _merge_breakdowns(path, results)
+
+    async def hourly(
+        self,
+        params: Optional["HourlyAnalyticsParams"] = None,
+        *,
+        as_columns: bool = False,
+    ) -> "AnalyticsResult":
+        """Get hourly analytics (click distribution by hour of day).
+
+        Returns 24 entries (one per UTC hour) showing the aggregate
+        click distribution. Useful for identifying peak traffic hours.
+
+        Args:
+            params: Date range and filter options. Pass ``None`` to
+                use the API default period.
+            as_columns: Return ``analytics`` as a :class:`~qck.Columns`
+                (one list per field, convertible with ``to_numpy()`` /
+                ``to_arrow()``) instead of a list of points.
+
+        Returns:
+            ``{"analytics": list[HourlyAnalyticsEntry], "usage": AnalyticsUsage}``.
+            24 entries (hours 0-23) with click and unique visitor
+            counts.
+
+        Example:
+            >>> result = await client.analytics.hourly({"days": 30})
+            >>> peak = max(result["analytics"], key=lambda h: h["clicks"])
+            >>> print(f"Peak hour: {peak['hour']}:00 UTC")
+        """
+        data = await self._client.get("/analytics/hourly", params=dict(params) if params else None)
+        if as_columns:
+            return _as_columns(data, HOURLY_SCHEMA)
+        return self._client.decode(_HOURLY, data)
+
+    async def snapshot(
+        self,
+        params: Optional["AnalyticsSnapshotParams"] = None,
+        *,
+        include: Optional[Iterable[str]] = None,
+    ) -> "AnalyticsSnapshot":
+        """Fetch several analytics endpoints at once for a dashboard.
+
+        Async counterpart of :meth:`AnalyticsResource.snapshot`: the
+        endpoints are requested as concurrent tasks on the running
+        event loop.
+
+        Args:
+            params: Date range and filter options applied to every
+                endpoint.
+            include: Endpoints to fetch, from :data:`SNAPSHOT_ENDPOINTS`.
+                Defaults to all of them.
+
+        Returns:
+            An :class:`~qck.AnalyticsSnapshot`.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *include* is empty or names an unknown
+                endpoint.
+        """
+        names = _snapshot_endpoints(include)
+
+        async def fetch(name: str) -> Tuple[str, Any, float]:
+            start = time.perf_counter()
+            try:
+                result = await getattr(self, name)(params)
+            except AuthenticationError:
+                raise
+            except QCKError as exc:
+                result = exc
+            return name, result, time.perf_counter() - start
+
+        start = time.perf_counter()
+        snapshot = _empty_snapshot()
+        async for outcome in abounded_map(fetch, names, concurrency=len(names)):
+            _record_snapshot(snapshot, outcome)
+        snapshot["elapsed"] = time.perf_counter() - start
+        return snapshot
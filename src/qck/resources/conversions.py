@@ -19,16 +19,26 @@ Example::
         "revenue": 49.99,
     })
 
+    # Coalesce high-volume tracking into background batches
+    tracker = client.conversions.tracker()
+    tracker.track({"link_id": "abc123", "visitor_id": "vis_xyz", "name": "purchase"})
+    tracker.close()
+
     # Get conversion summary
     summary = client.conversions.summary({"period": "30d"})
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, List, Literal, Optional, Union, overload
+
+from .. import models
+from .._columns import CONVERSION_TIMESERIES_SCHEMA, Columns
+from .._ingest import AsyncConversionTracker, ConversionTracker, conversion_event
 
 if TYPE_CHECKING:
-    from .._client import HttpClient
+    from .._client import AsyncHttpClient, HttpClient
+    from .._ingest import ErrorCallback
     from .._types import (
         ConversionBreakdownEntry,
         ConversionBreakdownParams,
@@ -76,25 +86,67 @@ class ConversionsResource:
         """
         import uuid
 
-        event = {
-            "link_id": params["link_id"],
-            "visitor_id": params["visitor_id"],
-            "session_id": params.get("session_id", ""),
-            "event_type": "conversion",
-            "event_name": params["name"],
-            "page_url": params.get("page_url", ""),
-            "conversion_name": params["name"],
-            "revenue_cents": round((params.get("revenue", 0) or 0) * 100),
-            "currency": params.get("currency", "USD"),
-            "properties": params.get("properties") or {},
-        }
-
         self._client.post(
             "/journey/events",
-            {"events": [event]},
+            {"events": [conversion_event(params)]},
             headers={"X-Idempotency-Key": uuid.uuid4().hex},
         )
 
+    def tracker(
+        self,
+        *,
+        max_batch: int = 100,
+        max_latency_ms: int = 1000,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional["ErrorCallback"] = None,
+    ) -> ConversionTracker:
+        """Create a buffered tracker that batches conversions in the background.
+
+        ``tracker.track(params)`` takes the same parameters as
+        :meth:`track` but returns immediately. A worker thread posts up
+        to *max_batch* conversions per request to ``/journey/events``,
+        cutting a batch when it is full or its oldest conversion has
+        waited *max_latency_ms*. Every batch carries one stable
+        ``X-Idempotency-Key`` across its retries. ``close()`` flushes
+        the buffer and returns delivery stats.
+
+        Args:
+            max_batch: Maximum conversions per request (1-100).
+            max_latency_ms: Maximum time a conversion waits before its
+                partial batch is sent.
+            max_queue: Maximum queued conversions; ``0`` means
+                unbounded. When full, ``track()`` drops the conversion
+                and returns ``False``.
+            concurrency: Number of batch requests that may be in flight.
+            on_error: Called with ``(exception, events)`` when a batch
+                fails after the client's automatic retries.
+
+        Returns:
+            A running :class:`~qck.ConversionTracker`.
+
+        Note:
+            Requires an API key with the ``journey:write`` permission.
+
+        Example:
+            >>> with client.conversions.tracker(max_latency_ms=2000) as tracker:
+            ...     tracker.track({
+            ...         "link_id": "550e8400-e29b-41d4-a716-446655440000",
+            ...         "visitor_id": "user-456",
+            ...         "name": "purchase",
+            ...         "revenue": 49.99,
+            ...     })
+            >>> print(tracker.stats["events_sent"])
+        """
+        return ConversionTracker(
+            self._client,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+        )
+
     def summary(
         self, params: Optional["ConversionScopeParams"] = None
     ) -> "ConversionSummary":
@@ -112,13 +164,41 @@ class ConversionsResource:
             >>> summary = client.conversions.summary({"period": "30d"})
             >>> print(summary["total_revenue"])
         """
-        return self._client.get(
+        data = self._client.get(
             "/conversions/summary", params=dict(params) if params else None
         )
+        return self._client.decode(models.ConversionSummary, data)
+
+    @overload
+    def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = ...,
+        *,
+        as_columns: Literal[False] = ...,
+    ) -> List["ConversionTimeseriesPoint"]: ...
+
+    @overload
+    def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> Columns: ...
+
+    @overload
+    def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = ...,
+        *,
+        as_columns: bool = ...,
+    ) -> Union[List["ConversionTimeseriesPoint"], Columns]: ...
 
     def timeseries(
-        self, params: Optional["ConversionTimeseriesParams"] = None
-    ) -> List["ConversionTimeseriesPoint"]:
+        self,
+        params: Optional["ConversionTimeseriesParams"] = None,
+        *,
+        as_columns: bool = False,
+    ) -> Union[List["ConversionTimeseriesPoint"], Columns]:
         """Get conversion timeseries data.
 
         Returns time-bucketed conversion counts and revenue, suitable
@@ -127,9 +207,13 @@ class ConversionsResource:
         Args:
             params: Period, interval, and scope filters. Pass ``None``
                 to use the API defaults.
+            as_columns: Return a :class:`~qck.Columns` (one list per
+                field, convertible with ``to_numpy()`` / ``to_arrow()``)
+                instead of a list of points.
 
         Returns:
-            List of timeseries data points ordered chronologically.
+            List of timeseries data points ordered chronologically, or
+            their columns with *as_columns*.
 
         Example:
             >>> points = client.conversions.timeseries({
@@ -137,9 +221,12 @@ class ConversionsResource:
             ...     "interval": "day",
             ... })
         """
-        return self._client.get(
+        data = self._client.get(
             "/conversions/timeseries", params=dict(params) if params else None
         )
+        if as_columns:
+            return Columns.from_rows(data or [], CONVERSION_TIMESERIES_SCHEMA)
+        return self._client.decode(models.ConversionTimeseriesPoint, data)
 
     def breakdown(
         self, params: "ConversionBreakdownParams"
@@ -160,7 +247,8 @@ class ConversionsResource:
             ...     "period": "30d",
             ... })
         """
-        return self._client.get("/conversions/breakdown", params=dict(params))
+        data = self._client.get("/conversions/breakdown", params=dict(params))
+        return self._client.decode(models.ConversionBreakdownEntry, data)
 
     def time_to_convert(
         self, params: Optional["ConversionScopeParams"] = None
@@ -172,3 +260,198 @@ class ConversionsResource:
         return self._client.get(
             "/conversions/time-to-convert", params=dict(params) if params else None
         )
+
+
+class AsyncConversionsResource:
+    """Asynchronous counterpart of :class:`ConversionsResource`.
+
+    Access via ``client.conversions`` on an :class:`~qck.AsyncQCK` client.
+    Every method mirrors its synchronous twin and must be awaited.
+
+    Attributes:
+        _client: The underlying async HTTP client used for API calls.
+    """
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        """Initialise the conversions resource.
+
+        Args:
+            client: HTTP client instance for making API requests.
+        """
+        self._client = client
+
+    async def track(self, params: "TrackConversionParams") -> None:
+        """Track a conversion event.
+
+        Use this from server-side code, mobile apps, or any HTTP client.
+        ``link_id`` is the link's **UUID** (read from the ``?qck_link=``
+        URL param after redirect), not its short code.
+
+        Each call sends a unique ``X-Idempotency-Key`` header so that
+        network-level retries cannot record the same conversion twice
+        (the backend deduplicates for 5 minutes).
+
+        Note:
+            Requires an API key with the ``journey:write`` permission
+            (conversions are ingested through the journey pipeline).
+        """
+        import uuid
+
+        await self._client.post(
+            "/journey/events",
+            {"events": [conversion_event(params)]},
+            headers={"X-Idempotency-Key": uuid.uuid4().hex},
+        )
+
+    def tracker(
+        self,
+        *,
+        max_batch: int = 100,
+        max_latency_ms: int = 1000,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional["ErrorCallback"] = None,
+    ) -> AsyncConversionTracker:
+        """Create a buffered tracker that batches conversions on the event loop.
+
+        Must be called from inside a running event loop. Takes the same
+        arguments as :meth:`ConversionsResource.tracker`; ``track()``
+        stays synchronous and returns immediately, while ``flush()`` and
+        ``close()`` must be awaited.
+
+        Returns:
+            A running :class:`~qck.AsyncConversionTracker`.
+
+        Note:
+            Requires an API key with the ``journey:write`` permission.
+
+        Example:
+            >>> async with client.conversions.tracker() as tracker:
+            ...     tracker.track({
+            ...         "link_id": "550e8400-e29b-41d4-a716-446655440000",
+            ...         "visitor_id": "user-456",
+            ...         "name": "purchase",
+            ...     })
+        """
+        return AsyncConversionTracker(
+            self._client,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+        )
+
+    async def summary(
+        self, params: Optional["ConversionScopeParams"] = None
+    ) -> "ConversionSummary":
+        """Get an aggregated conversion summary.
+
+        Args:
+            params: Scope filters (period, domain, or link). Pass
+                ``None`` to use the API default period.
+
+        Returns:
+            A summary with total conversions, unique converters,
+            revenue, average order value, and conversion rate.
+
+        Example:
+            >>> summary = await client.conversions.summary({"period": "30d"})
+            >>> print(summary["total_revenue"])
+        """
+        data = await self._client.get(
+            "/conversions/summary", params=dict(params) if params else None
+        )
+        return self._client.decode(models.ConversionSummary, data)
+
+    @overload
+    async def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = ...,
+        *,
+        as_columns: Literal[False] = ...,
+    ) -> List["ConversionTimeseriesPoint"]: ...
+
+    @overload
+    async def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = ...,
+        *,
+        as_columns: Literal[True],
+    ) -> Columns: ...
+
+    @overload
+    async def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = ...,
+        *,
+        as_columns: bool = ...,
+    ) -> Union[List["ConversionTimeseriesPoint"], Columns]: ...
+
+    async def timeseries(
+        self,
+        params: Optional["ConversionTimeseriesParams"] = None,
+        *,
+        as_columns: bool = False,
+    ) -> Union[List["ConversionTimeseriesPoint"], Columns]:
+        """Get conversion timeseries data.
+
+        Returns time-bucketed conversion counts and revenue, suitable
+        for charting trends over time.
+
+        Args:
+            params: Period, interval, and scope filters. Pass ``None``
+                to use the API defaults.
+            as_columns: Return a :class:`~qck.Columns` (one list per
+                field, convertible with ``to_numpy()`` / ``to_arrow()``)
+                instead of a list of points.
+
+        Returns:
+            List of timeseries data points ordered chronologically, or
+            their columns with *as_columns*.
+
+        Example:
+            >>> points = await client.conversions.timeseries({
+            ...     "period": "30d",
+            ...     "interval": "day",
+            ... })
+        """
+        data = await self._client.get(
+            "/conversions/timeseries", params=dict(params) if params else None
+        )
+        if as_columns:
+            return Columns.from_rows(data or [], CONVERSION_TIMESERIES_SCHEMA)
+        return self._client.decode(models.ConversionTimeseriesPoint, data)
+
+    async def breakdown(
+        self, params: "ConversionBreakdownParams"
+    ) -> List["ConversionBreakdownEntry"]:
+        """Get conversions broken down by a dimension.
+
+        Args:
+            params: Must include a ``dimension`` (``"device"``,
+                ``"country"``, ``"link"``, or ``"name"``).
+                Optional period and scope filters.
+
+        Returns:
+            List of breakdown entries sorted by conversions descending.
+
+        Example:
+            >>> by_country = await client.conversions.breakdown({
+            ...     "dimension": "country",
+            ...     "period": "30d",
+            ... })
+        """
+        data = await self._client.get("/conversions/breakdown", params=dict(params))
+        return self._client.decode(models.ConversionBreakdownEntry, data)
+
+    async def time_to_convert(
+        self, params: Optional["ConversionScopeParams"] = None
+    ) -> "TimeToConvertData":
+        """Get time-to-convert distribution.
+
+        Shows how long visitors take from first click to conversion.
+        """
+        return await self._client.get(
+            "/conversions/time-to-convert", params=dict(params) if params else None
+        )
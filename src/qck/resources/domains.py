@@ -17,8 +17,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List
 
+from .. import models
+
 if TYPE_CHECKING:
-    from .._client import HttpClient
+    from .._client import AsyncHttpClient, HttpClient
     from .._types import Domain
 
 
@@ -57,4 +59,41 @@ class DomainsResource:
             ...     print(d["domain"], d["status"])
         """
         response = self._client.get("/domains")
-        return response["domains"]
+        return self._client.decode(models.Domain, response["domains"])
+
+
+class AsyncDomainsResource:
+    """Asynchronous counterpart of :class:`DomainsResource`.
+
+    Access via ``client.domains`` on an :class:`~qck.AsyncQCK` client.
+    Every method mirrors its synchronous twin and must be awaited.
+
+    Attributes:
+        _client: The underlying async HTTP client used for API calls.
+    """
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        """Initialise the domains resource.
+
+        Args:
+            client: HTTP client instance for making API requests.
+        """
+        self._client = client
+
+    async def list(self) -> List["Domain"]:
+        """List all custom domains for the organization associated with the API key.
+
+        Returns:
+            List of domain objects. Fields are serialised in camelCase
+            (e.g. ``verificationToken``, ``dnsVerifiedAt``); ``status``
+            is one of ``pending``, ``provisioning``,
+            ``provisioning_failed``, ``active``, ``rejected``, or
+            ``suspended``.
+
+        Example:
+            >>> domains = await client.domains.list()
+            >>> for d in domains:
+            ...     print(d["domain"], d["status"])
+        """
+        response = await self._client.get("/domains")
+        return self._client.decode(models.Domain, response["domains"])
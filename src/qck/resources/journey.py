@@ -21,6 +21,10 @@ Example::
         },
     ]})
 
+    # Stream events from a hot path; batches are sent in the background
+    with client.journey.ingestor(max_latency_ms=500) as ingestor:
+        ingestor.add({...})
+
     # Get journey summary for a link
     summary = client.journey.get_summary("550e8400-e29b-41d4-a716-446655440000", {"period": "30d"})
 """
@@ -29,8 +33,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Dict, Optional
 
+from .. import models
+from .._ingest import AsyncJourneyIngestor, JourneyIngestor
+from ..models import Envelope
+
 if TYPE_CHECKING:
-    from .._client import HttpClient
+    from .._client import AsyncHttpClient, HttpClient
+    from .._ingest import ErrorCallback
     from .._types import (
         FunnelParams,
         FunnelResult,
@@ -44,6 +53,30 @@ if TYPE_CHECKING:
     )
 
 
+def _funnel_params(params: "FunnelParams") -> Dict[str, str]:
+    """Encode funnel parameters as query-string values.
+
+    Args:
+        params: Funnel configuration with ordered step names and an
+            optional period filter.
+
+    Returns:
+        Query parameters with ``steps`` joined by commas.
+    """
+    p: Dict[str, str] = {}
+    steps = params.get("steps")
+    if steps:
+        p["steps"] = ",".join(steps)
+    period = params.get("period")
+    if period:
+        p["period"] = period
+    return p
+
+
+_SESSIONS = Envelope("sessions", models.SessionSummary)
+_EVENTS = Envelope("events", models.JourneyEvent)
+
+
 class JourneyResource:
     """Ingest journey events and query link-level journey analytics.
 
@@ -84,6 +117,57 @@ class JourneyResource:
             headers={"X-Idempotency-Key": batch_id},
         )
 
+    def ingestor(
+        self,
+        *,
+        max_batch: int = 100,
+        max_latency_ms: int = 1000,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional["ErrorCallback"] = None,
+    ) -> JourneyIngestor:
+        """Create a background ingestor that batches events for you.
+
+        ``add(event)`` only enqueues, so producers never wait on the
+        network. A worker thread sends batches of up to *max_batch*
+        events through :meth:`ingest` (each with its own idempotency
+        key) when a batch fills up or its oldest event has waited
+        *max_latency_ms*. ``close()`` flushes what is left and returns
+        delivery stats.
+
+        Args:
+            max_batch: Maximum events per request (1-100).
+            max_latency_ms: Maximum time an event waits before its
+                partial batch is sent.
+            max_queue: Maximum queued events; ``0`` means unbounded.
+                When full, ``add()`` drops the event and returns
+                ``False``.
+            concurrency: Number of batch requests that may be in flight.
+            on_error: Called with ``(exception, events)`` when a batch
+                fails after the client's automatic retries.
+
+        Returns:
+            A running :class:`~qck.JourneyIngestor`.
+
+        Example:
+            >>> with client.journey.ingestor(max_latency_ms=250) as ingestor:
+            ...     ingestor.add({
+            ...         "link_id": "550e8400-e29b-41d4-a716-446655440000",
+            ...         "visitor_id": "user-456",
+            ...         "event_type": "page_view",
+            ...         "page_url": "/pricing",
+            ...     })
+            >>> print(ingestor.stats["events_sent"])
+        """
+        return JourneyIngestor(
+            self,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+        )
+
     def get_summary(
         self,
         link_id: str,
@@ -118,14 +202,8 @@ class JourneyResource:
             ...     "period": "30d",
             ... })
         """
-        p: Dict[str, str] = {}
-        steps = params.get("steps")
-        if steps:
-            p["steps"] = ",".join(steps)
-        period = params.get("period")
-        if period:
-            p["period"] = period
-        return self._client.get(f"/journey/links/{link_id}/funnel", params=p)
+        data = self._client.get(f"/journey/links/{link_id}/funnel", params=_funnel_params(params))
+        return self._client.decode(models.FunnelResult, data)
 
     def list_sessions(
         self,
@@ -146,10 +224,11 @@ class JourneyResource:
             >>> for session in page["sessions"]:
             ...     print(session["visitor_id"], session["event_count"])
         """
-        return self._client.get(
+        data = self._client.get(
             f"/journey/links/{link_id}/sessions",
             params=dict(params) if params else None,
         )
+        return self._client.decode(_SESSIONS, data)
 
     def list_events(
         self,
@@ -170,7 +249,175 @@ class JourneyResource:
             >>> for event in page["events"]:
             ...     print(event["event_type"], event["page_url"])
         """
-        return self._client.get(
+        data = self._client.get(
+            f"/journey/links/{link_id}/events",
+            params=dict(params) if params else None,
+        )
+        return self._client.decode(_EVENTS, data)
+
+
+class AsyncJourneyResource:
+    """Asynchronous counterpart of :class:`JourneyResource`.
+
+    Access via ``client.journey`` on an :class:`~qck.AsyncQCK` client.
+    Every method mirrors its synchronous twin and must be awaited.
+
+    Attributes:
+        _client: The underlying async HTTP client used for API calls.
+    """
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        self._client = client
+
+    async def ingest(self, params: "IngestEventsParams") -> None:
+        """Ingest a batch of journey events.
+
+        Events are processed asynchronously by the QCK platform.
+        Each call generates a unique idempotency key to prevent
+        duplicate processing on retries.
+
+        Example:
+            >>> await client.journey.ingest({"events": [
+            ...     {
+            ...         "link_id": "550e8400-e29b-41d4-a716-446655440000",
+            ...         "visitor_id": "user-456",
+            ...         "session_id": "sess-789",
+            ...         "event_type": "page_view",
+            ...         "page_url": "/pricing",
+            ...     },
+            ... ]})
+        """
+        import uuid
+
+        batch_id = str(uuid.uuid4())
+        await self._client.post(
+            "/journey/events",
+            dict(params),
+            headers={"X-Idempotency-Key": batch_id},
+        )
+
+    def ingestor(
+        self,
+        *,
+        max_batch: int = 100,
+        max_latency_ms: int = 1000,
+        max_queue: int = 0,
+        concurrency: int = 1,
+        on_error: Optional["ErrorCallback"] = None,
+    ) -> AsyncJourneyIngestor:
+        """Create an ingestor that batches events on the event loop.
+
+        Must be called from inside a running event loop. Takes the same
+        arguments as :meth:`JourneyResource.ingestor`; ``add()`` stays
+        synchronous and returns immediately, while ``flush()`` and
+        ``close()`` must be awaited.
+
+        Returns:
+            A running :class:`~qck.AsyncJourneyIngestor`.
+
+        Example:
+            >>> async with client.journey.ingestor(max_latency_ms=250) as ingestor:
+            ...     ingestor.add({
+            ...         "link_id": "550e8400-e29b-41d4-a716-446655440000",
+            ...         "visitor_id": "user-456",
+            ...         "event_type": "page_view",
+            ...         "page_url": "/pricing",
+            ...     })
+        """
+        return AsyncJourneyIngestor(
+            self,
+            max_batch=max_batch,
+            max_latency_ms=max_latency_ms,
+            max_queue=max_queue,
+            concurrency=concurrency,
+            on_error=on_error,
+        )
+
+    async def get_summary(
+        self,
+        link_id: str,
+        params: Optional["JourneyQueryParams"] = None,
+    ) -> "JourneyLinkSummary":
+        """Get a journey summary for a specific link.
+
+        Args:
+            link_id: The link's UUID.
+            params: Optional period filter.
+
+        Returns:
+            A summary with visitor/session counts, average session
+            duration, and top pages/events.
+        """
+        return await self._client.get(
+            f"/journey/links/{link_id}/summary",
+            params=dict(params) if params else None,
+        )
+
+    async def get_funnel(self, link_id: str, params: "FunnelParams") -> "FunnelResult":
+        """Run a funnel analysis for a specific link.
+
+        Args:
+            link_id: The link's UUID.
+            params: Funnel configuration with ordered step names and
+                an optional period filter.
+
+        Example:
+            >>> funnel = await client.journey.get_funnel("abc123", {
+            ...     "steps": ["page_view", "signup", "purchase"],
+            ...     "period": "30d",
+            ... })
+        """
+        data = await self._client.get(
+            f"/journey/links/{link_id}/funnel", params=_funnel_params(params)
+        )
+        return self._client.decode(models.FunnelResult, data)
+
+    async def list_sessions(
+        self,
+        link_id: str,
+        params: Optional["ListJourneySessionsParams"] = None,
+    ) -> "JourneySessionsPage":
+        """List visitor sessions for a specific link.
+
+        Args:
+            link_id: The link's UUID.
+            params: Pagination, visitor filter, and period options.
+
+        Returns:
+            ``{"sessions": [...], "total": int, "page": int, "limit": int}``.
+
+        Example:
+            >>> page = await client.journey.list_sessions("link-uuid", {"limit": 10})
+            >>> for session in page["sessions"]:
+            ...     print(session["visitor_id"], session["event_count"])
+        """
+        data = await self._client.get(
+            f"/journey/links/{link_id}/sessions",
+            params=dict(params) if params else None,
+        )
+        return self._client.decode(_SESSIONS, data)
+
+    async def list_events(
+        self,
+        link_id: str,
+        params: Optional["ListJourneyEventsParams"] = None,
+    ) -> "JourneyEventsPage":
+        """List journey events for a specific link.
+
+        Args:
+            link_id: The link's UUID.
+            params: Pagination, event type filter, and period options.
+
+        Returns:
+            ``{"events": [...], "total": int, "page": int, "limit": int}``.
+
+        Example:
+            >>> page = await client.journey.list_events("link-uuid", {"event_type": "custom"})
+            >>> for event in page["events"]:
+            ...     print(event["event_type"], event["page_url"])
+        """
+        data = await self._client.get(
             f"/journey/links/{link_id}/events",
             params=dict(params) if params else None,
         )
+        return self._client.decode(_EVENTS, data)
@@ -15,19 +15,72 @@ Example::
 
     # List links with filtering
     page = client.links.list({"tags": ["marketing"], "per_page": 10})
+
+    # Stream every link, prefetching pages in the background
+    for link in client.links.iter_all({"per_page": 100}):
+        print(link["short_url"])
 """
 
 from __future__ import annotations
 
-import mimetypes
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import asyncio
+import os
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import httpx
+
+from .. import models
+from .._client import _as_sdk_error
+from .._concurrency import abounded_map, achunked, bounded_map, chunked
+from .._errors import (
+    AuthenticationError,
+    CircuitOpenError,
+    NetworkError,
+    NotFoundError,
+    QCKError,
+)
+from .._export import CheckpointCallback, ExportWriter, export_params
+from .._import import ImportRow, RejectWriter, detect_format, read_rows
+from .._mirror import AsyncLinkMirror, LinkMirror
+from .._upload import (
+    AsyncChunkedBody,
+    ChunkedBody,
+    UploadSource,
+    open_buffer,
+    sniff_image_type,
+)
 
 if TYPE_CHECKING:
-    from .._client import HttpClient
+    from .._client import AsyncHttpClient, HttpClient
     from .._types import (
         BulkCreateResult,
+        BulkLinkError,
+        BulkLinkSuccess,
+        BulkOperationResult,
         CreateLinkParams,
+        ImportResult,
         Link,
         LinkStats,
         ListLinksParams,
@@ -35,6 +88,317 @@ if TYPE_CHECKING:
         UpdateLinkParams,
     )
 
+_DEFAULT_PREFETCH = 4
+_DEFAULT_BULK_CHUNK_SIZE = 100
+_DEFAULT_BULK_CONCURRENCY = 4
+_DEFAULT_UPLOAD_CONCURRENCY = 4
+_DEFAULT_FETCH_CONCURRENCY = 8
+_DEFAULT_OPERATION_CONCURRENCY = 8
+# Attempts per item in update_many/delete_many, on top of the client's retries.
+_OPERATION_ATTEMPTS = 3
+
+_PAGE = models.Envelope("data", models.Link)
+
+ProgressCallback = Callable[[int, int], None]
+"""Hook called as ``(processed, failed)`` after each item of a bulk operation."""
+
+_ALLOWED_OG_CONTENT_TYPES = {
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "image/gif",
+}
+
+
+def _page_params(params: Optional["ListLinksParams"], page: int) -> "ListLinksParams":
+    """Copy list filters with ``page`` set to a specific page number.
+
+    Args:
+        params: Caller-supplied filters (may be ``None``).
+        page: Page number to request.
+
+    Returns:
+        A new parameter dict suitable for ``list()``.
+    """
+    p: Dict[str, Any] = dict(params) if params else {}
+    p["page"] = page
+    return cast("ListLinksParams", p)
+
+
+def _empty_bulk_result() -> "BulkCreateResult":
+    """Return a zeroed :class:`~qck.BulkCreateResult` to merge chunks into."""
+    return {
+        "created": [],
+        "failed": [],
+        "total_requested": 0,
+        "success_count": 0,
+        "failure_count": 0,
+    }
+
+
+def _offset_bulk_result(
+    result: "BulkCreateResult", offset: int, chunk_len: int
+) -> "BulkCreateResult":
+    """Shift per-item indices of a chunk result to original input positions.
+
+    Args:
+        result: The ``/links/bulk`` response for one chunk.
+        offset: Position of the chunk's first link in the overall input.
+        chunk_len: Number of links sent in the chunk.
+
+    Returns:
+        A new result with every ``index`` offset by *offset*; *result*
+        itself is left unchanged.
+    """
+    created: List["BulkLinkSuccess"] = [
+        {**created_item, "index": created_item["index"] + offset}
+        for created_item in result.get("created") or []
+    ]
+    failed: List["BulkLinkError"] = [
+        {**failed_item, "index": failed_item["index"] + offset}
+        for failed_item in result.get("failed") or []
+    ]
+    return {
+        "created": created,
+        "failed": failed,
+        "total_requested": result.get("total_requested", chunk_len),
+        "success_count": result.get("success_count", len(created)),
+        "failure_count": result.get("failure_count", len(failed)),
+    }
+
+
+def _failed_chunk_result(
+    chunk: List["CreateLinkParams"], offset: int, exc: Exception
+) -> "BulkCreateResult":
+    """Record every link of a chunk whose request failed outright.
+
+    A 4xx response (or an open circuit) means the chunk was rejected
+    and none of its links exist. A 5xx response or a network error
+    (timeout, dropped connection) may come after the server has
+    already created some of them, so those links are reported as
+    unconfirmed instead: callers should reconcile them (e.g. with
+    ``links.list``) rather than retry them blindly.
+
+    Args:
+        chunk: The links sent in the failed request.
+        offset: Position of the chunk's first link in the overall input.
+        exc: The API or transport error raised for the request.
+
+    Returns:
+        A result listing each link as failed with the error message and
+        ``error_type`` ``"request"`` (rejected) or ``"unconfirmed"``
+        (outcome unknown).
+    """
+    rejected = isinstance(exc, CircuitOpenError) or (
+        isinstance(exc, QCKError) and 400 <= exc.status < 500
+    )
+    error_type = "request" if rejected else "unconfirmed"
+    return {
+        "created": [],
+        "failed": [
+            {
+                "index": offset + i,
+                "url": link.get("url", ""),
+                "error": str(exc),
+                "error_type": error_type,
+            }
+            for i, link in enumerate(chunk)
+        ],
+        "total_requested": len(chunk),
+        "success_count": 0,
+        "failure_count": len(chunk),
+    }
+
+
+def _merge_bulk_result(into: "BulkCreateResult", chunk: "BulkCreateResult") -> None:
+    """Accumulate a chunk result into a running total in place.
+
+    Args:
+        into: The combined result being built.
+        chunk: A chunk result with indices already remapped.
+    """
+    into["created"].extend(chunk["created"])
+    into["failed"].extend(chunk["failed"])
+    into["total_requested"] += chunk["total_requested"]
+    into["success_count"] += chunk["success_count"]
+    into["failure_count"] += chunk["failure_count"]
+
+
+def _empty_operation_result() -> "BulkOperationResult":
+    """Return a zeroed :class:`~qck.BulkOperationResult` to record items into."""
+    return {
+        "succeeded": [],
+        "failed": [],
+        "total_requested": 0,
+        "success_count": 0,
+        "failure_count": 0,
+    }
+
+
+def _record_operation(
+    result: "BulkOperationResult",
+    outcome: Tuple[int, str, Any],
+    on_progress: Optional[ProgressCallback],
+) -> None:
+    """Record one item of a bulk update or deletion in place.
+
+    Args:
+        result: The result being built.
+        outcome: ``(index, link_id, response_or_error)`` for the item.
+        on_progress: Optional progress hook, called after recording.
+    """
+    index, link_id, response = outcome
+    if isinstance(response, QCKError):
+        result["failed"].append(
+            {
+                "index": index,
+                "link_id": link_id,
+                "error": str(response),
+                "error_type": response.code,
+                "status": response.status,
+            }
+        )
+        result["failure_count"] += 1
+    else:
+        result["succeeded"].append({"index": index, "link_id": link_id, "link": response})
+        result["success_count"] += 1
+    result["total_requested"] += 1
+    if on_progress is not None:
+        on_progress(result["total_requested"], result["failure_count"])
+
+
+def _idempotency_headers() -> Dict[str, str]:
+    """Headers marking a request as safe to retry after a network error."""
+    return {"X-Idempotency-Key": str(uuid.uuid4())}
+
+
+def _should_resend(error: Exception, attempt: int) -> bool:
+    """Whether a bulk update or deletion should be sent again.
+
+    Network errors and 5xx responses are re-sent until
+    :data:`_OPERATION_ATTEMPTS` is reached. An open circuit is not: the
+    breaker would reject the request again.
+
+    Args:
+        error: The error of the failed attempt, transport errors already
+            wrapped in :class:`~qck.NetworkError`.
+        attempt: Zero-based index of the failed attempt.
+    """
+    if attempt + 1 >= _OPERATION_ATTEMPTS or isinstance(error, CircuitOpenError):
+        return False
+    return isinstance(error, NetworkError) or (
+        isinstance(error, QCKError) and error.status >= 500
+    )
+
+
+def _update_items(
+    updates: Union[Mapping[str, "UpdateLinkParams"], Iterable[Tuple[str, "UpdateLinkParams"]]],
+) -> Iterable[Tuple[str, "UpdateLinkParams"]]:
+    """Normalise the ``updates`` argument of the bulk update helpers."""
+    if isinstance(updates, Mapping):
+        return updates.items()
+    return updates
+
+
+def _record_import_chunk(
+    result: "ImportResult",
+    chunk: "BulkCreateResult",
+    sent: Deque[ImportRow],
+    chunk_size: int,
+    rejects: RejectWriter,
+    on_progress: Optional[ProgressCallback],
+) -> None:
+    """Account for one bulk-create chunk of an import in place.
+
+    Args:
+        result: The import summary being built.
+        chunk: The chunk's result, with indices offset to positions in
+            the stream of valid rows.
+        sent: Rows sent but not yet accounted for, oldest first. The
+            chunk's rows are popped from the front.
+        chunk_size: Rows per chunk.
+        rejects: Where rows the API rejected are recorded.
+        on_progress: Optional progress hook, called after recording.
+    """
+    rows = [sent.popleft() for _ in range(min(chunk_size, len(sent)))]
+    for failure in chunk["failed"]:
+        row = rows[failure["index"] % chunk_size]
+        rejects.write(row, failure["error"], failure["error_type"])
+    result["success_count"] += chunk["success_count"]
+    result["failure_count"] += chunk["failure_count"]
+    if on_progress is not None:
+        on_progress(result["success_count"] + result["failure_count"], result["failure_count"])
+
+
+def _valid_import_rows(
+    rows: Iterable[ImportRow],
+    result: "ImportResult",
+    sent: Deque[ImportRow],
+    rejects: RejectWriter,
+) -> Iterator["CreateLinkParams"]:
+    """Filter an import's rows, rejecting invalid ones and queueing the rest.
+
+    Args:
+        rows: Rows read from the import file.
+        result: The import summary, updated for every row read.
+        sent: Receives each valid row as its parameters are yielded.
+        rejects: Where rows that failed local validation are recorded.
+
+    Yields:
+        Link parameters of the valid rows, in file order.
+    """
+    for row in rows:
+        result["total_rows"] += 1
+        if row.params is None:
+            rejects.write(row, row.error or "", row.error_type or "validation")
+            result["failure_count"] += 1
+            continue
+        sent.append(row)
+        yield row.params
+
+
+@contextmanager
+def _open_og_image(image: UploadSource) -> Iterator[Tuple[memoryview, Dict[str, str]]]:
+    """Open an OG image for streaming and detect its content type.
+
+    Args:
+        image: A path, binary file object, ``bytes``, ``bytearray``, or
+            ``memoryview`` holding a JPEG, PNG, WebP, or GIF image.
+
+    Yields:
+        ``(view, headers)`` — a zero-copy view of the image and the
+        ``Content-Type`` / ``Content-Length`` headers for the upload.
+
+    Raises:
+        ValueError: If the data is not a supported image format.
+    """
+    with open_buffer(image) as view:
+        content_type = sniff_image_type(bytes(view[:12]))
+        if content_type not in _ALLOWED_OG_CONTENT_TYPES:
+            raise ValueError(
+                "Unsupported image type: expected "
+                f"{', '.join(sorted(_ALLOWED_OG_CONTENT_TYPES))} data"
+            )
+        yield view, {"Content-Type": content_type, "Content-Length": str(view.nbytes)}
+
+
+def _og_image_items(
+    images: Union[Mapping[str, UploadSource], Iterable[Tuple[str, UploadSource]]],
+) -> Iterable[Tuple[str, UploadSource]]:
+    """Normalise the ``images`` argument of the batch upload helpers."""
+    if isinstance(images, Mapping):
+        return images.items()
+    return images
+
+
+def _unique_ids(link_ids: Iterable[str]) -> Iterator[str]:
+    """Yield each link ID once, in first-seen order, consuming lazily."""
+    seen = set()
+    for link_id in link_ids:
+        if link_id not in seen:
+            seen.add(link_id)
+            yield link_id
+
 
 class LinksResource:
     """Create, list, update, and delete short links.
@@ -75,7 +439,8 @@ class LinksResource:
             ... })
             >>> print(link["short_url"])
         """
-        return self._client.post("/links", dict(params))
+        data = self._client.post("/links", dict(params))
+        return self._client.decode(models.Link, data)
 
     def list(self, params: Optional["ListLinksParams"] = None) -> "PaginatedResponse":
         """List links with optional filtering and pagination.
@@ -95,7 +460,79 @@ class LinksResource:
             ...     print(link["short_url"])
             >>> print(page["total"], page["total_pages"])
         """
-        return self._client.get("/links", params=dict(params) if params else None)
+        data = self._client.get("/links", params=dict(params) if params else None)
+        return self._client.decode(_PAGE, data)
+
+    def iter_all(
+        self,
+        params: Optional["ListLinksParams"] = None,
+        *,
+        prefetch: int = _DEFAULT_PREFETCH,
+    ) -> Iterator["Link"]:
+        """Iterate over every link matching *params*, across all pages.
+
+        The first page is fetched synchronously to learn
+        ``total_pages``; the following pages are then requested in the
+        background, with at most *prefetch* pages in flight or buffered
+        at once. Links are yielded one at a time in page order, so
+        memory stays bounded by the prefetch window regardless of how
+        many links the account holds.
+
+        Pagination is offset-based: links created or deleted while the
+        iteration runs can shift items between pages. Sort by a stable
+        field (e.g. ``{"sort_by": "created_at", "sort_order": "asc"}``)
+        for long-running exports.
+
+        Args:
+            params: Query filters as accepted by :meth:`list`. ``page``
+                sets the starting page (default 1); ``per_page`` sets
+                the page size.
+            prefetch: Maximum number of pages requested ahead of the
+                consumer. ``0`` fetches pages sequentially.
+
+        Yields:
+            Link objects in the order returned by the API.
+
+        Example:
+            >>> for link in client.links.iter_all({"per_page": 100}, prefetch=8):
+            ...     print(link["id"])
+        """
+        for page in self._iter_pages(params, prefetch=prefetch):
+            yield from self._client.decode(models.Link, page["data"])
+
+    def _iter_pages(
+        self,
+        params: Optional["ListLinksParams"],
+        *,
+        prefetch: int,
+        cache: bool = True,
+    ) -> Iterator["PaginatedResponse"]:
+        """Yield successive raw pages of :meth:`list`, prefetching ahead.
+
+        Args:
+            params: Query filters; ``page`` sets the starting page.
+            prefetch: Maximum number of pages requested ahead.
+            cache: ``False`` bypasses the client's response cache.
+
+        Yields:
+            Paginated responses in page order.
+        """
+
+        def fetch(page: int) -> "PaginatedResponse":
+            return self._client.get(
+                "/links", params=dict(_page_params(params, page)), cache=cache
+            )
+
+        start = int(params.get("page") or 1) if params else 1
+        first = fetch(start)
+        yield first
+
+        pages = range(start + 1, (first.get("total_pages") or 0) + 1)
+        if prefetch < 1:
+            for n in pages:
+                yield fetch(n)
+            return
+        yield from bounded_map(fetch, pages, concurrency=prefetch)
 
     def get(self, link_id: str) -> "Link":
         """Retrieve a single link by ID.
@@ -113,7 +550,8 @@ class LinksResource:
             >>> link = client.links.get("lnk_abc123")
             >>> print(link["original_url"])
         """
-        return self._client.get(f"/links/{link_id}")
+        data = self._client.get(f"/links/{link_id}")
+        return self._client.decode(models.Link, data)
 
     def update(self, link_id: str, params: "UpdateLinkParams") -> "Link":
         """Update an existing link.
@@ -138,7 +576,8 @@ class LinksResource:
             ...     "is_active": False,
             ... })
         """
-        return self._client.patch(f"/links/{link_id}", dict(params))
+        data = self._client.patch(f"/links/{link_id}", dict(params))
+        return self._client.decode(models.Link, data)
 
     def delete(self, link_id: str) -> None:
         """Delete a link.
@@ -154,6 +593,153 @@ class LinksResource:
         """
         self._client.delete(f"/links/{link_id}")
 
+    def update_many(
+        self,
+        updates: Union[Mapping[str, "UpdateLinkParams"], Iterable[Tuple[str, "UpdateLinkParams"]]],
+        *,
+        concurrency: int = _DEFAULT_OPERATION_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "BulkOperationResult":
+        """Update many links concurrently.
+
+        Each update is a ``PATCH /links/{id}`` sent with its own
+        idempotency key, so the client's retry policy also retries it
+        after timeouts and connection errors, not only on ``429``. An
+        item that still fails with a network error or a 5xx response is
+        re-sent with the same key, up to three attempts in all. All
+        requests share the client's connection pool and rate limiter,
+        with at most *concurrency* in flight.
+
+        A failed update does not abort the run: it is listed in
+        ``failed`` with the API error code (``NETWORK_ERROR`` or
+        ``TIMEOUT`` when no response arrived). Authentication errors are
+        raised.
+
+        Args:
+            updates: ``{link_id: params}`` or ``(link_id, params)``
+                pairs, consumed lazily.
+            concurrency: Maximum number of requests in flight.
+            on_progress: Optional ``(processed, failed)`` hook, called
+                on the calling thread after each item completes.
+
+        Returns:
+            The combined result, ordered by input position.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *concurrency* is less than 1.
+
+        Example:
+            >>> result = client.links.update_many(
+            ...     ((link_id, {"is_active": False}) for link_id in stale_ids),
+            ...     concurrency=16,
+            ...     on_progress=lambda done, failed: print(done, failed),
+            ... )
+            >>> print(result["success_count"], result["failure_count"])
+        """
+
+        def send(item: Tuple[int, Tuple[str, "UpdateLinkParams"]]) -> Tuple[int, str, Any]:
+            index, (link_id, params) = item
+            body = dict(params)
+            link = self._send_operation(
+                lambda headers: self._client.patch(f"/links/{link_id}", body, headers=headers)
+            )
+            if isinstance(link, QCKError):
+                return index, link_id, link
+            return index, link_id, self._client.decode(models.Link, link)
+
+        result = _empty_operation_result()
+        for outcome in bounded_map(
+            send, enumerate(_update_items(updates)), concurrency=concurrency
+        ):
+            _record_operation(result, outcome, on_progress)
+        return result
+
+    def delete_many(
+        self,
+        link_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_OPERATION_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "BulkOperationResult":
+        """Delete many links concurrently.
+
+        Behaves like :meth:`update_many`, sending one idempotent
+        ``DELETE /links/{id}`` per link. A ``404`` for a re-sent
+        deletion counts as success, since an earlier attempt removed
+        the link. Successful items carry ``link`` ``None``.
+
+        Args:
+            link_ids: Link IDs, consumed lazily.
+            concurrency: Maximum number of requests in flight.
+            on_progress: Optional ``(processed, failed)`` hook, called
+                on the calling thread after each item completes.
+
+        Returns:
+            The combined result, ordered by input position.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *concurrency* is less than 1.
+
+        Example:
+            >>> result = client.links.delete_many(expired_ids, concurrency=16)
+            >>> not_found = [f for f in result["failed"] if f["status"] == 404]
+        """
+
+        def send(item: Tuple[int, str]) -> Tuple[int, str, Any]:
+            index, link_id = item
+            outcome = self._send_operation(
+                lambda headers: self._client.delete(f"/links/{link_id}", headers=headers),
+                delete=True,
+            )
+            return index, link_id, outcome
+
+        result = _empty_operation_result()
+        for outcome in bounded_map(send, enumerate(link_ids), concurrency=concurrency):
+            _record_operation(result, outcome, on_progress)
+        return result
+
+    def _send_operation(
+        self, call: Callable[[Dict[str, str]], Any], *, delete: bool = False
+    ) -> Any:
+        """Send one item of a bulk update or deletion.
+
+        Every attempt carries the same idempotency key. Network errors
+        and 5xx responses are re-sent (see :func:`_should_resend`),
+        pausing per the client's retry policy. A ``404`` for a deletion
+        that was re-sent means an earlier attempt removed the link, so
+        it counts as success.
+
+        Args:
+            call: Sends the request with the given headers and returns
+                the response data.
+            delete: Whether the request is a deletion.
+
+        Returns:
+            The response data, or the last attempt's error.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+        """
+        headers = _idempotency_headers()
+        delay = 0.0
+        attempt = 0
+        while True:
+            try:
+                return call(headers)
+            except AuthenticationError:
+                raise
+            except (QCKError, httpx.TransportError) as exc:
+                error = _as_sdk_error(exc)
+            if delete and attempt > 0 and isinstance(error, NotFoundError):
+                return None
+            if not _should_resend(error, attempt):
+                return error
+            delay = self._client.backoff(attempt, delay)
+            time.sleep(delay)
+            attempt += 1
+
     def bulk_create(self, links: List["CreateLinkParams"]) -> "BulkCreateResult":
         """Create multiple links in a single request.
 
@@ -189,7 +775,157 @@ class LinksResource:
             >>> for failure in result["failed"]:
             ...     print(failure["url"], failure["error"])
         """
-        return self._client.post("/links/bulk", [dict(l) for l in links])
+        return self._client.post("/links/bulk", [dict(link) for link in links])
+
+    def bulk_create_many(
+        self,
+        links: Iterable["CreateLinkParams"],
+        *,
+        chunk_size: int = _DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+    ) -> "BulkCreateResult":
+        """Create any number of links by sending tier-sized chunks in parallel.
+
+        *links* is consumed lazily (any iterable or generator works)
+        and split into chunks of at most *chunk_size*, each sent to
+        ``POST /links/bulk`` with at most *concurrency* requests
+        outstanding. The per-chunk results are merged into a single
+        :class:`~qck.BulkCreateResult` whose ``index`` values refer to
+        positions in the original input.
+
+        A chunk whose request fails outright (e.g. a validation error
+        for the whole batch, or retries exhausted) does not abort the
+        run: each of its links is reported in ``failed`` with
+        ``error_type`` ``"request"``. If the failure was a server error
+        (5xx) or a network error, the chunk may have been partly
+        created before it failed; its links get ``error_type``
+        ``"unconfirmed"`` and should be reconciled, not retried
+        blindly. Authentication errors are raised.
+
+        Args:
+            links: Link creation parameters, in order.
+            chunk_size: Links per request. Keep this at or below your
+                tier's bulk import limit.
+            concurrency: Maximum number of chunk requests in flight.
+
+        Returns:
+            The merged bulk creation result, with ``created`` and
+            ``failed`` ordered by original index.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *chunk_size* or *concurrency* is less than 1.
+
+        Example:
+            >>> rows = ({"url": u} for u in urls)
+            >>> result = client.links.bulk_create_many(rows, chunk_size=500)
+            >>> print(result["success_count"], result["failure_count"])
+        """
+        result = _empty_bulk_result()
+        for chunk_result in self._bulk_create_chunks(
+            links, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            _merge_bulk_result(result, chunk_result)
+        return result
+
+    def import_file(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        format: Optional[str] = None,
+        *,
+        column_map: Optional[Mapping[str, str]] = None,
+        reject_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        chunk_size: int = _DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "ImportResult":
+        """Create links from a JSON Lines or CSV file of any size.
+
+        Rows are read lazily, mapped to :class:`~qck.CreateLinkParams`
+        (keys or header columns named after its fields; ``original_url``
+        is accepted for ``url``), and validated locally. Valid rows are
+        sent through :meth:`bulk_create_many`'s pipeline: chunks of
+        *chunk_size* with at most *concurrency* requests in flight. The
+        file is only read as fast as chunks complete, so memory stays
+        flat however large it is.
+
+        Rows rejected locally (``error_type`` ``"parse"`` or
+        ``"validation"``) or by the API are written to *reject_path* as
+        JSON Lines: ``{"row", "error", "error_type", "data"}``.
+
+        Args:
+            path: The file to import.
+            format: ``"jsonl"`` or ``"csv"``; inferred from the extension
+                (``.jsonl``, ``.ndjson``, ``.csv``) when ``None``.
+            column_map: Renames from source columns to
+                ``CreateLinkParams`` fields, e.g. ``{"link": "url"}``.
+            reject_path: Reject file, truncated first. ``None`` only
+                counts failures.
+            chunk_size: Links per request. Keep this at or below your
+                tier's bulk import limit.
+            concurrency: Maximum number of chunk requests in flight.
+            on_progress: Optional ``(processed, failed)`` hook, called
+                after each chunk completes.
+
+        Returns:
+            Row counts for the run.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If the format is unknown, or *chunk_size* or
+                *concurrency* is less than 1.
+            OSError: If the file cannot be read or the reject file
+                cannot be written.
+
+        Example:
+            >>> result = client.links.import_file(
+            ...     "links.csv", reject_path="rejects.jsonl", concurrency=8
+            ... )
+            >>> print(result["success_count"], result["failure_count"])
+        """
+        fmt = detect_format(path, format)
+        result: "ImportResult" = {"total_rows": 0, "success_count": 0, "failure_count": 0}
+        sent: Deque[ImportRow] = deque()
+        with open(path, encoding="utf-8", newline="") as fp, RejectWriter(reject_path) as rejects:
+            links = _valid_import_rows(read_rows(fp, fmt, column_map), result, sent, rejects)
+            for chunk in self._bulk_create_chunks(
+                links, chunk_size=chunk_size, concurrency=concurrency
+            ):
+                _record_import_chunk(result, chunk, sent, chunk_size, rejects, on_progress)
+        return result
+
+    def _bulk_create_chunks(
+        self,
+        links: Iterable["CreateLinkParams"],
+        *,
+        chunk_size: int,
+        concurrency: int,
+    ) -> Iterator["BulkCreateResult"]:
+        """Send *links* in concurrent chunks, yielding remapped chunk results.
+
+        Args:
+            links: Link creation parameters, consumed lazily.
+            chunk_size: Links per request.
+            concurrency: Maximum number of chunk requests in flight.
+
+        Yields:
+            One result per chunk, in input order, with indices offset
+            to original positions.
+        """
+
+        def send(item: Tuple[int, List["CreateLinkParams"]]) -> "BulkCreateResult":
+            offset, chunk = item
+            try:
+                return _offset_bulk_result(self.bulk_create(chunk), offset, len(chunk))
+            except AuthenticationError:
+                raise
+            except (QCKError, httpx.TransportError) as exc:
+                return _failed_chunk_result(chunk, offset, exc)
+
+        chunks = (
+            (n * chunk_size, chunk) for n, chunk in enumerate(chunked(links, chunk_size))
+        )
+        yield from bounded_map(send, chunks, concurrency=concurrency)
 
     def get_stats(self, link_id: str) -> "LinkStats":
         """Retrieve click statistics for a single link.
@@ -208,38 +944,894 @@ class LinksResource:
             >>> stats = client.links.get_stats("lnk_abc123")
             >>> print(stats["total_clicks"])
         """
-        return self._client.get(f"/links/{link_id}/stats")
+        data = self._client.get(f"/links/{link_id}/stats")
+        return self._client.decode(models.LinkStats, data)
+
+    def get_many(
+        self,
+        link_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_FETCH_CONCURRENCY,
+    ) -> Dict[str, Union["Link", QCKError]]:
+        """Retrieve many links concurrently.
+
+        Requests share the client's connection pool, with at most
+        *concurrency* in flight. A failed lookup does not abort the
+        batch: its error (e.g. :class:`~qck.NotFoundError`, or
+        :class:`~qck.NetworkError` when no response arrived) is returned
+        in place of the link. Authentication errors are raised.
+
+        Args:
+            link_ids: Link IDs, consumed lazily. Duplicates are fetched
+                once.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            ``{link_id: link_or_error}`` in input order.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *concurrency* is less than 1.
+
+        Example:
+            >>> links = client.links.get_many(["lnk_a", "lnk_b"], concurrency=16)
+            >>> missing = [k for k, v in links.items() if isinstance(v, NotFoundError)]
+        """
+        return self._fetch_many("/links/{}", models.Link, link_ids, concurrency)
+
+    def get_stats_many(
+        self,
+        link_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_FETCH_CONCURRENCY,
+    ) -> Dict[str, Union["LinkStats", QCKError]]:
+        """Retrieve click statistics for many links concurrently.
+
+        Behaves like :meth:`get_many`, calling :meth:`get_stats` for
+        each ID.
+
+        Args:
+            link_ids: Link IDs, consumed lazily. Duplicates are fetched
+                once.
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            ``{link_id: stats_or_error}`` in input order.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *concurrency* is less than 1.
+
+        Example:
+            >>> stats = client.links.get_stats_many(link_ids)
+            >>> clicks = sum(s["total_clicks"] for s in stats.values()
+            ...              if not isinstance(s, Exception))
+        """
+        return self._fetch_many("/links/{}/stats", models.LinkStats, link_ids, concurrency)
+
+    def _fetch_many(
+        self, path: str, model: "models.Model", link_ids: Iterable[str], concurrency: int
+    ) -> Dict[str, Any]:
+        """GET *path* (formatted with each ID) concurrently, errors as values."""
+
+        def fetch(link_id: str) -> Tuple[str, Any]:
+            try:
+                data = self._client.get(path.format(link_id))
+            except AuthenticationError:
+                raise
+            except (QCKError, httpx.TransportError) as exc:
+                return link_id, _as_sdk_error(exc)
+            return link_id, self._client.decode(model, data)
+
+        return dict(bounded_map(fetch, _unique_ids(link_ids), concurrency=concurrency))
 
-    def upload_og_image(self, link_id: str, file_path: str) -> Dict[str, Any]:
+    def upload_og_image(self, link_id: str, file_path: UploadSource) -> Dict[str, Any]:
         """Upload an OG image for a link.
 
-        Reads the file at *file_path*, detects its content type, and sends
-        the binary body via ``PUT /links/{link_id}/og-image``.
+        Streams the image to ``PUT /links/{link_id}/og-image`` without
+        reading it into memory first: paths and regular files are
+        memory-mapped, in-memory buffers are sent without copying. The
+        content type is detected from the image's magic bytes.
 
         Supported formats: JPEG, PNG, WebP, and GIF.
-        """
-        _ALLOWED_CONTENT_TYPES = {
-            "image/jpeg",
-            "image/png",
-            "image/webp",
-            "image/gif",
-        }
 
-        path = Path(file_path)
-        content_type, _ = mimetypes.guess_type(str(path))
-        if content_type not in _ALLOWED_CONTENT_TYPES:
-            raise ValueError(
-                f"Unsupported image type '{content_type}'. "
-                f"Allowed: {', '.join(sorted(_ALLOWED_CONTENT_TYPES))}"
+        Args:
+            link_id: The link's unique identifier.
+            file_path: The image: a filesystem path, a binary file object
+                (read from its current position), ``bytes``,
+                ``bytearray``, or ``memoryview``. The name predates
+                in-memory sources and is kept for keyword callers.
+
+        Returns:
+            The API response for the upload.
+
+        Raises:
+            ValueError: If the data is not a supported image format.
+            NotFoundError: If no link exists with the given ID.
+
+        Example:
+            >>> client.links.upload_og_image("lnk_abc123", "banner.png")
+            >>> with open("banner.webp", "rb") as fp:
+            ...     client.links.upload_og_image("lnk_abc123", fp)
+        """
+        with _open_og_image(file_path) as (view, headers):
+            return self._client.put(
+                f"/links/{link_id}/og-image",
+                content=ChunkedBody(view),
+                headers=headers,
             )
 
-        data = path.read_bytes()
-        return self._client.put(
-            f"/links/{link_id}/og-image",
-            content=data,
-            headers={"Content-Type": content_type},
+    def upload_og_images(
+        self,
+        images: Union[Mapping[str, UploadSource], Iterable[Tuple[str, UploadSource]]],
+        *,
+        concurrency: int = _DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Upload OG images for many links concurrently.
+
+        Each image is streamed as in :meth:`upload_og_image`, with at most
+        *concurrency* uploads in flight. A failed upload does not abort
+        the batch: its exception (an API error, an unsupported image, or
+        an unreadable file) is returned in place of the response.
+        Authentication errors are raised.
+
+        Args:
+            images: ``{link_id: image}`` or ``(link_id, image)`` pairs,
+                consumed lazily.
+            concurrency: Maximum number of uploads in flight.
+
+        Returns:
+            ``{link_id: response_or_exception}`` in input order.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *concurrency* is less than 1.
+
+        Example:
+            >>> results = client.links.upload_og_images(
+            ...     {"lnk_a": "a.png", "lnk_b": "b.jpg"}, concurrency=8
+            ... )
+            >>> failed = {k: v for k, v in results.items() if isinstance(v, Exception)}
+        """
+
+        def upload(
+            item: Tuple[str, UploadSource],
+        ) -> Tuple[str, Union[Dict[str, Any], Exception]]:
+            link_id, image = item
+            try:
+                return link_id, self.upload_og_image(link_id, image)
+            except AuthenticationError:
+                raise
+            except (QCKError, ValueError, OSError) as exc:
+                return link_id, exc
+
+        return dict(bounded_map(upload, _og_image_items(images), concurrency=concurrency))
+
+    def export(
+        self,
+        fp: IO[str],
+        format: str = "jsonl",
+        params: Optional["ListLinksParams"] = None,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: int = _DEFAULT_PREFETCH,
+        start_page: int = 1,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+    ) -> int:
+        """Export every link matching *params* to a JSON Lines or CSV file.
+
+        Pages are fetched as in :meth:`iter_all` — up to *prefetch* in
+        parallel — and written strictly in order as they arrive, so at
+        most ``prefetch + 1`` pages are held in memory (one with
+        ``prefetch=0``).
+
+        After each page is written the file is flushed and
+        *on_checkpoint* receives the page number. To resume an
+        interrupted export, reopen the file for appending and pass the
+        last checkpoint plus one as *start_page*. Resuming relies on a
+        stable order, so links are sorted by ``created_at`` ascending
+        unless *params* sets ``sort_by``.
+
+        Args:
+            fp: Text file opened for writing or appending. Open CSV
+                files with ``newline=""``.
+            format: ``"jsonl"`` (one JSON object per line) or ``"csv"``.
+            params: List filters as accepted by :meth:`list`;
+                ``per_page`` sets the page size.
+            fields: CSV columns; defaults to every :class:`~qck.Link`
+                field.
+            prefetch: Maximum number of pages requested ahead.
+            start_page: Page to start from. The CSV header is only
+                written when this is ``1``.
+            on_checkpoint: Called with each page number once the page
+                is safely written.
+
+        Returns:
+            The number of links written.
+
+        Raises:
+            ValueError: If *format* is unknown or *start_page* < 1.
+
+        Example:
+            >>> with open("links.jsonl", "w") as fp:
+            ...     client.links.export(fp, "jsonl", {"per_page": 100},
+            ...                         on_checkpoint=save_checkpoint)
+            >>> with open("links.jsonl", "a") as fp:  # resume
+            ...     client.links.export(fp, "jsonl", {"per_page": 100},
+            ...                         start_page=load_checkpoint() + 1)
+        """
+        writer = ExportWriter(fp, format, fields, header=start_page == 1)
+        pages = self._iter_pages(
+            cast("ListLinksParams", export_params(params, start_page)), prefetch=prefetch
+        )
+        written = 0
+        for page_number, page in enumerate(pages, start_page):
+            written += writer.write(page["data"])
+            if on_checkpoint is not None:
+                on_checkpoint(page_number)
+        return written
+
+    def mirror(
+        self,
+        path: str = ":memory:",
+        *,
+        params: Optional["ListLinksParams"] = None,
+        per_page: int = 100,
+        prefetch: int = _DEFAULT_PREFETCH,
+        full_sync_interval: Optional[float] = None,
+    ) -> LinkMirror:
+        """Create a local SQLite mirror of your links.
+
+        The mirror answers lookups by id, alias, tag, and domain without
+        network calls. Its ``sync()`` fetches only links created since
+        the previous sync; a full sync (the first one, ``sync(full=True)``,
+        or every *full_sync_interval* seconds) also picks up edits and
+        deletions, which the list endpoint cannot filter on.
+
+        Args:
+            path: SQLite database path, or ``":memory:"`` (default). A
+                file keeps the mirror, and its sync position, across runs.
+            params: List filters limiting which links are mirrored.
+            per_page: Page size used while syncing.
+            prefetch: Pages requested ahead while syncing.
+            full_sync_interval: Seconds after which ``sync()`` does a
+                full sync on its own; ``None`` disables it.
+
+        Returns:
+            A :class:`~qck.LinkMirror`. Call ``sync()`` to fill it.
+
+        Example:
+            >>> with client.links.mirror("links.db") as mirror:
+            ...     mirror.sync()
+            ...     link = mirror.by_alias("summer-sale")
+        """
+        return LinkMirror(
+            self,
+            path,
+            params=params,
+            per_page=per_page,
+            prefetch=prefetch,
+            full_sync_interval=full_sync_interval,
         )
 
     def delete_og_image(self, link_id: str) -> None:
         """Delete the OG image for a link."""
         self._client.delete(f"/links/{link_id}/og-image")
+
+
+class AsyncLinksResource:
+    """Asynchronous counterpart of :class:`LinksResource`.
+
+    Access via ``client.links`` on an :class:`~qck.AsyncQCK` client.
+    Every method mirrors its synchronous twin and must be awaited.
+
+    Attributes:
+        _client: The underlying async HTTP client used for API calls.
+    """
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        """Initialise the links resource.
+
+        Args:
+            client: HTTP client instance for making API requests.
+        """
+        self._client = client
+
+    async def create(self, params: "CreateLinkParams") -> "Link":
+        """Create a new short link.
+
+        Args:
+            params: Link creation parameters. Only ``url`` is required.
+
+        Returns:
+            The newly created link object.
+
+        Raises:
+            ValidationError: If the URL is invalid or params fail
+                validation.
+
+        Example:
+            >>> link = await client.links.create({
+            ...     "url": "https://example.com",
+            ...     "custom_alias": "my-link",
+            ...     "tags": ["marketing"],
+            ... })
+            >>> print(link["short_url"])
+        """
+        data = await self._client.post("/links", dict(params))
+        return self._client.decode(models.Link, data)
+
+    async def list(self, params: Optional["ListLinksParams"] = None) -> "PaginatedResponse":
+        """List links with optional filtering and pagination.
+
+        Args:
+            params: Query filters and pagination options. Pass ``None``
+                to retrieve the first page with default settings.
+
+        Returns:
+            ``{"data": [...], "page": int, "per_page": int,
+            "total": int, "total_pages": int}`` — the link list plus
+            pagination metadata (carried in the API envelope's ``meta``).
+
+        Example:
+            >>> page = await client.links.list({"page": 1, "per_page": 10})
+            >>> for link in page["data"]:
+            ...     print(link["short_url"])
+            >>> print(page["total"], page["total_pages"])
+        """
+        data = await self._client.get("/links", params=dict(params) if params else None)
+        return self._client.decode(_PAGE, data)
+
+    async def iter_all(
+        self,
+        params: Optional["ListLinksParams"] = None,
+        *,
+        prefetch: int = _DEFAULT_PREFETCH,
+    ) -> AsyncIterator["Link"]:
+        """Iterate over every link matching *params*, across all pages.
+
+        Async counterpart of :meth:`LinksResource.iter_all`: after the
+        first page reports ``total_pages``, up to *prefetch* following
+        pages are requested concurrently as tasks on the running event
+        loop while links are yielded in page order.
+
+        Args:
+            params: Query filters as accepted by :meth:`list`. ``page``
+                sets the starting page (default 1).
+            prefetch: Maximum number of pages requested ahead of the
+                consumer. ``0`` fetches pages sequentially.
+
+        Yields:
+            Link objects in the order returned by the API.
+
+        Example:
+            >>> async for link in client.links.iter_all({"per_page": 100}):
+            ...     print(link["id"])
+        """
+        async for page in self._iter_pages(params, prefetch=prefetch):
+            for link in self._client.decode(models.Link, page["data"]):
+                yield link
+
+    async def _iter_pages(
+        self,
+        params: Optional["ListLinksParams"],
+        *,
+        prefetch: int,
+        cache: bool = True,
+    ) -> AsyncIterator["PaginatedResponse"]:
+        """Yield successive raw pages of :meth:`list`, prefetching ahead.
+
+        Args:
+            params: Query filters; ``page`` sets the starting page.
+            prefetch: Maximum number of pages requested ahead.
+            cache: ``False`` bypasses the client's response cache.
+
+        Yields:
+            Paginated responses in page order.
+        """
+
+        async def fetch(page: int) -> "PaginatedResponse":
+            return await self._client.get(
+                "/links", params=dict(_page_params(params, page)), cache=cache
+            )
+
+        start = int(params.get("page") or 1) if params else 1
+        first = await fetch(start)
+        yield first
+
+        pages = range(start + 1, (first.get("total_pages") or 0) + 1)
+        if prefetch < 1:
+            for n in pages:
+                yield await fetch(n)
+            return
+        async for page in abounded_map(fetch, pages, concurrency=prefetch):
+            yield page
+
+    async def get(self, link_id: str) -> "Link":
+        """Retrieve a single link by ID.
+
+        Args:
+            link_id: The unique link identifier.
+
+        Returns:
+            The link object.
+
+        Raises:
+            NotFoundError: If no link exists with the given ID.
+
+        Example:
+            >>> link = await client.links.get("lnk_abc123")
+            >>> print(link["original_url"])
+        """
+        data = await self._client.get(f"/links/{link_id}")
+        return self._client.decode(models.Link, data)
+
+    async def update(self, link_id: str, params: "UpdateLinkParams") -> "Link":
+        """Update an existing link.
+
+        Only the fields included in *params* are modified; omitted
+        fields remain unchanged.
+
+        Args:
+            link_id: The unique link identifier.
+            params: Fields to update.
+
+        Returns:
+            The updated link object.
+
+        Raises:
+            NotFoundError: If no link exists with the given ID.
+            ValidationError: If the update params fail validation.
+
+        Example:
+            >>> updated = await client.links.update("lnk_abc123", {
+            ...     "title": "New Title",
+            ...     "is_active": False,
+            ... })
+        """
+        data = await self._client.patch(f"/links/{link_id}", dict(params))
+        return self._client.decode(models.Link, data)
+
+    async def delete(self, link_id: str) -> None:
+        """Delete a link.
+
+        Args:
+            link_id: The unique link identifier.
+
+        Raises:
+            NotFoundError: If no link exists with the given ID.
+
+        Example:
+            >>> await client.links.delete("lnk_abc123")
+        """
+        await self._client.delete(f"/links/{link_id}")
+
+    async def update_many(
+        self,
+        updates: Union[Mapping[str, "UpdateLinkParams"], Iterable[Tuple[str, "UpdateLinkParams"]]],
+        *,
+        concurrency: int = _DEFAULT_OPERATION_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "BulkOperationResult":
+        """Update many links concurrently.
+
+        See :meth:`LinksResource.update_many`. *on_progress* runs on the
+        event loop and must not block.
+
+        Returns:
+            The combined result, ordered by input position.
+        """
+
+        async def send(item: Tuple[int, Tuple[str, "UpdateLinkParams"]]) -> Tuple[int, str, Any]:
+            index, (link_id, params) = item
+            body = dict(params)
+            link = await self._send_operation(
+                lambda headers: self._client.patch(f"/links/{link_id}", body, headers=headers)
+            )
+            if isinstance(link, QCKError):
+                return index, link_id, link
+            return index, link_id, self._client.decode(models.Link, link)
+
+        result = _empty_operation_result()
+        async for outcome in abounded_map(
+            send, enumerate(_update_items(updates)), concurrency=concurrency
+        ):
+            _record_operation(result, outcome, on_progress)
+        return result
+
+    async def delete_many(
+        self,
+        link_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_OPERATION_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "BulkOperationResult":
+        """Delete many links concurrently.
+
+        See :meth:`LinksResource.delete_many`.
+
+        Returns:
+            The combined result, ordered by input position.
+        """
+
+        async def send(item: Tuple[int, str]) -> Tuple[int, str, Any]:
+            index, link_id = item
+            outcome = await self._send_operation(
+                lambda headers: self._client.delete(f"/links/{link_id}", headers=headers),
+                delete=True,
+            )
+            return index, link_id, outcome
+
+        result = _empty_operation_result()
+        async for outcome in abounded_map(send, enumerate(link_ids), concurrency=concurrency):
+            _record_operation(result, outcome, on_progress)
+        return result
+
+    async def _send_operation(
+        self, call: Callable[[Dict[str, str]], Awaitable[Any]], *, delete: bool = False
+    ) -> Any:
+        """Send one item of a bulk update or deletion.
+
+        See :meth:`LinksResource._send_operation`.
+        """
+        headers = _idempotency_headers()
+        delay = 0.0
+        attempt = 0
+        while True:
+            try:
+                return await call(headers)
+            except AuthenticationError:
+                raise
+            except (QCKError, httpx.TransportError) as exc:
+                error = _as_sdk_error(exc)
+            if delete and attempt > 0 and isinstance(error, NotFoundError):
+                return None
+            if not _should_resend(error, attempt):
+                return error
+            delay = self._client.backoff(attempt, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def bulk_create(self, links: List["CreateLinkParams"]) -> "BulkCreateResult":
+        """Create multiple links in a single request.
+
+        The maximum batch size depends on your subscription tier.
+
+        Bulk creation supports **partial success**: some links may be
+        created while others fail. The API responds with HTTP 207
+        (partial) or 422 (all failed) in those cases, and the SDK still
+        returns the result instead of raising — always inspect
+        ``failed`` / ``failure_count`` after calling.
+
+        Args:
+            links: List of link creation parameter objects.
+
+        Returns:
+            A bulk creation result with ``created`` (each entry has
+            ``index`` and ``link``), ``failed`` (each entry has
+            ``index``, ``url``, ``error``, ``error_type``),
+            ``total_requested``, ``success_count``, and
+            ``failure_count``.
+
+        Raises:
+            ValidationError: If the batch is empty or exceeds your
+                tier's bulk import limit.
+
+        Example:
+            >>> result = await client.links.bulk_create([
+            ...     {"url": "https://example.com/a"},
+            ...     {"url": "https://example.com/b"},
+            ... ])
+            >>> for item in result["created"]:
+            ...     print(item["link"]["short_url"])
+            >>> for failure in result["failed"]:
+            ...     print(failure["url"], failure["error"])
+        """
+        return await self._client.post("/links/bulk", [dict(link) for link in links])
+
+    async def bulk_create_many(
+        self,
+        links: Iterable["CreateLinkParams"],
+        *,
+        chunk_size: int = _DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+    ) -> "BulkCreateResult":
+        """Create any number of links by sending tier-sized chunks concurrently.
+
+        Async counterpart of :meth:`LinksResource.bulk_create_many`;
+        chunks are sent as tasks on the running event loop with at most
+        *concurrency* in flight.
+
+        Args:
+            links: Link creation parameters, in order.
+            chunk_size: Links per request. Keep this at or below your
+                tier's bulk import limit.
+            concurrency: Maximum number of chunk requests in flight.
+
+        Returns:
+            The merged bulk creation result, with ``index`` values
+            referring to positions in *links*.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *chunk_size* or *concurrency* is less than 1.
+        """
+        result = _empty_bulk_result()
+        async for chunk_result in self._bulk_create_chunks(
+            links, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            _merge_bulk_result(result, chunk_result)
+        return result
+
+    async def import_file(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        format: Optional[str] = None,
+        *,
+        column_map: Optional[Mapping[str, str]] = None,
+        reject_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        chunk_size: int = _DEFAULT_BULK_CHUNK_SIZE,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> "ImportResult":
+        """Create links from a JSON Lines or CSV file of any size.
+
+        See :meth:`LinksResource.import_file`. Each chunk of rows is
+        read, parsed, and validated on a worker thread
+        (:func:`asyncio.to_thread`), so large files do not stall the
+        event loop. Rows are still read one chunk at a time, and never
+        while *on_progress* runs.
+
+        Returns:
+            Row counts for the run.
+        """
+        fmt = detect_format(path, format)
+        result: "ImportResult" = {"total_rows": 0, "success_count": 0, "failure_count": 0}
+        sent: Deque[ImportRow] = deque()
+        with open(path, encoding="utf-8", newline="") as fp, RejectWriter(reject_path) as rejects:
+            links = _valid_import_rows(read_rows(fp, fmt, column_map), result, sent, rejects)
+            async for chunk in self._bulk_create_chunks(
+                links, chunk_size=chunk_size, concurrency=concurrency, read_in_thread=True
+            ):
+                _record_import_chunk(result, chunk, sent, chunk_size, rejects, on_progress)
+        return result
+
+    async def _bulk_create_chunks(
+        self,
+        links: Iterable["CreateLinkParams"],
+        *,
+        chunk_size: int,
+        concurrency: int,
+        read_in_thread: bool = False,
+    ) -> AsyncIterator["BulkCreateResult"]:
+        """Send *links* in concurrent chunks, yielding remapped chunk results.
+
+        Args:
+            links: Link creation parameters, consumed lazily.
+            chunk_size: Links per request.
+            concurrency: Maximum number of chunk requests in flight.
+            read_in_thread: Pull each chunk from *links* on a worker
+                thread, for sources that block (file reads, parsing).
+
+        Yields:
+            One result per chunk, in input order, with indices offset
+            to original positions.
+        """
+
+        async def send(item: Tuple[int, List["CreateLinkParams"]]) -> "BulkCreateResult":
+            offset, chunk = item
+            try:
+                return _offset_bulk_result(await self.bulk_create(chunk), offset, len(chunk))
+            except AuthenticationError:
+                raise
+            except (QCKError, httpx.TransportError) as exc:
+                return _failed_chunk_result(chunk, offset, exc)
+
+        async def chunks() -> AsyncIterator[Tuple[int, List["CreateLinkParams"]]]:
+            offset = 0
+            async for chunk in achunked(links, chunk_size, in_thread=read_in_thread):
+                yield offset, chunk
+                offset += len(chunk)
+
+        async for chunk_result in abounded_map(send, chunks(), concurrency=concurrency):
+            yield chunk_result
+
+    async def get_stats(self, link_id: str) -> "LinkStats":
+        """Retrieve click statistics for a single link.
+
+        Args:
+            link_id: The unique link identifier.
+
+        Returns:
+            Aggregated click statistics including breakdowns by
+            country, device, and referrer.
+
+        Raises:
+            NotFoundError: If no link exists with the given ID.
+
+        Example:
+            >>> stats = await client.links.get_stats("lnk_abc123")
+            >>> print(stats["total_clicks"])
+        """
+        data = await self._client.get(f"/links/{link_id}/stats")
+        return self._client.decode(models.LinkStats, data)
+
+    async def get_many(
+        self,
+        link_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_FETCH_CONCURRENCY,
+    ) -> Dict[str, Union["Link", QCKError]]:
+        """Retrieve many links concurrently.
+
+        See :meth:`LinksResource.get_many`.
+
+        Returns:
+            ``{link_id: link_or_error}`` in input order.
+        """
+        return await self._fetch_many("/links/{}", models.Link, link_ids, concurrency)
+
+    async def get_stats_many(
+        self,
+        link_ids: Iterable[str],
+        *,
+        concurrency: int = _DEFAULT_FETCH_CONCURRENCY,
+    ) -> Dict[str, Union["LinkStats", QCKError]]:
+        """Retrieve click statistics for many links concurrently.
+
+        See :meth:`LinksResource.get_stats_many`.
+
+        Returns:
+            ``{link_id: stats_or_error}`` in input order.
+        """
+        return await self._fetch_many("/links/{}/stats", models.LinkStats, link_ids, concurrency)
+
+    async def _fetch_many(
+        self, path: str, model: "models.Model", link_ids: Iterable[str], concurrency: int
+    ) -> Dict[str, Any]:
+        """GET *path* (formatted with each ID) concurrently, errors as values."""
+
+        async def fetch(link_id: str) -> Tuple[str, Any]:
+            try:
+                data = await self._client.get(path.format(link_id))
+            except AuthenticationError:
+                raise
+            except (QCKError, httpx.TransportError) as exc:
+                return link_id, _as_sdk_error(exc)
+            return link_id, self._client.decode(model, data)
+
+        results: Dict[str, Any] = {}
+        async for link_id, result in abounded_map(
+            fetch, _unique_ids(link_ids), concurrency=concurrency
+        ):
+            results[link_id] = result
+        return results
+
+    async def upload_og_image(self, link_id: str, file_path: UploadSource) -> Dict[str, Any]:
+        """Upload an OG image for a link.
+
+        Async counterpart of :meth:`LinksResource.upload_og_image`; the
+        image is streamed without being read into memory first and its
+        content type is detected from its magic bytes.
+
+        Supported formats: JPEG, PNG, WebP, and GIF.
+
+        Args:
+            link_id: The link's unique identifier.
+            file_path: The image: a filesystem path, a binary file
+                object, ``bytes``, ``bytearray``, or ``memoryview``.
+
+        Returns:
+            The API response for the upload.
+
+        Raises:
+            ValueError: If the data is not a supported image format.
+            NotFoundError: If no link exists with the given ID.
+        """
+        with _open_og_image(file_path) as (view, headers):
+            return await self._client.put(
+                f"/links/{link_id}/og-image",
+                content=AsyncChunkedBody(view),
+                headers=headers,
+            )
+
+    async def upload_og_images(
+        self,
+        images: Union[Mapping[str, UploadSource], Iterable[Tuple[str, UploadSource]]],
+        *,
+        concurrency: int = _DEFAULT_UPLOAD_CONCURRENCY,
+    ) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Upload OG images for many links concurrently.
+
+        Async counterpart of :meth:`LinksResource.upload_og_images`.
+
+        Args:
+            images: ``{link_id: image}`` or ``(link_id, image)`` pairs.
+            concurrency: Maximum number of uploads in flight.
+
+        Returns:
+            ``{link_id: response_or_exception}`` in input order.
+
+        Raises:
+            AuthenticationError: If the API key is rejected.
+            ValueError: If *concurrency* is less than 1.
+        """
+
+        async def upload(
+            item: Tuple[str, UploadSource],
+        ) -> Tuple[str, Union[Dict[str, Any], Exception]]:
+            link_id, image = item
+            try:
+                return link_id, await self.upload_og_image(link_id, image)
+            except AuthenticationError:
+                raise
+            except (QCKError, ValueError, OSError) as exc:
+                return link_id, exc
+
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        async for link_id, result in abounded_map(
+            upload, _og_image_items(images), concurrency=concurrency
+        ):
+            results[link_id] = result
+        return results
+
+    async def export(
+        self,
+        fp: IO[str],
+        format: str = "jsonl",
+        params: Optional["ListLinksParams"] = None,
+        *,
+        fields: Optional[Sequence[str]] = None,
+        prefetch: int = _DEFAULT_PREFETCH,
+        start_page: int = 1,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+    ) -> int:
+        """Export every link matching *params* to a JSON Lines or CSV file.
+
+        See :meth:`LinksResource.export`. Writes to *fp* are synchronous.
+
+        Returns:
+            The number of links written.
+        """
+        writer = ExportWriter(fp, format, fields, header=start_page == 1)
+        pages = self._iter_pages(
+            cast("ListLinksParams", export_params(params, start_page)), prefetch=prefetch
+        )
+        written = 0
+        page_number = start_page
+        async for page in pages:
+            written += writer.write(page["data"])
+            if on_checkpoint is not None:
+                on_checkpoint(page_number)
+            page_number += 1
+        return written
+
+    def mirror(
+        self,
+        path: str = ":memory:",
+        *,
+        params: Optional["ListLinksParams"] = None,
+        per_page: int = 100,
+        prefetch: int = _DEFAULT_PREFETCH,
+        full_sync_interval: Optional[float] = None,
+    ) -> AsyncLinkMirror:
+        """Create a local SQLite mirror of your links.
+
+        See :meth:`LinksResource.mirror`. Lookups on the returned mirror
+        are synchronous; only ``sync()`` and ``refresh()`` are awaited.
+
+        Returns:
+            An :class:`~qck.AsyncLinkMirror`.
+        """
+        return AsyncLinkMirror(
+            self,
+            path,
+            params=params,
+            per_page=per_page,
+            prefetch=prefetch,
+            full_sync_interval=full_sync_interval,
+        )
+
+    async def delete_og_image(self, link_id: str) -> None:
+        """Delete the OG image for a link."""
+        await self._client.delete(f"/links/{link_id}/og-image")
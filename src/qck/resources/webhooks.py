@@ -25,8 +25,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List
 
+from .. import models
+
 if TYPE_CHECKING:
-    from .._client import HttpClient
+    from .._client import AsyncHttpClient, HttpClient
     from .._types import (
         CreateWebhookParams,
         UpdateWebhookParams,
@@ -77,7 +79,8 @@ class WebhooksResource:
             ... })
             >>> print(webhook["secret"])
         """
-        return self._client.post("/webhooks", dict(params))
+        data = self._client.post("/webhooks", dict(params))
+        return self._client.decode(models.WebhookEndpoint, data)
 
     def list(self) -> List["WebhookEndpoint"]:
         """List all webhook endpoints.
@@ -90,7 +93,8 @@ class WebhooksResource:
             >>> for wh in webhooks:
             ...     print(wh["url"], wh["is_active"])
         """
-        return self._client.get("/webhooks")
+        data = self._client.get("/webhooks")
+        return self._client.decode(models.WebhookEndpoint, data)
 
     def get(self, webhook_id: str) -> "WebhookEndpoint":
         """Retrieve a single webhook endpoint by ID.
@@ -108,7 +112,8 @@ class WebhooksResource:
             >>> wh = client.webhooks.get("wh_abc123")
             >>> print(wh["events"])
         """
-        return self._client.get(f"/webhooks/{webhook_id}")
+        data = self._client.get(f"/webhooks/{webhook_id}")
+        return self._client.decode(models.WebhookEndpoint, data)
 
     def update(self, webhook_id: str, params: "UpdateWebhookParams") -> "WebhookEndpoint":
         """Update an existing webhook endpoint.
@@ -132,7 +137,8 @@ class WebhooksResource:
             ...     "is_active": False,
             ... })
         """
-        return self._client.patch(f"/webhooks/{webhook_id}", dict(params))
+        data = self._client.patch(f"/webhooks/{webhook_id}", dict(params))
+        return self._client.decode(models.WebhookEndpoint, data)
 
     def delete(self, webhook_id: str) -> None:
         """Delete a webhook endpoint.
@@ -169,7 +175,8 @@ class WebhooksResource:
             >>> for d in deliveries:
             ...     print(d["event_type"], d["status"], d["http_status"])
         """
-        return self._client.get(f"/webhooks/{webhook_id}/deliveries")
+        data = self._client.get(f"/webhooks/{webhook_id}/deliveries")
+        return self._client.decode(models.WebhookDelivery, data)
 
     def test(self, webhook_id: str) -> None:
         """Send a test delivery to a webhook endpoint.
@@ -187,3 +194,162 @@ class WebhooksResource:
             >>> client.webhooks.test("wh_abc123")
         """
         self._client.post(f"/webhooks/{webhook_id}/test")
+
+
+class AsyncWebhooksResource:
+    """Asynchronous counterpart of :class:`WebhooksResource`.
+
+    Access via ``client.webhooks`` on an :class:`~qck.AsyncQCK` client.
+    Every method mirrors its synchronous twin and must be awaited.
+
+    Attributes:
+        _client: The underlying async HTTP client used for API calls.
+    """
+
+    def __init__(self, client: "AsyncHttpClient") -> None:
+        """Initialise the webhooks resource.
+
+        Args:
+            client: HTTP client instance for making API requests.
+        """
+        self._client = client
+
+    async def create(self, params: "CreateWebhookParams") -> "WebhookEndpoint":
+        """Create a new webhook endpoint.
+
+        The response includes a ``secret`` field that should be saved
+        for verifying webhook payloads. The secret is only returned
+        once at creation time.
+
+        Args:
+            params: Webhook creation parameters including URL, events,
+                and optional description.
+
+        Returns:
+            The newly created webhook endpoint (includes ``secret``).
+
+        Raises:
+            ValidationError: If params fail validation.
+
+        Example:
+            >>> webhook = await client.webhooks.create({
+            ...     "url": "https://example.com/webhook",
+            ...     "events": ["link.created"],
+            ... })
+            >>> print(webhook["secret"])
+        """
+        data = await self._client.post("/webhooks", dict(params))
+        return self._client.decode(models.WebhookEndpoint, data)
+
+    async def list(self) -> List["WebhookEndpoint"]:
+        """List all webhook endpoints.
+
+        Returns:
+            List of webhook endpoint objects.
+
+        Example:
+            >>> webhooks = await client.webhooks.list()
+            >>> for wh in webhooks:
+            ...     print(wh["url"], wh["is_active"])
+        """
+        data = await self._client.get("/webhooks")
+        return self._client.decode(models.WebhookEndpoint, data)
+
+    async def get(self, webhook_id: str) -> "WebhookEndpoint":
+        """Retrieve a single webhook endpoint by ID.
+
+        Args:
+            webhook_id: The unique webhook endpoint identifier.
+
+        Returns:
+            The webhook endpoint object.
+
+        Raises:
+            NotFoundError: If no webhook exists with the given ID.
+
+        Example:
+            >>> wh = await client.webhooks.get("wh_abc123")
+            >>> print(wh["events"])
+        """
+        data = await self._client.get(f"/webhooks/{webhook_id}")
+        return self._client.decode(models.WebhookEndpoint, data)
+
+    async def update(self, webhook_id: str, params: "UpdateWebhookParams") -> "WebhookEndpoint":
+        """Update an existing webhook endpoint.
+
+        Only the fields included in *params* are modified; omitted
+        fields remain unchanged.
+
+        Args:
+            webhook_id: The unique webhook endpoint identifier.
+            params: Fields to update.
+
+        Returns:
+            The updated webhook endpoint object.
+
+        Raises:
+            NotFoundError: If no webhook exists with the given ID.
+            ValidationError: If the update params fail validation.
+
+        Example:
+            >>> await client.webhooks.update("wh_abc123", {
+            ...     "is_active": False,
+            ... })
+        """
+        data = await self._client.patch(f"/webhooks/{webhook_id}", dict(params))
+        return self._client.decode(models.WebhookEndpoint, data)
+
+    async def delete(self, webhook_id: str) -> None:
+        """Delete a webhook endpoint.
+
+        Args:
+            webhook_id: The unique webhook endpoint identifier.
+
+        Raises:
+            NotFoundError: If no webhook exists with the given ID.
+
+        Example:
+            >>> await client.webhooks.delete("wh_abc123")
+        """
+        await self._client.delete(f"/webhooks/{webhook_id}")
+
+    async def list_deliveries(self, webhook_id: str) -> List["WebhookDelivery"]:
+        """List delivery attempts for a webhook endpoint.
+
+        Returns the 50 most recent delivery records (newest first).
+        The endpoint is not paginated. Useful for debugging failed
+        deliveries and monitoring webhook health.
+
+        Args:
+            webhook_id: The unique webhook endpoint identifier.
+
+        Returns:
+            A list of up to 50 delivery attempt records.
+
+        Raises:
+            NotFoundError: If no webhook exists with the given ID.
+
+        Example:
+            >>> deliveries = await client.webhooks.list_deliveries("wh_abc123")
+            >>> for d in deliveries:
+            ...     print(d["event_type"], d["status"], d["http_status"])
+        """
+        data = await self._client.get(f"/webhooks/{webhook_id}/deliveries")
+        return self._client.decode(models.WebhookDelivery, data)
+
+    async def test(self, webhook_id: str) -> None:
+        """Send a test delivery to a webhook endpoint.
+
+        Fires a synthetic test event to verify that the endpoint is
+        reachable and correctly processing payloads.
+
+        Args:
+            webhook_id: The unique webhook endpoint identifier.
+
+        Raises:
+            NotFoundError: If no webhook exists with the given ID.
+
+        Example:
+            >>> await client.webhooks.test("wh_abc123")
+        """
+        await self._client.post(f"/webhooks/{webhook_id}/test")
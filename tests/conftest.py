@@ -0,0 +1,71 @@
+"""Shared fixtures: clients whose HTTP traffic goes to an ``httpx.MockTransport``."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+import pytest
+
+from qck import QCK, AsyncQCK, RetryPolicy
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def envelope(
+    data: Any,
+    status: int = 200,
+    *,
+    meta: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> httpx.Response:
+    """Build a response in the API's ``{"success", "data", "meta"}`` envelope."""
+    body: Dict[str, Any] = {"success": status < 400, "data": data}
+    if meta is not None:
+        body["meta"] = meta
+    return httpx.Response(status, json=body, headers=headers)
+
+
+def error(status: int, code: str = "ERROR", message: str = "failed") -> httpx.Response:
+    """Build an API error response."""
+    body = {"success": False, "error": {"code": code, "message": message}}
+    return httpx.Response(status, json=body)
+
+
+# Retries in tests must not sleep.
+NO_BACKOFF = RetryPolicy(backoff=lambda attempt, previous: 0.0)
+
+
+@pytest.fixture
+def make_client() -> Callable[..., QCK]:
+    """Return a factory for :class:`QCK` clients backed by a mock handler."""
+
+    def factory(handler: Handler, **kwargs: Any) -> QCK:
+        kwargs.setdefault("retry_policy", NO_BACKOFF)
+        client = QCK(api_key="qck_test", base_url="https://api.test", **kwargs)
+        http = client._client
+        http._client.close()
+        http._client = httpx.Client(
+            headers=http._client.headers,
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    return factory
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncQCK]:
+    """Return a factory for :class:`AsyncQCK` clients backed by a mock handler."""
+
+    def factory(handler: Handler, **kwargs: Any) -> AsyncQCK:
+        kwargs.setdefault("retry_policy", NO_BACKOFF)
+        client = AsyncQCK(api_key="qck_test", base_url="https://api.test", **kwargs)
+        http = client._client
+        http._client = httpx.AsyncClient(
+            headers=http._client.headers,
+            transport=httpx.MockTransport(handler),
+        )
+        return client
+
+    return factory
@@ -0,0 +1,80 @@
+"""The asyncio client: request building, envelope handling, and errors."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import List
+
+import httpx
+import pytest
+
+from qck import AsyncQCK, AuthenticationError, NotFoundError, ValidationError
+
+from .conftest import envelope, error
+
+
+def test_get_unwraps_envelope_and_sends_auth(make_async_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope({"id": "abc", "url": "https://example.com"})
+
+    client = make_async_client(handler)
+    link = asyncio.run(client.links.get("abc"))
+
+    assert link == {"id": "abc", "url": "https://example.com"}
+    assert calls[0].method == "GET"
+    assert calls[0].url.path.endswith("/links/abc")
+    assert calls[0].headers["X-API-Key"] == "qck_test"
+
+
+def test_post_sends_json_body(make_async_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope({"id": "abc"})
+
+    client = make_async_client(handler)
+    asyncio.run(client.links.create({"url": "https://example.com"}))
+
+    assert calls[0].method == "POST"
+    assert json.loads(calls[0].content) == {"url": "https://example.com"}
+
+
+@pytest.mark.parametrize(
+    ("status", "exc_type"),
+    [(400, ValidationError), (401, AuthenticationError), (404, NotFoundError)],
+)
+def test_error_statuses_raise_typed_errors(make_async_client, status, exc_type):
+    client = make_async_client(lambda request: error(status, "CODE", "nope"))
+
+    with pytest.raises(exc_type) as info:
+        asyncio.run(client.links.get("abc"))
+    assert info.value.code == "CODE"
+    assert str(info.value) == "nope"
+
+
+def test_concurrent_calls_share_one_client(make_async_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return envelope({"id": request.url.path.rsplit("/", 1)[-1]})
+
+    client = make_async_client(handler)
+
+    async def run() -> List[str]:
+        links = await asyncio.gather(*(client.links.get(str(n)) for n in range(10)))
+        return [link["id"] for link in links]
+
+    assert asyncio.run(run()) == [str(n) for n in range(10)]
+
+
+def test_context_manager_closes_transport():
+    async def run() -> AsyncQCK:
+        async with AsyncQCK(api_key="qck_test") as client:
+            pass
+        return client
+
+    client = asyncio.run(run())
+    assert client._client._client.is_closed
@@ -0,0 +1,119 @@
+"""Per-endpoint-group circuit breaking."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from qck import CircuitBreaker, CircuitOpenError, NotFoundError, QCKError
+
+from .conftest import envelope, error
+
+
+def test_opens_after_consecutive_server_errors(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(503, "UNAVAILABLE")
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    client = make_client(handler, retries=0, circuit_breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(QCKError):
+            client.links.get("abc")
+    with pytest.raises(CircuitOpenError) as info:
+        client.links.get("abc")
+
+    assert len(calls) == 2
+    assert breaker.state("/links") == "open"
+    assert info.value.retry_after > 0
+
+
+def test_groups_are_independent(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/links/abc"):
+            return error(500)
+        return envelope({"domains": []})
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = make_client(handler, retries=0, circuit_breaker=breaker)
+
+    with pytest.raises(QCKError):
+        client.links.get("abc")
+
+    assert breaker.state("/links") == "open"
+    assert client.domains.list() == []
+
+
+def test_client_errors_count_as_success(make_client):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = make_client(lambda request: error(404, "NOT_FOUND"), circuit_breaker=breaker)
+
+    for _ in range(3):
+        with pytest.raises(NotFoundError):
+            client.links.get("abc")
+
+    assert breaker.state("/links") == "closed"
+
+
+def test_half_open_probe_success_closes_circuit(make_client):
+    responses = [error(500), envelope({"id": "abc"})]
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    client = make_client(lambda request: responses.pop(0), retries=0, circuit_breaker=breaker)
+
+    with pytest.raises(QCKError):
+        client.links.get("abc")
+    assert breaker.state("/links") == "open"
+
+    assert client.links.get("abc") == {"id": "abc"}
+    assert breaker.state("/links") == "closed"
+
+
+def test_full_probe_slots_report_zero_retry_after():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    with pytest.raises(httpx.ConnectError):
+        with breaker.guard("/links"):
+            raise httpx.ConnectError("down")
+
+    with breaker.guard("/links"):
+        with pytest.raises(CircuitOpenError) as info:
+            with breaker.guard("/links"):
+                pass
+
+    assert info.value.retry_after == 0
+    assert breaker.state("/links") == "closed"
+
+
+def test_cancelled_probe_releases_slot_without_outcome():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    with pytest.raises(httpx.ConnectError):
+        with breaker.guard("/links"):
+            raise httpx.ConnectError("down")
+
+    with pytest.raises(asyncio.CancelledError):
+        with breaker.guard("/links"):
+            raise asyncio.CancelledError()
+
+    assert breaker.state("/links") == "half_open"
+    with breaker.guard("/links"):
+        pass
+    assert breaker.state("/links") == "closed"
+
+
+def test_async_client_shares_breaker_state(make_async_client):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = make_async_client(lambda request: error(502), retries=0, circuit_breaker=breaker)
+
+    async def run() -> None:
+        with pytest.raises(QCKError):
+            await client.links.get("abc")
+        with pytest.raises(CircuitOpenError):
+            await client.links.get("abc")
+
+    asyncio.run(run())
+    assert breaker.state("/links") == "open"
@@ -0,0 +1,126 @@
+"""Chunked, concurrent ``links.bulk_create_many``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from qck import AuthenticationError
+from qck.resources.links import _offset_bulk_result
+
+from .conftest import envelope, error
+
+
+def bulk_response(request: httpx.Request) -> httpx.Response:
+    """Create every link except those whose URL contains ``bad``."""
+    links = json.loads(request.content)
+    created = [
+        {"index": i, "link": {"id": link["url"]}}
+        for i, link in enumerate(links)
+        if "bad" not in link["url"]
+    ]
+    failed = [
+        {"index": i, "url": link["url"], "error": "invalid", "error_type": "validation"}
+        for i, link in enumerate(links)
+        if "bad" in link["url"]
+    ]
+    result = {
+        "created": created,
+        "failed": failed,
+        "total_requested": len(links),
+        "success_count": len(created),
+        "failure_count": len(failed),
+    }
+    return envelope(result, 207 if failed else 201)
+
+
+def urls(n: int) -> List[Dict[str, Any]]:
+    return [{"url": f"https://example.com/{i}"} for i in range(n)]
+
+
+def test_chunks_are_merged_with_original_indices(make_client):
+    chunk_sizes: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunk_sizes.append(len(json.loads(request.content)))
+        return bulk_response(request)
+
+    rows = urls(7)
+    rows[5] = {"url": "https://bad.example.com"}
+    client = make_client(handler)
+
+    result = client.links.bulk_create_many(iter(rows), chunk_size=3, concurrency=2)
+
+    assert sorted(chunk_sizes) == [1, 3, 3]
+    assert [item["index"] for item in result["created"]] == [0, 1, 2, 3, 4, 6]
+    assert [item["link"]["id"] for item in result["created"]][-1] == "https://example.com/6"
+    assert [item["index"] for item in result["failed"]] == [5]
+    assert result["total_requested"] == 7
+    assert (result["success_count"], result["failure_count"]) == (6, 1)
+
+
+@pytest.mark.parametrize(
+    ("response", "error_type"),
+    [
+        (lambda request: error(400, "VALIDATION_ERROR"), "request"),
+        (lambda request: error(502, "BAD_GATEWAY"), "unconfirmed"),
+    ],
+)
+def test_failed_chunk_is_reported_per_link(make_client, response, error_type):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/1" in request.content.decode():
+            return response(request)
+        return bulk_response(request)
+
+    client = make_client(handler, retries=0)
+    result = client.links.bulk_create_many(urls(4), chunk_size=2)
+
+    assert [item["index"] for item in result["created"]] == [2, 3]
+    assert [(item["index"], item["error_type"]) for item in result["failed"]] == [
+        (0, error_type),
+        (1, error_type),
+    ]
+
+
+def test_network_error_marks_chunk_unconfirmed(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/1" in request.content.decode():
+            raise httpx.ReadTimeout("timed out", request=request)
+        return bulk_response(request)
+
+    client = make_client(handler, retries=0)
+    result = client.links.bulk_create_many(urls(4), chunk_size=2)
+
+    assert [item["index"] for item in result["created"]] == [2, 3]
+    assert {item["error_type"] for item in result["failed"]} == {"unconfirmed"}
+
+
+def test_authentication_error_aborts(make_client):
+    client = make_client(lambda request: error(401, "UNAUTHORIZED"))
+
+    with pytest.raises(AuthenticationError):
+        client.links.bulk_create_many(urls(4), chunk_size=2)
+
+
+def test_offset_does_not_mutate_server_result():
+    result = bulk_response(
+        httpx.Request("POST", "https://api.test/links/bulk", json=urls(2))
+    ).json()["data"]
+
+    shifted = _offset_bulk_result(result, 10, 2)
+
+    assert [item["index"] for item in shifted["created"]] == [10, 11]
+    assert [item["index"] for item in result["created"]] == [0, 1]
+
+
+def test_async_bulk_create_many(make_async_client):
+    client = make_async_client(bulk_response)
+
+    result = asyncio.run(client.links.bulk_create_many(urls(5), chunk_size=2))
+
+    assert [item["index"] for item in result["created"]] == [0, 1, 2, 3, 4]
+    assert result["failure_count"] == 0
@@ -0,0 +1,140 @@
+"""``update_many`` / ``delete_many``: per-item results and re-sends."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from qck import AuthenticationError
+
+from .conftest import envelope, error
+
+
+def test_update_many_sends_one_idempotent_patch_per_item(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        link_id = request.url.path.rsplit("/", 1)[-1]
+        return envelope({"id": link_id, **json.loads(request.content)})
+
+    client = make_client(handler)
+    progress: List[tuple] = []
+    result = client.links.update_many(
+        {"a": {"is_active": False}, "b": {"title": "B"}},
+        on_progress=lambda done, failed: progress.append((done, failed)),
+    )
+
+    assert result["success_count"] == 2 and result["failure_count"] == 0
+    assert [s["link"] for s in result["succeeded"]] == [
+        {"id": "a", "is_active": False},
+        {"id": "b", "title": "B"},
+    ]
+    assert {call.method for call in calls} == {"PATCH"}
+    assert len({call.headers["X-Idempotency-Key"] for call in calls}) == 2
+    assert progress[-1] == (2, 0)
+
+
+def test_server_errors_are_resent_with_the_same_key(make_client):
+    keys: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers["X-Idempotency-Key"])
+        if len(keys) < 3:
+            return error(500, "INTERNAL_ERROR")
+        return envelope({"id": "a"})
+
+    client = make_client(handler, retries=0)
+    result = client.links.update_many([("a", {"title": "A"})])
+
+    assert result["success_count"] == 1
+    assert len(keys) == 3 and len(set(keys)) == 1
+
+
+def test_attempts_are_bounded(make_client):
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return error(500, "INTERNAL_ERROR")
+
+    client = make_client(handler, retries=0)
+    result = client.links.update_many([("a", {"title": "A"})])
+
+    assert len(calls) == 3
+    assert result["failed"][0]["status"] == 500
+
+
+def test_client_errors_are_not_resent(make_client):
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return error(400, "VALIDATION_ERROR")
+
+    client = make_client(handler)
+    result = client.links.update_many([("a", {"url": "nope"})])
+
+    assert len(calls) == 1
+    assert result["failed"][0]["error_type"] == "VALIDATION_ERROR"
+
+
+def test_transport_errors_are_recorded_per_item(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/bad"):
+            raise httpx.ReadError("connection dropped", request=request)
+        return httpx.Response(204)
+
+    client = make_client(handler)
+    result = client.links.delete_many(["ok", "bad"])
+
+    assert [s["link_id"] for s in result["succeeded"]] == ["ok"]
+    failure = result["failed"][0]
+    assert failure["link_id"] == "bad"
+    assert failure["error_type"] == "NETWORK_ERROR" and failure["status"] == 0
+
+
+def test_not_found_after_resent_delete_is_success(make_client):
+    attempts: Dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        link_id = request.url.path.rsplit("/", 1)[-1]
+        attempts[link_id] = attempts.get(link_id, 0) + 1
+        if link_id == "gone":
+            return error(404, "NOT_FOUND")
+        if attempts[link_id] == 1:
+            return error(503, "UNAVAILABLE")
+        return error(404, "NOT_FOUND")
+
+    client = make_client(handler, retries=0)
+    result = client.links.delete_many(["flaky", "gone"])
+
+    assert [s["link_id"] for s in result["succeeded"]] == ["flaky"]
+    assert [(f["link_id"], f["status"]) for f in result["failed"]] == [("gone", 404)]
+
+
+def test_authentication_error_aborts(make_client):
+    client = make_client(lambda request: error(401, "INVALID_API_KEY"))
+
+    with pytest.raises(AuthenticationError):
+        client.links.delete_many(["a"])
+
+
+def test_async_delete_many_resends(make_async_client):
+    attempts: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        if len(attempts) == 1:
+            raise httpx.ReadError("connection dropped", request=request)
+        return error(404, "NOT_FOUND")
+
+    client = make_async_client(handler, retries=0)
+    result = asyncio.run(client.links.delete_many(["a"]))
+
+    assert len(attempts) == 2
+    assert result["success_count"] == 1
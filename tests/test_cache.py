@@ -0,0 +1,100 @@
+"""Response caching and invalidation."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from qck import CacheBackend, DiskCache, ResponseCache
+
+from .conftest import envelope
+
+
+def domains_handler(calls: List[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope({"domains": [{"id": "d1"}]})
+
+    return handler
+
+
+def test_fresh_get_is_served_from_cache(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(domains_handler(calls), cache=ResponseCache(ttl=60))
+
+    first = client.domains.list()
+    second = client.domains.list()
+
+    assert first == second == [{"id": "d1"}]
+    assert len(calls) == 1
+
+
+def test_cached_data_is_isolated_from_callers(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(domains_handler(calls), cache=ResponseCache(ttl=60))
+
+    client.domains.list()[0]["id"] = "mutated"
+
+    assert client.domains.list() == [{"id": "d1"}]
+
+
+def test_write_invalidates_resource(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope({"id": "abc"})
+
+    client = make_client(handler, cache=ResponseCache(ttl=60))
+
+    client.links.get("abc")
+    client.links.update("abc", {"is_active": False})
+    client.links.get("abc")
+
+    assert [request.method for request in calls] == ["GET", "PATCH", "GET"]
+
+
+def test_expired_entry_is_refetched(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(domains_handler(calls), cache=ResponseCache(ttl=0))
+
+    client.domains.list()
+    client.domains.list()
+
+    assert len(calls) == 2
+
+
+def test_path_ttl_none_disables_caching(make_client):
+    calls: List[httpx.Request] = []
+    cache = ResponseCache(ttl=60, path_ttls={"/domains": None})
+    client = make_client(domains_handler(calls), cache=cache)
+
+    client.domains.list()
+    client.domains.list()
+
+    assert len(calls) == 2
+
+
+def test_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        CacheBackend()  # type: ignore[abstract]
+
+
+def test_disk_cache_with_async_client(make_async_client, tmp_path):
+    calls: List[httpx.Request] = []
+    backend = DiskCache(str(tmp_path / "cache.db"))
+    client = make_async_client(domains_handler(calls), cache=ResponseCache(backend, ttl=60))
+
+    async def run():
+        return await client.domains.list(), await client.domains.list()
+
+    try:
+        first, second = asyncio.run(run())
+    finally:
+        backend.close()
+
+    assert first == second == [{"id": "d1"}]
+    assert len(calls) == 1
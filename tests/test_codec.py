@@ -0,0 +1,94 @@
+"""JSON codec selection, fast-backend parity, and fallbacks."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+from typing import List
+
+import httpx
+import pytest
+
+from qck._codec import JsonCodec, get_codec
+
+from .conftest import envelope
+
+BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            name != "stdlib" and importlib.util.find_spec(name) is None,
+            reason=f"{name} not installed",
+        ),
+    )
+    for name in ("stdlib", "orjson", "msgspec")
+]
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_round_trip_matches_stdlib(name):
+    codec = get_codec(name)
+    value = {"url": "https://example.com/ü", "tags": ["a", "b"], "n": 3, "x": 1.5, "ok": None}
+
+    encoded = codec.dumps(value)
+
+    assert encoded == json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    assert codec.loads(encoded) == value
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+@pytest.mark.parametrize("bad", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_floats_are_rejected_by_every_backend(name, bad):
+    codec = get_codec(name)
+
+    with pytest.raises(ValueError):
+        codec.dumps({"outer": [{"revenue": bad}]})
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_values_fast_backends_cannot_encode_fall_back_to_stdlib(name):
+    codec = get_codec(name)
+
+    assert codec.dumps({"big": 2**70}) == b'{"big":1180591620717411303424}'
+    assert json.loads(codec.dumps({1: "one"})) == {"1": "one"}
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_invalid_input_raises_value_error(name):
+    with pytest.raises(ValueError):
+        get_codec(name).loads(b"{not json")
+
+
+def test_invalid_input_is_parsed_once():
+    calls: List[bytes] = []
+
+    def loads(data: bytes) -> object:
+        calls.append(data)
+        raise ValueError("malformed")
+
+    codec = JsonCodec("fake", lambda obj: b"", loads)
+
+    with pytest.raises(ValueError, match="malformed"):
+        codec.loads(b"{")
+    assert calls == [b"{"]
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError, match="unknown json_codec"):
+        get_codec("simdjson")
+
+
+def test_client_encodes_bodies_with_selected_codec(make_client):
+    bodies: List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return envelope({"id": "abc"})
+
+    client = make_client(handler, json_codec="stdlib")
+    client.links.create({"url": "https://example.com"})
+
+    assert client._client._codec.name == "stdlib"
+    assert bodies == [b'{"url":"https://example.com"}']
+    with pytest.raises(ValueError):
+        client.links.create({"url": "https://example.com", "revenue": float("nan")})  # type: ignore[typeddict-unknown-key]
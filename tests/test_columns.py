@@ -0,0 +1,110 @@
+"""Column-oriented results (``as_columns=True``)."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+
+import httpx
+import pytest
+
+from qck import Columns
+from qck._columns import CONVERSION_TIMESERIES_SCHEMA, TIMESERIES_SCHEMA
+
+from .conftest import envelope
+
+POINTS = [
+    {"date": "2026-03-01", "clicks": 4, "unique_visitors": 2},
+    {"date": "2026-03-02", "clicks": 7},
+]
+CONVERSIONS = [
+    {"timestamp": "2026-03-01T00:00:00Z", "conversions": 2, "revenue": 9.5},
+    {"timestamp": "2026-03-02T00:00:00+02:00", "conversions": 1, "revenue": None},
+]
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/conversions/timeseries":
+        return envelope(CONVERSIONS)
+    return envelope({"analytics": POINTS, "usage": {"clicks_this_month": 11}})
+
+
+def test_analytics_timeseries_as_columns(make_client):
+    client = make_client(handler)
+
+    result = client.analytics.timeseries({"days": 2}, as_columns=True)
+
+    cols = result["analytics"]
+    assert isinstance(cols, Columns)
+    assert result["usage"] == {"clicks_this_month": 11}
+    assert cols["clicks"] == [4, 7]
+    assert cols["unique_visitors"] == [2, None]
+    assert list(cols) == ["date", "clicks", "unique_visitors"]
+    assert len(cols) == 3 and cols.num_rows == 2
+    assert repr(cols) == "Columns(date, clicks, unique_visitors; 2 rows)"
+
+
+def test_to_dicts_restores_rows():
+    cols = Columns.from_rows(POINTS, TIMESERIES_SCHEMA)
+
+    assert cols.to_dicts() == [
+        {"date": "2026-03-01", "clicks": 4, "unique_visitors": 2},
+        {"date": "2026-03-02", "clicks": 7, "unique_visitors": None},
+    ]
+
+
+def test_conversions_timeseries_as_columns(make_client):
+    client = make_client(handler)
+
+    cols = client.conversions.timeseries(as_columns=True)
+    points = client.conversions.timeseries()
+
+    assert cols["conversions"] == [2, 1]
+    assert points == CONVERSIONS
+
+
+def test_to_numpy_types_columns():
+    np = pytest.importorskip("numpy")
+    cols = Columns.from_rows(CONVERSIONS, CONVERSION_TIMESERIES_SCHEMA)
+
+    arrays = cols.to_numpy()
+
+    assert arrays["timestamp"].dtype == np.dtype("datetime64[us]")
+    assert str(arrays["timestamp"][1]) == "2026-03-01T22:00:00.000000"
+    assert arrays["conversions"].dtype == np.int64
+    assert np.isnan(arrays["revenue"][1])
+
+
+def test_to_arrow_types_columns():
+    pa = pytest.importorskip("pyarrow")
+    cols = Columns.from_rows(POINTS, TIMESERIES_SCHEMA)
+
+    table = cols.to_arrow()
+
+    assert table.schema.field("date").type == pa.date32()
+    assert table.column("unique_visitors").null_count == 1
+
+
+def test_missing_optional_dependency(monkeypatch):
+    real_import = importlib.import_module
+
+    def fake_import(name: str, *args: object) -> object:
+        if name == "numpy":
+            raise ImportError(name)
+        return real_import(name, *args)
+
+    monkeypatch.setattr(importlib, "import_module", fake_import)
+    cols = Columns.from_rows(POINTS, TIMESERIES_SCHEMA)
+
+    with pytest.raises(ImportError, match=r"qck-sdk\[numpy\]"):
+        cols.to_numpy()
+
+
+def test_async_hourly_as_columns(make_async_client):
+    client = make_async_client(
+        lambda request: envelope({"analytics": [{"hour": 0, "clicks": 3}], "usage": {}})
+    )
+
+    result = asyncio.run(client.analytics.hourly(as_columns=True))
+
+    assert result["analytics"]["hour"] == [0]
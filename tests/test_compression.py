@@ -0,0 +1,100 @@
+"""Request body compression and Accept-Encoding negotiation."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from typing import List
+
+import httpx
+import pytest
+
+from qck._compression import check_accept_encoding, get_compressor
+
+from .conftest import envelope
+
+EVENTS = {
+    "events": [
+        {"link_id": "l1", "visitor_id": f"v{n}", "event_type": "page_view"} for n in range(50)
+    ]
+}
+
+
+def recording(calls: List[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope(None, 202)
+
+    return handler
+
+
+def test_large_json_body_is_gzipped(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(recording(calls), compression="gzip")
+
+    client.journey.ingest(EVENTS)  # type: ignore[arg-type]
+
+    request = calls[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.content)) == EVENTS
+    assert int(request.headers["Content-Length"]) == len(request.content)
+
+
+def test_small_body_is_sent_uncompressed(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(recording(calls), compression="gzip")
+
+    client.links.create({"url": "https://example.com"})
+
+    assert "Content-Encoding" not in calls[0].headers
+    assert json.loads(calls[0].content) == {"url": "https://example.com"}
+
+
+def test_incompressible_body_is_sent_unchanged():
+    compressor = get_compressor("gzip", threshold=0)
+    assert compressor is not None
+
+    assert compressor.compress(b"x") is None
+    assert compressor.compress(b"a" * 2000) is not None
+
+
+def test_zstd_compression(make_async_client):
+    zstandard = pytest.importorskip("zstandard")
+    calls: List[httpx.Request] = []
+    client = make_async_client(recording(calls), compression="zstd")
+
+    asyncio.run(client.journey.ingest(EVENTS))  # type: ignore[arg-type]
+
+    assert calls[0].headers["Content-Encoding"] == "zstd"
+    assert json.loads(zstandard.ZstdDecompressor().decompress(calls[0].content)) == EVENTS
+
+
+def test_invalid_compression_settings():
+    with pytest.raises(ValueError, match="unknown compression"):
+        get_compressor("lz4", 1024)
+    with pytest.raises(ValueError, match="negative"):
+        get_compressor("gzip", -1)
+    assert get_compressor(None, 1024) is None
+
+
+def test_accept_encoding_validation(monkeypatch):
+    value = "gzip, deflate;q=0.5, identity, *"
+    assert check_accept_encoding(value) == value
+    with pytest.raises(ValueError, match="unsupported"):
+        check_accept_encoding("gzip, compress")
+
+    monkeypatch.setattr("importlib.util.find_spec", lambda name, *args: None)
+    with pytest.raises(ImportError, match="brotli"):
+        check_accept_encoding("br")
+    with pytest.raises(ImportError, match="zstandard"):
+        check_accept_encoding("zstd, gzip")
+
+
+def test_accept_encoding_header_is_sent(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(recording(calls), accept_encoding="gzip")
+
+    client.links.get("abc")
+
+    assert calls[0].headers["Accept-Encoding"] == "gzip"
@@ -0,0 +1,140 @@
+"""Order-preserving bounded concurrency helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Iterator, List
+
+import pytest
+
+from qck._concurrency import abounded_map, achunked, bounded_map
+
+
+def test_bounded_map_preserves_input_order():
+    def slow_for_small(n: int) -> int:
+        time.sleep((10 - n) * 0.002)
+        return n * n
+
+    assert list(bounded_map(slow_for_small, range(10), concurrency=4)) == [
+        n * n for n in range(10)
+    ]
+
+
+def test_bounded_map_limits_outstanding_calls():
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(n: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+        return n
+
+    assert list(bounded_map(work, range(20), concurrency=3)) == list(range(20))
+    assert 1 <= peak <= 3
+
+
+def test_bounded_map_consumes_input_lazily():
+    pulled: List[int] = []
+
+    def source() -> Iterator[int]:
+        for n in range(100):
+            pulled.append(n)
+            yield n
+
+    results = bounded_map(lambda n: n, source(), concurrency=2)
+    assert next(results) == 0
+    results.close()
+    assert len(pulled) <= 3
+
+
+def test_bounded_map_reraises_at_failing_position():
+    def work(n: int) -> int:
+        if n == 2:
+            raise RuntimeError("boom")
+        return n
+
+    results = bounded_map(work, range(5), concurrency=3)
+    assert [next(results), next(results)] == [0, 1]
+    with pytest.raises(RuntimeError, match="boom"):
+        next(results)
+
+
+def test_bounded_map_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        list(bounded_map(lambda n: n, [1], concurrency=0))
+
+
+def test_abounded_map_preserves_input_order():
+    async def slow_for_small(n: int) -> int:
+        await asyncio.sleep((10 - n) * 0.002)
+        return n * n
+
+    async def run() -> List[int]:
+        return [r async for r in abounded_map(slow_for_small, range(10), concurrency=4)]
+
+    assert asyncio.run(run()) == [n * n for n in range(10)]
+
+
+def test_abounded_map_limits_outstanding_tasks():
+    running = 0
+    peak = 0
+
+    async def work(n: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return n
+
+    async def run() -> List[int]:
+        return [r async for r in abounded_map(work, range(20), concurrency=3)]
+
+    assert asyncio.run(run()) == list(range(20))
+    assert 1 <= peak <= 3
+
+
+def test_abounded_map_rejects_zero_concurrency():
+    async def run() -> None:
+        async for _ in abounded_map(asyncio.sleep, [0], concurrency=0):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def test_abounded_map_accepts_async_iterables():
+    async def numbers():
+        for n in range(5):
+            yield n
+
+    async def double(n: int) -> int:
+        return 2 * n
+
+    async def run() -> List[int]:
+        return [r async for r in abounded_map(double, numbers(), concurrency=2)]
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8]
+
+
+def test_achunked_reads_chunks_in_a_worker_thread():
+    threads = set()
+
+    def items() -> Iterator[int]:
+        for n in range(5):
+            threads.add(threading.get_ident())
+            yield n
+
+    async def run() -> List[List[int]]:
+        return [chunk async for chunk in achunked(items(), 2, in_thread=True)]
+
+    assert asyncio.run(run()) == [[0, 1], [2, 3], [4]]
+    assert threading.get_ident() not in threads
@@ -0,0 +1,149 @@
+"""Buffered conversion tracking and the asyncio batchers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, List, Tuple
+
+import httpx
+import pytest
+
+from qck import AsyncConversionTracker, AsyncJourneyIngestor
+
+from .conftest import envelope, error
+
+
+def conversion(n: int) -> dict:
+    return {"link_id": "l1", "visitor_id": f"v{n}", "name": "purchase", "revenue": 12.5}
+
+
+def recording_handler(calls: List[Tuple[List[dict], str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/journey/events")
+        calls.append((json.loads(request.content)["events"], request.headers["X-Idempotency-Key"]))
+        return envelope(None, 202)
+
+    return handler
+
+
+def test_tracker_batches_conversion_events(make_client):
+    calls: List[Tuple[List[dict], str]] = []
+    client = make_client(recording_handler(calls))
+
+    with client.conversions.tracker(max_batch=2, max_latency_ms=60_000) as tracker:
+        for n in range(3):
+            assert tracker.track(conversion(n))
+
+    assert [len(events) for events, _ in calls] == [2, 1]
+    assert len({key for _, key in calls}) == 2
+    first = calls[0][0][0]
+    assert first["event_type"] == "conversion"
+    assert first["conversion_name"] == "purchase"
+    assert first["revenue_cents"] == 1250
+    assert tracker.stats["events_sent"] == 3
+
+
+def test_tracker_reuses_idempotency_key_across_retries(make_client):
+    keys: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers["X-Idempotency-Key"])
+        if len(keys) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"success": False})
+        return envelope(None, 202)
+
+    client = make_client(handler)
+    with client.conversions.tracker() as tracker:
+        tracker.track(conversion(1))
+
+    assert len(keys) == 2
+    assert keys[0] == keys[1]
+
+
+def test_tracker_rejects_incomplete_params(make_client):
+    client = make_client(recording_handler([]))
+    with client.conversions.tracker() as tracker, pytest.raises(KeyError):
+        tracker.track({"link_id": "l1", "visitor_id": "v1"})  # type: ignore[typeddict-item]
+
+
+def test_async_tracker_batches_and_closes(make_async_client):
+    calls: List[Tuple[List[dict], str]] = []
+    client = make_async_client(recording_handler(calls))
+
+    async def run() -> Any:
+        tracker = client.conversions.tracker(max_batch=2, max_latency_ms=60_000)
+        assert isinstance(tracker, AsyncConversionTracker)
+        for n in range(5):
+            tracker.track(conversion(n))
+        return await tracker.close()
+
+    stats = asyncio.run(run())
+    assert [len(events) for events, _ in calls] == [2, 2, 1]
+    assert len({key for _, key in calls}) == 3
+    assert (stats["events_sent"], stats["batches_sent"], stats["events_pending"]) == (5, 3, 0)
+
+
+def test_async_ingestor_flushes_on_latency_and_request(make_async_client):
+    calls: List[Tuple[List[dict], str]] = []
+    client = make_async_client(recording_handler(calls))
+    event = {"link_id": "l1", "visitor_id": "v1", "event_type": "page_view"}
+
+    async def run() -> None:
+        async with client.journey.ingestor(max_latency_ms=10) as ingestor:
+            assert isinstance(ingestor, AsyncJourneyIngestor)
+            ingestor.add(event)
+            for _ in range(200):
+                if calls:
+                    break
+                await asyncio.sleep(0.01)
+            assert len(calls) == 1
+            ingestor.add(event)
+            assert await ingestor.flush(timeout=2)
+        with pytest.raises(RuntimeError):
+            ingestor.add(event)
+
+    asyncio.run(run())
+    assert [events for events, _ in calls] == [[event], [event]]
+
+
+def test_async_batcher_reports_failures_and_drops(make_async_client):
+    client = make_async_client(lambda request: error(400, "VALIDATION_ERROR"))
+    failures: List[Tuple[BaseException, List[dict]]] = []
+
+    async def run() -> Any:
+        ingestor = client.journey.ingestor(
+            max_queue=1, on_error=lambda exc, events: failures.append((exc, events))
+        )
+        event = {"link_id": "l1", "visitor_id": "v1", "event_type": "page_view"}
+        assert ingestor.add(event)
+        assert not ingestor.add(event)
+        return await ingestor.close()
+
+    stats = asyncio.run(run())
+    assert (stats["events_failed"], stats["events_dropped"], stats["batches_failed"]) == (1, 1, 1)
+    assert len(failures) == 1 and failures[0][1][0]["visitor_id"] == "v1"
+
+
+def test_async_close_timeout_leaves_delivery_running(make_async_client):
+    async def run() -> None:
+        release = asyncio.Event()
+        sent: List[List[dict]] = []
+        client = make_async_client(recording_handler([]))
+
+        async def slow_ingest(params: Any) -> None:
+            await release.wait()
+            sent.append(params["events"])
+
+        client.journey.ingest = slow_ingest  # type: ignore[method-assign]
+        ingestor = client.journey.ingestor(max_batch=1)
+        ingestor.add({"link_id": "l1", "visitor_id": "v1", "event_type": "page_view"})
+
+        stats = await ingestor.close(timeout=0.05)
+        assert stats["events_pending"] == 1
+        release.set()
+        stats = await ingestor.close()
+        assert stats["events_pending"] == 0
+        assert len(sent) == 1
+
+    asyncio.run(run())
@@ -0,0 +1,99 @@
+"""Conditional revalidation of stale cache entries with ETag / Last-Modified."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from qck import QCKError, ResponseCache
+
+from .conftest import envelope
+
+
+def validating_handler(calls: List[httpx.Request], etag: str = '"v1"'):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return envelope({"domains": [{"id": "d1"}]}, headers={"ETag": etag})
+
+    return handler
+
+
+def test_stale_entry_is_revalidated_with_etag(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(validating_handler(calls), cache=ResponseCache(ttl=0))
+
+    assert client.domains.list() == [{"id": "d1"}]
+    assert client.domains.list() == [{"id": "d1"}]
+
+    assert "If-None-Match" not in calls[0].headers
+    assert calls[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_changed_resource_replaces_entry(make_client):
+    calls: List[httpx.Request] = []
+    version = {"etag": '"v1"', "id": "d1"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-None-Match") == version["etag"]:
+            return httpx.Response(304, headers={"ETag": version["etag"]})
+        return envelope({"domains": [{"id": version["id"]}]}, headers={"ETag": version["etag"]})
+
+    client = make_client(handler, cache=ResponseCache(ttl=0))
+    client.domains.list()
+    version.update(etag='"v2"', id="d2")
+
+    assert client.domains.list() == [{"id": "d2"}]
+    assert client.domains.list() == [{"id": "d2"}]
+    assert calls[2].headers["If-None-Match"] == '"v2"'
+
+
+def test_last_modified_is_sent_as_if_modified_since(make_client):
+    calls: List[httpx.Request] = []
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-Modified-Since") == stamp:
+            return httpx.Response(304)
+        return envelope({"domains": []}, headers={"Last-Modified": stamp})
+
+    client = make_client(handler, cache=ResponseCache(ttl=0))
+
+    assert client.domains.list() == []
+    assert client.domains.list() == []
+    assert calls[1].headers["If-Modified-Since"] == stamp
+
+
+def test_revalidate_false_refetches_unconditionally(make_client):
+    calls: List[httpx.Request] = []
+    client = make_client(validating_handler(calls), cache=ResponseCache(ttl=0, revalidate=False))
+
+    client.domains.list()
+    client.domains.list()
+
+    assert "If-None-Match" not in calls[1].headers
+
+
+def test_not_modified_without_cached_entry_raises(make_client):
+    client = make_client(lambda request: httpx.Response(304))
+
+    with pytest.raises(QCKError) as info:
+        client._client._request("GET", "/domains", headers={"If-None-Match": '"v1"'})
+    assert info.value.status == 304
+
+
+def test_async_client_revalidates(make_async_client):
+    calls: List[httpx.Request] = []
+    client = make_async_client(validating_handler(calls), cache=ResponseCache(ttl=0))
+
+    async def run():
+        return await client.domains.list(), await client.domains.list()
+
+    assert asyncio.run(run()) == ([{"id": "d1"}], [{"id": "d1"}])
+    assert calls[1].headers["If-None-Match"] == '"v1"'
@@ -0,0 +1,112 @@
+"""Streaming ``links.export`` to JSON Lines and CSV."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from .conftest import envelope
+
+TOTAL_PAGES = 3
+
+
+def export_handler(queries: List[Dict[str, str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = dict(request.url.params)
+        queries.append(query)
+        page = int(query["page"])
+        links = [
+            {
+                "id": f"{page}-{n}",
+                "url": "https://example.com",
+                "tags": ["a", "b"],
+                "is_active": n == 0,
+                "title": None,
+            }
+            for n in range(2)
+        ]
+        meta = {"page": page, "per_page": 2, "total": 2 * TOTAL_PAGES, "total_pages": TOTAL_PAGES}
+        return envelope(links, meta=meta)
+
+    return handler
+
+
+def test_jsonl_export_writes_every_link_and_checkpoints(make_client):
+    queries: List[Dict[str, str]] = []
+    client = make_client(export_handler(queries))
+    fp = io.StringIO()
+    checkpoints: List[int] = []
+
+    written = client.links.export(fp, "jsonl", {"per_page": 2}, on_checkpoint=checkpoints.append)
+
+    lines = [json.loads(line) for line in fp.getvalue().splitlines()]
+    assert written == 6
+    assert [link["id"] for link in lines] == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert checkpoints == [1, 2, 3]
+    assert queries[0]["sort_by"] == "created_at" and queries[0]["sort_order"] == "asc"
+
+
+def test_csv_export_formats_cells(make_client):
+    client = make_client(export_handler([]))
+    fp = io.StringIO(newline="")
+
+    client.links.export(fp, "csv", fields=["id", "tags", "is_active", "title"], prefetch=0)
+
+    rows = list(csv.reader(io.StringIO(fp.getvalue())))
+    assert rows[0] == ["id", "tags", "is_active", "title"]
+    assert rows[1] == ["1-0", '["a","b"]', "true", ""]
+    assert rows[2][2] == "false"
+    assert len(rows) == 7
+
+
+def test_resumed_csv_export_skips_header_and_earlier_pages(make_client):
+    queries: List[Dict[str, str]] = []
+    client = make_client(export_handler(queries))
+    fp = io.StringIO(newline="")
+    checkpoints: List[int] = []
+
+    written = client.links.export(
+        fp,
+        "csv",
+        {"sort_by": "url"},
+        fields=["id"],
+        start_page=2,
+        on_checkpoint=checkpoints.append,
+    )
+
+    assert written == 4
+    assert fp.getvalue().split() == ["2-0", "2-1", "3-0", "3-1"]
+    assert checkpoints == [2, 3]
+    assert queries[0]["sort_by"] == "url" and "sort_order" not in queries[0]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"format": "xml"}, "unknown export format"),
+        ({"start_page": 0}, "start_page"),
+    ],
+)
+def test_invalid_arguments(make_client, kwargs, message):
+    client = make_client(export_handler([]))
+
+    with pytest.raises(ValueError, match=message):
+        client.links.export(io.StringIO(), **kwargs)
+
+
+def test_async_export(make_async_client):
+    client = make_async_client(export_handler([]))
+    fp = io.StringIO()
+    checkpoints: List[int] = []
+
+    written = asyncio.run(client.links.export(fp, on_checkpoint=checkpoints.append))
+
+    assert written == 6
+    assert len(fp.getvalue().splitlines()) == 6
+    assert checkpoints == [1, 2, 3]
@@ -0,0 +1,97 @@
+"""Concurrent ``get_many`` / ``get_stats_many`` lookups."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from qck import AuthenticationError, NetworkError, NotFoundError
+
+from .conftest import envelope, error
+
+
+def lookup_handler(calls: List[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        calls.append(path)
+        link_id = path.split("/")[2]
+        if link_id == "missing":
+            return error(404, "NOT_FOUND")
+        if link_id == "offline":
+            raise httpx.ConnectError("connection reset", request=request)
+        if path.endswith("/stats"):
+            return envelope({"total_clicks": len(link_id)})
+        return envelope({"id": link_id})
+
+    return handler
+
+
+def test_results_in_input_order_with_errors_as_values(make_client):
+    calls: List[str] = []
+    client = make_client(lookup_handler(calls), retries=1)
+
+    results = client.links.get_many(["b", "missing", "a", "offline", "b"], concurrency=4)
+
+    assert list(results) == ["b", "missing", "a", "offline"]
+    assert results["a"] == {"id": "a"} and results["b"] == {"id": "b"}
+    assert isinstance(results["missing"], NotFoundError)
+    assert isinstance(results["offline"], NetworkError)
+    assert calls.count("/links/b") == 1
+
+
+def test_stats_many(make_client):
+    client = make_client(lookup_handler([]))
+
+    stats = client.links.get_stats_many(["ab", "abc"])
+
+    assert stats == {"ab": {"total_clicks": 2}, "abc": {"total_clicks": 3}}
+
+
+def test_concurrency_is_bounded(make_client):
+    lock = threading.Lock()
+    active = peak = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return envelope({"id": request.url.path.rsplit("/", 1)[-1]})
+
+    client = make_client(handler)
+    results = client.links.get_many([str(n) for n in range(20)], concurrency=3)
+
+    assert len(results) == 20
+    assert 1 < peak <= 3
+
+
+def test_authentication_error_aborts(make_client):
+    client = make_client(lambda request: error(401, "INVALID_API_KEY"))
+
+    with pytest.raises(AuthenticationError):
+        client.links.get_many(["a", "b"])
+
+
+def test_invalid_concurrency(make_client):
+    client = make_client(lookup_handler([]))
+
+    with pytest.raises(ValueError):
+        client.links.get_many(["a"], concurrency=0)
+
+
+def test_async_get_many(make_async_client):
+    client = make_async_client(lookup_handler([]), retries=0)
+
+    results = asyncio.run(client.links.get_many(["a", "offline", "missing"]))
+
+    assert results["a"] == {"id": "a"}
+    assert isinstance(results["offline"], NetworkError)
+    assert isinstance(results["missing"], NotFoundError)
@@ -0,0 +1,141 @@
+"""Streaming ``links.import_file`` from JSON Lines and CSV."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from qck._import import detect_format, read_rows
+
+from .test_bulk_create import bulk_response
+
+
+def recording_handler(sent: List[Dict[str, Any]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.extend(json.loads(request.content))
+        return bulk_response(request)
+
+    return handler
+
+
+def read_rejects(path: Path) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_csv_import_maps_columns_and_records_rejects(make_client, tmp_path):
+    source = tmp_path / "links.csv"
+    source.write_text(
+        "link,tags,is_password_protected,title\n"
+        'https://example.com/a,"x, y",no,A\n'
+        "not-a-url,,,\n"
+        'https://bad.example.com,["z"],,\n'
+        "https://example.com/b,,,\n",
+        encoding="utf-8",
+    )
+    rejects = tmp_path / "rejects.jsonl"
+    sent: List[Dict[str, Any]] = []
+    progress: List[tuple] = []
+    client = make_client(recording_handler(sent))
+
+    result = client.links.import_file(
+        source,
+        column_map={"link": "url"},
+        reject_path=rejects,
+        chunk_size=2,
+        on_progress=lambda done, failed: progress.append((done, failed)),
+    )
+
+    assert result == {"total_rows": 4, "success_count": 2, "failure_count": 2}
+    assert sent[0] == {
+        "url": "https://example.com/a",
+        "tags": ["x", "y"],
+        "is_password_protected": False,
+        "title": "A",
+    }
+    assert sent[1] == {"url": "https://bad.example.com", "tags": ["z"]}
+    assert [(r["row"], r["error_type"]) for r in read_rejects(rejects)] == [
+        (2, "validation"),
+        (3, "validation"),
+    ]
+    assert progress[-1] == (4, 2)
+
+
+def test_jsonl_import_rejects_unparsable_lines(make_client, tmp_path):
+    source = tmp_path / "links.ndjson"
+    source.write_text('{"original_url": "https://example.com/a"}\n\n{oops\n[1]\n', encoding="utf-8")
+    rejects = tmp_path / "rejects.jsonl"
+    sent: List[Dict[str, Any]] = []
+    client = make_client(recording_handler(sent))
+
+    result = client.links.import_file(source, reject_path=rejects)
+
+    assert result == {"total_rows": 3, "success_count": 1, "failure_count": 2}
+    assert sent == [{"url": "https://example.com/a"}]
+    assert [(r["row"], r["error_type"]) for r in read_rejects(rejects)] == [
+        (3, "parse"),
+        (4, "parse"),
+    ]
+
+
+def test_read_rows_validates_locally(tmp_path):
+    source = tmp_path / "links.csv"
+    source.write_text(
+        "url,is_password_protected,password\n"
+        "https://example.com,true,\n"
+        "ftp://example.com,,\n"
+        "https://example.com,maybe,\n",
+        encoding="utf-8",
+    )
+
+    with source.open(newline="") as fp:
+        errors = [row.error for row in read_rows(fp, "csv")]
+
+    assert "password is required" in errors[0]
+    assert "absolute http(s) URL" in errors[1]
+    assert "must be a boolean" in errors[2]
+
+
+@pytest.mark.parametrize(
+    ("path", "format", "message"),
+    [("links.txt", None, "cannot infer"), ("links.csv", "xml", "unknown import format")],
+)
+def test_detect_format_errors(path, format, message):
+    with pytest.raises(ValueError, match=message):
+        detect_format(path, format)
+
+
+def test_async_import_reads_rows_off_the_event_loop(make_async_client, tmp_path, monkeypatch):
+    import qck.resources.links as links_module
+
+    reader_threads = set()
+
+    def tracking_read_rows(*args: Any, **kwargs: Any):
+        for row in read_rows(*args, **kwargs):
+            reader_threads.add(threading.get_ident())
+            yield row
+
+    monkeypatch.setattr(links_module, "read_rows", tracking_read_rows)
+    source = tmp_path / "links.jsonl"
+    source.write_text(
+        "".join(json.dumps({"url": f"https://example.com/{n}"}) + "\n" for n in range(5)),
+        encoding="utf-8",
+    )
+    sent: List[Dict[str, Any]] = []
+    client = make_async_client(recording_handler(sent))
+
+    async def run() -> Any:
+        loop_thread = threading.get_ident()
+        result = await client.links.import_file(source, chunk_size=2, concurrency=2)
+        return loop_thread, result
+
+    loop_thread, result = asyncio.run(run())
+
+    assert result == {"total_rows": 5, "success_count": 5, "failure_count": 0}
+    assert len(sent) == 5
+    assert reader_threads and loop_thread not in reader_threads
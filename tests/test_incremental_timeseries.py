@@ -0,0 +1,128 @@
+"""``analytics.incremental_timeseries``: refetching only the open tail."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+import qck._timeseries as timeseries_module
+
+from .conftest import envelope
+
+TODAY = date(2026, 3, 10)
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch):
+    monkeypatch.setattr(timeseries_module, "_today", lambda: TODAY)
+
+
+def series_handler(queries: List[Dict[str, str]], usage: Dict[str, Any], clicks: int = 1):
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = dict(request.url.params)
+        queries.append(query)
+        start = date.fromisoformat(query["start_date"])
+        end = date.fromisoformat(query["end_date"])
+        points = [
+            {"date": (start + timedelta(days=n)).isoformat(), "clicks": clicks}
+            for n in range((end - start).days + 1)
+        ]
+        return envelope({"analytics": points, "usage": usage})
+
+    return handler
+
+
+def test_first_refresh_fetches_the_window_then_only_the_tail(make_client):
+    queries: List[Dict[str, str]] = []
+    client = make_client(series_handler(queries, {}))
+    trend = client.analytics.incremental_timeseries(7, params={"bot_filter": "real", "days": 3})
+
+    first = trend.refresh()
+    second = trend.refresh()
+
+    assert queries[0] == {
+        "bot_filter": "real",
+        "start_date": "2026-03-04",
+        "end_date": "2026-03-10",
+    }
+    assert queries[1]["start_date"] == "2026-03-09"
+    assert len(first["analytics"]) == len(second["analytics"]) == 7
+    assert trend.last_refresh is not None
+
+
+def test_tail_replaces_stored_buckets(make_client):
+    handlers = [series_handler([], {}), series_handler([], {}, clicks=9)]
+    client = make_client(lambda request: handlers[0](request))
+    trend = client.analytics.incremental_timeseries(5)
+    trend.refresh()
+
+    handlers.pop(0)
+    result = trend.refresh()
+
+    assert [p["clicks"] for p in result["analytics"]] == [1, 1, 1, 9, 9]
+
+
+def test_window_moves_and_evicts_old_buckets(make_client, monkeypatch):
+    queries: List[Dict[str, str]] = []
+    client = make_client(series_handler(queries, {}))
+    trend = client.analytics.incremental_timeseries(3)
+    trend.refresh()
+
+    monkeypatch.setattr(timeseries_module, "_today", lambda: TODAY + timedelta(days=2))
+    result = trend.refresh()
+
+    assert queries[1]["start_date"] == "2026-03-10"
+    assert [p["date"] for p in result["analytics"]] == ["2026-03-10", "2026-03-11", "2026-03-12"]
+
+
+def test_retention_and_cutoff_clamp_the_window(make_client):
+    queries: List[Dict[str, str]] = []
+    usage = {"retention_days": 4, "cutoff_date": "2026-03-08T00:00:00Z"}
+    client = make_client(series_handler(queries, usage))
+    trend = client.analytics.incremental_timeseries(30)
+
+    result = trend.refresh()
+    trend.refresh(full=True)
+
+    assert [p["date"] for p in result["analytics"]] == ["2026-03-08", "2026-03-09", "2026-03-10"]
+    assert queries[1]["start_date"] == "2026-03-08"
+
+
+def test_rollup_and_clear(make_client):
+    queries: List[Dict[str, str]] = []
+    client = make_client(series_handler(queries, {}))
+    trend = client.analytics.incremental_timeseries(14)
+    trend.refresh()
+
+    weeks = trend.rollup("week")
+    trend.clear()
+    trend.refresh()
+
+    assert sum(row["clicks"] for row in weeks) == 14
+    assert queries[1]["start_date"] == queries[0]["start_date"]
+
+
+def test_invalid_days(make_client):
+    client = make_client(series_handler([], {}))
+
+    with pytest.raises(ValueError):
+        client.analytics.incremental_timeseries(0)
+
+
+def test_async_refresh(make_async_client):
+    queries: List[Dict[str, str]] = []
+    client = make_async_client(series_handler(queries, {}))
+    trend = client.analytics.incremental_timeseries(4)
+
+    async def run() -> Any:
+        await trend.refresh()
+        return await trend.refresh()
+
+    result = asyncio.run(run())
+
+    assert len(result["analytics"]) == 4
+    assert [q["start_date"] for q in queries] == ["2026-03-07", "2026-03-09"]
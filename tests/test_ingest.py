@@ -0,0 +1,147 @@
+"""Background batching ``JourneyIngestor``."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from .conftest import envelope, error
+
+
+def event(n: int) -> dict:
+    return {"link_id": "l1", "visitor_id": f"v{n}", "event_type": "page_view"}
+
+
+def recording_handler(batches: List[List[dict]], keys: List[str]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        batches.append(json.loads(request.content)["events"])
+        keys.append(request.headers["X-Idempotency-Key"])
+        return envelope(None, 202)
+
+    return handler
+
+
+def test_batches_are_cut_by_size(make_client):
+    batches: List[List[dict]] = []
+    keys: List[str] = []
+    client = make_client(recording_handler(batches, keys))
+
+    with client.journey.ingestor(max_batch=3, max_latency_ms=60_000) as ingestor:
+        for n in range(7):
+            assert ingestor.add(event(n))
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [e["visitor_id"] for batch in batches for e in batch] == [f"v{n}" for n in range(7)]
+    assert len(set(keys)) == 3
+    stats = ingestor.stats
+    assert (stats["events_added"], stats["events_sent"], stats["batches_sent"]) == (7, 7, 3)
+    assert stats["events_pending"] == 0
+
+
+def test_partial_batch_is_sent_after_max_latency(make_client):
+    batches: List[List[dict]] = []
+    client = make_client(recording_handler(batches, []))
+    ingestor = client.journey.ingestor(max_batch=100, max_latency_ms=20)
+
+    ingestor.add(event(1))
+    deadline = time.monotonic() + 2
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert batches == [[event(1)]]
+    ingestor.close()
+
+
+def test_flush_hands_off_buffered_events(make_client):
+    batches: List[List[dict]] = []
+    client = make_client(recording_handler(batches, []))
+    ingestor = client.journey.ingestor(max_latency_ms=60_000)
+
+    ingestor.add(event(1))
+    ingestor.add(event(2))
+    assert ingestor.flush(timeout=2)
+    stats = ingestor.close()
+
+    assert batches == [[event(1), event(2)]]
+    assert stats["batches_sent"] == 1
+
+
+def test_failed_batches_are_counted_and_reported(make_client):
+    failures: List[int] = []
+    client = make_client(lambda request: error(400, "VALIDATION_ERROR"))
+    ingestor = client.journey.ingestor(
+        max_batch=2, on_error=lambda exc, batch: failures.append(len(batch))
+    )
+
+    for n in range(3):
+        ingestor.add(event(n))
+    stats = ingestor.close()
+
+    assert failures == [2, 1]
+    assert (stats["events_failed"], stats["batches_failed"]) == (3, 2)
+
+
+def test_add_after_close_raises(make_client):
+    client = make_client(recording_handler([], []))
+    ingestor = client.journey.ingestor()
+    ingestor.close()
+
+    with pytest.raises(RuntimeError):
+        ingestor.add(event(1))
+    assert ingestor.flush() is True
+
+
+def test_full_queue_drops_without_blocking(make_client):
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        return envelope(None, 202)
+
+    client = make_client(handler)
+    ingestor = client.journey.ingestor(max_batch=1, max_queue=2)
+    try:
+        started = time.monotonic()
+        results = [ingestor.add(event(n)) for n in range(20)]
+        flushed = ingestor.flush(timeout=0.05)
+        more = [ingestor.add(event(n)) for n in range(5)]
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+    stats = ingestor.close()
+
+    assert elapsed < 1
+    assert not flushed
+    assert results.count(False) > 0 and more.count(False) > 0
+    assert stats["events_dropped"] == results.count(False) + more.count(False)
+    assert stats["events_sent"] == stats["events_added"]
+
+
+def test_close_timeout_reports_pending_and_keeps_delivering(make_client):
+    release = threading.Event()
+    batches: List[List[dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        release.wait(5)
+        batches.append(json.loads(request.content)["events"])
+        return envelope(None, 202)
+
+    client = make_client(handler)
+    ingestor = client.journey.ingestor(max_batch=1)
+    for n in range(3):
+        ingestor.add(event(n))
+
+    started = time.monotonic()
+    stats = ingestor.close(timeout=0.1)
+    assert time.monotonic() - started < 1
+    assert stats["events_pending"] == 3
+
+    release.set()
+    ingestor._thread.join(5)
+    assert len(batches) == 3
+    assert ingestor.stats["events_sent"] == 3
@@ -0,0 +1,154 @@
+"""Local SQLite link mirror with incremental sync."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any, Dict, List
+
+import httpx
+
+from qck import ResponseCache
+
+from .conftest import envelope, error
+
+
+class FakeLinks:
+    """In-memory ``/links`` endpoint with an exclusive ``created_after`` filter."""
+
+    def __init__(self) -> None:
+        self.links: List[Dict[str, Any]] = []
+        self.requests: List[httpx.Request] = []
+
+    def add(self, link_id: str, created_at: str, **fields: Any) -> None:
+        self.links.append(
+            {"id": link_id, "short_code": link_id, "created_at": created_at, **fields}
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path != "/links":
+            link_id = request.url.path.rsplit("/", 1)[-1]
+            found = [link for link in self.links if link["id"] == link_id]
+            return envelope(found[0]) if found else error(404, "NOT_FOUND")
+        params = request.url.params
+        after = params.get("created_after")
+        rows = sorted(
+            (link for link in self.links if after is None or link["created_at"] > after),
+            key=lambda link: link["created_at"],
+        )
+        per_page, page = int(params["per_page"]), int(params["page"])
+        total_pages = max(1, math.ceil(len(rows) / per_page))
+        meta = {"page": page, "per_page": per_page, "total": len(rows), "total_pages": total_pages}
+        return envelope(rows[(page - 1) * per_page : page * per_page], meta=meta)
+
+
+def test_full_sync_and_local_lookups(make_client):
+    server = FakeLinks()
+    server.add("a", "2026-01-01T00:00:00.000Z", tags=["x"], domain_name="go.test")
+    server.add("b", "2026-01-02T00:00:00.000Z", tags=["x", "y"])
+    server.add("c", "2026-01-03T00:00:00.000Z")
+    client = make_client(server)
+
+    with client.links.mirror(per_page=2) as mirror:
+        stats = mirror.sync()
+        assert stats == {"full": True, "fetched": 3, "removed": 0, "total": 3}
+        requests = len(server.requests)
+
+        assert mirror.get("b")["id"] == "b"
+        assert mirror.by_alias("a", domain="go.test")["id"] == "a"
+        assert [link["id"] for link in mirror.by_tag("x")] == ["a", "b"]
+        assert [link["id"] for link in mirror.by_domain(None)] == ["b", "c"]
+        assert "c" in mirror and len(mirror) == 3
+        assert len(server.requests) == requests
+
+
+def test_incremental_sync_catches_links_sharing_the_cursor_timestamp(make_client):
+    server = FakeLinks()
+    server.add("a", "2026-01-01T00:00:00.000Z")
+    server.add("b", "2026-01-02T00:00:00.000Z")
+    client = make_client(server)
+    mirror = client.links.mirror()
+    mirror.sync()
+
+    # Created in the same millisecond as "b", after the first sync read it.
+    server.add("b2", "2026-01-02T00:00:00.000Z")
+    stats = mirror.sync()
+
+    assert server.requests[-1].url.params["created_after"] == "2026-01-01T23:59:59Z"
+    assert stats["full"] is False
+    assert stats["fetched"] == 1
+    assert "b2" in mirror and len(mirror) == 3
+
+
+def test_empty_first_sync_still_enables_incremental_sync(make_client):
+    server = FakeLinks()
+    client = make_client(server)
+    mirror = client.links.mirror()
+
+    assert mirror.sync() == {"full": True, "fetched": 0, "removed": 0, "total": 0}
+    server.add("a", "2999-01-01T00:00:00.000Z")
+    stats = mirror.sync()
+
+    assert "created_after" in server.requests[-1].url.params
+    assert stats == {"full": False, "fetched": 1, "removed": 0, "total": 1}
+
+
+def test_sync_bypasses_response_cache(make_client):
+    server = FakeLinks()
+    server.add("a", "2026-01-01T00:00:00.000Z")
+    client = make_client(server, cache=ResponseCache(ttl=3600))
+    mirror = client.links.mirror()
+    mirror.sync()
+
+    server.add("b", "2026-01-02T00:00:00.000Z")
+    mirror.sync(full=True)
+
+    assert "b" in mirror
+
+
+def test_full_sync_sweeps_deleted_links_and_refresh_forgets(make_client):
+    server = FakeLinks()
+    server.add("a", "2026-01-01T00:00:00.000Z")
+    server.add("b", "2026-01-02T00:00:00.000Z")
+    client = make_client(server)
+    mirror = client.links.mirror()
+    mirror.sync()
+
+    server.links = [link for link in server.links if link["id"] != "a"]
+    assert mirror.sync(full=True)["removed"] == 1
+
+    server.links.clear()
+    assert mirror.refresh("b") is None
+    assert len(mirror) == 0
+
+
+def test_file_mirror_resumes_incrementally(make_client, tmp_path):
+    server = FakeLinks()
+    server.add("a", "2026-01-01T00:00:00.000Z")
+    client = make_client(server)
+    path = str(tmp_path / "links.db")
+    with client.links.mirror(path) as mirror:
+        mirror.sync()
+
+    with client.links.mirror(path) as mirror:
+        assert mirror.sync()["full"] is False
+        assert mirror.get("a") is not None
+
+
+def test_async_mirror(make_async_client):
+    server = FakeLinks()
+    server.add("a", "2026-01-01T00:00:00.000Z")
+    server.add("b", "2026-01-01T00:00:00.000Z")
+    client = make_async_client(server)
+
+    async def run() -> Any:
+        mirror = client.links.mirror(per_page=1)
+        first = await mirror.sync()
+        server.add("c", "2026-01-01T00:00:00.000Z")
+        return first, await mirror.sync(), len(mirror)
+
+    first, second, total = asyncio.run(run())
+    assert first["fetched"] == 2
+    assert second == {"full": False, "fetched": 1, "removed": 0, "total": 3}
+    assert total == 3
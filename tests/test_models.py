@@ -0,0 +1,88 @@
+"""Slotted response records (``models=True``)."""
+
+from __future__ import annotations
+
+import pickle
+
+import httpx
+import pytest
+
+from qck import models
+
+from .conftest import envelope
+
+LINK = {
+    "id": "lnk_1",
+    "short_url": "https://qck.sh/a",
+    "tags": ["x"],
+    "metadata": {"title": "Example", "is_safe": True},
+    "future_field": 1,
+}
+
+
+def test_record_round_trips_response_data():
+    link = models.Link.from_dict(LINK)
+
+    assert link.id == "lnk_1"
+    assert link.title is None
+    assert link.to_dict() == LINK
+    assert link == LINK
+    assert not hasattr(link, "__dict__")
+
+
+def test_nested_fields_decode_on_first_access():
+    link = models.Link.from_dict(LINK)
+
+    assert isinstance(models.Link.metadata.raw(link), dict)
+    assert link.metadata.title == "Example"
+    assert isinstance(models.Link.metadata.raw(link), models.LinkMetadata)
+    assert link.to_dict()["metadata"] == LINK["metadata"]
+
+
+def test_dict_compatibility():
+    link = models.Link.from_dict(LINK)
+
+    assert link["future_field"] == 1
+    assert link.get("title", "none") == "none"
+    assert "tags" in link and "title" not in link
+    assert link.keys() == ["id", "short_url", "tags", "metadata", "future_field"]
+    with pytest.raises(KeyError):
+        link["title"]
+
+
+def test_records_pickle():
+    link = models.Link.from_dict(LINK)
+
+    assert pickle.loads(pickle.dumps(link)) == link
+
+
+def test_domain_fields_keep_wire_names():
+    domain = models.Domain.from_dict({"id": "d1", "createdAt": "2026-01-01T00:00:00Z"})
+
+    assert domain.createdAt == "2026-01-01T00:00:00Z"
+    assert domain.sslStatus is None
+
+
+def test_decode_envelope_converts_only_the_records():
+    page = {"data": [LINK], "page": 1, "total": 1}
+
+    decoded = models.decode(models.Envelope("data", models.Link), page)
+
+    assert decoded["page"] == 1
+    assert isinstance(decoded["data"][0], models.Link)
+    assert models.to_dicts(decoded["data"]) == [LINK]
+
+
+def test_client_decodes_responses_when_enabled(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/links":
+            meta = {"page": 1, "per_page": 1, "total": 1, "total_pages": 1}
+            return envelope([LINK], meta=meta)
+        return envelope(LINK)
+
+    plain = make_client(handler)
+    client = make_client(handler, models=True)
+
+    assert isinstance(plain.links.get("lnk_1"), dict)
+    assert isinstance(client.links.get("lnk_1"), models.Link)
+    assert [link.id for link in client.links.iter_all()] == ["lnk_1"]
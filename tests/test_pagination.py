@@ -0,0 +1,77 @@
+"""Auto-paginating ``links.iter_all`` with prefetching."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from .conftest import envelope
+
+TOTAL_PAGES = 4
+
+
+def paged_handler(pages: List[int], delay: float = 0.0):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        pages.append(page)
+        # Later pages answer first, so prefetching would reorder a naive merge.
+        time.sleep(delay * (TOTAL_PAGES - page))
+        links = [{"id": f"{page}-{n}"} for n in range(2)]
+        meta = {"page": page, "per_page": 2, "total": 2 * TOTAL_PAGES, "total_pages": TOTAL_PAGES}
+        return envelope(links, meta=meta)
+
+    return handler
+
+
+def expected_ids(start: int = 1) -> List[str]:
+    return [f"{page}-{n}" for page in range(start, TOTAL_PAGES + 1) for n in range(2)]
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_all_yields_every_page_in_order(make_client, prefetch):
+    pages: List[int] = []
+    client = make_client(paged_handler(pages, delay=0.002))
+
+    ids = [link["id"] for link in client.links.iter_all(prefetch=prefetch)]
+
+    assert ids == expected_ids()
+    assert sorted(pages) == list(range(1, TOTAL_PAGES + 1))
+
+
+def test_iter_all_starts_at_requested_page(make_client):
+    pages: List[int] = []
+    client = make_client(paged_handler(pages))
+
+    ids = [link["id"] for link in client.links.iter_all({"page": 3, "per_page": 2})]
+
+    assert ids == expected_ids(start=3)
+    assert sorted(pages) == [3, 4]
+
+
+def test_iter_all_sequential_fetches_lazily(make_client):
+    pages: List[int] = []
+    client = make_client(paged_handler(pages))
+
+    links = client.links.iter_all(prefetch=0)
+    next(links)
+    next(links)
+    next(links)
+
+    assert pages == [1, 2]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_async_iter_all_yields_every_page_in_order(make_async_client, prefetch):
+    pages: List[int] = []
+    client = make_async_client(paged_handler(pages))
+
+    async def run() -> List[str]:
+        return [link["id"] async for link in client.links.iter_all(prefetch=prefetch)]
+
+    assert asyncio.run(run()) == expected_ids()
+    if prefetch == 0:
+        assert pages == list(range(1, TOTAL_PAGES + 1))
@@ -0,0 +1,90 @@
+"""Connection pooling and HTTP/2 configuration."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import httpx
+import pytest
+
+from qck import QCK, AsyncQCK
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: Set[Tuple[str, int]] = set()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.peers.add(self.client_address)
+        body = json.dumps({"success": True, "data": {"id": "abc"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[Tuple[str, Set[Tuple[str, int]]]]:
+    peers: Set[Tuple[str, int]] = set()
+    handler = type("Handler", (_Handler,), {"peers": peers})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", peers
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_sequential_requests_reuse_one_connection(server):
+    base_url, peers = server
+    with QCK(api_key="qck_test", base_url=base_url) as client:
+        for _ in range(5):
+            assert client.links.get("abc") == {"id": "abc"}
+    assert len(peers) == 1
+
+
+def test_async_concurrency_is_capped_by_max_connections(server):
+    base_url, peers = server
+
+    async def run() -> List[Any]:
+        async with AsyncQCK(api_key="qck_test", base_url=base_url, max_connections=2) as client:
+            return await asyncio.gather(*(client.links.get("abc") for _ in range(10)))
+
+    assert asyncio.run(run()) == [{"id": "abc"}] * 10
+    assert 1 <= len(peers) <= 2
+
+
+def test_pool_options_reach_httpx(monkeypatch):
+    seen: List[Dict[str, Any]] = []
+
+    class Recording(httpx.Client):
+        def __init__(self, **kwargs: Any) -> None:
+            seen.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "Client", Recording)
+    QCK(api_key="qck_test", max_connections=7, max_keepalive_connections=3, keepalive_expiry=2.5)
+
+    limits = seen[0]["limits"]
+    assert (limits.max_connections, limits.max_keepalive_connections) == (7, 3)
+    assert limits.keepalive_expiry == 2.5
+    assert seen[0]["http2"] is False
+
+
+def test_http2_without_h2_raises_import_error(monkeypatch):
+    monkeypatch.setattr("importlib.util.find_spec", lambda name, *args: None)
+
+    with pytest.raises(ImportError, match="h2"):
+        QCK(api_key="qck_test", http2=True)
+    with pytest.raises(ImportError, match="h2"):
+        AsyncQCK(api_key="qck_test", http2=True)
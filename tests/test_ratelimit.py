@@ -0,0 +1,122 @@
+"""Client-side adaptive rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from qck import RateLimiter, RateLimitError, RetryPolicy
+
+from .conftest import envelope
+
+
+def test_burst_is_free_then_requests_are_spaced():
+    limiter = RateLimiter(rate=10, burst=3)
+
+    waits = [limiter.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert 0.05 < waits[3] <= 0.1
+    assert waits[4] > waits[3]
+
+
+def test_try_reserve_does_not_take_a_token_when_rejected():
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.reserve()
+
+    assert limiter.try_reserve(0.1) is None
+    assert limiter.try_reserve(0.1) is None
+    assert 0.9 < limiter.reserve() <= 1.0
+
+
+def test_backoff_pauses_and_halves_rate():
+    limiter = RateLimiter(rate=10, burst=5)
+
+    limiter.backoff(2)
+
+    assert limiter.rate == 5
+    assert 1.9 < limiter.reserve() <= 2.0
+
+
+def test_headers_cap_rate_and_exhausted_quota_pauses():
+    limiter = RateLimiter(rate=100, min_rate=1)
+
+    limiter.observe(httpx.Headers({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "5"}))
+    assert limiter.rate == pytest.approx(2.0)
+
+    limiter.observe(httpx.Headers({"RateLimit-Remaining": "0", "RateLimit-Reset": "3"}))
+    assert limiter.reserve() > 2.5
+
+
+def test_non_adaptive_limiter_ignores_headers():
+    limiter = RateLimiter(rate=10, adaptive=False)
+
+    limiter.backoff(0)
+    limiter.observe(httpx.Headers({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "10"}))
+
+    assert limiter.rate == 10
+
+
+@pytest.mark.parametrize(("rate", "burst"), [(0, None), (-1, None), (1, 0)])
+def test_invalid_arguments(rate, burst):
+    with pytest.raises(ValueError):
+        RateLimiter(rate=rate, burst=burst)
+
+
+def test_client_throttles_and_follows_429(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"success": False})
+        return envelope({"id": "abc"})
+
+    limiter = RateLimiter(rate=1000, burst=10)
+    client = make_client(handler, rate_limit=limiter)
+
+    assert client.links.get("abc") == {"id": "abc"}
+    assert len(calls) == 2
+    # Halved by the 429, then one recovery step for the success.
+    assert limiter.rate == 550
+
+
+def test_wait_past_deadline_fails_without_sending(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope({"id": "abc"})
+
+    limiter = RateLimiter(rate=0.5, burst=1)
+    limiter.reserve()
+    policy = RetryPolicy(backoff=lambda attempt, previous: 0.0, deadline=0.5)
+    client = make_client(handler, rate_limit=limiter, retry_policy=policy)
+
+    with pytest.raises(RateLimitError) as info:
+        client.links.get("abc")
+
+    assert info.value.code == "CLIENT_RATE_LIMITED"
+    assert calls == []
+    # The rejected call left the next slot free for other requests.
+    assert 1.5 < limiter.reserve() <= 2.0
+
+
+def test_async_wait_past_deadline_fails_without_sending(make_async_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return envelope({"id": "abc"})
+
+    limiter = RateLimiter(rate=0.5, burst=1)
+    limiter.reserve()
+    policy = RetryPolicy(backoff=lambda attempt, previous: 0.0, deadline=0.5)
+    client = make_async_client(handler, rate_limit=limiter, retry_policy=policy)
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(client.links.get("abc"))
+    assert calls == []
@@ -0,0 +1,248 @@
+"""Automatic retries, back-off strategies, budgets, and deadlines."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from qck import (
+    CircuitBreaker,
+    CircuitOpenError,
+    NetworkError,
+    QCKError,
+    RateLimitError,
+    RetryBudget,
+    RetryPolicy,
+)
+
+from .conftest import envelope, error
+
+
+def rate_limited() -> httpx.Response:
+    return httpx.Response(
+        429,
+        json={"success": False, "error": {"code": "RATE_LIMIT_EXCEEDED", "message": "slow down"}},
+        headers={"Retry-After": "0"},
+    )
+
+
+def test_rate_limit_is_retried(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return rate_limited() if len(calls) < 3 else envelope({"id": "abc"})
+
+    client = make_client(handler)
+    assert client.links.get("abc") == {"id": "abc"}
+    assert len(calls) == 3
+
+
+def test_rate_limit_raises_after_retries_exhausted(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return rate_limited()
+
+    client = make_client(handler, retries=2)
+    with pytest.raises(RateLimitError) as info:
+        client.links.get("abc")
+    assert info.value.code == "RATE_LIMIT_EXCEEDED"
+    assert len(calls) == 3
+
+
+def test_connect_error_is_retried_for_get(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return envelope({"id": "abc"})
+
+    client = make_client(handler)
+    assert client.links.get("abc") == {"id": "abc"}
+    assert len(calls) == 2
+
+
+def test_connect_error_is_not_retried_for_plain_post(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = make_client(handler)
+    with pytest.raises(NetworkError) as info:
+        client.links.create({"url": "https://example.com"})
+    assert info.value.code == "NETWORK_ERROR"
+    assert isinstance(info.value.__cause__, httpx.ConnectError)
+    assert len(calls) == 1
+
+
+def test_final_timeout_is_wrapped_after_retries(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    client = make_client(handler, retries=2)
+    with pytest.raises(NetworkError) as info:
+        client.links.get("abc")
+    assert info.value.code == "TIMEOUT"
+    assert info.value.status == 0
+    assert isinstance(info.value.__cause__, httpx.ReadTimeout)
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_gateway_errors_are_retried_for_get(make_client, status):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(status, "UNAVAILABLE") if len(calls) == 1 else envelope({"id": "abc"})
+
+    client = make_client(handler)
+    assert client.links.get("abc") == {"id": "abc"}
+    assert len(calls) == 2
+
+
+def test_gateway_errors_are_not_retried_for_plain_post(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(503, "UNAVAILABLE")
+
+    client = make_client(handler)
+    with pytest.raises(QCKError) as info:
+        client.links.create({"url": "https://example.com"})
+    assert info.value.status == 503
+    assert len(calls) == 1
+
+
+def test_retry_statuses_are_configurable(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(500, "INTERNAL") if len(calls) == 1 else envelope({"id": "abc"})
+
+    policy = RetryPolicy(backoff=lambda attempt, previous: 0.0, retry_statuses={500})
+    client = make_client(handler, retry_policy=policy)
+    assert client.links.get("abc") == {"id": "abc"}
+    assert len(calls) == 2
+
+    calls.clear()
+    client = make_client(handler)
+    with pytest.raises(QCKError):
+        client.links.get("abc")
+    assert len(calls) == 1
+
+
+def test_open_circuit_is_not_retried(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(503, "UNAVAILABLE")
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = make_client(handler, circuit_breaker=breaker, retries=3)
+    with pytest.raises(CircuitOpenError):
+        client.links.get("abc")
+    assert len(calls) == 1
+
+
+def test_client_errors_are_not_retried(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(400, "VALIDATION_ERROR", "bad url")
+
+    client = make_client(handler)
+    with pytest.raises(QCKError) as info:
+        client.links.create({"url": "nope"})
+    assert info.value.status == 400
+    assert len(calls) == 1
+
+
+def test_async_rate_limit_is_retried(make_async_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return rate_limited() if len(calls) < 2 else envelope({"id": "abc"})
+
+    client = make_async_client(handler)
+    assert asyncio.run(client.links.get("abc")) == {"id": "abc"}
+    assert len(calls) == 2
+
+
+def test_retry_budget_stops_retries(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(503, "UNAVAILABLE")
+
+    budget = RetryBudget(ratio=0.0, min_retries=1)
+    policy = RetryPolicy(backoff=lambda attempt, previous: 0.0, budget=budget)
+    client = make_client(handler, retry_policy=policy, retries=5)
+    with pytest.raises(QCKError):
+        client.links.get("abc")
+    assert len(calls) == 2
+
+
+def test_deadline_skips_retry_that_would_overrun(make_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return error(503, "UNAVAILABLE")
+
+    policy = RetryPolicy(backoff=lambda attempt, previous: 5.0, deadline=0.5)
+    client = make_client(handler, retry_policy=policy)
+    with pytest.raises(QCKError) as info:
+        client.links.get("abc")
+    assert info.value.status == 503
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("strategy", ["exponential", "full_jitter", "decorrelated_jitter"])
+def test_backoff_strategies_stay_within_bounds(strategy):
+    policy = RetryPolicy(strategy, base_delay=0.5, max_delay=4.0)
+    previous = 0.0
+    for attempt in range(8):
+        delay = policy.delay(attempt, previous)
+        assert 0.0 <= delay <= 4.0
+        previous = delay
+    assert RetryPolicy("exponential", base_delay=0.5).delay(2, 0.0) == 2.0
+
+
+@pytest.mark.parametrize("kwargs", [{"backoff": "linear"}, {"deadline": 0}])
+def test_invalid_policy_arguments(kwargs):
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
+
+
+def test_async_gateway_error_then_network_error_is_wrapped(make_async_client):
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return error(502, "BAD_GATEWAY")
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = make_async_client(handler, retries=1)
+    with pytest.raises(NetworkError):
+        asyncio.run(client.links.get("abc"))
+    assert len(calls) == 2
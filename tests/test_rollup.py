@@ -0,0 +1,92 @@
+"""Local period rollups of timeseries buckets."""
+
+from __future__ import annotations
+
+import pytest
+
+import qck._rollup as rollup_module
+from qck import Columns, rollup
+from qck._columns import CONVERSION_TIMESERIES_SCHEMA, TIMESERIES_SCHEMA
+
+DAILY = [
+    {"date": "2026-03-01", "clicks": 1, "unique_visitors": 1},  # Sunday
+    {"date": "2026-03-02", "clicks": 2, "unique_visitors": 1},
+    {"date": "2026-03-09", "clicks": 4},
+    {"date": "2026-04-01", "clicks": 8, "unique_visitors": 3, "is_partial": True},
+]
+HOURLY = [
+    {"timestamp": "2026-03-01T22:30:00Z", "conversions": 1, "revenue": 2.5},
+    {"timestamp": "2026-03-02T21:00:00Z", "conversions": 2, "revenue": None},
+    {"timestamp": "2026-03-02T23:00:00+00:00", "conversions": 3, "revenue": 1.0},
+]
+
+
+def test_weeks_and_months():
+    weeks = rollup(DAILY, "week")
+    sunday_weeks = rollup(DAILY, "week", week_start=6)
+    months = rollup(reversed(DAILY), "month")
+
+    assert [(w["date"], w["clicks"]) for w in weeks] == [
+        ("2026-02-23", 1),
+        ("2026-03-02", 2),
+        ("2026-03-09", 4),
+        ("2026-03-30", 8),
+    ]
+    assert [w["clicks"] for w in sunday_weeks] == [3, 4, 8]
+    assert months == [
+        {"date": "2026-03-01", "clicks": 7, "unique_visitors": 2},
+        {"date": "2026-04-01", "clicks": 8, "unique_visitors": 3},
+    ]
+
+
+def test_timestamps_are_bucketed_in_the_time_zone():
+    days = rollup(HOURLY, "day", tz="Europe/Berlin")
+
+    assert days == [
+        {"timestamp": "2026-03-01T00:00:00+01:00", "conversions": 1, "revenue": 2.5},
+        {"timestamp": "2026-03-02T00:00:00+01:00", "conversions": 2, "revenue": 0},
+        {"timestamp": "2026-03-03T00:00:00+01:00", "conversions": 3, "revenue": 1.0},
+    ]
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_columns_match_rows(monkeypatch, numpy):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(rollup_module, "_numpy", lambda: None)
+    daily = Columns.from_rows(DAILY, TIMESERIES_SCHEMA)
+    hourly = Columns.from_rows(HOURLY, CONVERSION_TIMESERIES_SCHEMA)
+
+    months = rollup(daily, "month")
+    days = rollup(hourly, "day", tz="Europe/Berlin")
+
+    assert isinstance(months, Columns) and months.schema == TIMESERIES_SCHEMA
+    assert months.to_dicts() == rollup(DAILY, "month")
+    assert days.to_dicts() == rollup(HOURLY, "day", tz="Europe/Berlin")
+    assert all(type(n) is int for n in months["clicks"])
+
+
+def test_empty_input():
+    assert rollup([], "week") == []
+    assert rollup(Columns.from_rows([], TIMESERIES_SCHEMA), "week").num_rows == 0
+
+
+@pytest.mark.parametrize(
+    ("points", "message"),
+    [
+        ([{"clicks": 1}], "need a 'date' or 'timestamp'"),
+        ([{"date": "2026-03-01"}, {"clicks": 1}], "row 1 has no 'date'"),
+        ([{"date": "2026-03-01"}, {"date": "March 2"}], "row 1 has an invalid 'date'"),
+        (Columns.from_rows([{"clicks": 1}], TIMESERIES_SCHEMA), "row 0 has no 'date'"),
+    ],
+)
+def test_rows_without_a_valid_key(points, message):
+    with pytest.raises(ValueError, match=message):
+        rollup(points, "month")
+
+
+@pytest.mark.parametrize(("period", "week_start"), [("fortnight", 0), ("week", 7)])
+def test_invalid_arguments(period, week_start):
+    with pytest.raises(ValueError):
+        rollup(DAILY, period, week_start=week_start)
@@ -0,0 +1,99 @@
+"""Concurrent dashboard queries with ``analytics.snapshot``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from qck import AuthenticationError
+
+from .conftest import envelope, error
+
+
+def analytics_response(name: str, clicks: int, **usage: object) -> httpx.Response:
+    body = {"analytics": {"endpoint": name}, "usage": {"clicks_this_month": clicks, **usage}}
+    return envelope(body)
+
+
+def test_snapshot_fetches_every_endpoint_concurrently(make_client):
+    lock = threading.Lock()
+    active = peak = 0
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            paths.append(request.url.path)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        assert request.url.params["days"] == "7"
+        name = request.url.path.rsplit("/", 1)[-1]
+        return analytics_response(name, len(paths), limit_exceeded=name == "geo")
+
+    client = make_client(handler)
+    snap = client.analytics.snapshot({"days": 7})
+
+    assert sorted(paths) == sorted(
+        f"/analytics/{name}"
+        for name in ("summary", "timeseries", "geo", "devices", "referrers", "hourly")
+    )
+    assert snap["analytics"]["geo"] == {"endpoint": "geo"}
+    assert snap["usage"] == {"clicks_this_month": 6, "limit_exceeded": True}
+    assert set(snap["latency"]) == set(snap["analytics"])
+    assert snap["errors"] == {}
+    assert peak > 1
+    assert snap["elapsed"] > 0
+
+
+def test_failed_endpoints_are_reported_without_losing_the_rest(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/geo"):
+            return error(403, "TIER_LIMIT", "upgrade required")
+        return analytics_response("summary", 1)
+
+    client = make_client(handler)
+    snap = client.analytics.snapshot(include=["summary", "geo", "summary"])
+
+    assert list(snap["analytics"]) == ["summary"]
+    assert snap["errors"]["geo"] == {
+        "error": "upgrade required",
+        "error_type": "TIER_LIMIT",
+        "status": 403,
+    }
+
+
+def test_authentication_error_is_raised(make_client):
+    client = make_client(lambda request: error(401, "INVALID_API_KEY"))
+
+    with pytest.raises(AuthenticationError):
+        client.analytics.snapshot(include=["summary"])
+
+
+@pytest.mark.parametrize("include", [[], ["summary", "funnels"]])
+def test_invalid_include(make_client, include):
+    client = make_client(lambda request: analytics_response("summary", 1))
+
+    with pytest.raises(ValueError):
+        client.analytics.snapshot(include=include)
+
+
+def test_async_snapshot(make_async_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return analytics_response(request.url.path.rsplit("/", 1)[-1], 3)
+
+    client = make_async_client(handler)
+    snap = asyncio.run(client.analytics.snapshot(include=["summary", "hourly"]))
+
+    assert snap["analytics"] == {
+        "summary": {"endpoint": "summary"},
+        "hourly": {"endpoint": "hourly"},
+    }
+    assert snap["usage"] == {"clicks_this_month": 3}
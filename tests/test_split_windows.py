@@ -0,0 +1,95 @@
+"""Splitting long breakdown queries into parallel date windows."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from typing import Dict, List
+
+import httpx
+import pytest
+
+import qck.resources.analytics as analytics_module
+
+from .conftest import envelope
+
+
+def geo_handler(queries: List[Dict[str, str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = dict(request.url.params)
+        queries.append(query)
+        month = int(query.get("start_date", "2026-01-01")[5:7])
+        rows = [
+            {"country_code": "DE", "clicks": 10 * month, "unique_visitors": month},
+            {"country_code": f"C{month}", "clicks": 5, "unique_visitors": 1},
+        ]
+        usage = {"clicks_this_month": month, "limit_exceeded": month == 2}
+        return envelope({"analytics": rows, "usage": usage})
+
+    return handler
+
+
+def test_range_is_split_and_rows_merged(make_client):
+    queries: List[Dict[str, str]] = []
+    client = make_client(geo_handler(queries))
+
+    result = client.analytics.geo(
+        {"start_date": "2026-01-01", "end_date": "2026-03-15", "bot_filter": "real"},
+        split_days=31,
+    )
+
+    windows = sorted((q["start_date"], q["end_date"]) for q in queries)
+    assert windows == [
+        ("2026-01-01", "2026-01-31"),
+        ("2026-02-01", "2026-03-03"),
+        ("2026-03-04", "2026-03-15"),
+    ]
+    assert all(q["bot_filter"] == "real" for q in queries)
+    rows = result["analytics"]
+    assert rows[0] == {"country_code": "DE", "clicks": 60, "unique_visitors": 6}
+    assert [row["country_code"] for row in rows[1:]] == ["C1", "C2", "C3"]
+    assert result["usage"] == {"clicks_this_month": 3, "limit_exceeded": True}
+
+
+def test_days_become_an_explicit_range(make_client, monkeypatch):
+    monkeypatch.setattr(analytics_module, "_today", lambda: date(2026, 3, 10))
+    queries: List[Dict[str, str]] = []
+    client = make_client(geo_handler(queries))
+
+    client.analytics.referrers({"days": 10}, split_days=5)
+
+    assert sorted(q["start_date"] for q in queries) == ["2026-03-01", "2026-03-06"]
+    assert all("days" not in q for q in queries)
+
+
+@pytest.mark.parametrize("params", [None, {"start_date": "2026-01-01"}, {"days": 3}])
+def test_short_or_open_ranges_send_one_query(make_client, params):
+    queries: List[Dict[str, str]] = []
+    client = make_client(geo_handler(queries))
+
+    client.analytics.devices(params, split_days=7)
+
+    assert len(queries) == 1
+
+
+@pytest.mark.parametrize(
+    ("params", "split_days"),
+    [({"days": 30}, 0), ({"start_date": "2026-02-01", "end_date": "2026-01-01"}, 7)],
+)
+def test_invalid_split(make_client, params, split_days):
+    client = make_client(geo_handler([]))
+
+    with pytest.raises(ValueError):
+        client.analytics.geo(params, split_days=split_days)
+
+
+def test_async_split(make_async_client):
+    queries: List[Dict[str, str]] = []
+    client = make_async_client(geo_handler(queries))
+
+    result = asyncio.run(
+        client.analytics.geo({"start_date": "2026-01-01", "end_date": "2026-02-28"}, split_days=31)
+    )
+
+    assert len(queries) == 2
+    assert result["analytics"][0]["clicks"] == 30
@@ -0,0 +1,140 @@
+"""Streaming OG image uploads."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from qck import AuthenticationError, ValidationError
+from qck._upload import open_buffer, sniff_image_type
+
+from .conftest import envelope, error
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200_000
+
+
+def recording(bodies: List[bytes], headers: List[Dict[str, str]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        headers.append(dict(request.headers))
+        return envelope({"og_image_url": "https://cdn.test/og.png"})
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"\xff\xd8\xff\xe0" + b"\x00" * 8, "image/jpeg"),
+        (PNG[:12], "image/png"),
+        (b"GIF89a" + b"\x00" * 6, "image/gif"),
+        (b"RIFF\x00\x00\x00\x00WEBP", "image/webp"),
+        (b"%PDF-1.7\n\x00\x00\x00", None),
+    ],
+)
+def test_sniff_image_type(head, expected):
+    assert sniff_image_type(head) == expected
+
+
+def test_upload_from_path_streams_whole_file(make_client, tmp_path):
+    bodies: List[bytes] = []
+    headers: List[Dict[str, str]] = []
+    path = tmp_path / "banner.bin"
+    path.write_bytes(PNG)
+    client = make_client(recording(bodies, headers))
+
+    client.links.upload_og_image("abc", str(path))
+
+    assert bodies == [PNG]
+    assert headers[0]["content-type"] == "image/png"
+    assert headers[0]["content-length"] == str(len(PNG))
+
+
+def test_file_path_keyword_still_works(make_client, tmp_path):
+    bodies: List[bytes] = []
+    path = tmp_path / "banner.png"
+    path.write_bytes(PNG)
+    client = make_client(recording(bodies, []))
+
+    client.links.upload_og_image("abc", file_path=str(path))
+
+    assert bodies == [PNG]
+
+
+def test_file_object_is_read_from_current_position(make_client):
+    bodies: List[bytes] = []
+    client = make_client(recording(bodies, []))
+    stream = io.BytesIO(b"junk" + PNG)
+    stream.seek(4)
+
+    client.links.upload_og_image("abc", stream)
+
+    assert bodies == [PNG]
+
+
+def test_non_contiguous_memoryview_is_copied():
+    data = bytes(range(256)) * 4
+
+    with open_buffer(memoryview(data)[::2]) as view:
+        assert view.tobytes() == data[::2]
+        assert view.format == "B" and view.ndim == 1
+
+
+def test_retried_upload_resends_full_body(make_client):
+    bodies: List[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        if len(bodies) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"success": False})
+        return envelope({})
+
+    client = make_client(handler)
+    client.links.upload_og_image("abc", bytearray(PNG))
+
+    assert bodies == [PNG, PNG]
+
+
+def test_unsupported_data_is_rejected_before_sending(make_client):
+    calls: List[bytes] = []
+    client = make_client(recording(calls, []))
+
+    with pytest.raises(ValueError, match="Unsupported image type"):
+        client.links.upload_og_image("abc", b"plain text, not an image")
+    assert calls == []
+
+
+def test_batch_upload_collects_failures(make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/bad/" in request.url.path:
+            return error(400, "VALIDATION_ERROR", "too large")
+        return envelope({"ok": True})
+
+    client = make_client(handler)
+    results = client.links.upload_og_images({"good": PNG, "bad": PNG, "text": b"nope"})
+
+    assert results["good"] == {"ok": True}
+    assert isinstance(results["bad"], ValidationError)
+    assert isinstance(results["text"], ValueError)
+
+
+def test_batch_upload_raises_authentication_errors(make_client):
+    client = make_client(lambda request: error(401, "INVALID_API_KEY"))
+
+    with pytest.raises(AuthenticationError):
+        client.links.upload_og_images([("a", PNG)])
+
+
+def test_async_upload(make_async_client):
+    bodies: List[bytes] = []
+    client = make_async_client(recording(bodies, []))
+
+    async def run() -> None:
+        await client.links.upload_og_image("abc", memoryview(PNG))
+
+    asyncio.run(run())
+    assert bodies == [PNG]